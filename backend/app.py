@@ -6,6 +6,8 @@ from flask_cors import CORS
 from flask.json import JSONEncoder
 
 from config import S3_CONFIG
+from connection import close_request_db_connection
+from seller_name_index import get_seller_name_index
 from seller.view.seller_view import SellerView
 from product.view.product_view import ProductView
 from image.view.image_view import ImageView
@@ -85,6 +87,8 @@ def create_app():
 
     History:
         2020-03-25 (leesh3@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): 요청이 끝나면 요청 단위 커넥션을 반납하는 teardown 등록
+        2026-10-17 (leesh3@brandi.co.kr): 셀러명 자동완성 색인 생성
 
     """
     # set flask object
@@ -92,11 +96,21 @@ def create_app():
     app.json_encoder = CustomJSONEncoder
     make_config(app)
     CORS(app, resources={r"/*/*": {"origins": "*"}})
+
+    # 요청 단위 데이터베이스 커넥션을 요청이 끝날 때 커넥션 풀에 반납
+    app.teardown_appcontext(close_request_db_connection)
+
     app.register_blueprint(SellerView.seller_app)
     app.register_blueprint(ProductView.product_app)
     app.register_blueprint(ImageView.image_app)
     app.register_blueprint(EventView.event_app)
 
+    # 셀러명 자동완성 색인을 미리 만듦 (실패하면 첫 자동완성 요청에서 다시 만듦)
+    try:
+        get_seller_name_index()
+    except Exception as e:
+        print(f'SELLER_NAME_INDEX_LOAD_ERROR_WITH {e}')
+
     return app
 
 
@@ -0,0 +1,232 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+import jwt
+
+from config import SECRET
+
+
+# 토큰에 권한 정보를 담아서 login_required 에서 데이터베이스를 조회하지 않는 모드 (기본값은 사용하지 않음)
+STATELESS_TOKEN = SECRET.get('stateless_token', False)
+
+# 토큰 유효 시간(초). 기존 토큰은 3일, stateless 모드의 access token 은 짧게 발급한다.
+TOKEN_LIFETIME = SECRET.get('token_lifetime', 3 * 24 * 60 * 60)
+ACCESS_TOKEN_LIFETIME = SECRET.get('access_token_lifetime', 15 * 60)
+REFRESH_TOKEN_LIFETIME = SECRET.get('refresh_token_lifetime', 3 * 24 * 60 * 60)
+
+# 다른 프로세스에서 폐기한 토큰(accounts.tokens_revoked_at)을 읽어오는 주기(초)
+REVOCATION_SYNC_INTERVAL = SECRET.get('token_revocation_sync_interval', 10)
+
+# 폐기 시각 계산 후 커밋까지 걸린 시간만큼 놓치지 않도록 이전 동기화 시각보다 앞에서부터 읽음(초)
+REVOCATION_SYNC_MARGIN = 60
+
+
+class TokenRevocationList:
+
+    """ 계정별 토큰 폐기 목록
+
+    계정 번호와 폐기 시각을 저장하고, 폐기 시각 이전에 발급된(iat) 토큰을 폐기된 토큰으로 판단한다.
+    폐기 시각과 발급 시각은 초 단위 이하까지 비교하므로, 폐기 직후 같은 초에 발급된 토큰은 폐기되지 않는다.
+    토큰은 최대 max_age(초) 까지만 유효하므로 그보다 오래된 항목은 정리해서 크기를 작게 유지한다.
+    프로세스마다 따로 존재하고, 다른 프로세스의 폐기는 데이터베이스(accounts.tokens_revoked_at)에서 sync 로 읽어온다.
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+
+    def __init__(self, max_age):
+        self.max_age = max_age
+        self._lock = threading.Lock()
+
+        # account_no: 폐기 시각(unix time, 초 단위 소수)
+        self._revoked_at = {}
+
+        # 마지막으로 데이터베이스에서 폐기 목록을 읽어온 시각 (한 스레드만 읽음)
+        self._synced_at = None
+        self._sync_lock = threading.Lock()
+
+    def revoke(self, account_no, revoked_at=None):
+        revoked_at = revoked_at if revoked_at is not None else time.time()
+
+        with self._lock:
+            self._revoked_at[account_no] = max(revoked_at, self._revoked_at.get(account_no, 0))
+            self._prune()
+
+    def is_revoked(self, account_no, issued_at):
+        # 폐기된 계정이 없으면 dict 조회 한번으로 끝남
+        revoked_at = self._revoked_at.get(account_no)
+        return revoked_at is not None and issued_at < revoked_at
+
+    def sync(self, load_revocations, interval):
+
+        """ 다른 프로세스에서 폐기한 토큰을 목록에 반영
+
+        interval(초) 마다 한번, 한 스레드에서만 load_revocations 를 호출한다.
+        다른 스레드가 읽는 중이면 기다리지 않고 지금 목록으로 확인한다.
+
+        Args:
+            load_revocations: since(unix time) 이후의 폐기 [(account_no, 폐기 시각)] 를 리턴하는 함수
+            interval: 읽어오는 주기(초)
+        """
+        now = time.time()
+        if self._synced_at is not None and now - self._synced_at < interval:
+            return
+
+        if not self._sync_lock.acquire(blocking=False):
+            return
+
+        try:
+            since = (self._synced_at if self._synced_at is not None else now - self.max_age) - REVOCATION_SYNC_MARGIN
+            for account_no, revoked_at in load_revocations(since):
+                self.revoke(account_no, revoked_at)
+            self._synced_at = now
+
+        finally:
+            self._sync_lock.release()
+
+    def _prune(self):
+        expired_before = time.time() - self.max_age
+        for account_no in [key for key, value in self._revoked_at.items() if value < expired_before]:
+            del self._revoked_at[account_no]
+
+    def __len__(self):
+        return len(self._revoked_at)
+
+
+# refresh token 까지 막아야 하므로 가장 긴 토큰 유효 시간 만큼 유지
+token_revocation_list = TokenRevocationList(max(ACCESS_TOKEN_LIFETIME, REFRESH_TOKEN_LIFETIME))
+
+
+def revoke_account_tokens(db_cursor, account_no):
+
+    """ 계정의 토큰 폐기
+
+    계정 삭제(is_deleted), 권한 변경(auth_type_id), 비밀번호 변경 등 토큰에 담긴 정보가 더 이상 유효하지 않을 때
+    변경한 트랜잭션 안에서 커밋 전에 호출해서 지금까지 발급된 해당 계정의 토큰을 사용하지 못하도록 한다.
+    폐기 시각은 accounts.tokens_revoked_at 에 저장되어 다른 프로세스의 폐기 목록(sync)과
+    refresh token 재발급(is_issued_before)에도 반영된다.
+    롤백되면 폐기되지 않아야 하므로 이 프로세스의 폐기 목록에는 호출한 쪽에서 커밋 후에
+    리턴된 폐기 시각으로 token_revocation_list.revoke 를 호출해서 반영한다.
+
+    Args:
+        db_cursor: 변경을 실행한 트랜잭션의 데이터베이스 커서
+        account_no: 토큰을 폐기할 계정 번호
+
+    Returns:
+        폐기 시각(unix time)
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): 폐기 시각을 데이터베이스에 저장해서 프로세스 간에 공유
+        2026-10-17 (leesh3@brandi.co.kr): 폐기 목록 반영은 커밋 후 호출한 쪽에서 하도록 폐기 시각만 리턴
+    """
+    revoked_at = time.time()
+    db_cursor.execute("""
+        UPDATE
+            accounts
+        SET
+            tokens_revoked_at = FROM_UNIXTIME(%(revoked_at)s)
+        WHERE
+            account_no = %(account_no)s
+    """, {'revoked_at': revoked_at, 'account_no': account_no})
+
+    return revoked_at
+
+
+def sync_token_revocations(get_connection):
+
+    """ 다른 프로세스에서 폐기한 토큰을 이 프로세스의 폐기 목록에 반영
+
+    REVOCATION_SYNC_INTERVAL 마다 한번만 데이터베이스를 조회하므로 매 요청마다 호출해도 된다.
+    (tokens_revoked_at 인덱스로 마지막 조회 이후에 폐기된 계정만 읽음)
+
+    Args:
+        get_connection: 데이터베이스 커넥션을 리턴하는 함수 (조회할 때만 호출)
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+
+    def load_revocations(since):
+        with get_connection().cursor() as db_cursor:
+            db_cursor.execute("""
+                SELECT
+                    account_no,
+                    UNIX_TIMESTAMP(tokens_revoked_at) AS revoked_at
+                FROM
+                    accounts
+                WHERE
+                    tokens_revoked_at > FROM_UNIXTIME(%(since)s)
+            """, {'since': max(since, 0)})
+            return [(row['account_no'], float(row['revoked_at'])) for row in db_cursor.fetchall()]
+
+    token_revocation_list.sync(load_revocations, REVOCATION_SYNC_INTERVAL)
+
+
+def is_token_revoked(payload):
+    """ 토큰이 폐기된 계정의 폐기 이전에 발급된 토큰인지 확인 """
+    return token_revocation_list.is_revoked(payload['account_no'], payload.get('iat', 0))
+
+
+def is_issued_before(payload, revoked_at):
+    """ 토큰이 데이터베이스에 저장된 폐기 시각(UNIX_TIMESTAMP(tokens_revoked_at)) 이전에 발급되었는지 확인 """
+    return revoked_at is not None and payload.get('iat', 0) < float(revoked_at)
+
+
+def issue_tokens(account):
+
+    """ 로그인 토큰 발급
+
+    - 기본 모드: account_no 만 담긴 token 을 발급 (유효 시간 token_lifetime)
+    - stateless 모드: account_no, auth_type_id, is_deleted 를 담은 짧은 access token 과
+      access token 재발급에 사용하는 refresh token 을 함께 발급
+
+    Args:
+        account: account_no, auth_type_id, is_deleted 를 가진 계정 정보
+
+    Returns:
+        {'token': ..} 또는 {'token': .., 'refresh_token': ..}
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): 발급 시각(iat)을 초 단위 이하까지 저장
+    """
+    now = datetime.utcnow()
+
+    # 폐기 시각과 같은 초에 발급된 토큰을 구분할 수 있도록 iat 는 소수 초까지 저장
+    issued_at = time.time()
+
+    if not STATELESS_TOKEN:
+        token = jwt.encode({'account_no': account['account_no'],
+                            'exp': now + timedelta(seconds=TOKEN_LIFETIME)},
+                           SECRET['secret_key'], algorithm=SECRET['algorithm'])
+        return {'token': token}
+
+    access_token = jwt.encode({'account_no': account['account_no'],
+                               'auth_type_id': account['auth_type_id'],
+                               'is_deleted': account['is_deleted'],
+                               'type': 'access',
+                               'iat': issued_at,
+                               'exp': now + timedelta(seconds=ACCESS_TOKEN_LIFETIME)},
+                              SECRET['secret_key'], algorithm=SECRET['algorithm'])
+
+    refresh_token = jwt.encode({'account_no': account['account_no'],
+                                'type': 'refresh',
+                                'iat': issued_at,
+                                'exp': now + timedelta(seconds=REFRESH_TOKEN_LIFETIME)},
+                               SECRET['secret_key'], algorithm=SECRET['algorithm'])
+
+    return {'token': access_token, 'refresh_token': refresh_token}
@@ -0,0 +1,161 @@
+""" 선분이력 최신 이력 조회 벤치마크
+
+이력이 많이 쌓인 product_infos 와 같은 형태의 임시 테이블을 만들고,
+최신 이력 조회 쿼리를 두가지 방식으로 비교한다.
+    - close_time: close_time = '2037-12-31 23:59:59' 조건 (인덱스 없음, product_id / seller_id 외래키 인덱스만 있음)
+    - is_current: 생성 컬럼 is_current = 1 조건 + (is_current, product_id), (is_current, seller_id) 인덱스 (schema v2.6)
+
+config 의 DATABASES 데이터베이스에 bench_product_infos 테이블을 만들고 끝나면 삭제한다.
+
+실행:
+    cd backend
+    python benchmark/current_version_benchmark.py [--products 20000] [--versions 20] [--rounds 200]
+
+Authors:
+    leesh3@brandi.co.kr (이소헌)
+
+History:
+    2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from connection import _connect_database  # noqa: E402
+
+CURRENT_CLOSE_TIME = '2037-12-31 23:59:59'
+SELLER_COUNT = 200
+INSERT_BATCH_SIZE = 5000
+
+CONDITIONS = {
+    'close_time': f"close_time = '{CURRENT_CLOSE_TIME}'",
+    'is_current': 'is_current = 1',
+}
+
+QUERIES = {
+    # 상품 상세 / 수정: 상품번호로 최신 이력 한건
+    'product current row': "SELECT product_info_no, name FROM bench_product_infos WHERE product_id = %(product_id)s AND {condition}",
+
+    # 셀러 리스트의 셀러별 상품 수
+    'seller product count': "SELECT COUNT(0) AS count FROM bench_product_infos WHERE seller_id = %(seller_id)s AND {condition}",
+
+    # 상품 리스트: 최신 이력 전체
+    'current row count': "SELECT COUNT(0) AS count FROM bench_product_infos WHERE {condition}",
+}
+
+
+def create_table(db_cursor):
+    db_cursor.execute("DROP TABLE IF EXISTS bench_product_infos")
+    db_cursor.execute(f"""
+        CREATE TABLE bench_product_infos (
+            product_info_no INT NOT NULL AUTO_INCREMENT,
+            product_id INT NOT NULL,
+            seller_id INT NOT NULL,
+            name VARCHAR(100) NOT NULL,
+            start_time DATETIME NOT NULL,
+            close_time DATETIME NOT NULL DEFAULT '{CURRENT_CLOSE_TIME}',
+            is_current TINYINT AS (close_time = '{CURRENT_CLOSE_TIME}') STORED,
+            PRIMARY KEY (product_info_no),
+            INDEX IX_bench_product_id (product_id),
+            INDEX IX_bench_seller_id (seller_id)
+        ) ENGINE=InnoDB
+    """)
+
+
+def generate_history(db_connection, product_count, version_count):
+    # 상품마다 version_count 개의 이력 (마지막 이력만 최신)
+    insert_statement = """
+        INSERT INTO bench_product_infos (product_id, seller_id, name, start_time, close_time)
+        VALUES (%s, %s, %s, %s, %s)
+    """
+    rows = []
+    with db_connection.cursor() as db_cursor:
+        for product_id in range(1, product_count + 1):
+            seller_id = random.randint(1, SELLER_COUNT)
+            for version in range(version_count):
+                start_time = f'2020-01-01 00:00:{version % 60:02d}'
+                close_time = CURRENT_CLOSE_TIME if version == version_count - 1 else f'2020-01-01 00:01:{version % 60:02d}'
+                rows.append((product_id, seller_id, f'상품{product_id}-{version}', start_time, close_time))
+
+                if len(rows) >= INSERT_BATCH_SIZE:
+                    db_cursor.executemany(insert_statement, rows)
+                    rows = []
+
+        if rows:
+            db_cursor.executemany(insert_statement, rows)
+
+    db_connection.commit()
+
+
+def measure(db_cursor, statement, params_list):
+    # 쿼리 한번 당 평균 시간(ms)
+    started_at = time.perf_counter()
+    for params in params_list:
+        db_cursor.execute(statement, params)
+        db_cursor.fetchall()
+    return (time.perf_counter() - started_at) / len(params_list) * 1000
+
+
+def explain_rows(db_cursor, statement, params):
+    db_cursor.execute('EXPLAIN ' + statement, params)
+    plan = db_cursor.fetchone()
+    return plan['rows'], plan['key']
+
+
+def run_queries(db_cursor, name, product_count, rounds):
+    params_list = [
+        {'product_id': random.randint(1, product_count), 'seller_id': random.randint(1, SELLER_COUNT)}
+        for _ in range(rounds)
+    ]
+
+    for query_name, query in QUERIES.items():
+        statement = query.format(condition=CONDITIONS[name])
+
+        # 전체 건수 쿼리는 오래 걸리므로 반복 횟수를 줄임
+        query_params = params_list if '%(' in statement else params_list[:max(1, rounds // 20)]
+        elapsed = measure(db_cursor, statement, query_params)
+        rows, key = explain_rows(db_cursor, statement, params_list[0])
+        print(f'{name:<12} {query_name:<22} {elapsed:10.3f} ms/query  rows={str(rows):<10} key={key}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='선분이력 최신 이력 조회 벤치마크')
+    parser.add_argument('--products', type=int, default=20000)
+    parser.add_argument('--versions', type=int, default=20)
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+
+    db_connection = _connect_database()
+    try:
+        with db_connection.cursor() as db_cursor:
+            create_table(db_cursor)
+
+        print(f'products: {args.products}, versions per product: {args.versions}, '
+              f'rows: {args.products * args.versions}, rounds: {args.rounds}')
+        generate_history(db_connection, args.products, args.versions)
+
+        with db_connection.cursor() as db_cursor:
+            db_cursor.execute("ANALYZE TABLE bench_product_infos")
+            db_cursor.fetchall()
+            print()
+            run_queries(db_cursor, 'close_time', args.products, args.rounds)
+
+            # schema v2.6 의 최신 이력 인덱스
+            db_cursor.execute("CREATE INDEX IX_bench_current ON bench_product_infos (is_current, product_id)")
+            db_cursor.execute("CREATE INDEX IX_bench_current_seller ON bench_product_infos (is_current, seller_id)")
+            db_cursor.execute("ANALYZE TABLE bench_product_infos")
+            db_cursor.fetchall()
+            run_queries(db_cursor, 'is_current', args.products, args.rounds)
+
+    finally:
+        with db_connection.cursor() as db_cursor:
+            db_cursor.execute("DROP TABLE IF EXISTS bench_product_infos")
+        db_connection.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+""" 상품 이미지 리사이즈 벤치마크
+
+상품 하나(이미지 5장)를 big / medium / small 사이즈로 리사이즈할 때의 CPU 시간을 비교한다.
+    - legacy: 사이즈마다 원본을 새로 열고 디코딩해서 리사이즈 (기존 resize_to_big / medium / small)
+    - pipeline: 한번 디코딩 후 큰 사이즈부터 이어서 리사이즈 (image_resize.resize_image)
+
+실행:
+    cd backend
+    python benchmark/image_resize_benchmark.py [--rounds 10] [--image image/service/test_image.jpeg]
+
+Authors:
+    leesh3@brandi.co.kr (이소헌)
+
+History:
+    2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from image_resize import resize_image, PRODUCT_IMAGE_SIZES, RESAMPLE_FILTERS  # noqa: E402
+
+IMAGES_PER_PRODUCT = 5
+DEFAULT_IMAGE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'image', 'service', 'test_image.jpeg')
+
+
+def legacy_resize(image_bytes):
+    # 사이즈마다 원본을 새로 열어서 디코딩
+    for _, standard_size, _ in PRODUCT_IMAGE_SIZES:
+        with Image.open(io.BytesIO(image_bytes)) as opened_image:
+            size = (int(standard_size), int(opened_image.size[1] * (standard_size / opened_image.size[0])))
+            resized_image = opened_image.resize(size)
+            image_io = io.BytesIO()
+            resized_image.save(image_io, 'jpeg')
+
+
+def pipeline_resize(image_bytes, resample, reducing_gap):
+    resize_image(io.BytesIO(image_bytes), 'image/jpeg', resample=resample, reducing_gap=reducing_gap)
+
+
+def measure(func, rounds):
+    # 상품 하나(이미지 5장) 당 CPU 시간(ms)
+    started_at = time.process_time()
+    for _ in range(rounds):
+        for _ in range(IMAGES_PER_PRODUCT):
+            func()
+    return (time.process_time() - started_at) / rounds * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='상품 이미지 리사이즈 벤치마크')
+    parser.add_argument('--image', default=DEFAULT_IMAGE)
+    parser.add_argument('--rounds', type=int, default=10)
+    args = parser.parse_args()
+
+    with open(args.image, 'rb') as image_file:
+        image_bytes = image_file.read()
+
+    with Image.open(io.BytesIO(image_bytes)) as opened_image:
+        print(f'image: {args.image} {opened_image.size[0]}x{opened_image.size[1]} {len(image_bytes)} bytes')
+    print(f'rounds: {args.rounds}, images per product: {IMAGES_PER_PRODUCT}')
+    print()
+
+    legacy_time = measure(lambda: legacy_resize(image_bytes), args.rounds)
+    print(f'{"legacy":<28} {legacy_time:8.1f} ms/product')
+
+    for resample in RESAMPLE_FILTERS:
+        for reducing_gap in (None, 2.0):
+            pipeline_time = measure(lambda: pipeline_resize(image_bytes, resample, reducing_gap), args.rounds)
+            name = f'pipeline {resample} gap={reducing_gap}'
+            print(f'{name:<28} {pipeline_time:8.1f} ms/product  x{legacy_time / pipeline_time:.2f}')
+
+
+if __name__ == '__main__':
+    main()
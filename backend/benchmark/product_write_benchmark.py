@@ -0,0 +1,156 @@
+""" 상품 등록 / 수정시 이미지, 태그 저장 벤치마크
+
+상품 하나를 저장할 때 product_images, product_tags 에 쓰는 쿼리를 두가지 방식으로 비교한다.
+    - row: 이미지 사이즈마다, 태그마다 INSERT 한번씩, 바꾸지 않은 이미지는 순서 / 사이즈마다 INSERT ... SELECT (기존 방식)
+    - batch: 테이블마다 multi-row INSERT 한번, 바꾸지 않은 이미지는 INSERT ... SELECT 한번 (product.model.product_image_tag)
+저장 한번에 서버로 보낸 쿼리 수(Questions 세션 상태 값의 차이)와 시간을 측정한다.
+    - insert: 이미지 5개(사이즈 3개씩), 태그 --tags 개인 상품 등록
+    - update: 이미지 2개만 바꾸고 3개는 이전 상품 정보에서 복사, 태그 --tags 개인 상품 수정
+
+config 의 DATABASES 데이터베이스의 product_images, product_tags 테이블에 쓰고, 트랜잭션을 롤백해서 남기지 않는다.
+(상품 정보를 만들지 않도록 세션의 외래키 검사를 끈다)
+
+실행:
+    cd backend
+    python benchmark/product_write_benchmark.py [--rounds 200] [--tags 5]
+
+Authors:
+    leesh3@brandi.co.kr (이소헌)
+
+History:
+    2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from connection import _connect_database  # noqa: E402
+from product.model.product_image_tag import (  # noqa: E402
+    IMAGE_SIZES, copy_product_images, get_product_image_rows, insert_product_images, insert_product_tags
+)
+from utils import PRODUCT_IMAGE_ORDERS  # noqa: E402
+
+# 실제 상품 정보와 겹치지 않는 상품 정보 번호
+PREVIOUS_PRODUCT_INFO_ID = 2000000000
+PRODUCT_INFO_ID = 2000000001
+
+
+def get_images(changed_count):
+    # 앞의 changed_count 개는 새 이미지, 나머지는 바꾸지 않은 이미지(빈 딕셔너리)
+    images = {}
+    for index, image_order in enumerate(PRODUCT_IMAGE_ORDERS):
+        images[image_order] = {}
+        if index < changed_count:
+            for image_size_id, size in enumerate(IMAGE_SIZES, 1):
+                images[image_order][f'{size}_size_url'] = f'https://example.com/{image_order}_{size}.jpg'
+                images[image_order][f'{size}_image_size_id'] = image_size_id
+    return images
+
+
+def save_by_row(db_cursor, images, tags):
+    # 기존 방식
+    for image_set, image in images.items():
+        image_order = image_set[-1]
+        if image:
+            for size in IMAGE_SIZES:
+                db_cursor.execute("""
+                    INSERT INTO product_images(image_url, product_info_id, image_size_id, image_order)
+                    VALUES (%(image_url)s, %(product_info_id)s, %(image_size_id)s, %(image_order)s)
+                """, {
+                    'image_url': image[f'{size}_size_url'],
+                    'product_info_id': PRODUCT_INFO_ID,
+                    'image_size_id': image[f'{size}_image_size_id'],
+                    'image_order': image_order,
+                })
+        else:
+            for image_size_id in range(1, len(IMAGE_SIZES) + 1):
+                db_cursor.execute("""
+                    INSERT INTO product_images(image_url, image_size_id, image_order, product_info_id)
+                    SELECT image_url, image_size_id, image_order, %(product_info_id)s
+                    FROM product_images
+                    WHERE product_info_id = %(previous_product_info_id)s
+                    AND image_order = %(image_order)s AND image_size_id = %(image_size_id)s
+                """, {
+                    'product_info_id': PRODUCT_INFO_ID,
+                    'previous_product_info_id': PREVIOUS_PRODUCT_INFO_ID,
+                    'image_order': image_order,
+                    'image_size_id': image_size_id,
+                })
+
+    for tag in tags:
+        db_cursor.execute("""
+            INSERT INTO product_tags(name, product_info_id)
+            VALUES (%(name)s, %(product_info_id)s)
+        """, {'name': tag, 'product_info_id': PRODUCT_INFO_ID})
+
+
+def save_by_batch(db_cursor, images, tags):
+    image_rows, _, unchanged_image_orders = get_product_image_rows(images, PRODUCT_INFO_ID)
+    insert_product_images(db_cursor, image_rows)
+    copy_product_images(db_cursor, PREVIOUS_PRODUCT_INFO_ID, PRODUCT_INFO_ID, unchanged_image_orders)
+    insert_product_tags(db_cursor, PRODUCT_INFO_ID, tags)
+
+
+def get_question_count(db_cursor):
+    db_cursor.execute("SHOW SESSION STATUS LIKE 'Questions'")
+    return int(db_cursor.fetchone()['Value'])
+
+
+def measure(db_connection, name, save, scenario, images, tags, rounds):
+    statement_count = 0
+    elapsed = 0
+
+    with db_connection.cursor() as db_cursor:
+        db_cursor.execute("SET SESSION FOREIGN_KEY_CHECKS = 0")
+
+        for _ in range(rounds):
+            db_cursor.execute("START TRANSACTION")
+
+            # 수정할 이전 상품 정보의 이미지 (측정 제외)
+            previous_rows, _, _ = get_product_image_rows(get_images(len(PRODUCT_IMAGE_ORDERS)), PREVIOUS_PRODUCT_INFO_ID)
+            insert_product_images(db_cursor, previous_rows)
+
+            # SHOW SESSION STATUS 자신도 Questions 에 포함되므로 1을 뺌
+            question_count = get_question_count(db_cursor)
+            started_at = time.perf_counter()
+            save(db_cursor, images, tags)
+            elapsed += time.perf_counter() - started_at
+            statement_count += get_question_count(db_cursor) - question_count - 1
+
+            db_connection.rollback()
+
+        db_cursor.execute("SET SESSION FOREIGN_KEY_CHECKS = 1")
+
+    print(f'{scenario:<7} {name:<6} statements/save {statement_count / rounds:6.1f}  '
+          f'{elapsed / rounds * 1000:8.3f} ms/save')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='상품 이미지, 태그 저장 벤치마크')
+    parser.add_argument('--rounds', type=int, default=200)
+    parser.add_argument('--tags', type=int, default=5)
+    args = parser.parse_args()
+
+    tags = [f'태그{index}' for index in range(args.tags)]
+    scenarios = {
+        'insert': get_images(len(PRODUCT_IMAGE_ORDERS)),
+        'update': get_images(2),
+    }
+
+    db_connection = _connect_database()
+    try:
+        print(f'rounds: {args.rounds}, tags: {args.tags}')
+        for scenario, images in scenarios.items():
+            measure(db_connection, 'row', save_by_row, scenario, images, tags, args.rounds)
+            measure(db_connection, 'batch', save_by_batch, scenario, images, tags, args.rounds)
+
+    finally:
+        db_connection.rollback()
+        db_connection.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+""" 상품명 / 셀러명 부분 검색 벤치마크
+
+product_list_view 와 같은 형태의 임시 테이블에 상품을 채우고, 부분 검색 쿼리를 두가지 방식으로 비교한다.
+    - like: LIKE '%검색어%' 조건 (인덱스를 사용할 수 없어 전체 row 를 읽음)
+    - ngram: ngram 전문 검색 인덱스 + MATCH ... AGAINST (BOOLEAN MODE) 조건 (schema v2.9, ListQuery.add_text_search)
+검색어 별로 한 페이지(50건) 조회와 검색된 상품 수 조회 시간을 측정한다.
+
+config 의 DATABASES 데이터베이스에 bench_product_list 테이블을 만들고 끝나면 삭제한다.
+
+실행:
+    cd backend
+    python benchmark/text_search_benchmark.py [--rows 1000000] [--rounds 50]
+
+Authors:
+    leesh3@brandi.co.kr (이소헌)
+
+History:
+    2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from connection import _connect_database  # noqa: E402
+from list_query import ListQuery  # noqa: E402
+
+INSERT_BATCH_SIZE = 5000
+PAGE_SIZE = 50
+
+# 상품명을 만들 단어
+ADJECTIVES = ['데일리', '베이직', '오버핏', '슬림', '루즈핏', '크롭', '빈티지', '린넨', '니트', '체크', '스트라이프', '플라워']
+ITEMS = ['셔츠', '블라우스', '원피스', '슬랙스', '청바지', '가디건', '자켓', '코트', '스커트', '티셔츠', '후드', '맨투맨']
+COLORS = ['블랙', '화이트', '아이보리', '베이지', '네이비', '그레이', '카키', '핑크', '스카이블루', '브라운']
+SELLERS = [f'{prefix}{suffix}' for prefix in ['러블리', '모던', '심플', '어반', '로맨틱', '캐주얼'] for suffix in ['하우스', '룩', '클로젯', '스토어', '마켓']]
+
+# 검색어 (단어 하나, 단어 일부, 두 단어)
+KEYWORDS = ['원피스', '블루', '오버핏 셔츠', '린넨 슬랙스', '가디', '스트라이프 티셔츠']
+
+
+def create_table(db_cursor):
+    db_cursor.execute("DROP TABLE IF EXISTS bench_product_list")
+    db_cursor.execute("""
+        CREATE TABLE bench_product_list (
+            product_no INT NOT NULL AUTO_INCREMENT,
+            created_at DATETIME NOT NULL,
+            product_name VARCHAR(45) NOT NULL,
+            seller_name VARCHAR(45) NOT NULL,
+            PRIMARY KEY (product_no),
+            INDEX IX_bench_created_at (created_at, product_no)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """)
+
+
+def generate_rows(db_connection, row_count):
+    insert_statement = """
+        INSERT INTO bench_product_list (created_at, product_name, seller_name)
+        VALUES (%s, %s, %s)
+    """
+    rows = []
+    with db_connection.cursor() as db_cursor:
+        for product_no in range(1, row_count + 1):
+            product_name = f'{random.choice(ADJECTIVES)} {random.choice(COLORS)} {random.choice(ITEMS)}'
+            created_at = f'2020-{random.randint(1, 12):02d}-{random.randint(1, 28):02d} {random.randint(0, 23):02d}:00:00'
+            rows.append((created_at, product_name, random.choice(SELLERS)))
+
+            if len(rows) >= INSERT_BATCH_SIZE:
+                db_cursor.executemany(insert_statement, rows)
+                rows = []
+
+        if rows:
+            db_cursor.executemany(insert_statement, rows)
+
+    db_connection.commit()
+
+
+def build_query(name, keyword):
+    # 상품 리스트와 같은 방식으로 조회 쿼리를 만듦
+    query = ListQuery(
+        'product_no, created_at, product_name, seller_name',
+        'FROM bench_product_list WHERE 1 = 1',
+        {'product_name': keyword}
+    )
+
+    if name == 'ngram':
+        query.add_text_search('product_name', 'product_name')
+    else:
+        # 단어마다 LIKE '%단어%' (ngram 검색과 같은 결과)
+        for index, word in enumerate(keyword.split()):
+            query.params[f'word_{index}'] = f'%{word}%'
+            query.add_filter(f'product_name LIKE %(word_{index})s')
+
+    return query
+
+
+def measure(db_cursor, name, rounds):
+    for keyword in KEYWORDS:
+        query = build_query(name, keyword)
+
+        page_elapsed = 0
+        count_elapsed = 0
+        for _ in range(rounds):
+            started_at = time.perf_counter()
+            query.fetch_page(db_cursor, 'created_at DESC, product_no DESC', limit=PAGE_SIZE, with_count=False)
+            page_elapsed += time.perf_counter() - started_at
+
+            started_at = time.perf_counter()
+            product_count = query.count(db_cursor)
+            count_elapsed += time.perf_counter() - started_at
+
+        print(f'{name:<6} {keyword:<14} page {page_elapsed / rounds * 1000:10.3f} ms  '
+              f'count {count_elapsed / rounds * 1000:10.3f} ms  matched={product_count}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='상품명 부분 검색 벤치마크')
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--rounds', type=int, default=50)
+    args = parser.parse_args()
+
+    db_connection = _connect_database()
+    try:
+        with db_connection.cursor() as db_cursor:
+            create_table(db_cursor)
+
+        print(f'rows: {args.rows}, rounds: {args.rounds}')
+        generate_rows(db_connection, args.rows)
+
+        with db_connection.cursor() as db_cursor:
+            db_cursor.execute("ANALYZE TABLE bench_product_list")
+            db_cursor.fetchall()
+            print()
+            measure(db_cursor, 'like', args.rounds)
+
+            # schema v2.9 의 ngram 전문 검색 인덱스
+            started_at = time.perf_counter()
+            db_cursor.execute("SET SESSION innodb_ft_enable_stopword = OFF")
+            db_cursor.execute(
+                "CREATE FULLTEXT INDEX IX_bench_product_name_ngram ON bench_product_list (product_name) WITH PARSER ngram"
+            )
+            print(f'\nngram index build {time.perf_counter() - started_at:.1f} s\n')
+            measure(db_cursor, 'ngram', args.rounds)
+
+    finally:
+        with db_connection.cursor() as db_cursor:
+            db_cursor.execute("DROP TABLE IF EXISTS bench_product_list")
+        db_connection.close()
+
+
+if __name__ == '__main__':
+    main()
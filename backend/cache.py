@@ -0,0 +1,150 @@
+import threading
+import time
+from collections import OrderedDict
+
+from config import SECRET
+
+
+class TTLCache:
+
+    """ 만료 시간(TTL)과 최대 크기(LRU)가 정해진 프로세스 내부 캐시
+
+    - 저장된 후 ttl(초) 이 지난 값은 없는 값으로 취급하고 지운다.
+    - max_size 를 넘으면 가장 오래 사용되지 않은 값부터 지운다.
+    - 적중(hit) / 실패(miss) 횟수를 기록해서 stats() 로 확인할 수 있다.
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+
+    def __init__(self, max_size=1024, ttl=60):
+        if max_size < 1 or ttl <= 0:
+            raise ValueError('INVALID_CACHE_SIZE')
+
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+
+        # key: (value, 만료 시각). 가장 최근에 사용된 값이 오른쪽 끝에 위치한다.
+        self._items = OrderedDict()
+
+        # 캐시 통계
+        self._hit_count = 0
+        self._miss_count = 0
+        self._expired_count = 0
+        self._evicted_count = 0
+        self._invalidated_count = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._items.get(key)
+
+            if item is None:
+                self._miss_count += 1
+                return default
+
+            value, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._items[key]
+                self._expired_count += 1
+                self._miss_count += 1
+                return default
+
+            self._items.move_to_end(key)
+            self._hit_count += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._items[key] = (value, time.monotonic() + self.ttl)
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+                self._evicted_count += 1
+
+    def invalidate(self, key):
+        with self._lock:
+            if self._items.pop(key, None) is not None:
+                self._invalidated_count += 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def stats(self):
+        """ 캐시 통계 (크기, 적중 / 실패 횟수, 적중률 등) """
+        with self._lock:
+            lookup_count = self._hit_count + self._miss_count
+            return {
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'size': len(self._items),
+                'hit_count': self._hit_count,
+                'miss_count': self._miss_count,
+                'hit_rate': self._hit_count / lookup_count if lookup_count else 0.0,
+                'expired_count': self._expired_count,
+                'evicted_count': self._evicted_count,
+                'invalidated_count': self._invalidated_count,
+            }
+
+
+# login_required 에서 사용하는 계정 정보 캐시 (account_no: {'auth_type_id', 'is_deleted'})
+# 프로세스마다 따로 존재하므로 다른 프로세스에서 변경된 계정은 최대 ttl 만큼 늦게 반영된다.
+account_cache = TTLCache(
+    max_size=SECRET.get('account_cache_max_size', 4096),
+    ttl=SECRET.get('account_cache_ttl', 60),
+)
+
+
+def invalidate_account_cache(account_no):
+
+    """ 계정 정보 캐시 무효화
+
+    계정의 권한, 삭제 여부, 비밀번호, 셀러 상태 등이 바뀌는 곳에서
+    커밋 후 호출해서 다음 요청부터 데이터베이스의 최신 정보를 사용하도록 한다.
+
+    Args:
+        account_no: 변경된 계정 번호
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    account_cache.invalidate(account_no)
+
+
+def get_account_cache_stats():
+    """ 계정 정보 캐시 통계 (적중 / 실패 횟수 등) """
+    return account_cache.stats()
+
+
+# 리스트의 전체(필터 없는) 건수. 페이지를 넘길 때마다 다시 세지 않도록 짧게 보관
+list_count_cache = TTLCache(
+    max_size=SECRET.get('list_count_cache_max_size', 64),
+    ttl=SECRET.get('list_count_cache_ttl', 60),
+)
+
+
+def invalidate_list_count_cache(list_name):
+
+    """ 리스트 전체 건수 캐시 무효화
+
+    리스트에 row 가 추가되거나 삭제되는 곳에서 커밋 후 호출한다.
+
+    Args:
+        list_name: 리스트 이름 (예: seller_list)
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    list_count_cache.invalidate(list_name)
@@ -1,35 +1,597 @@
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections import deque
+
 import pymysql
-import mysql.connector
 import boto3
+from botocore.config import Config as BotoConfig
 
-from flask import jsonify
+from flask import jsonify, g, has_app_context
 
-from mysql.connector.errors import InterfaceError, ProgrammingError, NotSupportedError
 from config import DATABASES, S3_CONFIG
 
 
+class LocalS3Client:
+
+    """ 로컬 파일시스템을 사용하는 s3 클라이언트 대체 객체
+
+    테스트나 로컬 개발 환경에서 s3 대신 root 디렉토리 아래 {bucket}/{key} 경로에 파일을 저장한다.
+    이 프로젝트에서 사용하는 boto3 s3 클라이언트의 매서드만 같은 인자로 구현한다.
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def _path(self, bucket, key):
+        path = os.path.abspath(os.path.join(self.root, bucket, key))
+        if not path.startswith(os.path.abspath(self.root) + os.sep):
+            raise ValueError('INVALID_KEY')
+        return path
+
+    def put_object(self, Body, Bucket, Key, **kwargs):
+        path = self._path(Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, 'wb') as local_file:
+            if isinstance(Body, (bytes, bytearray)):
+                local_file.write(Body)
+            else:
+                shutil.copyfileobj(Body, local_file)
+        return {}
+
+    def upload_file(self, Filename, Bucket, Key, **kwargs):
+        with open(Filename, 'rb') as source_file:
+            self.put_object(Body=source_file, Bucket=Bucket, Key=Key)
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, **kwargs):
+        self.put_object(Body=Fileobj, Bucket=Bucket, Key=Key)
+
+    def get_object(self, Bucket, Key, **kwargs):
+        path = self._path(Bucket, Key)
+        return {'Body': open(path, 'rb'), 'ContentLength': os.path.getsize(path)}
+
+    def delete_object(self, Bucket, Key, **kwargs):
+        try:
+            os.remove(self._path(Bucket, Key))
+        except FileNotFoundError:
+            pass
+        return {}
+
+    def delete_objects(self, Bucket, Delete, **kwargs):
+        for deleted_object in Delete['Objects']:
+            self.delete_object(Bucket=Bucket, Key=deleted_object['Key'])
+        return {}
+
+    # multipart 업로드: part 는 root/.multipart/{UploadId}/ 아래에 저장했다가 complete 에서 합침
+    def _multipart_path(self, upload_id, part_number=None):
+        if not upload_id.isalnum():
+            raise ValueError('INVALID_UPLOAD_ID')
+
+        path = os.path.join(self.root, '.multipart', upload_id)
+        return path if part_number is None else os.path.join(path, str(int(part_number)))
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        upload_id = uuid.uuid4().hex
+        os.makedirs(self._multipart_path(upload_id))
+        return {'Bucket': Bucket, 'Key': Key, 'UploadId': upload_id}
+
+    def upload_part(self, Body, Bucket, Key, PartNumber, UploadId, **kwargs):
+        with open(self._multipart_path(UploadId, PartNumber), 'wb') as part_file:
+            part_file.write(Body)
+        return {'ETag': f'"{UploadId}-{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload, **kwargs):
+        path = self._path(Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, 'wb') as local_file:
+            for part in sorted(MultipartUpload['Parts'], key=lambda part: part['PartNumber']):
+                with open(self._multipart_path(UploadId, part['PartNumber']), 'rb') as part_file:
+                    shutil.copyfileobj(part_file, local_file)
+
+        shutil.rmtree(self._multipart_path(UploadId), ignore_errors=True)
+        return {'Bucket': Bucket, 'Key': Key}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId, **kwargs):
+        shutil.rmtree(self._multipart_path(UploadId), ignore_errors=True)
+        return {}
+
+
+def _create_boto3_s3_client():
+    """ 커넥션 풀 크기, 재시도 횟수, 타임아웃이 설정된 boto3 s3 클라이언트 생성 """
+    client_config = BotoConfig(
+        max_pool_connections=S3_CONFIG.get('max_pool_connections', 20),
+        connect_timeout=S3_CONFIG.get('connect_timeout', 5),
+        read_timeout=S3_CONFIG.get('read_timeout', 30),
+        retries={
+            'max_attempts': S3_CONFIG.get('max_attempts', 3),
+            'mode': S3_CONFIG.get('retry_mode', 'standard'),
+        },
+    )
+
+    return boto3.client(
+        's3',
+        aws_access_key_id=S3_CONFIG['AWS_ACCESS_KEY_ID'],
+        aws_secret_access_key=S3_CONFIG['AWS_SECRET_ACCESS_KEY'],
+        region_name=S3_CONFIG['REGION_NAME'],
+        config=client_config,
+    )
+
+
+def _create_local_s3_client():
+    """ S3_CONFIG 의 local_root 디렉토리를 사용하는 로컬 s3 클라이언트 생성 """
+    return LocalS3Client(S3_CONFIG.get('local_root', 'local_s3'))
+
+
+# S3_CONFIG 의 backend 값에 따라 사용할 s3 클라이언트 생성 함수
+S3_BACKENDS = {
+    's3': _create_boto3_s3_client,
+    'local': _create_local_s3_client,
+}
+
+_s3_connection = None
+_s3_connection_lock = threading.Lock()
+
+
 def get_s3_connection():
 
     """ s3와 커넥션을 만들어주는 함수
 
-    import 되어서 사용될 때 마다 하나의 s3 커넥션이 생긴다
+    처음 호출될 때 한번만 s3 클라이언트를 만들고, 이후에는 같은 클라이언트를 프로세스 전체에서 같이 사용한다.
+    boto3 클라이언트는 스레드간에 공유해도 안전하며, 내부 커넥션 풀을 재사용한다.
+    S3_CONFIG 에 선택적으로 설정할 수 있는 값
+        backend: 's3' (기본) 또는 'local' (local_root 디렉토리에 저장)
+        max_pool_connections: 커넥션 풀 크기 (기본 20)
+        connect_timeout, read_timeout: 타임아웃(초) (기본 5, 30)
+        max_attempts, retry_mode: 재시도 횟수와 방식 (기본 3, 'standard')
 
     Returns:
         s3_connection 객체
 
     Authors:
         yoonhc@brandi.co.kr (윤희철)
+        leesh3@brandi.co.kr (이소헌)
 
     History:
         2020-04-01 (yoonhc@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): 매번 클라이언트를 만들지 않고 하나의 클라이언트를 공유하도록 변경, backend 선택 추가
     """
-    s3_connection = boto3.client(
-        's3',
-        aws_access_key_id=S3_CONFIG['AWS_ACCESS_KEY_ID'],
-        aws_secret_access_key=S3_CONFIG['AWS_SECRET_ACCESS_KEY'],
-        region_name=S3_CONFIG['REGION_NAME'],
-    )
-    return s3_connection
+    global _s3_connection
+
+    if _s3_connection is None:
+        with _s3_connection_lock:
+            if _s3_connection is None:
+                _s3_connection = S3_BACKENDS[S3_CONFIG.get('backend', 's3')]()
+
+    return _s3_connection
+
+
+def set_s3_connection(s3_connection):
+    """ 공유하는 s3 클라이언트를 교체 (테스트에서 LocalS3Client 등으로 바꿀 때 사용). None 이면 다음 호출 때 새로 생성 """
+    global _s3_connection
+
+    with _s3_connection_lock:
+        _s3_connection = s3_connection
+
+
+class PoolTimeoutError(Exception):
+    """ 제한 시간 안에 커넥션 풀에서 커넥션을 받지 못했을 때 발생하는 에러 """
+    pass
+
+
+class PooledConnection:
+
+    """ 커넥션 풀에서 빌려온 데이터베이스 커넥션
+
+    pymysql 커넥션의 모든 속성을 그대로 사용할 수 있고, close() 를 호출하면
+    실제로 연결을 끊지 않고 커넥션 풀에 반납한다.
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+
+    def __init__(self, pool, raw_connection):
+        self._pool = pool
+        self._raw_connection = raw_connection
+
+    def __getattr__(self, name):
+        if self._raw_connection is None:
+            raise pymysql.err.InterfaceError('CONNECTION_ALREADY_RELEASED')
+        return getattr(self._raw_connection, name)
+
+    # pymysql 커넥션과 동일하게 with 문에서 커서를 리턴하고, 종료시 commit / rollback
+    def __enter__(self):
+        return self._raw_connection.__enter__()
+
+    def __exit__(self, exc_type, exc_value, exc_trace):
+        return self._raw_connection.__exit__(exc_type, exc_value, exc_trace)
+
+    def close(self):
+        # 두번 이상 호출되어도 커넥션은 한번만 반납
+        if self._raw_connection is not None:
+            raw_connection, self._raw_connection = self._raw_connection, None
+            self._pool.release(raw_connection)
+
+
+class RequestConnection(PooledConnection):
+
+    """ 하나의 요청 안에서 데코레이터, 뷰, 서비스, DAO 가 같이 사용하는 커넥션
+
+    뷰에서 close() 를 호출해도 반납하지 않고, 요청이 끝날 때 teardown 에서 release() 로 반납한다.
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+
+    def close(self):
+        pass
+
+    def release(self):
+        super().close()
+
+
+class ConnectionPool:
+
+    """ 최소 / 최대 크기가 정해진 데이터베이스 커넥션 풀
+
+    - 최대 크기 만큼 커넥션이 모두 사용중이면 timeout 까지 반납을 기다린다.
+    - 커넥션을 빌려줄 때 ping 으로 살아있는지 확인하고, 끊어진 커넥션은 새로 만든다.
+    - max_idle_time 보다 오래 쉬고 있는 커넥션은 최소 크기를 넘는 만큼 정리한다.
+    - 반납된 커넥션은 rollback 해서 끝나지 않은 트랜잭션이 다음 요청으로 넘어가지 않도록 한다.
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+
+    def __init__(self, connect, min_size=1, max_size=10, max_idle_time=300, timeout=10):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError('INVALID_POOL_SIZE')
+
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_idle_time = max_idle_time
+        self.timeout = timeout
+
+        self._condition = threading.Condition()
+
+        # (커넥션, 반납 시각) 을 담는 deque. 가장 최근에 반납된 커넥션부터 다시 사용한다.
+        self._idle = deque()
+        self._size = 0
+        self._in_use = 0
+        self._waiting = 0
+
+        # 풀 통계
+        self._checkout_count = 0
+        self._timeout_count = 0
+        self._created_count = 0
+        self._discarded_count = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    def fill(self):
+        """ 최소 크기 만큼 커넥션을 미리 만들어 둔다. """
+        while True:
+            with self._condition:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+
+            try:
+                raw_connection = self._create()
+            except Exception:
+                with self._condition:
+                    self._size -= 1
+                    self._condition.notify()
+                raise
+
+            with self._condition:
+                self._idle.append((raw_connection, time.monotonic()))
+                self._condition.notify()
+
+    def get_connection(self, timeout=None, connection_class=PooledConnection):
+
+        """ 커넥션 풀에서 커넥션을 빌려옴
+
+        쉬고 있는 커넥션이 있으면 ping 으로 확인 후 빌려주고,
+        없으면 최대 크기 안에서 새로 만들고,
+        최대 크기에 도달했으면 timeout 까지 다른 요청의 반납을 기다린다.
+
+        Args:
+            timeout: 커넥션을 기다릴 최대 시간(초), None 이면 풀의 기본값
+            connection_class: 빌려준 커넥션을 감쌀 클래스(PooledConnection, RequestConnection)
+
+        Returns:
+            PooledConnection 객체
+
+        Raises:
+            PoolTimeoutError: timeout 안에 커넥션을 받지 못한 경우
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started_at = time.monotonic()
+        deadline = started_at + timeout
+        raw_connection = None
+
+        with self._condition:
+            self._waiting += 1
+            try:
+                while True:
+                    self._evict_idle_connections()
+
+                    if self._idle:
+                        raw_connection, _ = self._idle.pop()
+                        break
+
+                    # 새로 만들 자리를 먼저 예약하고, 실제 연결은 lock 밖에서 진행
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeout_count += 1
+                        raise PoolTimeoutError('DATABASE_CONNECTION_POOL_TIMEOUT')
+
+                    self._condition.wait(remaining)
+
+                self._in_use += 1
+                self._checkout_count += 1
+                wait_time = time.monotonic() - started_at
+                self._total_wait_time += wait_time
+                self._max_wait_time = max(self._max_wait_time, wait_time)
+
+            finally:
+                self._waiting -= 1
+
+        try:
+            # 쉬고 있던 커넥션은 살아있는지 확인하고, 끊어졌으면 새로 만든다.
+            if raw_connection is not None and not self._is_alive(raw_connection):
+                self._close_quietly(raw_connection)
+                with self._condition:
+                    self._discarded_count += 1
+                raw_connection = None
+
+            if raw_connection is None:
+                raw_connection = self._create()
+
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+
+        return connection_class(self, raw_connection)
+
+    def release(self, raw_connection):
+
+        """ 빌려준 커넥션을 풀에 반납
+
+        커밋되지 않은 트랜잭션은 rollback 하고, rollback 에 실패한 커넥션은 버린다.
+
+        Args:
+            raw_connection: 반납할 pymysql 커넥션 객체
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+        try:
+            raw_connection.rollback()
+            is_reusable = raw_connection.open
+
+        except Exception:
+            is_reusable = False
+
+        with self._condition:
+            self._in_use -= 1
+
+            if is_reusable:
+                self._idle.append((raw_connection, time.monotonic()))
+            else:
+                self._size -= 1
+                self._discarded_count += 1
+
+            self._condition.notify()
+
+        if not is_reusable:
+            self._close_quietly(raw_connection)
+
+    def evict_idle_connections(self):
+        """ max_idle_time 을 넘긴 커넥션을 최소 크기까지 정리한다. """
+        with self._condition:
+            self._evict_idle_connections()
+
+    def stats(self):
+
+        """ 커넥션 풀 통계
+
+        Returns:
+            in_use: 사용중인 커넥션 수
+            idle: 쉬고 있는 커넥션 수
+            waiting: 커넥션을 기다리고 있는 요청 수
+            avg_wait_time / max_wait_time: 커넥션을 받기까지 기다린 시간(초)
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+        with self._condition:
+            return {
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'size': self._size,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'waiting': self._waiting,
+                'checkout_count': self._checkout_count,
+                'timeout_count': self._timeout_count,
+                'created_count': self._created_count,
+                'discarded_count': self._discarded_count,
+                'total_wait_time': self._total_wait_time,
+                'avg_wait_time': self._total_wait_time / self._checkout_count if self._checkout_count else 0.0,
+                'max_wait_time': self._max_wait_time,
+            }
+
+    def close(self):
+        """ 쉬고 있는 커넥션을 모두 끊는다. 사용중인 커넥션은 반납될 때 다시 풀에 들어온다. """
+        with self._condition:
+            idle_connections = [raw_connection for raw_connection, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle_connections)
+
+        for raw_connection in idle_connections:
+            self._close_quietly(raw_connection)
+
+    def _create(self):
+        raw_connection = self._connect()
+        with self._condition:
+            self._created_count += 1
+        return raw_connection
+
+    def _evict_idle_connections(self):
+        # lock 을 잡은 상태에서 호출. 가장 오래 쉰 커넥션은 deque 의 왼쪽에 있다.
+        now = time.monotonic()
+        while (self._idle
+               and self._size > self.min_size
+               and now - self._idle[0][1] > self.max_idle_time):
+            raw_connection, _ = self._idle.popleft()
+            self._size -= 1
+            self._discarded_count += 1
+            self._close_quietly(raw_connection)
+
+    @staticmethod
+    def _is_alive(raw_connection):
+        try:
+            raw_connection.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(raw_connection):
+        try:
+            raw_connection.close()
+        except Exception:
+            pass
+
+
+_connection_pool = None
+_connection_pool_lock = threading.Lock()
+
+
+def _connect_database():
+    db_config = {
+        'database': DATABASES['database'],
+        'user': DATABASES['user'],
+        'password': DATABASES['password'],
+        'host': DATABASES['host'],
+        'port': DATABASES['port'],
+        'charset': DATABASES['charset'],
+        'cursorclass': pymysql.cursors.DictCursor,
+    }
+    return pymysql.connect(**db_config)
+
+
+def get_connection_pool():
+
+    """ 프로세스에서 공유하는 데이터베이스 커넥션 풀
+
+    처음 호출될 때 config 의 DATABASES 설정으로 풀을 만들고 최소 크기만큼 커넥션을 채운다.
+    풀 설정은 DATABASES 에 선택적으로 추가할 수 있다.
+        pool_min_size: 최소 커넥션 수 (기본 1)
+        pool_max_size: 최대 커넥션 수 (기본 10)
+        pool_max_idle_time: 커넥션이 쉴 수 있는 최대 시간(초) (기본 300)
+        pool_timeout: 커넥션을 기다리는 최대 시간(초) (기본 10)
+
+    Returns:
+        ConnectionPool 객체
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    global _connection_pool
+
+    if _connection_pool is None:
+        with _connection_pool_lock:
+            if _connection_pool is None:
+                pool = ConnectionPool(
+                    _connect_database,
+                    min_size=DATABASES.get('pool_min_size', 1),
+                    max_size=DATABASES.get('pool_max_size', 10),
+                    max_idle_time=DATABASES.get('pool_max_idle_time', 300),
+                    timeout=DATABASES.get('pool_timeout', 10),
+                )
+                pool.fill()
+                _connection_pool = pool
+
+    return _connection_pool
+
+
+def get_request_db_connection():
+
+    """ 요청 단위 데이터베이스 커넥션
+
+    요청 안에서 처음 호출될 때 커넥션 풀에서 커넥션을 빌려 flask.g 에 저장하고,
+    같은 요청 안에서는 데코레이터, 뷰, 서비스, DAO 가 모두 이 커넥션을 같이 사용한다.
+    반납은 close_request_db_connection(teardown) 에서 한번만 한다.
+
+    Returns:
+        RequestConnection 객체
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    if 'db_connection' not in g:
+        g.db_connection = get_connection_pool().get_connection(connection_class=RequestConnection)
+
+    return g.db_connection
+
+
+def close_request_db_connection(exception=None):
+    """ app context 가 끝날 때 요청 단위 커넥션을 커넥션 풀에 반납 (teardown_appcontext 에 등록) """
+    db_connection = g.pop('db_connection', None)
+    if db_connection is not None:
+        db_connection.release()
+
+
+def get_db_pool_stats():
+    """ 데이터베이스 커넥션 풀 통계 (사용중, 대기, 대기시간 등) """
+    return get_connection_pool().stats()
 
 
 class DatabaseConnection:
@@ -38,8 +600,8 @@ class DatabaseConnection:
 
         """ 데이터베이스 커넥션을 만들어주는 클래스.
 
-        import 되어서 사용될 때 마다 하나의 데이터베이스 커넥션이 생긴다.
-        하나의 요청에 하나의 커넥션이라는 독립성을 지켜주기 위해서 connection 은 요청이 들어올 때 마다 만들어준다.
+        get_db_connection 으로 커넥션을 가져온다. 요청 처리 중에는 데코레이터와 같은 요청 단위 커넥션을 사용하고,
+        close 를 호출해도 요청이 끝날 때 한번만 커넥션 풀에 반납한다.
 
         Returns:
             database connection 객체
@@ -51,32 +613,25 @@ class DatabaseConnection:
         History:
             2020-03-30 (yoonhc@brandi.co.kr): 초기 생성
             2020-04-01 (leesh3@brandi.co.kr): 클래스화
+            2026-10-17 (leesh3@brandi.co.kr): 매 요청마다 연결하지 않고 커넥션 풀에서 빌려오도록 변경
+            2026-10-17 (leesh3@brandi.co.kr): 요청 처리 중에는 요청 단위 커넥션을 사용하도록 변경
 
         """
-        self.db_config = {
-            'database': DATABASES['database'],
-            'user': DATABASES['user'],
-            'password': DATABASES['password'],
-            'host': DATABASES['host'],
-            'port': DATABASES['port'],
-            'charset': DATABASES['charset'],
-            'collation': DATABASES['collation'],
-        }
         try:
-            self.db_connection = mysql.connector.connect(**self.db_config)
+            self.db_connection = get_db_connection()
 
-        except InterfaceError as e:
-            print(f'INTERFACE_ERROR_WITH {e}')
+        except PoolTimeoutError as e:
+            print(f'POOL_TIMEOUT_ERROR_WITH {e}')
 
-        except ProgrammingError as e:
-            print(f'PROGRAMMING_ERROR_WITH {e}')
+        except pymysql.err.OperationalError as e:
+            print(f'OPERATIONAL_ERROR_WITH {e}')
 
-        except NotSupportedError as e:
-            print(f'NOT_SUPPORTED_ERROR_WITH {e}')
+        except pymysql.err.InterfaceError as e:
+            print(f'INTERFACE_ERROR_WITH {e}')
 
     def __enter__(self):
         try:
-            self.cursor = self.db_connection.cursor(buffered=True, dictionary=True)
+            self.cursor = self.db_connection.cursor()
             return self.cursor
 
         except AttributeError as e:
@@ -103,7 +658,10 @@ class DatabaseConnection:
 def get_db_connection():
     """ 데이터베이스 커넥션 생성
 
-    import 되어서 사용될 때 마다 하나의 데이터베이스 커넥션이 생성
+    요청 처리 중에는 요청 단위 커넥션(get_request_db_connection)을 리턴하고,
+    이 경우 close 는 무시되며 요청이 끝날 때 커넥션 풀에 반납됨.
+    요청 밖(백그라운드 작업 등)에서는 커넥션 풀에서 하나의 데이터베이스 커넥션을 빌려오고,
+    close 를 호출하면 커넥션이 끊어지지 않고 커넥션 풀에 반납됨.
 
     Returns:
         database connection 객체
@@ -113,16 +671,11 @@ def get_db_connection():
 
     History:
         2020-04-03 (leesh3@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): 커넥션 풀에서 빌려오도록 변경
+        2026-10-17 (leesh3@brandi.co.kr): 요청 처리 중에는 요청 단위 커넥션을 공유하도록 변경
 
     """
-    db_config = {
-        'database': DATABASES['database'],
-        'user': DATABASES['user'],
-        'password': DATABASES['password'],
-        'host': DATABASES['host'],
-        'port': DATABASES['port'],
-        'charset': DATABASES['charset'],
-        'cursorclass': pymysql.cursors.DictCursor,
-    }
-    db = pymysql.connect(**db_config)
-    return db
+    if has_app_context():
+        return get_request_db_connection()
+
+    return get_connection_pool().get_connection()
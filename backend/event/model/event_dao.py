@@ -1,5 +1,5 @@
 from flask import jsonify
-from mysql.connector.errors import Error
+from pymysql.err import Error
 
 
 class EventDao:
@@ -720,6 +720,7 @@ class EventDao:
             2020-04-10 (leejm3@brandi.co.kr): 초기 생성
             2020-04-10 (yoonhc@brandi.co.kr): 이벤트 타입이 상품이미지, 상품테스트, 유튜브인 경우 기획전 상품을 가져오는 기능 추가
             2020-04-15 (leejm3@brandi.co.kr): sql 문 별칭수정
+            2026-10-17 (leesh3@brandi.co.kr): 최신 이력 조건을 is_current 로 변경
         """
         try:
             with db_connection.cursor() as db_cursor:
@@ -776,7 +777,7 @@ class EventDao:
                     -- 해당 기획전 번호의 가장 최신 이력 정보를 가져옴
                     WHERE 
                         EV01.event_no = %(event_no)s 
-                        AND EV02.close_time = '2037-12-31 23:59:59'
+                        AND EV02.is_current = 1
                 """
 
                 db_cursor.execute(select_statement, {'event_no': event_no})
@@ -827,11 +828,11 @@ class EventDao:
                         
                         WHERE 
                             # 삭제되지 않은 상품 최신 정보 
-                            PI01.close_time = '2037-12-31 23:59:59' 
+                            PI01.is_current = 1 
                             AND PI01.is_deleted = 0
                             
                             # 삭제되지 않은 최신 셀러 정보  
-                            AND PI05.close_time = '2037-12-31 23:59:59'
+                            AND PI05.is_current = 1
                             AND PI05.is_deleted = 0
                             
                             # 기획전 상세 상품정보
@@ -895,6 +896,7 @@ class EventDao:
                 기획전타입이 상품이미지, 상품텍스트, 유튜브인 경우 event_detail_product_infos 테이블에 row 추가(값이 들어왔다면)
             2020-04-15 (leejm3@brandi.co.kr):
                 - 기획전 아이디가 존재하지 않을 경우 처리 추가
+            2026-10-17 (leesh3@brandi.co.kr): 최신 이력 조건을 is_current 로 변경
         """
         try:
             with db_connection.cursor() as db_cursor:
@@ -912,7 +914,7 @@ class EventDao:
                     
                     WHERE
                         -- 변경 전 최신 이력
-                        close_time = '2037-12-31 23:59:59'
+                        is_current = 1
                         AND event_id = %(event_no)s
                 """
 
@@ -1079,6 +1081,7 @@ class EventDao:
         History:
             2020-04-12 (leesh3@brandi.co.kr): 초기 생성
             2020-04-15 (leesh3@brandi.co.kr): offset, limit, 포함된 상품 추
+            2026-10-17 (leesh3@brandi.co.kr): 최신 이력 조건을 is_current 로 변경
         """
         try:
             with db_connection.cursor() as db_cursor:
@@ -1103,7 +1106,7 @@ class EventDao:
                         (
                             SELECT COUNT(0) FROM event_detail_product_infos
                             WHERE event_detail_product_infos.event_info_id = event_infos.event_info_no
-                            AND event_infos.close_time = '2037-12-31 23:59:59.0'
+                            AND event_infos.is_current = 1
                         ) as product_count                    
                     FROM
                         event_infos
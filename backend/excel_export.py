@@ -0,0 +1,286 @@
+import csv
+import gzip
+import io
+import uuid
+
+import pymysql
+from openpyxl import Workbook
+
+from config import S3_CONFIG
+from connection import get_s3_connection
+
+# 내려받기 파일을 올리는 버킷과 url
+EXPORT_BUCKET = 'brandi-intern'
+EXPORT_URL = 'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{key}'
+
+# s3 multipart 업로드의 최소 part 크기 (마지막 part 제외)
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+# 진행 상황(쓴 row 수)을 알리는 간격
+PROGRESS_INTERVAL = 1000
+
+# csv 를 한번에 인코딩해서 쓰는 row 수
+CSV_CHUNK_ROWS = 1000
+
+# 내려받기 파일 형식별 확장자, content type
+EXPORT_FILE_TYPES = {
+    'xlsx': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'csv': ('csv', 'text/csv; charset=utf-8'),
+}
+
+
+class S3MultipartWriter:
+
+    """ s3 multipart 업로드에 바로 쓰는 파일 객체
+
+    write 로 받은 데이터를 part_size 만큼 모아서 part 로 업로드하고, complete 에서 업로드를 끝낸다.
+    로컬 디스크에 파일을 만들지 않고, 메모리에는 part 하나만큼만 가지고 있는다.
+    seek 는 지원하지 않으므로 zipfile(openpyxl) 은 data descriptor 방식으로 쓴다.
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+
+    def __init__(self, s3, key, bucket=EXPORT_BUCKET, content_type=None, part_size=None):
+        self.s3 = s3
+        self.key = key
+        self.bucket = bucket
+        self.part_size = max(part_size or S3_CONFIG.get('export_part_size', 8 * 1024 * 1024), MIN_PART_SIZE)
+
+        upload_options = {'ContentType': content_type} if content_type else {}
+        self.upload_id = s3.create_multipart_upload(Bucket=bucket, Key=key, **upload_options)['UploadId']
+
+        self._buffer = bytearray()
+        self._parts = []
+        self._position = 0
+
+    def write(self, data):
+        self._buffer += data
+        self._position += len(data)
+
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[:self.part_size]))
+            del self._buffer[:self.part_size]
+
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def _upload_part(self, body):
+        part_number = len(self._parts) + 1
+        response = self.s3.upload_part(
+            Body=body,
+            Bucket=self.bucket,
+            Key=self.key,
+            PartNumber=part_number,
+            UploadId=self.upload_id
+        )
+        self._parts.append({'ETag': response['ETag'], 'PartNumber': part_number})
+
+    def complete(self):
+        """ 남은 데이터를 마지막 part 로 올리고 업로드를 끝냄. 업로드한 바이트 수를 리턴 """
+        if self._buffer or not self._parts:
+            self._upload_part(bytes(self._buffer))
+            self._buffer = bytearray()
+
+        self.s3.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            MultipartUpload={'Parts': self._parts}
+        )
+        return self._position
+
+    def abort(self):
+        """ 업로드를 취소하고 이미 올라간 part 를 삭제 """
+        try:
+            self.s3.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self.upload_id)
+        except Exception as e:
+            print(f'S3_ABORT_MULTIPART_UPLOAD_ERROR_WITH {e}')
+
+
+def iter_rows(db_connection, statement, params=None, fetch_size=None):
+
+    """ 서버 사이드 커서로 조회 결과를 fetch_size 개씩 가져오면서 한 row 씩 리턴
+
+    결과 전체를 메모리에 올리지 않는다. 모두 읽기 전에는 같은 커넥션으로 다른 쿼리를 실행할 수 없다.
+
+    Args:
+        db_connection: 데이터베이스 커넥션 객체
+        statement: 조회 쿼리
+        params: 쿼리에 바인딩할 값
+        fetch_size: 한번에 가져올 row 수 (기본 S3_CONFIG 의 export_fetch_size, 1000)
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    fetch_size = fetch_size or S3_CONFIG.get('export_fetch_size', 1000)
+
+    db_cursor = db_connection.cursor(pymysql.cursors.SSDictCursor)
+    try:
+        db_cursor.execute(statement, params)
+        while True:
+            rows = db_cursor.fetchmany(fetch_size)
+            if not rows:
+                break
+            yield from rows
+
+    finally:
+        db_cursor.close()
+
+
+def write_xlsx(rows, columns, file, index_header='번호', progress=None):
+
+    """ row 를 openpyxl write-only 워크북으로 써서 file 에 저장
+
+    첫 컬럼은 1부터 시작하는 번호이고, 나머지는 columns 순서대로 쓴다.
+
+    Args:
+        rows: 딕셔너리 row 를 리턴하는 iterable
+        columns: (엑셀 컬럼명, row 의 key) 목록
+        file: 파일 객체
+        index_header: 번호 컬럼명
+        progress: PROGRESS_INTERVAL row 마다, 그리고 마지막에 쓴 row 수를 인자로 호출할 함수
+
+    Returns:
+        쓴 row 수
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet()
+    worksheet.append([index_header] + [header for header, _ in columns])
+
+    row_count = 0
+    for row_count, row in enumerate(rows, 1):
+        worksheet.append([row_count] + [row[key] for _, key in columns])
+
+        if progress and row_count % PROGRESS_INTERVAL == 0:
+            progress(row_count)
+
+    workbook.save(file)
+
+    if progress:
+        progress(row_count)
+    return row_count
+
+
+def write_csv(rows, columns, file, index_header='번호', progress=None):
+
+    """ row 를 csv 로 file 에 씀
+
+    CSV_CHUNK_ROWS row 씩 문자열 버퍼에 쓰고 utf-8 로 인코딩해서 file 에 쓰므로 메모리에는 한 chunk 만 가지고 있는다.
+    엑셀에서 한글이 깨지지 않도록 utf-8 BOM 을 먼저 쓴다. 컬럼 순서는 write_xlsx 와 같다.
+
+    Args:
+        rows: 딕셔너리 row 를 리턴하는 iterable
+        columns: (컬럼명, row 의 key) 목록
+        file: 바이트를 쓰는 파일 객체
+        index_header: 번호 컬럼명
+        progress: write_xlsx 참고
+
+    Returns:
+        쓴 row 수
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    buffer = io.StringIO()
+    csv_writer = csv.writer(buffer)
+
+    def flush_buffer():
+        file.write(buffer.getvalue().encode('utf-8'))
+        buffer.seek(0)
+        buffer.truncate()
+
+    buffer.write('\ufeff')
+    csv_writer.writerow([index_header] + [header for header, _ in columns])
+
+    row_count = 0
+    for row_count, row in enumerate(rows, 1):
+        csv_writer.writerow([row_count] + [row[key] for _, key in columns])
+
+        if row_count % CSV_CHUNK_ROWS == 0:
+            flush_buffer()
+
+        if progress and row_count % PROGRESS_INTERVAL == 0:
+            progress(row_count)
+
+    flush_buffer()
+
+    if progress:
+        progress(row_count)
+    return row_count
+
+
+def export_rows_to_s3(db_connection, statement, params, columns, file_name=None, progress=None,
+                      file_format='xlsx', compress=False):
+
+    """ 조회 결과를 엑셀(xlsx) / csv 파일로 만들어 s3에 올리고 다운로드 url 을 리턴
+
+    서버 사이드 커서 -> openpyxl write-only 워크북 / csv chunk -> (gzip) -> s3 multipart 업로드로 바로 이어서 쓰기 때문에
+    셀러 / 상품 수와 관계없이 메모리 사용량이 일정하고, 요청마다 로컬 경로에 파일을 만들지 않는다.
+    (xlsx 시트 내용은 openpyxl 이 스스로 관리하는 임시 파일에 쌓였다가 바로 zip 으로 복사된다)
+    중간에 실패하면 multipart 업로드를 취소하고 에러를 다시 발생시킨다.
+
+    Args:
+        db_connection: 데이터베이스 커넥션 객체
+        statement: 조회 쿼리 (페이지네이션 없이 필터만 적용)
+        params: 쿼리에 바인딩할 값
+        columns: (엑셀 컬럼명, row 의 key) 목록
+        file_name: s3 key, 없으면 uuid 로 만듦
+        progress: 쓴 row 수를 알려줄 함수 (write_xlsx 참고)
+        file_format: 'xlsx' 또는 'csv'
+        compress: True 이면 gzip 으로 압축 (file_name 이 없으면 .gz 를 붙임)
+
+    Returns:
+        (다운로드 url, 쓴 row 수)
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): csv 형식과 gzip 압축 추가
+    """
+    extension, content_type = EXPORT_FILE_TYPES[file_format]
+    if compress:
+        extension, content_type = f'{extension}.gz', 'application/gzip'
+
+    file_name = file_name or f'{uuid.uuid4()}.{extension}'
+    writer = S3MultipartWriter(get_s3_connection(), file_name, content_type=content_type)
+
+    write_rows = write_csv if file_format == 'csv' else write_xlsx
+
+    try:
+        rows = iter_rows(db_connection, statement, params)
+        if compress:
+            with gzip.GzipFile(filename='', mode='wb', fileobj=writer) as gzip_file:
+                row_count = write_rows(rows, columns, gzip_file, progress=progress)
+        else:
+            row_count = write_rows(rows, columns, writer, progress=progress)
+
+        writer.complete()
+
+    except Exception:
+        writer.abort()
+        raise
+
+    return EXPORT_URL.format(key=file_name), row_count
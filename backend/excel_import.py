@@ -0,0 +1,80 @@
+import codecs
+import csv
+import os
+
+from openpyxl import load_workbook
+
+# 업로드할 수 있는 파일 확장자
+IMPORT_FILE_TYPES = ('.csv', '.xlsx')
+
+
+class ImportFileError(Exception):
+    """ 업로드된 파일을 읽을 수 없는 경우 (메세지는 응답 message 로 사용) """
+    pass
+
+
+def _iter_csv_rows(file):
+    # BOM 이 붙은 엑셀 저장 csv 도 읽을 수 있도록 utf-8-sig
+    try:
+        yield from csv.reader(codecs.iterdecode(file, 'utf-8-sig'))
+
+    except UnicodeDecodeError:
+        raise ImportFileError('INVALID_FILE_ENCODING')
+
+
+def _iter_xlsx_rows(file):
+    try:
+        workbook = load_workbook(file, read_only=True, data_only=True)
+    except Exception as e:
+        print(f'XLSX_LOAD_ERROR_WITH {e}')
+        raise ImportFileError('INVALID_FILE')
+
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+
+    finally:
+        workbook.close()
+
+
+def read_upload_rows(file, file_name):
+
+    """ 업로드된 csv / xlsx 파일을 한 row 씩 읽음
+
+    파일 전체를 메모리에 올리지 않는다. (csv reader, openpyxl read-only 워크북)
+    첫 row 는 컬럼명이고, 값이 모두 비어있는 row 는 건너뛴다.
+    csv 의 값은 문자열이고, xlsx 의 값은 셀 타입(숫자, 날짜 등)을 그대로 가진다.
+
+    Args:
+        file: 업로드된 파일 객체 (xlsx 는 seek 가능해야 함)
+        file_name: 업로드된 파일 이름 (확장자로 형식을 구분)
+
+    Returns:
+        (컬럼명 목록, (row 번호, {컬럼명: 값}) 을 리턴하는 iterator) row 번호는 컬럼명 row 가 1
+
+    Raises:
+        ImportFileError: UNSUPPORTED_FILE_TYPE, INVALID_FILE, INVALID_FILE_ENCODING, EMPTY_FILE
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    file_type = os.path.splitext(file_name or '')[1].lower()
+    if file_type not in IMPORT_FILE_TYPES:
+        raise ImportFileError('UNSUPPORTED_FILE_TYPE')
+
+    rows = _iter_csv_rows(file) if file_type == '.csv' else _iter_xlsx_rows(file)
+
+    header = next(rows, None)
+    if not header:
+        raise ImportFileError('EMPTY_FILE')
+    columns = [str(column).strip() if column is not None else '' for column in header]
+
+    def iter_rows():
+        for row_number, row in enumerate(rows, 2):
+            if all(value is None or value == '' for value in row):
+                continue
+            yield row_number, dict(zip(columns, row))
+
+    return columns, iter_rows()
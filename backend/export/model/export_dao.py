@@ -0,0 +1,352 @@
+# 파일 생성 작업 상태
+EXPORT_JOB_PENDING_STATUSES = ('pending', 'processing')
+
+EXPORT_JOB_COLUMNS = """
+    job_id,
+    list_name,
+    filter_key,
+    file_format,
+    compress,
+    status,
+    row_count,
+    file_key,
+    error,
+    created_at,
+    started_at,
+    finished_at
+"""
+
+
+class ExportDao:
+    """ 리스트 파일 생성 작업 모델
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+
+    """
+
+    # noinspection PyMethodMayBeStatic
+    def get_fresh_export_job(self, filter_info, db_connection):
+
+        """ 같은 필터로 재사용할 수 있는 최근 파일 생성 작업
+
+        아직 처리중이고 timeout 이 지나지 않은 작업이나, fresh_ttl 안에 완료된 작업 중 가장 최근 작업을 리턴한다.
+        (실패한 작업 제외)
+
+        Args:
+            filter_info:
+                filter_key: 필터 key (ExportJobQueue.get_filter_key)
+                timeout: 작업이 끝나야 하는 시간(초)
+                fresh_ttl: 완료된 작업을 재사용하는 시간(초)
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            작업 정보, 없으면 None
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        with db_connection.cursor() as db_cursor:
+            db_cursor.execute(f"""
+                SELECT
+                    {EXPORT_JOB_COLUMNS}
+                FROM
+                    export_jobs
+                WHERE
+                    filter_key = %(filter_key)s
+                AND
+                    (
+                        (status IN %(pending_statuses)s AND created_at >= NOW() - INTERVAL %(timeout)s SECOND)
+                        OR (status = 'done' AND finished_at >= NOW() - INTERVAL %(fresh_ttl)s SECOND)
+                    )
+                ORDER BY
+                    created_at DESC
+                LIMIT 1
+            """, {
+                'filter_key': filter_info['filter_key'],
+                'timeout': filter_info['timeout'],
+                'fresh_ttl': filter_info['fresh_ttl'],
+                'pending_statuses': EXPORT_JOB_PENDING_STATUSES,
+            })
+            return db_cursor.fetchone()
+
+    # noinspection PyMethodMayBeStatic
+    def insert_export_job(self, job_info, db_connection):
+
+        """ 파일 생성 작업 등록
+
+        작업 상태는 모든 프로세스에서 조회할 수 있도록 export_jobs 에 저장.
+
+        Args:
+            job_info:
+                job_id: 작업 번호
+                list_name: 리스트 이름
+                filter_key: 필터 key
+                file_format: 'xlsx' 또는 'csv'
+                compress: gzip 압축 여부
+            db_connection: 데이터베이스 커넥션 객체
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        try:
+            with db_connection.cursor() as db_cursor:
+                db_cursor.execute("""
+                    INSERT INTO export_jobs
+                    (
+                        job_id,
+                        list_name,
+                        filter_key,
+                        file_format,
+                        compress
+                    ) VALUES (
+                        %(job_id)s,
+                        %(list_name)s,
+                        %(filter_key)s,
+                        %(file_format)s,
+                        %(compress)s
+                    )
+                """, job_info)
+
+                db_connection.commit()
+
+        except Exception:
+            db_connection.rollback()
+            raise
+
+    # noinspection PyMethodMayBeStatic
+    def get_export_job(self, job_id, db_connection):
+
+        """ 파일 생성 작업 조회
+
+        Args:
+            job_id: 작업 번호
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            작업 정보, 작업이 없으면 None
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        with db_connection.cursor() as db_cursor:
+            db_cursor.execute(f"""
+                SELECT
+                    {EXPORT_JOB_COLUMNS}
+                FROM
+                    export_jobs
+                WHERE
+                    job_id = %(job_id)s
+            """, {'job_id': job_id})
+            return db_cursor.fetchone()
+
+    # noinspection PyMethodMayBeStatic
+    def start_export_job(self, job_id, db_connection):
+
+        """ 파일 생성 작업을 처리중으로 변경
+
+        Args:
+            job_id: 작업 번호
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            변경 여부 (만료 처리된 작업이면 False)
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        try:
+            with db_connection.cursor() as db_cursor:
+                db_cursor.execute("""
+                    UPDATE
+                        export_jobs
+                    SET
+                        status = 'processing',
+                        started_at = NOW()
+                    WHERE
+                        job_id = %(job_id)s
+                    AND
+                        status = 'pending'
+                """, {'job_id': job_id})
+                started = db_cursor.rowcount == 1
+
+                db_connection.commit()
+                return started
+
+        except Exception:
+            db_connection.rollback()
+            raise
+
+    # noinspection PyMethodMayBeStatic
+    def update_export_job_progress(self, progress_info, db_connection):
+
+        """ 파일 생성 작업 진행 상황(파일에 쓴 row 수) 기록
+
+        Args:
+            progress_info:
+                job_id: 작업 번호
+                row_count: 파일에 쓴 row 수
+            db_connection: 데이터베이스 커넥션 객체
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        try:
+            with db_connection.cursor() as db_cursor:
+                db_cursor.execute("""
+                    UPDATE
+                        export_jobs
+                    SET
+                        row_count = %(row_count)s
+                    WHERE
+                        job_id = %(job_id)s
+                    AND
+                        status = 'processing'
+                """, progress_info)
+
+                db_connection.commit()
+
+        except Exception:
+            db_connection.rollback()
+            raise
+
+    # noinspection PyMethodMayBeStatic
+    def finish_export_job(self, job_info, db_connection):
+
+        """ 파일 생성 작업 완료 / 실패 기록
+
+        아직 끝나지 않은(pending, processing) 작업만 변경한다.
+
+        Args:
+            job_info:
+                job_id: 작업 번호
+                status: done 또는 failed
+                row_count: 파일에 쓴 row 수
+                file_key: 완료된 경우 s3 key
+                error: 실패한 경우 에러 메세지
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            변경 여부 (그 사이 만료 처리된 작업이면 False)
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        try:
+            with db_connection.cursor() as db_cursor:
+                db_cursor.execute("""
+                    UPDATE
+                        export_jobs
+                    SET
+                        status = %(status)s,
+                        row_count = %(row_count)s,
+                        file_key = %(file_key)s,
+                        error = %(error)s,
+                        finished_at = NOW()
+                    WHERE
+                        job_id = %(job_id)s
+                    AND
+                        status IN %(pending_statuses)s
+                """, {
+                    'job_id': job_info['job_id'],
+                    'status': job_info['status'],
+                    'row_count': job_info.get('row_count', 0),
+                    'file_key': job_info.get('file_key'),
+                    'error': (job_info.get('error') or '')[:200] or None,
+                    'pending_statuses': EXPORT_JOB_PENDING_STATUSES,
+                })
+                finished = db_cursor.rowcount == 1
+
+                db_connection.commit()
+                return finished
+
+        except Exception:
+            db_connection.rollback()
+            raise
+
+    # noinspection PyMethodMayBeStatic
+    def expire_export_jobs(self, expire_info, db_connection):
+
+        """ 오래 끝나지 않은 파일 생성 작업을 실패(EXPORT_JOB_EXPIRED)로 변경
+
+        작업을 처리하던 프로세스가 종료되면 작업이 끝나지 않으므로,
+        등록 후 timeout(초) 이 지나도 끝나지 않은 작업은 실패로 기록한다.
+
+        Args:
+            expire_info:
+                timeout: 작업이 끝나야 하는 시간(초)
+                job_id: 이 작업만 확인 (없으면 오래된 작업부터 limit 개)
+                limit: 한번에 만료 처리할 작업 수
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            만료 처리된 작업 수
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        expire_data = {
+            'timeout': expire_info['timeout'],
+            'job_id': expire_info.get('job_id'),
+            'limit': expire_info.get('limit', 100),
+            'pending_statuses': EXPORT_JOB_PENDING_STATUSES,
+        }
+
+        try:
+            with db_connection.cursor() as db_cursor:
+                job_condition = "job_id = %(job_id)s AND" if expire_data['job_id'] else ""
+                db_cursor.execute(f"""
+                    UPDATE
+                        export_jobs
+                    SET
+                        status = 'failed',
+                        error = 'EXPORT_JOB_EXPIRED',
+                        finished_at = NOW()
+                    WHERE
+                        {job_condition}
+                        status IN %(pending_statuses)s
+                    AND
+                        created_at < NOW() - INTERVAL %(timeout)s SECOND
+                    ORDER BY
+                        created_at
+                    LIMIT %(limit)s
+                """, expire_data)
+                expired_count = db_cursor.rowcount
+
+                db_connection.commit()
+                return expired_count
+
+        except Exception:
+            db_connection.rollback()
+            raise
@@ -0,0 +1,308 @@
+import hashlib
+import json
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from config import S3_CONFIG
+from connection import get_db_connection
+from excel_export import EXPORT_FILE_TYPES, EXPORT_URL, export_rows_to_s3
+from export.model.export_dao import ExportDao
+
+# 쿼리에 바인딩되는 파라미터 이름 (%(name)s)
+BOUND_PARAM_PATTERN = re.compile(r'%\((\w+)\)s')
+
+# 진행 상황(파일에 쓴 row 수)을 데이터베이스에 기록하는 최소 간격(초)
+PROGRESS_UPDATE_INTERVAL = 1
+
+
+class ExportJob:
+
+    """ 리스트 엑셀 / csv 파일 생성 작업
+
+    status: pending(대기) -> processing(처리중) -> done(완료) / failed(실패)
+    작업 상태는 export_jobs 에 저장된 값. (조회 쿼리는 작업을 처리하는 프로세스에만 있음)
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): 파일 형식(file_format), gzip 압축 여부(compress) 추가
+        2026-10-17 (leesh3@brandi.co.kr): 작업 상태를 데이터베이스에 저장하도록 변경, 조회 쿼리는 작업 큐에서 따로 전달
+    """
+
+    def __init__(self, job_id, list_name, filter_key, file_format='xlsx', compress=False, status='pending',
+                 row_count=0, file_key=None, error=None, created_at=None, started_at=None, finished_at=None):
+        self.job_id = job_id
+        self.list_name = list_name
+        self.filter_key = filter_key
+        self.status = status
+
+        # 파일 형식('xlsx', 'csv')과 gzip 압축 여부
+        self.file_format = file_format
+        self.compress = bool(compress)
+
+        # 진행 상황(파일에 쓴 row 수)과 완료되면 s3 key
+        self.row_count = row_count
+        self.file_key = file_key
+        self.error = error
+
+        self.created_at = created_at
+        self.started_at = started_at
+        self.finished_at = finished_at
+
+    @classmethod
+    def from_row(cls, export_job):
+        return cls(**export_job)
+
+    def to_dict(self):
+        return {
+            'job_id': self.job_id,
+            'list_name': self.list_name,
+            'file_format': self.file_format,
+            'gzip': self.compress,
+            'status': self.status,
+            'row_count': self.row_count,
+            'file_url': EXPORT_URL.format(key=self.file_key) if self.file_key else None,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+        }
+
+
+class ExportJobQueue:
+
+    """ 셀러 / 상품 리스트 엑셀 / csv 파일 비동기 생성 큐
+
+    요청에서는 리스트와 같은 필터로 만든 조회 쿼리를 등록하고 작업 번호만 바로 리턴하고,
+    작업 스레드에서 서버 사이드 커서로 읽으면서 엑셀 / csv 파일을 s3에 올린다. (excel_export.export_rows_to_s3)
+    같은 리스트, 같은 필터의 작업이 처리중이거나 fresh_ttl 안에 끝났으면 새로 만들지 않고 그 작업을 리턴한다. (실패한 작업 제외)
+    작업 상태와 진행 상황은 데이터베이스(export_jobs)에 저장하므로 어느 프로세스에서나 조회, 재사용할 수 있고,
+    작업을 처리하던 프로세스가 종료되어 timeout(초) 안에 끝나지 않은 작업은 실패(EXPORT_JOB_EXPIRED)로 기록된다.
+    (동시에 같은 필터로 등록되면 작업이 두개 만들어질 수 있지만 같은 파일을 만들 뿐이므로 막지 않음)
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): csv 형식과 gzip 압축 추가
+        2026-10-17 (leesh3@brandi.co.kr): 작업 상태를 데이터베이스에 저장해서 프로세스 간에 조회, 재사용
+    """
+
+    def __init__(self, max_workers=2, fresh_ttl=300, timeout=3600):
+        self.fresh_ttl = fresh_ttl
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='export-job')
+        self._export_dao = ExportDao()
+        self._lock = threading.Lock()
+
+        # 이 프로세스의 작업 통계
+        self._submitted_count = 0
+        self._reused_count = 0
+        self._done_count = 0
+        self._failed_count = 0
+
+    @staticmethod
+    def get_filter_key(list_name, statement, params, file_format='xlsx', compress=False):
+        """ 리스트 이름, 쿼리와 쿼리에 바인딩되는 값, 파일 형식으로 만든 필터 key """
+        filter_info = json.dumps([list_name, statement, params, file_format, compress], sort_keys=True, default=str)
+        return hashlib.sha256(filter_info.encode('utf-8')).hexdigest()
+
+    def submit(self, list_name, statement, params, columns, file_format='xlsx', compress=False):
+
+        """ 엑셀 / csv 파일 생성 작업 등록
+
+        Args:
+            list_name: 리스트 이름 ('seller_list', 'product_list')
+            statement: 페이지네이션 없이 필터만 적용한 조회 쿼리
+            params: 쿼리에 바인딩할 값 (쿼리에서 사용하지 않는 값은 무시)
+            columns: (엑셀 컬럼명, row 의 key) 목록
+            file_format: 'xlsx' 또는 'csv'
+            compress: True 이면 gzip 으로 압축
+
+        Returns:
+            (ExportJob 객체, 이전 작업을 재사용했는지 여부)
+        """
+        # 쿼리에 바인딩되는 값만 남겨서 페이지네이션 등 결과와 관계없는 값은 필터 key 에 포함하지 않음
+        params = {name: params[name] for name in set(BOUND_PARAM_PATTERN.findall(statement))}
+        filter_key = self.get_filter_key(list_name, statement, params, file_format, compress)
+
+        db_connection = get_db_connection()
+        try:
+            fresh_job = self._export_dao.get_fresh_export_job(
+                {'filter_key': filter_key, 'timeout': self.timeout, 'fresh_ttl': self.fresh_ttl}, db_connection
+            )
+            if fresh_job is not None:
+                with self._lock:
+                    self._reused_count += 1
+                return ExportJob.from_row(fresh_job), True
+
+            job = ExportJob(uuid.uuid4().hex, list_name, filter_key, file_format, compress)
+            self._export_dao.insert_export_job({
+                'job_id': job.job_id,
+                'list_name': job.list_name,
+                'filter_key': job.filter_key,
+                'file_format': job.file_format,
+                'compress': job.compress,
+            }, db_connection)
+
+        finally:
+            db_connection.close()
+
+        with self._lock:
+            self._submitted_count += 1
+
+        self._executor.submit(self._process, job, statement, params, columns)
+
+        # 다른 프로세스가 종료되면서 남긴 작업 정리
+        self._executor.submit(self._expire_jobs)
+        return job, False
+
+    def get_job(self, job_id):
+
+        """ 작업 조회
+
+        timeout 이 지나도록 끝나지 않은 작업은 실패로 바꾼 뒤 리턴한다.
+
+        Returns:
+            ExportJob 객체, 작업이 없으면 None
+        """
+        db_connection = get_db_connection()
+        try:
+            self._export_dao.expire_export_jobs({'job_id': job_id, 'timeout': self.timeout}, db_connection)
+
+            export_job = self._export_dao.get_export_job(job_id, db_connection)
+            return ExportJob.from_row(export_job) if export_job else None
+
+        finally:
+            db_connection.close()
+
+    def _process(self, job, statement, params, columns):
+        try:
+            if not self._run_dao(self._export_dao.start_export_job, job.job_id):
+                return
+
+            progress_info = {'job_id': job.job_id, 'row_count': 0, 'updated_at': time.monotonic()}
+
+            def progress(row_count):
+                # 조회 커넥션은 서버 사이드 커서로 읽는 중이므로 진행 상황은 다른 커넥션으로 기록
+                progress_info['row_count'] = row_count
+                if time.monotonic() - progress_info['updated_at'] >= PROGRESS_UPDATE_INTERVAL:
+                    progress_info['updated_at'] = time.monotonic()
+                    self._run_dao(self._export_dao.update_export_job_progress, progress_info)
+
+            extension, _ = EXPORT_FILE_TYPES[job.file_format]
+            if job.compress:
+                extension = f'{extension}.gz'
+            file_key = f'{job.list_name}_{job.job_id}.{extension}'
+
+            # 요청 밖이므로 커넥션 풀에서 따로 빌려서 사용하고 반납
+            db_connection = None
+            try:
+                db_connection = get_db_connection()
+                _, row_count = export_rows_to_s3(
+                    db_connection,
+                    statement,
+                    params,
+                    columns,
+                    file_key,
+                    progress=progress,
+                    file_format=job.file_format,
+                    compress=job.compress
+                )
+                job_info = {'job_id': job.job_id, 'status': 'done', 'row_count': row_count, 'file_key': file_key}
+
+            except Exception as e:
+                print(f'EXPORT_JOB_ERROR_WITH {job.job_id} {e}')
+                job_info = {
+                    'job_id': job.job_id, 'status': 'failed', 'row_count': progress_info['row_count'], 'error': f'{e}'
+                }
+
+            finally:
+                if db_connection is not None:
+                    db_connection.close()
+
+            if not self._run_dao(self._export_dao.finish_export_job, job_info):
+                return
+
+            with self._lock:
+                if job_info['status'] == 'done':
+                    self._done_count += 1
+                else:
+                    self._failed_count += 1
+
+        except Exception as e:
+            print(f'EXPORT_JOB_ERROR_WITH {job.job_id} {e}')
+
+    def _expire_jobs(self):
+        try:
+            expired_count = self._run_dao(self._export_dao.expire_export_jobs, {'timeout': self.timeout})
+            if expired_count:
+                print(f'EXPORT_JOB_EXPIRED {expired_count}')
+
+        except Exception as e:
+            print(f'EXPORT_JOB_EXPIRE_ERROR_WITH {e}')
+
+    @staticmethod
+    def _run_dao(dao_method, dao_info):
+        # 요청 밖(작업 스레드)에서는 커넥션 풀에서 따로 빌려서 사용하고 반납
+        db_connection = get_db_connection()
+        try:
+            return dao_method(dao_info, db_connection)
+
+        finally:
+            db_connection.close()
+
+    def stats(self):
+        """ 이 프로세스의 작업 큐 통계 (등록, 재사용, 완료, 실패 수 등) """
+        with self._lock:
+            return {
+                'submitted_count': self._submitted_count,
+                'reused_count': self._reused_count,
+                'done_count': self._done_count,
+                'failed_count': self._failed_count,
+                'pending_count': self._submitted_count - self._done_count - self._failed_count,
+            }
+
+
+_export_job_queue = None
+_export_job_queue_lock = threading.Lock()
+
+
+def get_export_job_queue():
+
+    """ 리스트 엑셀 파일 생성 작업 큐
+
+    처음 호출될 때 한번만 생성되고 프로세스 안에서 공유된다.
+    설정은 S3_CONFIG 에 선택적으로 추가할 수 있다.
+        export_job_workers: 동시에 처리할 작업 수 (기본 2)
+        export_job_fresh_ttl: 같은 필터의 작업 결과를 재사용하는 시간(초) (기본 300)
+        export_job_timeout: 작업이 끝나야 하는 시간(초), 지나면 실패로 기록 (기본 3600)
+
+    Returns:
+        ExportJobQueue 객체
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): 작업 보관 시간(export_job_ttl) 대신 작업 만료 시간(export_job_timeout) 설정
+    """
+    global _export_job_queue
+
+    if _export_job_queue is None:
+        with _export_job_queue_lock:
+            if _export_job_queue is None:
+                _export_job_queue = ExportJobQueue(
+                    max_workers=S3_CONFIG.get('export_job_workers', 2),
+                    fresh_ttl=S3_CONFIG.get('export_job_fresh_ttl', 300),
+                    timeout=S3_CONFIG.get('export_job_timeout', 3600),
+                )
+
+    return _export_job_queue
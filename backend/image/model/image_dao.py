@@ -0,0 +1,494 @@
+import json
+
+from product.model.product_image_tag import get_product_image_rows, insert_product_images
+from product.model.product_list_view import refresh_product_list_view
+
+# 이미지 작업 상태
+IMAGE_JOB_PENDING_STATUSES = ('pending', 'processing')
+
+
+class ImageDao:
+    """ 이미지 모델
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+
+    """
+
+    # noinspection PyMethodMayBeStatic
+    def insert_image_job(self, job_info, db_connection):
+
+        """ 상품 이미지 작업 등록
+
+        작업 상태는 모든 프로세스에서 조회할 수 있도록 product_image_jobs 에 저장.
+
+        Args:
+            job_info:
+                job_id: 작업 번호
+                account_id: 작업을 등록한 계정 번호
+                image_orders: 이미지가 들어온 이미지 순서 목록
+            db_connection: 데이터베이스 커넥션 객체
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 작업을 등록한 계정 저장
+        """
+
+        try:
+            with db_connection.cursor() as db_cursor:
+                db_cursor.execute("""
+                    INSERT INTO product_image_jobs
+                    (
+                        job_id,
+                        account_id,
+                        image_orders
+                    ) VALUES (
+                        %(job_id)s,
+                        %(account_id)s,
+                        %(image_orders)s
+                    )
+                """, {
+                    'job_id': job_info['job_id'],
+                    'account_id': job_info['account_id'],
+                    'image_orders': json.dumps(job_info['image_orders']),
+                })
+
+                db_connection.commit()
+
+        except Exception:
+            db_connection.rollback()
+            raise
+
+    # noinspection PyMethodMayBeStatic
+    def get_image_job(self, job_id, db_connection):
+
+        """ 상품 이미지 작업과 작업에 연결된 상품 목록
+
+        Args:
+            job_id: 작업 번호
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            작업 정보 (images, dedupe_report, image_orders 는 JSON 을 풀어서 리턴, links: 연결된 상품 목록)
+            작업이 없으면 None
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 작업을 등록한 계정(account_id) 추가
+        """
+
+        with db_connection.cursor() as db_cursor:
+            db_cursor.execute("""
+                SELECT
+                    job_id,
+                    account_id,
+                    status,
+                    image_orders,
+                    images,
+                    dedupe_report,
+                    error,
+                    created_at,
+                    started_at,
+                    finished_at
+                FROM
+                    product_image_jobs
+                WHERE
+                    job_id = %(job_id)s
+            """, {'job_id': job_id})
+            image_job = db_cursor.fetchone()
+
+            if image_job is None:
+                return None
+
+            for column in ('image_orders', 'images', 'dedupe_report'):
+                if isinstance(image_job[column], (str, bytes)):
+                    image_job[column] = json.loads(image_job[column])
+
+            db_cursor.execute("""
+                SELECT
+                    product_id,
+                    status,
+                    product_info_id,
+                    error,
+                    created_at,
+                    linked_at
+                FROM
+                    product_image_job_links
+                WHERE
+                    job_id = %(job_id)s
+                ORDER BY
+                    link_no
+            """, {'job_id': job_id})
+            image_job['links'] = db_cursor.fetchall()
+
+            return image_job
+
+    # noinspection PyMethodMayBeStatic
+    def start_image_job(self, job_id, db_connection):
+
+        """ 상품 이미지 작업을 처리중으로 변경
+
+        Args:
+            job_id: 작업 번호
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            변경 여부 (만료 처리된 작업이면 False)
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        try:
+            with db_connection.cursor() as db_cursor:
+                db_cursor.execute("""
+                    UPDATE
+                        product_image_jobs
+                    SET
+                        status = 'processing',
+                        started_at = NOW()
+                    WHERE
+                        job_id = %(job_id)s
+                    AND
+                        status = 'pending'
+                """, {'job_id': job_id})
+                started = db_cursor.rowcount == 1
+
+                db_connection.commit()
+                return started
+
+        except Exception:
+            db_connection.rollback()
+            raise
+
+    # noinspection PyMethodMayBeStatic
+    def finish_image_job(self, job_info, db_connection):
+
+        """ 상품 이미지 작업 완료 / 실패 기록
+
+        아직 끝나지 않은(pending, processing) 작업만 변경한다.
+
+        Args:
+            job_info:
+                job_id: 작업 번호
+                status: done 또는 failed
+                images: 완료된 경우 이미지 순서별 url, 사이즈 정보
+                dedupe_report: 완료된 경우 중복 제거 결과
+                error: 실패한 경우 에러 메세지
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            변경 여부 (그 사이 만료 처리된 작업이면 False)
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        try:
+            with db_connection.cursor() as db_cursor:
+                db_cursor.execute("""
+                    UPDATE
+                        product_image_jobs
+                    SET
+                        status = %(status)s,
+                        images = %(images)s,
+                        dedupe_report = %(dedupe_report)s,
+                        error = %(error)s,
+                        finished_at = NOW()
+                    WHERE
+                        job_id = %(job_id)s
+                    AND
+                        status IN %(pending_statuses)s
+                """, {
+                    'job_id': job_info['job_id'],
+                    'status': job_info['status'],
+                    'images': json.dumps(job_info['images']) if job_info.get('images') is not None else None,
+                    'dedupe_report': json.dumps(job_info['dedupe_report']) if job_info.get('dedupe_report') else None,
+                    'error': (job_info.get('error') or '')[:200] or None,
+                    'pending_statuses': IMAGE_JOB_PENDING_STATUSES,
+                })
+                finished = db_cursor.rowcount == 1
+
+                db_connection.commit()
+                return finished
+
+        except Exception:
+            db_connection.rollback()
+            raise
+
+    # noinspection PyMethodMayBeStatic
+    def expire_image_jobs(self, expire_info, db_connection):
+
+        """ 오래 끝나지 않은 상품 이미지 작업을 실패(IMAGE_JOB_EXPIRED)로 변경
+
+        작업을 처리하던 프로세스가 종료되면 작업이 끝나지 않으므로,
+        등록 후 timeout(초) 이 지나도 끝나지 않은 작업은 실패로 기록해서 연결된 상품에 실패를 남긴다.
+
+        Args:
+            expire_info:
+                timeout: 작업이 끝나야 하는 시간(초)
+                job_id: 이 작업만 확인 (없으면 오래된 작업부터 limit 개)
+                limit: 한번에 만료 처리할 작업 수
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            만료 처리된 작업 번호 목록
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        expire_data = {
+            'timeout': expire_info['timeout'],
+            'job_id': expire_info.get('job_id'),
+            'limit': expire_info.get('limit', 100),
+            'pending_statuses': IMAGE_JOB_PENDING_STATUSES,
+        }
+
+        try:
+            with db_connection.cursor() as db_cursor:
+                db_cursor.execute("START TRANSACTION")
+
+                job_condition = "job_id = %(job_id)s AND" if expire_data['job_id'] else ""
+                db_cursor.execute(f"""
+                    SELECT
+                        job_id
+                    FROM
+                        product_image_jobs
+                    WHERE
+                        {job_condition}
+                        status IN %(pending_statuses)s
+                    AND
+                        created_at < NOW() - INTERVAL %(timeout)s SECOND
+                    ORDER BY
+                        created_at
+                    LIMIT %(limit)s
+                    FOR UPDATE
+                """, expire_data)
+                expired_job_ids = [image_job['job_id'] for image_job in db_cursor.fetchall()]
+
+                if expired_job_ids:
+                    db_cursor.execute("""
+                        UPDATE
+                            product_image_jobs
+                        SET
+                            status = 'failed',
+                            error = 'IMAGE_JOB_EXPIRED',
+                            finished_at = NOW()
+                        WHERE
+                            job_id IN %(job_ids)s
+                    """, {'job_ids': tuple(expired_job_ids)})
+
+                db_connection.commit()
+                return expired_job_ids
+
+        except Exception:
+            db_connection.rollback()
+            raise
+
+    # noinspection PyMethodMayBeStatic
+    def insert_image_job_link(self, link_info, db_connection):
+
+        """ 상품 이미지 작업에 상품 연결
+
+        상품 정보가 커밋된 뒤에 호출한다. 작업이 끝나면 link_image_job 에서 상품의 최신 상품 정보에 이미지를 등록한다.
+        작업을 등록한 계정이나 마스터가 아니면 연결하지 않는다.
+
+        Args:
+            link_info:
+                job_id: 작업 번호
+                product_id: 이미지를 연결할 상품 번호
+                auth_type_id: 연결하는 계정의 권한 타입
+                account_no: 연결하는 계정 번호
+            db_connection: 데이터베이스 커넥션 객체
+
+        Raises:
+            ValueError('NO_AUTHORIZATION'): 작업이 없거나 작업을 등록한 계정, 마스터가 아닌 경우
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 작업을 등록한 계정과 마스터만 연결
+        """
+
+        try:
+            with db_connection.cursor() as db_cursor:
+                db_cursor.execute("""
+                    INSERT INTO product_image_job_links
+                    (
+                        job_id,
+                        product_id
+                    )
+                    SELECT
+                        job_id,
+                        %(product_id)s
+                    FROM
+                        product_image_jobs
+                    WHERE
+                        job_id = %(job_id)s
+                    AND
+                        (account_id = %(account_no)s OR %(auth_type_id)s = 1)
+                """, link_info)
+
+                if db_cursor.rowcount == 0:
+                    raise ValueError('NO_AUTHORIZATION')
+
+                db_connection.commit()
+
+        except Exception:
+            db_connection.rollback()
+            raise
+
+    # noinspection PyMethodMayBeStatic
+    def link_image_job(self, job_id, db_connection):
+
+        """ 끝난 상품 이미지 작업의 이미지를 연결을 기다리는 상품에 등록
+
+        작업 row 를 잠그고 처리하므로 작업을 끝낸 프로세스와 상품을 연결한 프로세스가 동시에 호출해도 한번만 등록된다.
+        작업이 아직 끝나지 않았으면 아무것도 하지 않는다.
+            - 완료된 작업: 상품의 최신 상품 정보(is_current = 1)에 이미지를 등록한다.
+              상품이 그 사이 수정되었어도 최신 이력에 등록되고, 최신 이력에 이미 이미지가 있는 순서는 건너뛴다.
+            - 실패한 작업, 상품이 없는 경우: 연결을 실패(failed)로 기록하고 에러를 남긴다.
+
+        Args:
+            job_id: 작업 번호
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            처리한 연결 목록 [{'product_id', 'status', 'product_info_id', 'error'}]
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        try:
+            with db_connection.cursor() as db_cursor:
+                db_cursor.execute("START TRANSACTION")
+
+                db_cursor.execute("""
+                    SELECT
+                        status,
+                        images,
+                        error
+                    FROM
+                        product_image_jobs
+                    WHERE
+                        job_id = %(job_id)s
+                    FOR UPDATE
+                """, {'job_id': job_id})
+                image_job = db_cursor.fetchone()
+
+                if image_job is None or image_job['status'] in IMAGE_JOB_PENDING_STATUSES:
+                    db_connection.commit()
+                    return []
+
+                db_cursor.execute("""
+                    SELECT
+                        link_no,
+                        product_id
+                    FROM
+                        product_image_job_links
+                    WHERE
+                        job_id = %(job_id)s
+                    AND
+                        status = 'waiting'
+                    FOR UPDATE
+                """, {'job_id': job_id})
+                waiting_links = db_cursor.fetchall()
+
+                images = image_job['images']
+                if isinstance(images, (str, bytes)):
+                    images = json.loads(images)
+
+                linked = []
+                for link in waiting_links:
+                    link.update({'status': 'failed', 'product_info_id': None, 'error': None})
+
+                    if image_job['status'] != 'done':
+                        link['error'] = image_job['error'] or 'IMAGE_JOB_FAILED'
+
+                    else:
+                        # 작업을 기다리는 동안 상품이 수정되었을 수 있으므로 지금의 최신 상품 정보에 등록
+                        db_cursor.execute("""
+                            SELECT
+                                product_info_no
+                            FROM
+                                product_infos
+                            WHERE
+                                product_id = %(product_id)s
+                            AND
+                                is_current = 1
+                            FOR UPDATE
+                        """, link)
+                        product_info = db_cursor.fetchone()
+
+                        if product_info is None:
+                            link['error'] = 'PRODUCT_DOES_NOT_EXIST'
+
+                        else:
+                            # 최신 상품 정보에 이미 이미지가 있는 순서(그 사이 새 이미지로 수정된 순서)는 건너뜀
+                            db_cursor.execute("""
+                                SELECT DISTINCT
+                                    image_order
+                                FROM
+                                    product_images
+                                WHERE
+                                    product_info_id = %(product_info_no)s
+                            """, product_info)
+                            existing_orders = {str(image['image_order']) for image in db_cursor.fetchall()}
+
+                            link_images = {
+                                image_order: image for image_order, image in images.items()
+                                if image and image_order[-1] not in existing_orders
+                            }
+                            image_rows, _, _ = get_product_image_rows(link_images, product_info['product_info_no'])
+                            insert_product_images(db_cursor, image_rows)
+
+                            # 대표 이미지가 생겼을 수 있으므로 상품 리스트 조회용 테이블 갱신
+                            refresh_product_list_view(db_cursor, product_no=link['product_id'])
+
+                            link['status'] = 'linked'
+                            link['product_info_id'] = product_info['product_info_no']
+
+                    db_cursor.execute("""
+                        UPDATE
+                            product_image_job_links
+                        SET
+                            status = %(status)s,
+                            product_info_id = %(product_info_id)s,
+                            error = %(error)s,
+                            linked_at = NOW()
+                        WHERE
+                            link_no = %(link_no)s
+                    """, link)
+                    linked.append(link)
+
+                db_connection.commit()
+                return linked
+
+        except Exception:
+            db_connection.rollback()
+            raise
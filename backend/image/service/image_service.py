@@ -3,380 +3,134 @@ from connection import get_s3_connection
 from flask import jsonify
 
 from PIL import Image
+from image_job import get_image_job_queue
+from utils import ImageUpload
 
 
 class ImageService:
 
-    # 이미지 리사이즈 : big
-    def resize_to_big(self, image_file):
+    # 요청받은 상품 이미지를 리사이즈 하고 s3에 업로드
+    def upload_product_image(self, request):
         """
+        상품 등록 / 수정에서 사용하는 utils.ImageUpload 와 같은 리사이즈 파이프라인으로 처리
+
         Args:
-            image_file: 이미지 파일
+            request: 요청 값
 
         Returns:
-            리사이즈 성공시: ByteIO 객체, uuid
+            리사이즈 성공시: s3 버킷에 올라간 이미지파일의 url(dictionary)
+            리사이즈 실패시: error message, status code
 
         Authors:
             yoonhc@brandi.co.kr (윤희철)
+            leesh3@brandi.co.kr (이소헌)
 
         History:
             2020-04-02 (yoonhc@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 중복된 리사이즈 / 업로드 로직을 ImageUpload 로 합침
         """
+        image_upload = ImageUpload()
+        return image_upload.upload_product_image(request)
 
-        standard_size = 640
-        try:
-            with Image.open(image_file) as opened_image:
-                big = (int(standard_size), int(opened_image.size[1]*(standard_size/opened_image.size[0])))
-                resized_image_big = opened_image.resize(big)
-                big_io = io.BytesIO()
-                image_file_form = image_file.content_type
-                if 'png' in image_file_form:
-                    resized_image_big.save(big_io, 'png')
-                if 'jpeg' in image_file_form:
-                    resized_image_big.save(big_io, 'jpeg')
-                big_io.seek(0)
-                return [big_io, str(uuid.uuid4())]
-        except:
-            return None
-
-    # 이미지 리사이즈 : medium
-    def resize_to_medium(self, image_file):
+    # 요청받은 상품 이미지를 이미지 작업 큐에 등록
+    def submit_product_image_job(self, request, account_info):
         """
+        원본 이미지를 저장하고 작업 번호를 바로 리턴. 리사이즈와 업로드는 작업 큐에서 처리
+
         Args:
-            image_file: 이미지 파일
+            request: 요청 값
+            account_info: 작업을 등록하는 계정 정보 (account_no)
 
         Returns:
-            리사이즈 성공시: ByteIO 객체, uuid
+            202: 등록된 작업 번호와 상태
+            400: 파일형식이 잘못된 경우, 파일 크기가 너무 큰 경우, 이미지가 없는 경우
 
         Authors:
-            yoonhc@brandi.co.kr (윤희철)
+            leesh3@brandi.co.kr (이소헌)
 
         History:
-            2020-04-02 (yoonhc@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 작업을 등록한 계정 저장
         """
-        standard_size = 320
-        try:
-            with Image.open(image_file) as opened_image:
-                medium = (int(standard_size), int(opened_image.size[1]*(standard_size/opened_image.size[0])))
-                resized_image_medium = opened_image.resize(medium)
-                medium_io = io.BytesIO()
-                resized_image_medium.save(medium_io, "JPEG")
-                medium_io.seek(0)
-                return [medium_io, str(uuid.uuid4())]
+        image_upload = ImageUpload()
+        image_files = image_upload.get_product_image_files(request)
+        if (400 in image_files) or (500 in image_files):
+            return image_files
 
-        except:
-            return None
+        if not any(image_files.values()):
+            return jsonify({'message': 'IMAGE_DOES_NOT_EXIST'}), 400
+
+        image_job = get_image_job_queue().submit(image_files, account_info['account_no'])
+        return jsonify({'job_id': image_job.job_id, 'status': image_job.status}), 202
 
-    # 이미지 리사이즈 : small
-    def resize_to_small(self, image_file):
+    # 상품 이미지 작업 상태 조회
+    def get_product_image_job(self, job_id, account_info):
         """
+        작업을 등록한 계정과 마스터만 조회할 수 있음
+
         Args:
-            image_file: 이미지 파일
+            job_id: 작업 번호
+            account_info: 조회하는 계정 정보 (auth_type_id, account_no)
 
         Returns:
-            리사이즈 성공시: ByteIO 객체, uuid
+            200: 작업 상태, 완료된 경우 이미지 url, 연결된 상품별 이미지 등록 결과(links)
+            403: NO_AUTHORIZATION
+            404: IMAGE_JOB_DOES_NOT_EXIST
 
         Authors:
-            yoonhc@brandi.co.kr (윤희철)
+            leesh3@brandi.co.kr (이소헌)
 
         History:
-            2020-04-02 (yoonhc@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 작업 상태를 데이터베이스에서 조회, 상품 연결 결과 추가
+            2026-10-17 (leesh3@brandi.co.kr): 작업을 등록한 계정과 마스터만 조회
         """
-        standard_size = 120
-        try:
-            with Image.open(image_file) as opened_image:
-                small = (int(standard_size), int(opened_image.size[1]*(standard_size/opened_image.size[0])))
-                resized_image_small = opened_image.resize(small)
-                small_io = io.BytesIO()
-                resized_image_small.save(small_io, "JPEG")
-                small_io.seek(0)
+        image_job = get_image_job_queue().get_job(job_id)
+        if image_job is None:
+            return jsonify({'message': 'IMAGE_JOB_DOES_NOT_EXIST'}), 404
 
-                return [small_io, str(uuid.uuid4())]
+        if not image_job.is_accessible_by(account_info):
+            return jsonify({'message': 'NO_AUTHORIZATION'}), 403
 
-        except:
-            return None
+        return jsonify(image_job.to_dict()), 200
 
-    # 요청받은 상품 이미지를 리사이즈 하고 s3에 업로드
-    def upload_product_image(self, request):
+    # 상품 등록 / 수정에 사용할 이미지 작업의 이미지 정보
+    def get_product_image_references(self, job_id, account_info):
         """
+        작업이 완료되었으면 업로드된 이미지 url 을, 처리중이면 이미지 순서별 작업 번호({'job_id': ..})를 리턴.
+        작업 번호가 담긴 이미지는 상품 커밋 후 작업에 연결되어 작업이 끝날 때 상품의 최신 상품 정보에 등록됨.
+        작업을 등록한 계정과 마스터만 사용할 수 있음
+
         Args:
-            request: 요청 값
+            job_id: 작업 번호
+            account_info: 상품을 등록 / 수정하는 계정 정보 (auth_type_id, account_no)
 
         Returns:
-            리사이즈 성공시: s3 버킷에 올라간 이미지파일의 url(dictionary)
-            리사이즈 실패시: error message, status code
+            이미지 순서별 이미지 정보 (upload_product_image 의 리턴값과 같은 형태)
+            400: IMAGE_JOB_FAILED
+            403: NO_AUTHORIZATION
+            404: IMAGE_JOB_DOES_NOT_EXIST
 
         Authors:
-            yoonhc@brandi.co.kr (윤희철)
+            leesh3@brandi.co.kr (이소헌)
 
         History:
-            2020-04-02 (yoonhc@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 작업을 등록한 계정과 마스터만 사용
         """
-        # s3 연결
-        s3 = get_s3_connection()
-
-        # 리턴값이 들어갈 리스트
-        data = {
-            'image_file_1': {},
-            'image_file_2': {},
-            'image_file_3': {},
-            'image_file_4': {},
-            'image_file_5': {}
-        }
-
-        # 파일의 존재여부 확인, 이미지 순서를 파일 이름으로 받음.
-        image_file_1 = request.files.get('image_file_1', None)
-        image_file_2 = request.files.get('image_file_2', None)
-        image_file_3 = request.files.get('image_file_3', None)
-        image_file_4 = request.files.get('image_file_4', None)
-        image_file_5 = request.files.get('image_file_5', None)
-
-        # 순서1번의 이미지파일 이 존재하면 업로드하고 url을 딕셔너리에 추가
-        if image_file_1:
-            try:
-                # 들어온 파일의 사이즈와 확장자를 구함.
-                image_file_size = os.fstat(image_file_1.fileno()).st_size
-                image_file_form = image_file_1.content_type
-
-                # 이미지 파일이 아닌 다른형식의 파일이 들어오는 것을 차단.
-                if not ('image' in image_file_form):
-                    return jsonify({'message': 'INVALID_FILE'})
-
-                # 들어온 이미지 크기가 10MB보다 크면 request를 받지 않음.
-                if image_file_size > 10485760:
-                    return jsonify({'message': 'INVALID_IMAGE1'})
-
-                # big_size 업로드
-                big_size_buffer = self.resize_to_big(image_file_1)
-                if not big_size_buffer:
-                    return jsonify({"message": "INVALID_IMAGE33"}), 400
-                s3.put_object(Body=big_size_buffer[0], Bucket="brandi-intern", Key=big_size_buffer[1],
-                              ContentType='image/jpeg')
-                big_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{big_size_buffer[1]}'
-                data['image_file_1']['big_size_url'] = big_size_url
-                data['image_file_1']['big_image_size_id'] = 1
-
-                # medium_size 업로드
-                medium_size_buffer = self.resize_to_medium(image_file_1)
-                if not medium_size_buffer:
-                    return jsonify({"message": "INVALID_IMAGE"}), 400
-                s3.put_object(Body=medium_size_buffer[0], Bucket="brandi-intern", Key=medium_size_buffer[1],
-                              ContentType='image/jpeg')
-                medium_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{medium_size_buffer[1]}'
-                data['image_file_1']['medium_size_url'] = medium_size_url
-                data['image_file_1']['medium_image_size_id'] = 2
-
-                # small_size 업로드
-                small_size_buffer = self.resize_to_small(image_file_1)
-                if not small_size_buffer:
-                    return jsonify({"message": "INVALID_IMAGE"}), 400
-                s3.put_object(Body=small_size_buffer[0], Bucket="brandi-intern", Key=small_size_buffer[1],
-                              ContentType='image/jpeg')
-                small_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{small_size_buffer[1]}'
-                data['image_file_1']['small_size_url'] = small_size_url
-                data['image_file_1']['small_image_size_id'] = 3
-
-            except Exception as e:
-                print(f'error1 : {e}')
-                return jsonify({'message' : 'INVALID_REQUEST'})
-
-        # 순서2번의 이미지파일 이 존재하면 업로드하고 url을 딕셔너리에 추가
-        if image_file_2:
-            try:
-                # 들어온 파일의 사이즈와 확장자를 구함.
-                image_file_size = os.fstat(image_file_2.fileno()).st_size
-                image_file_form = image_file_2.content_type
+        image_job_queue = get_image_job_queue()
+        image_job = image_job_queue.get_job(job_id)
 
-                # 이미지 파일이 아닌 다른형식의 파일이 들어오는 것을 차단.
-                if not ('image' in image_file_form):
-                    return jsonify({'message': 'INVALID_FILE'})
-
-                # 들어온 이미지 크기가 10MB보다 크면 request를 받지 않음.
-                if image_file_size > 10485760:
-                    return jsonify({'message': 'INVALID_IMAGE1'})
-
-                # big_size 업로드
-                big_size_buffer = self.resize_to_big(image_file_2)
-                if not big_size_buffer:
-                    return jsonify({"message": "INVALID_IMAGE2"}), 400
-                s3.put_object(Body=big_size_buffer[0], Bucket="brandi-intern", Key=big_size_buffer[1],
-                              ContentType='image/jpeg')
-                big_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{big_size_buffer[1]}'
-                data['image_file_2']['big_size_url'] = big_size_url
-                data['image_file_2']['big_image_size_id'] = 1
-
-                # medium_size 업로드
-                medium_size_buffer = self.resize_to_medium(image_file_2)
-                if not medium_size_buffer:
-                    return jsonify({"message": "INVALID_IMAGE33"}), 400
-                s3.put_object(Body=medium_size_buffer[0], Bucket="brandi-intern", Key=medium_size_buffer[1],
-                              ContentType='image/jpeg')
-                medium_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{medium_size_buffer[1]}'
-                data['image_file_2']['medium_size_url'] = medium_size_url
-                data['image_file_2']['medium_image_size_id'] = 2
-
-                # small_size 업로드
-                small_size_buffer = self.resize_to_small(image_file_2)
-                if not small_size_buffer:
-                    return jsonify({"message": "INVALID_IMAGE"}), 400
-                s3.put_object(Body=small_size_buffer[0], Bucket="brandi-intern", Key=small_size_buffer[1],
-                              ContentType='image/jpeg')
-                small_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{small_size_buffer[1]}'
-                data['image_file_2']['small_size_url'] = small_size_url
-                data['image_file_2']['small_image_size_id'] = 3
-
-            except Exception as e:
-                print(f'error1 : {e}')
-                return jsonify({'message' : 'INVALID_REQUEST'})
-
-        # 순서3번의 이미지파일 이 존재하면 업로드하고 url을 딕셔너리에 추가
-        if image_file_3:
-            try:
-                # 들어온 파일의 사이즈와 확장자를 구함.
-                image_file_size = os.fstat(image_file_3.fileno()).st_size
-                image_file_form = image_file_3.content_type
-
-                # 이미지 파일이 아닌 다른형식의 파일이 들어오는 것을 차단.
-                if not ('image' in image_file_form):
-                    return jsonify({'message': 'INVALID_FILE'})
-
-                # 들어온 이미지 크기가 10MB보다 크면 request를 받지 않음.
-                if image_file_size > 10485760:
-                    return jsonify({'message': 'INVALID_IMAGE1'})
-
-                # big_size 업로드
-                big_size_buffer = self.resize_to_big(image_file_3)
-                if not big_size_buffer:
-                    return jsonify({"message": "INVALID_IMAGE"}), 400
-                s3.put_object(Body=big_size_buffer[0], Bucket="brandi-intern", Key=big_size_buffer[1],
-                              ContentType='image/jpeg')
-                big_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{big_size_buffer[1]}'
-                data['image_file_3']['big_size_url'] = big_size_url
-                data['image_file_3']['big_image_size_id'] = 1
-
-                # medium_size 업로드
-                medium_size_buffer = self.resize_to_medium(image_file_3)
-                if not medium_size_buffer:
-                    return jsonify({"message": "INVALID_IMAGE"}), 400
-                s3.put_object(Body=medium_size_buffer[0], Bucket="brandi-intern", Key=medium_size_buffer[1],
-                              ContentType='image/jpeg')
-                medium_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{medium_size_buffer[1]}'
-                data['image_file_3']['medium_size_url'] = medium_size_url
-                data['image_file_3']['medium_image_size_id'] = 2
-
-                # small_size 업로드
-                small_size_buffer = self.resize_to_small(image_file_3)
-                if not small_size_buffer:
-                    return jsonify({"message": "INVALID_IMAGE"}), 400
-                s3.put_object(Body=small_size_buffer[0], Bucket="brandi-intern", Key=small_size_buffer[1],
-                              ContentType='image/jpeg')
-                small_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{small_size_buffer[1]}'
-                data['image_file_3']['small_size_url'] = small_size_url
-                data['image_file_3']['small_image_size_id'] = 3
-
-            except Exception as e:
-                print(f'error1 : {e}')
-                return jsonify({'message' : 'INVALID_REQUEST'})
-
-        # 순서4번의 이미지파일 이 존재하면 업로드하고 url을 딕셔너리에 추가
-        if image_file_4:
-            try:
-                # 들어온 파일의 사이즈와 확장자를 구함.
-                image_file_size = os.fstat(image_file_4.fileno()).st_size
-                image_file_form = image_file_4.content_type
-
-                # 이미지 파일이 아닌 다른형식의 파일이 들어오는 것을 차단.
-                if not ('image' in image_file_form):
-                    return jsonify({'message': 'INVALID_FILE'})
-
-                # 들어온 이미지 크기가 10MB보다 크면 request를 받지 않음.
-                if image_file_size > 10485760:
-                    return jsonify({'message': 'INVALID_IMAGE1'})
-
-                # big_size 업로드
-                big_size_buffer = self.resize_to_big(image_file_4)
-                if not big_size_buffer:
-                    return jsonify({"message": "INVALID_IMAGE"}), 400
-                s3.put_object(Body=big_size_buffer[0], Bucket="brandi-intern", Key=big_size_buffer[1],
-                              ContentType='image/jpeg')
-                big_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{big_size_buffer[1]}'
-                data['image_file_4']['big_size_url'] = big_size_url
-                data['image_file_4']['big_image_size_id'] = 1
-
-                # medium_size 업로드
-                medium_size_buffer = self.resize_to_medium(image_file_4)
-                if not medium_size_buffer:
-                    return jsonify({"message": "INVALID_IMAGE"}), 400
-                s3.put_object(Body=medium_size_buffer[0], Bucket="brandi-intern", Key=medium_size_buffer[1],
-                              ContentType='image/jpeg')
-                medium_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{medium_size_buffer[1]}'
-                data['image_file_4']['medium_size_url'] = medium_size_url
-                data['image_file_4']['medium_image_size_id'] = 2
-
-                # small_size 업로드
-                small_size_buffer = self.resize_to_small(image_file_4)
-                if not small_size_buffer:
-                    return jsonify({"message": "INVALID_IMAGE"}), 400
-                s3.put_object(Body=small_size_buffer[0], Bucket="brandi-intern", Key=small_size_buffer[1],
-                              ContentType='image/jpeg')
-                small_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{small_size_buffer[1]}'
-                data['image_file_4']['small_size_url'] = small_size_url
-                data['image_file_4']['small_image_size_id'] = 3
-
-            except Exception as e:
-                print(f'error1 : {e}')
-                return jsonify({'message' : 'INVALID_REQUEST'})
+        if image_job is None:
+            return jsonify({'message': 'IMAGE_JOB_DOES_NOT_EXIST'}), 404
 
-        # 순서5번의 이미지파일 이 존재하면 업로드하고 url을 딕셔너리에 추가
-        if image_file_5:
-            try:
-                # 들어온 파일의 사이즈와 확장자를 구함.
-                image_file_size = os.fstat(image_file_5.fileno()).st_size
-                image_file_form = image_file_5.content_type
+        if not image_job.is_accessible_by(account_info):
+            return jsonify({'message': 'NO_AUTHORIZATION'}), 403
 
-                # 이미지 파일이 아닌 다른형식의 파일이 들어오는 것을 차단.
-                if not ('image' in image_file_form):
-                    return jsonify({'message': 'INVALID_FILE'})
+        if image_job.status == 'failed':
+            return jsonify({'message': 'IMAGE_JOB_FAILED'}), 400
 
-                # 들어온 이미지 크기가 10MB보다 크면 request를 받지 않음.
-                if image_file_size > 10485760:
-                    return jsonify({'message': 'INVALID_IMAGE1'})
-
-                # big_size 업로드
-                big_size_buffer = self.resize_to_big(image_file_5)
-                if not big_size_buffer:
-                    return jsonify({"message": "INVALID_IMAGE"}), 400
-                s3.put_object(Body=big_size_buffer[0], Bucket="brandi-intern", Key=big_size_buffer[1],
-                              ContentType='image/jpeg')
-                big_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{big_size_buffer[1]}'
-                data['image_file_5']['big_size_url'] = big_size_url
-                data['image_file_5']['big_image_size_id'] = 1
-
-                # medium_size 업로드
-                medium_size_buffer = self.resize_to_medium(image_file_5)
-                if not medium_size_buffer:
-                    return jsonify({"message": "INVALID_IMAGE"}), 400
-                s3.put_object(Body=medium_size_buffer[0], Bucket="brandi-intern", Key=medium_size_buffer[1],
-                              ContentType='image/jpeg')
-                medium_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{medium_size_buffer[1]}'
-                data['image_file_5']['medium_size_url'] = medium_size_url
-                data['image_file_5']['medium_image_size_id'] = 2
-
-                # small_size 업로드
-                small_size_buffer = self.resize_to_small(image_file_5)
-                if not small_size_buffer:
-                    return jsonify({"message": "INVALID_IMAGE"}), 400
-                s3.put_object(Body=small_size_buffer[0], Bucket="brandi-intern", Key=small_size_buffer[1],
-                              ContentType='image/jpeg')
-                small_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{small_size_buffer[1]}'
-                data['image_file_5']['small_size_url'] = small_size_url
-                data['image_file_5']['small_image_size_id'] = 3
-
-            except Exception as e:
-                print(f'error1 : {e}')
-                return jsonify({'message' : 'INVALID_REQUEST'})
-
-        return data
+        return image_job_queue.get_image_references(image_job)
 
     # 요청받은 셀러 이미지를 s3에 업로드
     def upload_seller_image(self, request):
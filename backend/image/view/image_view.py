@@ -1,5 +1,6 @@
-from flask import request, Blueprint
+from flask import request, Blueprint, g
 from image.service.image_service import ImageService
+from utils import login_required
 
 
 class ImageView:
@@ -11,6 +12,20 @@ class ImageView:
         image_upload_result = image_service.upload_product_image(request)
         return image_upload_result
 
+    @image_app.route('/product/job', methods=['POST'])
+    @login_required
+    def submit_product_image_job():
+        image_service = ImageService()
+        image_job_result = image_service.submit_product_image_job(request, g.account_info)
+        return image_job_result
+
+    @image_app.route('/product/job/<job_id>', methods=['GET'])
+    @login_required
+    def get_product_image_job(job_id):
+        image_service = ImageService()
+        image_job_result = image_service.get_product_image_job(job_id, g.account_info)
+        return image_job_result
+
     @image_app.route('/seller', methods = ['POST'])
     def upload_seller_image():
         image_service = ImageService()
@@ -0,0 +1,120 @@
+import json
+import sqlite3
+import threading
+
+from config import S3_CONFIG
+
+
+class ImageHashIndex:
+
+    """ 내용 해시로 저장된 이미지의 로컬 색인
+
+    - source_images: 원본 이미지 해시 -> 사이즈별 저장 key (같은 원본은 리사이즈와 업로드를 모두 생략)
+    - stored_objects: s3에 올라간 사이즈별 이미지 key(내용 해시) (같은 결과물은 업로드를 생략)
+    s3 에 존재 여부를 묻지 않고 이 색인만 확인한다. path 가 없으면 메모리에만 저장한다.
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+
+    def __init__(self, path=None):
+        self.path = path or ':memory:'
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+
+        with self._lock, self._connection:
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS source_images (
+                    source_hash TEXT PRIMARY KEY,
+                    variants TEXT NOT NULL
+                )
+            """)
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS stored_objects (
+                    object_key TEXT PRIMARY KEY,
+                    bytes INTEGER NOT NULL
+                )
+            """)
+
+        # 절약 통계
+        self._resize_saved_count = 0
+        self._upload_saved_count = 0
+        self._upload_saved_bytes = 0
+        self._upload_count = 0
+        self._upload_bytes = 0
+
+    def get_variants(self, source_hash):
+        """ 원본 해시로 이미 만들어진 사이즈별 이미지 정보 {사이즈 이름: {'key', 'image_size_id', 'bytes'}} 를 리턴 """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT variants FROM source_images WHERE source_hash = ?", (source_hash,)
+            ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def has_object(self, object_key):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM stored_objects WHERE object_key = ?", (object_key,)
+            ).fetchone()
+
+        return row is not None
+
+    def add(self, source_hash, variants):
+        """ 업로드가 끝난 원본과 사이즈별 이미지를 색인에 추가 """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO source_images (source_hash, variants) VALUES (?, ?)",
+                (source_hash, json.dumps(variants))
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO stored_objects (object_key, bytes) VALUES (?, ?)",
+                [(variant['key'], variant['bytes']) for variant in variants.values()]
+            )
+
+    def record(self, report):
+        """ 요청 한번의 절약 결과를 누적 """
+        with self._lock:
+            self._resize_saved_count += report['resize_saved']
+            self._upload_saved_count += report['uploads_saved']
+            self._upload_saved_bytes += report['bytes_saved']
+            self._upload_count += report['uploads']
+            self._upload_bytes += report['bytes_uploaded']
+
+    def stats(self):
+        """ 색인 통계 (저장된 이미지 수, 생략된 리사이즈 / 업로드 수와 바이트) """
+        with self._lock:
+            source_count = self._connection.execute("SELECT COUNT(*) FROM source_images").fetchone()[0]
+            object_count, object_bytes = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM stored_objects"
+            ).fetchone()
+
+            return {
+                'source_count': source_count,
+                'object_count': object_count,
+                'object_bytes': object_bytes,
+                'resize_saved_count': self._resize_saved_count,
+                'upload_count': self._upload_count,
+                'upload_bytes': self._upload_bytes,
+                'upload_saved_count': self._upload_saved_count,
+                'upload_saved_bytes': self._upload_saved_bytes,
+            }
+
+
+_image_hash_index = None
+_image_hash_index_lock = threading.Lock()
+
+
+def get_image_hash_index():
+    """ 이미지 해시 색인. S3_CONFIG 의 image_hash_index_path 에 sqlite 파일로 저장 (없으면 메모리) """
+    global _image_hash_index
+
+    if _image_hash_index is None:
+        with _image_hash_index_lock:
+            if _image_hash_index is None:
+                _image_hash_index = ImageHashIndex(S3_CONFIG.get('image_hash_index_path'))
+
+    return _image_hash_index
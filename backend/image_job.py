@@ -0,0 +1,330 @@
+import os
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from config import S3_CONFIG
+from connection import get_db_connection
+from image.model.image_dao import ImageDao
+from utils import PRODUCT_IMAGE_ORDERS, store_product_images
+
+
+class ImageJob:
+
+    """ 상품 이미지 리사이즈 / 업로드 작업
+
+    status: pending(대기) -> processing(처리중) -> done(완료) / failed(실패)
+    작업 상태와 연결된 상품(links)은 product_image_jobs, product_image_job_links 에 저장된 값.
+    작업은 등록한 계정(account_id)과 마스터만 조회하고 상품에 연결할 수 있다.
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): 작업 상태를 데이터베이스에 저장하도록 변경, 연결된 상품 목록 추가
+        2026-10-17 (leesh3@brandi.co.kr): 작업을 등록한 계정 추가
+    """
+
+    def __init__(self, job_id, account_id=None, status='pending', image_orders=(), images=None, dedupe_report=None,
+                 error=None, links=(), created_at=None, started_at=None, finished_at=None):
+        self.job_id = job_id
+        self.account_id = account_id
+        self.status = status
+        self.image_orders = list(image_orders)
+
+        # 완료되면 이미지 순서별 url, 사이즈 정보 (upload_product_image 의 리턴값과 같은 형태)
+        self.images = images
+        self.dedupe_report = dedupe_report
+        self.error = error
+
+        # 이미지를 연결할 상품 목록 ({'product_id', 'status': waiting / linked / failed, 'product_info_id', 'error'})
+        self.links = list(links)
+
+        self.created_at = created_at
+        self.started_at = started_at
+        self.finished_at = finished_at
+
+    @classmethod
+    def from_row(cls, image_job):
+        return cls(**image_job)
+
+    def is_accessible_by(self, account_info):
+        """ 작업을 등록한 계정이나 마스터(auth_type_id 1)인지 확인 """
+        return account_info['auth_type_id'] == 1 or self.account_id == account_info['account_no']
+
+    def to_dict(self):
+        return {
+            'job_id': self.job_id,
+            'status': self.status,
+            'image_orders': self.image_orders,
+            'images': self.images,
+            'error': self.error,
+            'dedupe_report': self.dedupe_report,
+            'links': self.links,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+        }
+
+
+class ImageJobQueue:
+
+    """ 상품 이미지 비동기 처리 큐
+
+    요청에서는 원본 이미지를 spool 디렉토리에 저장하고 작업 번호만 바로 리턴하고,
+    작업 스레드에서 리사이즈, s3 업로드를 한 뒤 연결된 상품이 있으면 상품의 최신 상품 정보에 product_images 를 등록한다.
+    작업 상태는 데이터베이스에 저장하므로 어느 프로세스에서나 조회, 상품 연결을 할 수 있고,
+    작업을 처리하던 프로세스가 종료되어 timeout(초) 안에 끝나지 않은 작업은 실패(IMAGE_JOB_EXPIRED)로 기록된다.
+    이미지를 등록하지 못한 상품은 연결 상태(failed)와 에러가 작업 조회 결과에 남는다.
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): 작업 상태를 데이터베이스에 저장하고 상품 번호로 최신 상품 정보에 연결하도록 변경
+    """
+
+    def __init__(self, max_workers=2, spool_dir=None, timeout=600):
+        self.spool_dir = spool_dir or os.path.join(tempfile.gettempdir(), 'brandi-image-jobs')
+        os.makedirs(self.spool_dir, exist_ok=True)
+
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='image-job')
+        self._image_dao = ImageDao()
+        self._lock = threading.Lock()
+
+        # 이 프로세스의 작업 통계
+        self._submitted_count = 0
+        self._done_count = 0
+        self._failed_count = 0
+        self._link_failed_count = 0
+
+    def submit(self, image_files, account_no):
+
+        """ 이미지 작업 등록
+
+        Args:
+            image_files: {이미지 순서: 파일 객체 또는 None} (ImageUpload.get_product_image_files 의 리턴값)
+            account_no: 작업을 등록하는 계정 번호
+
+        Returns:
+            ImageJob 객체
+        """
+        spooled_files = {}
+
+        try:
+            for image_order, image_file in image_files.items():
+                if image_file:
+                    path = os.path.join(self.spool_dir, uuid.uuid4().hex)
+                    image_file.save(path)
+                    spooled_files[image_order] = (path, image_file.content_type)
+
+            job = ImageJob(uuid.uuid4().hex, account_id=account_no, image_orders=sorted(spooled_files))
+            self._run_dao(self._image_dao.insert_image_job, {
+                'job_id': job.job_id,
+                'account_id': job.account_id,
+                'image_orders': job.image_orders,
+            })
+
+        except Exception:
+            self._remove_files(spooled_files)
+            raise
+
+        with self._lock:
+            self._submitted_count += 1
+
+        self._executor.submit(self._process, job.job_id, spooled_files)
+
+        # 다른 프로세스가 종료되면서 남긴 작업 정리
+        self._executor.submit(self._expire_jobs)
+        return job
+
+    def get_job(self, job_id):
+
+        """ 작업 조회
+
+        timeout 이 지나도록 끝나지 않은 작업은 실패로 바꾸고,
+        끝났는데 연결을 기다리는 상품이 남아 있으면(연결하던 프로세스가 종료된 경우) 여기서 연결한다.
+
+        Returns:
+            ImageJob 객체, 작업이 없으면 None
+        """
+        db_connection = get_db_connection()
+        try:
+            if self._image_dao.expire_image_jobs({'job_id': job_id, 'timeout': self.timeout}, db_connection):
+                self._link_job(job_id, db_connection)
+
+            image_job = self._image_dao.get_image_job(job_id, db_connection)
+            if image_job is None:
+                return None
+
+            waiting = any(link['status'] == 'waiting' for link in image_job['links'])
+            if waiting and image_job['status'] not in ('pending', 'processing'):
+                self._link_job(job_id, db_connection)
+                image_job = self._image_dao.get_image_job(job_id, db_connection)
+
+            return ImageJob.from_row(image_job)
+
+        finally:
+            db_connection.close()
+
+    @staticmethod
+    def get_image_references(job):
+
+        """ 상품 등록 / 수정에 사용할 이미지 정보
+
+        작업이 완료되었으면 업로드된 이미지의 url 을, 아직 처리중이면 이미지 순서별로 작업 번호({'job_id': ..})를 리턴한다.
+        이미지가 없는 순서는 빈 딕셔너리로 채운다.
+        """
+        if job.status == 'done':
+            return dict(job.images)
+
+        return {
+            image_order: ({'job_id': job.job_id} if image_order in job.image_orders else {})
+            for image_order in PRODUCT_IMAGE_ORDERS
+        }
+
+    def attach_product(self, job_id, product_id, account_info):
+
+        """ 작업에 상품 연결
+
+        상품 정보가 커밋된 뒤에 호출한다. 작업이 끝나면 그때의 최신 상품 정보(is_current = 1)에 product_images 를 등록하고,
+        이미 끝난 작업이면 바로 등록한다. 실패한 작업이면 연결을 실패로 기록한다.
+        작업을 등록한 계정이나 마스터가 아니면(account_info: auth_type_id, account_no) 연결하지 않는다.
+        """
+        db_connection = get_db_connection()
+        try:
+            self._image_dao.insert_image_job_link({
+                'job_id': job_id,
+                'product_id': product_id,
+                'auth_type_id': account_info['auth_type_id'],
+                'account_no': account_info['account_no'],
+            }, db_connection)
+            self._link_job(job_id, db_connection)
+
+        except Exception as e:
+            print(f'IMAGE_JOB_LINK_ERROR_WITH {job_id} {product_id} {e}')
+
+        finally:
+            db_connection.close()
+
+    def _process(self, job_id, image_files):
+        try:
+            if not self._run_dao(self._image_dao.start_image_job, job_id):
+                return
+
+            try:
+                # 리사이즈 후 내용 해시를 key 로 업로드 (이미 저장된 이미지는 생략)
+                images, _, dedupe_report = store_product_images(image_files)
+                job_info = {'job_id': job_id, 'status': 'done', 'images': images, 'dedupe_report': dedupe_report}
+
+            except Exception as e:
+                print(f'IMAGE_JOB_ERROR_WITH {job_id} {e}')
+                job_info = {'job_id': job_id, 'status': 'failed', 'error': f'{e}'}
+
+            if not self._run_dao(self._image_dao.finish_image_job, job_info):
+                return
+
+            with self._lock:
+                if job_info['status'] == 'done':
+                    self._done_count += 1
+                else:
+                    self._failed_count += 1
+
+            self._run_dao(self._link_job, job_id)
+
+        except Exception as e:
+            print(f'IMAGE_JOB_ERROR_WITH {job_id} {e}')
+
+        finally:
+            self._remove_files(image_files)
+
+    def _expire_jobs(self):
+        try:
+            expired_job_ids = self._run_dao(self._image_dao.expire_image_jobs, {'timeout': self.timeout})
+            for job_id in expired_job_ids:
+                print(f'IMAGE_JOB_EXPIRED {job_id}')
+                self._run_dao(self._link_job, job_id)
+
+        except Exception as e:
+            print(f'IMAGE_JOB_EXPIRE_ERROR_WITH {e}')
+
+    def _link_job(self, job_id, db_connection):
+        links = self._image_dao.link_image_job(job_id, db_connection)
+
+        for link in links:
+            if link['status'] == 'failed':
+                print(f'IMAGE_JOB_LINK_FAILED {job_id} {link["product_id"]} {link["error"]}')
+                with self._lock:
+                    self._link_failed_count += 1
+
+        return links
+
+    @staticmethod
+    def _run_dao(dao_method, dao_info):
+        # 요청 밖(작업 스레드)에서는 커넥션 풀에서 따로 빌려서 사용하고 반납
+        db_connection = get_db_connection()
+        try:
+            return dao_method(dao_info, db_connection)
+
+        finally:
+            db_connection.close()
+
+    @staticmethod
+    def _remove_files(image_files):
+        for path, _ in image_files.values():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def stats(self):
+        """ 이 프로세스의 작업 큐 통계 (등록, 완료, 실패, 상품 연결 실패 수 등) """
+        with self._lock:
+            return {
+                'submitted_count': self._submitted_count,
+                'done_count': self._done_count,
+                'failed_count': self._failed_count,
+                'link_failed_count': self._link_failed_count,
+                'pending_count': self._submitted_count - self._done_count - self._failed_count,
+            }
+
+
+_image_job_queue = None
+_image_job_queue_lock = threading.Lock()
+
+
+def get_image_job_queue():
+
+    """ 상품 이미지 작업 큐
+
+    처음 호출될 때 한번만 생성되고 프로세스 안에서 공유된다.
+    설정은 S3_CONFIG 에 선택적으로 추가할 수 있다.
+        image_job_workers: 동시에 처리할 작업 수 (기본 2)
+        image_job_spool_dir: 원본 이미지를 저장할 디렉토리 (기본 임시 디렉토리)
+        image_job_timeout: 작업이 끝나야 하는 시간(초), 지나면 실패로 기록 (기본 600)
+
+    Returns:
+        ImageJobQueue 객체
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    global _image_job_queue
+
+    if _image_job_queue is None:
+        with _image_job_queue_lock:
+            if _image_job_queue is None:
+                _image_job_queue = ImageJobQueue(
+                    max_workers=S3_CONFIG.get('image_job_workers', 2),
+                    spool_dir=S3_CONFIG.get('image_job_spool_dir'),
+                    timeout=S3_CONFIG.get('image_job_timeout', 600),
+                )
+
+    return _image_job_queue
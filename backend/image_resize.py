@@ -0,0 +1,76 @@
+import io
+import uuid
+
+from PIL import Image
+
+
+# 상품 이미지 사이즈 (이름, 가로 길이, image_sizes 테이블의 id). 큰 사이즈부터 순서대로 리사이즈한다.
+PRODUCT_IMAGE_SIZES = (
+    ('big', 640, 1),
+    ('medium', 320, 2),
+    ('small', 120, 3),
+)
+
+RESAMPLE_FILTERS = {
+    'nearest': Image.NEAREST,
+    'bilinear': Image.BILINEAR,
+    'bicubic': Image.BICUBIC,
+    'lanczos': Image.LANCZOS,
+}
+
+
+class ImageResizeError(Exception):
+    """ 이미지를 열거나 리사이즈하지 못한 경우 """
+    pass
+
+
+def resize_image(image_file, content_type, sizes=PRODUCT_IMAGE_SIZES, resample='lanczos', reducing_gap=2.0):
+
+    """ 이미지를 한번만 디코딩해서 여러 사이즈로 리사이즈
+
+    - JPEG 는 draft 모드로 가장 큰 사이즈보다 작아지지 않는 범위에서 축소된 상태로 디코딩한다.
+    - 가장 큰 사이즈를 먼저 만들고, 다음 사이즈는 바로 앞 사이즈에서 이어서 리사이즈한다.
+    - reducing_gap 을 사용해서 큰 비율로 줄일 때 정수배 축소를 먼저 적용한다.
+    - 사이즈별로 한번씩만 인코딩해서 BytesIO buffer 에 담는다.
+
+    Args:
+        image_file: 이미지 파일 객체 (파일 경로, 파일 객체, FileStorage)
+        content_type: 이미지 파일의 content type (png 이면 png, 그 외에는 jpeg 로 인코딩)
+        sizes: (이름, 가로 길이, 사이즈 id) 튜플. 가로 길이가 큰 순서대로 정렬되어 있어야 함
+        resample: 리사이즈 필터 이름 (nearest, bilinear, bicubic, lanczos)
+        reducing_gap: Image.resize 의 reducing_gap, None 이면 사용하지 않음
+
+    Returns:
+        {이름: [BytesIO 객체, uuid, 사이즈 id]} 딕셔너리
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    resample_filter = RESAMPLE_FILTERS[resample]
+    image_format = 'png' if 'png' in content_type else 'jpeg'
+
+    with Image.open(image_file) as opened_image:
+        largest_width = sizes[0][1]
+        largest_height = int(opened_image.size[1] * (largest_width / opened_image.size[0]))
+
+        # JPEG 는 디코딩 단계에서 1/2, 1/4, 1/8 로 축소해서 디코딩 (가장 큰 사이즈보다 작아지지 않음)
+        opened_image.draft('RGB', (largest_width, largest_height))
+
+        source_image = opened_image
+        if image_format == 'jpeg' and source_image.mode not in ('RGB', 'L'):
+            source_image = source_image.convert('RGB')
+
+        resized_images = {}
+        for name, width, size_id in sizes:
+            height = max(1, int(source_image.size[1] * (width / source_image.size[0])))
+            source_image = source_image.resize((width, height), resample_filter, reducing_gap=reducing_gap)
+
+            image_io = io.BytesIO()
+            source_image.save(image_io, image_format)
+            image_io.seek(0)
+            resized_images[name] = [image_io, str(uuid.uuid4()), size_id]
+
+    return resized_images
@@ -0,0 +1,181 @@
+import re
+
+from cache import list_count_cache
+
+# ngram 전문 검색 인덱스의 토큰 길이 (MySQL ngram_token_size 기본값)
+NGRAM_TOKEN_SIZE = 2
+
+# 단어는 큰따옴표로 감싼 phrase 로 검색하므로 검색어의 큰따옴표는 제거 (phrase 안의 다른 연산자 문자는 그대로 검색됨)
+FULLTEXT_QUOTE_PATTERN = re.compile(r'"')
+
+
+class ListQuery:
+
+    """ 필터링된 리스트 조회 쿼리
+
+    SELECT 컬럼, FROM / 기본 WHERE 절과 필터 조건을 한번만 정의하고
+    페이지 조회, 필터된 건수 조회, 페이지네이션 없는 전체 조회(엑셀) 쿼리를 만든다.
+
+    페이지 조회에는 COUNT(*) OVER () 를 같이 조회해서 필터된 건수를 한번에 가져온다. (MySQL 8.0 이상)
+    다음의 경우에만 건수를 따로 조회한다.
+        - cursor 조건(seek_condition)이 있는 경우: 윈도우 함수는 cursor 조건이 적용된 뒤의 건수를 세기 때문
+        - offset 이 전체 건수보다 커서 조회된 row 가 없는 경우
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): ngram 전문 검색 조건(add_text_search)과 검색 관련도 정렬 추가
+    """
+
+    def __init__(self, select_columns, from_clause, params):
+
+        """
+        Args:
+            select_columns: SELECT 할 컬럼 목록 (SELECT 키워드 제외)
+            from_clause: FROM 절과 기본 WHERE 조건 (필터 조건은 add_filter 로 추가)
+            params: 쿼리에 바인딩할 값 딕셔너리
+        """
+        self.select_columns = select_columns
+        self.from_clause = from_clause
+        self.params = params
+        self.filters = []
+        self.relevance = []
+
+    def add_filter(self, condition):
+        """ 필터 조건 추가 (AND 로 연결) """
+        self.filters.append(condition)
+
+    def add_text_search(self, column, param_name):
+
+        """ 부분 / 단어 검색 조건 추가
+
+        params[param_name] 의 검색어를 공백으로 나눈 단어가 모두 포함된 row 를 찾는다.
+        column 에 ngram 전문 검색 인덱스가 있어야 하고, 각 단어는 ngram phrase 로 검색되어 LIKE '%단어%' 와 같은 결과를 낸다.
+        NGRAM_TOKEN_SIZE 보다 짧은 단어가 있으면 ngram 으로 찾을 수 없으므로 검색어 전체를 LIKE '%검색어%' 로 검색한다.
+        전문 검색으로 찾은 경우 관련도 식을 relevance 에 추가한다. (relevance_order 로 정렬)
+
+        Args:
+            column: 검색할 컬럼
+            param_name: 검색어가 담긴 파라미터 이름
+        """
+        keyword = self.params[param_name].strip()
+        words = FULLTEXT_QUOTE_PATTERN.sub(' ', keyword).split()
+
+        if words and all(len(word) >= NGRAM_TOKEN_SIZE for word in words):
+            self.params[param_name] = ' '.join(f'+"{word}"' for word in words)
+            match = f'MATCH({column}) AGAINST (%({param_name})s IN BOOLEAN MODE)'
+            self.add_filter(match)
+            self.relevance.append(match)
+
+        else:
+            self.params[param_name] = '%' + keyword.replace('%', '\\%').replace('_', '\\_') + '%'
+            self.add_filter(f'{column} LIKE %({param_name})s')
+
+    def relevance_order(self, order_by):
+        """ 전문 검색 조건이 있으면 관련도가 높은 순으로 먼저 정렬하는 정렬 조건 """
+        return ', '.join([f'{match} DESC' for match in self.relevance] + [order_by])
+
+    def _where(self):
+        return self.from_clause + ''.join(f' AND {condition}' for condition in self.filters)
+
+    def select_statement(self, order_by=None):
+        """ 페이지네이션 없이 필터만 적용한 조회 쿼리 """
+        statement = f'SELECT {self.select_columns} {self._where()}'
+        if order_by:
+            statement += f' ORDER BY {order_by}'
+        return statement
+
+    def count_statement(self):
+        """ 필터된 건수 조회 쿼리 """
+        return f'SELECT COUNT(0) AS filtered_count {self._where()}'
+
+    def fetch_page(self, db_cursor, order_by, limit=None, offset=None, seek_condition=None, with_count=True):
+
+        """ 페이지 조회
+
+        Args:
+            db_cursor: 데이터베이스 커서
+            order_by: 정렬 조건
+            limit: 조회할 row 수, 없으면 전부 조회
+            offset: 건너뛸 row 수
+            seek_condition: cursor 페이지네이션 조건 (필터된 건수에는 적용하지 않음)
+            with_count: False 면 필터된 건수를 조회하지 않음
+
+        Returns:
+            (row 리스트, 필터된 건수 또는 None)
+        """
+        use_window_count = with_count and not seek_condition
+
+        statement = f'SELECT {self.select_columns}'
+        if use_window_count:
+            statement += ', COUNT(*) OVER () AS filtered_count'
+        statement += f' {self._where()}'
+
+        if seek_condition:
+            statement += f' AND {seek_condition}'
+
+        statement += f' ORDER BY {order_by}'
+
+        params = dict(self.params)
+        if limit:
+            params['page_limit'] = limit
+            statement += ' LIMIT %(page_limit)s'
+
+            if offset:
+                params['page_offset'] = offset
+                statement += ' OFFSET %(page_offset)s'
+
+        db_cursor.execute(statement, params)
+        rows = db_cursor.fetchall()
+
+        if not with_count:
+            return rows, None
+
+        if use_window_count and rows:
+            filtered_count = rows[0]['filtered_count']
+            for row in rows:
+                del row['filtered_count']
+            return rows, filtered_count
+
+        if use_window_count and not offset:
+            return rows, 0
+
+        return rows, self.count(db_cursor)
+
+    def count(self, db_cursor):
+        """ 필터된 건수 조회 """
+        db_cursor.execute(self.count_statement(), self.params)
+        return db_cursor.fetchone()['filtered_count']
+
+
+def get_total_count(list_name, db_cursor, count_statement, params=None):
+
+    """ 필터 없는 리스트 전체 건수
+
+    list_count_cache 에 보관된 값이 있으면 조회하지 않고 사용한다.
+    리스트에 row 가 추가 / 삭제되는 곳에서는 cache.invalidate_list_count_cache 를 호출한다.
+
+    Args:
+        list_name: 캐시 key 로 사용할 리스트 이름
+        db_cursor: 데이터베이스 커서
+        count_statement: 첫번째 컬럼이 전체 건수인 쿼리
+        params: 쿼리에 바인딩할 값
+
+    Returns:
+        전체 건수
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    total_count = list_count_cache.get(list_name)
+    if total_count is None:
+        db_cursor.execute(count_statement, params)
+        total_count = list(db_cursor.fetchone().values())[0]
+        list_count_cache.set(list_name, total_count)
+
+    return total_count
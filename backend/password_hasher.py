@@ -0,0 +1,170 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+import bcrypt
+
+from config import SECRET
+
+
+class PasswordHashError(Exception):
+    """ 비밀번호 암호화 작업을 처리하지 못했을 때 발생하는 에러 """
+    pass
+
+
+class PasswordHashBusyError(PasswordHashError):
+    """ 대기중인 암호화 작업이 최대치에 도달해서 새 작업을 받지 못할 때 발생하는 에러 """
+    pass
+
+
+class PasswordHashTimeoutError(PasswordHashError):
+    """ 제한 시간 안에 암호화 작업이 끝나지 않았을 때 발생하는 에러 """
+    pass
+
+
+class PasswordHasher:
+
+    """ bcrypt 비밀번호 암호화 / 확인을 처리하는 작업 풀
+
+    bcrypt 는 암호화 중 GIL 을 놓기 때문에 스레드 풀에서 여러 작업을 동시에 처리할 수 있다.
+    - 실행중 + 대기중인 작업이 max_workers + max_queue_size 를 넘으면 바로 PasswordHashBusyError 를 발생시킨다.
+    - 작업이 timeout(초) 안에 끝나지 않으면 PasswordHashTimeoutError 를 발생시킨다.
+    - rounds 는 새로 암호화 할 때 사용하는 work factor 이고, 저장된 비밀번호의 cost 가 다르면 needs_rehash 가 True 가 된다.
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+
+    def __init__(self, rounds=12, max_workers=4, max_queue_size=32, timeout=5):
+        if max_workers < 1 or max_queue_size < 0:
+            raise ValueError('INVALID_HASHER_SIZE')
+
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.timeout = timeout
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='password-hasher')
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue_size)
+
+        # 작업 통계
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed_count = 0
+        self._rejected_count = 0
+        self._timeout_count = 0
+        self._total_run_time = 0.0
+
+    def hash_password(self, password):
+        """ 비밀번호를 설정된 work factor 로 암호화해서 문자열로 리턴 """
+        hashed_password = self._run(bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt(self.rounds))
+        return hashed_password.decode('utf-8')
+
+    def check_password(self, password, hashed_password):
+        """ 입력한 비밀번호와 암호화 된 비밀번호가 일치하는지 확인 """
+        return self._run(bcrypt.checkpw, password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+    def needs_rehash(self, hashed_password):
+        """ 저장된 비밀번호의 cost 가 설정된 work factor 와 다른지 확인 ($2b$12$... 형식) """
+        try:
+            return int(hashed_password.split('$')[2]) != self.rounds
+        except (IndexError, ValueError):
+            return False
+
+    def _run(self, func, *args):
+        # 자리가 없으면 기다리지 않고 바로 거절
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected_count += 1
+            raise PasswordHashBusyError('PASSWORD_HASH_BUSY')
+
+        with self._lock:
+            self._pending += 1
+
+        future = self._executor.submit(self._timed, func, *args)
+
+        # 제한 시간이 지나도 실행중인 작업은 끝까지 자리를 차지하므로 완료될 때 반납
+        future.add_done_callback(self._release)
+
+        try:
+            return future.result(timeout=self.timeout)
+
+        except FutureTimeoutError:
+            # 아직 시작하지 않은 작업은 취소
+            future.cancel()
+            with self._lock:
+                self._timeout_count += 1
+            raise PasswordHashTimeoutError('PASSWORD_HASH_TIMEOUT')
+
+    def _timed(self, func, *args):
+        started_at = time.monotonic()
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._completed_count += 1
+                self._total_run_time += time.monotonic() - started_at
+
+    def _release(self, future):
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def stats(self):
+        """ 작업 풀 통계 (대기중, 완료, 거절, 시간 초과 횟수 등) """
+        with self._lock:
+            return {
+                'rounds': self.rounds,
+                'max_workers': self.max_workers,
+                'max_queue_size': self.max_queue_size,
+                'pending': self._pending,
+                'completed_count': self._completed_count,
+                'rejected_count': self._rejected_count,
+                'timeout_count': self._timeout_count,
+                'avg_run_time': self._total_run_time / self._completed_count if self._completed_count else 0.0,
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+_password_hasher = None
+_password_hasher_lock = threading.Lock()
+
+
+def get_password_hasher():
+
+    """ 비밀번호 암호화 작업 풀
+
+    처음 호출될 때 한번만 생성되고 프로세스 안에서 공유된다.
+    설정은 SECRET 에 선택적으로 추가할 수 있다.
+        bcrypt_rounds: 암호화 work factor (기본 12)
+        bcrypt_max_workers: 동시에 실행할 작업 수 (기본 4)
+        bcrypt_max_queue_size: 대기할 수 있는 작업 수 (기본 32)
+        bcrypt_timeout: 작업을 기다리는 최대 시간(초) (기본 5)
+
+    Returns:
+        PasswordHasher 객체
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    global _password_hasher
+
+    if _password_hasher is None:
+        with _password_hasher_lock:
+            if _password_hasher is None:
+                _password_hasher = PasswordHasher(
+                    rounds=SECRET.get('bcrypt_rounds', 12),
+                    max_workers=SECRET.get('bcrypt_max_workers', 4),
+                    max_queue_size=SECRET.get('bcrypt_max_queue_size', 32),
+                    timeout=SECRET.get('bcrypt_timeout', 5),
+                )
+
+    return _password_hasher
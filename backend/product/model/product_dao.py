@@ -1,6 +1,33 @@
 from flask import jsonify
-from mysql.connector.errors import Error
-
+from pymysql.err import Error
+
+from image_job import get_image_job_queue
+from image_resize import PRODUCT_IMAGE_SIZES
+from list_query import ListQuery
+from product.model.product_image_tag import (
+    copy_product_images, get_product_image_rows, insert_product_images, insert_product_tag_rows, insert_product_tags
+)
+from product.model.product_list_view import refresh_product_list_view
+from seller.model.seller_product_count import change_seller_product_count, move_seller_product_count
+from utils import encode_cursor
+
+# 상품 리스트 엑셀파일의 컬럼명과 상품 정보의 key
+PRODUCT_EXCEL_COLUMNS = [
+    ('등록일', 'created_at'),
+    ('대표이미지', 'image_url'),
+    ('상품명', 'product_name'),
+    ('상품번호', 'product_no'),
+    ('셀러속성', 'seller_type_name'),
+    ('셀러명', 'seller_name'),
+    ('판매가', 'price'),
+    ('할인가', 'discount_price'),
+    ('판매여부', 'is_available'),
+    ('진열여부', 'is_on_display'),
+    ('할인여부', 'is_discount')
+]
+
+# 상품 리스트 정렬 (등록순)
+PRODUCT_LIST_ORDER_BY = "PL01.created_at DESC, PL01.product_no DESC"
 
 class ProductDao:
 
@@ -31,6 +58,7 @@ class ProductDao:
         History:
             2020-04-02 (leesh3@brandi.co.kr): 초기 생성
             2020-04-16 (leejm3@brandi.co.kr): SQL 문 별칭 적용
+            2026-10-17 (leesh3@brandi.co.kr): 최신 이력 조건을 is_current 로 변경
 
         """
         try:
@@ -53,7 +81,7 @@ class ProductDao:
                     
                     WHERE 
                         PC01.account_no=%(account_no)s 
-                        AND PC03.close_time = '2037-12-31 23:59:59.0'
+                        AND PC03.is_current = 1
                 """
 
                 db_cursor.execute(get_stmt, {'account_no': account_no})
@@ -131,19 +159,23 @@ class ProductDao:
             return jsonify({'message': 'DB_CURSOR_ERROR'}), 500
 
     # noinspection PyMethodMayBeStatic
-    def get_product_detail(self, product_no, db_connection):
+    def get_product_detail(self, product_no, account_info, db_connection, as_of=None):
 
         """상품 등록/수정시 나타나는 개별 상품의 기존 정보 표출
 
         상품의 번호를 받아 해당하는 상품의 상세 정보를 표출
+        셀러는 최신 이력의 셀러가 자신인 상품만 조회할 수 있음 (as_of 로 이전 셀러의 이력을 조회하는 경우도 같음)
 
         Args:
             product_no(integer): 동일 상품 변경 이력의 가장 최신 버전 인덱스 번호
+            account_info: 조회하는 계정 정보(auth_type_id, token_account_no)
             db_connection(DatabaseConnection): 데이터베이스 커넥션 객체
+            as_of: 이 시점(데이터베이스 일시)에 유효했던 이력을 조회, 없으면 최신 이력
 
         Returns:
-            200: 상품별 상세 정보
+            200: 상품별 상세 정보 (이력의 시작일시, 종료일시 포함)
             400: key_error
+            403: NO_AUTHORIZATION
             404: page_not_found
             500: database_error
 
@@ -152,13 +184,62 @@ class ProductDao:
 
         History:
             2020-04-03 (leesh3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 최신 이력 조건을 is_current 로 변경
+            2026-10-17 (leesh3@brandi.co.kr): as_of 시점 이력 조회 추가, 이력의 시작일시 / 종료일시 표출
+            2026-10-17 (leesh3@brandi.co.kr): 셀러 권한이면 상품의 셀러 확인 (get_product_history 와 같은 기준)
         """
         try:
             with db_connection.cursor() as db_cursor:
                 product_info = {
-                    'product_id': product_no
+                    'product_id': product_no,
+                    'as_of': as_of
                 }
 
+                # 셀러 권한이면 최신 이력의 셀러가 자신이어야 함
+                if account_info['auth_type_id'] == 2:
+                    db_cursor.execute("""
+                        SELECT
+                            SA01.account_id
+                        
+                        FROM
+                            product_infos AS PI01
+                        
+                        INNER JOIN
+                            seller_accounts AS SA01
+                            ON SA01.seller_account_no = PI01.seller_id
+                        
+                        WHERE
+                            PI01.product_id = %(product_id)s
+                        AND
+                            PI01.is_current = 1
+                    """, product_info)
+                    product_owner = db_cursor.fetchone()
+
+                    if not product_owner:
+                        return jsonify({'message': 'PRODUCT_DOES_NOT_EXIST'}), 404
+
+                    if product_owner['account_id'] != account_info['token_account_no']:
+                        return jsonify({'message': 'NO_AUTHORIZATION'}), 403
+
+                # as_of 가 있으면 그 시점에 유효했던 이력 (start_time <= as_of < close_time)
+                # (product_id, start_time, close_time) 인덱스에서 start_time <= as_of 인 마지막 이력 하나만 읽음
+                if as_of:
+                    version_condition = """
+                        start_time <= %(as_of)s
+                    AND
+                        close_time > %(as_of)s
+                    ORDER BY
+                        start_time DESC
+                    LIMIT 1
+                    """
+
+                else:
+                    version_condition = """
+                        is_current = 1
+                    GROUP BY
+                        product_infos.product_info_no
+                    """
+
                 get_stmt = """
                     SELECT
                         seller_id,
@@ -182,7 +263,9 @@ class ProductDao:
                         max_unit,
                         product_id,
                         product_info_no,
-                        seller_account_no
+                        seller_account_no,
+                        start_time,
+                        close_time
                     FROM 
                         product_infos 
                     INNER JOIN 
@@ -191,10 +274,7 @@ class ProductDao:
                     WHERE 
                         product_id=%(product_id)s 
                     AND
-                        close_time='2037-12-31 23:59:59.0'
-                    GROUP BY
-                        product_infos.product_info_no
-                """
+                """ + version_condition
                 db_cursor.execute(get_stmt, product_info)
                 product_information = db_cursor.fetchone()
 
@@ -240,6 +320,113 @@ class ProductDao:
             db_connection.rollback()
             return jsonify({'message': 'DB_CURSOR_ERROR'}), 500
 
+    # noinspection PyMethodMayBeStatic
+    def get_product_history(self, history_info, db_connection):
+
+        """ 상품 정보 변경 이력 목록
+
+        상품의 모든 이력(product_infos)을 시작일시 최신순으로 표출.
+        (product_id, start_time, close_time) 인덱스로 상품의 이력만 읽음.
+
+        Args:
+            history_info: 상품 번호(product_no), offset, limit, 조회하는 계정 정보(auth_type_id, token_account_no)
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            200: 전체 이력 수(total_count), 상품 이력 목록(histories)
+            403: NO_AUTHORIZATION
+            404: PRODUCT_DOES_NOT_EXIST
+            400: INVALID_KEY
+            500: DB_CURSOR_ERROR
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        try:
+            with db_connection.cursor() as db_cursor:
+
+                # 상품의 소유 셀러와 전체 이력 수
+                db_cursor.execute("""
+                    SELECT
+                        SA01.account_id,
+                        COUNT(*) AS total_count
+
+                    FROM
+                        product_infos AS PI01
+
+                    INNER JOIN
+                        seller_accounts AS SA01
+                        ON SA01.seller_account_no = PI01.seller_id
+
+                    WHERE
+                        PI01.product_id = %(product_no)s
+
+                    GROUP BY
+                        SA01.account_id
+
+                    ORDER BY
+                        MAX(PI01.start_time) DESC
+                """, history_info)
+                product_owners = db_cursor.fetchall()
+
+                if not product_owners:
+                    return jsonify({'message': 'PRODUCT_DOES_NOT_EXIST'}), 404
+
+                # 셀러 권한이면 최신 이력의 셀러가 자신이어야 함
+                if history_info['auth_type_id'] == 2 \
+                        and product_owners[0]['account_id'] != history_info['token_account_no']:
+                    return jsonify({'message': 'NO_AUTHORIZATION'}), 403
+
+                db_cursor.execute("""
+                    SELECT
+                        PI01.product_info_no,
+                        PI01.start_time,
+                        PI01.close_time,
+                        PI01.is_current,
+                        PI01.is_available,
+                        PI01.is_on_display,
+                        PI01.name,
+                        PI01.price,
+                        PI01.discount_rate,
+                        PI01.stock,
+                        AC01.login_id AS modifier
+
+                    FROM
+                        product_infos AS PI01
+
+                    -- 수정자 로그인아이디
+                    LEFT JOIN
+                        accounts AS AC01
+                        ON AC01.account_no = PI01.modifier
+
+                    WHERE
+                        PI01.product_id = %(product_no)s
+
+                    ORDER BY
+                        PI01.start_time DESC,
+                        PI01.product_info_no DESC
+
+                    LIMIT %(limit)s OFFSET %(offset)s
+                """, history_info)
+                histories = db_cursor.fetchall()
+
+                return jsonify({
+                    'total_count': sum(owner['total_count'] for owner in product_owners),
+                    'histories': histories
+                }), 200
+
+        except KeyError as e:
+            print(f'KEY_ERROR_WITH {e}')
+            return jsonify({'message': 'INVALID_KEY'}), 400
+
+        except Error as e:
+            print(f'DATABASE_CURSOR_ERROR_WITH {e}')
+            return jsonify({'message': 'DB_CURSOR_ERROR'}), 500
+
     # noinspection PyMethodMayBeStatic
     def insert_new_product(self, product_info, db_connection):
 
@@ -272,6 +459,11 @@ class ProductDao:
             2020-04-06 (leesh3@brandi.co.kr): 초기 생성
             2020-04-09 (leesh3@brandi.co.kr): tag, image 정보 추가 부분 리스트 표현식으로 수정
             2020-04-16 (leejm3@brandi.co.kr): 해당 셀러가 존재하지 않을 경우 에러 반환 추가
+            2026-10-17 (leesh3@brandi.co.kr): 이미지 작업 큐에서 처리중인 이미지 참조 지원
+            2026-10-17 (leesh3@brandi.co.kr): 커밋 전에 상품 리스트 조회용 테이블(product_list_view) 갱신
+            2026-10-17 (leesh3@brandi.co.kr): 셀러의 상품 수(product_count) 증가
+            2026-10-17 (leesh3@brandi.co.kr): 상품 이미지, 태그를 테이블마다 한번의 INSERT 로 등록
+            2026-10-17 (leesh3@brandi.co.kr): 처리중인 이미지 작업을 상품 번호로 연결
         """
 
         try:
@@ -377,56 +569,16 @@ class ProductDao:
                 db_cursor.execute(insert_product_info_stmt, product_info)
                 product_info_id = db_cursor.lastrowid
 
+                # 셀러의 상품 수 증가
+                change_seller_product_count(db_cursor, product_info['seller_id'], 1)
+
                 # 3. TABLE product_images
-                images = product_info['images']
-                for image_set in images.keys():
-                    image_order = image_set[-1]
-                    image_sizes = ['big', 'medium', 'small']
-
-                    if images[image_set]:
-                        for size in image_sizes:
-                            image_info = {
-                                'image_url': images[image_set][f'{size}_size_url'],
-                                'product_info_id': product_info_id,
-                                'image_size_id': images[image_set][f'{size}_image_size_id'],
-                                'image_order': image_order,
-                            }
-
-                            insert_image_stmt = """
-                                INSERT INTO product_images(
-                                    image_url,
-                                    product_info_id,
-                                    image_size_id,
-                                    image_order
-                                ) VALUES (
-                                    %(image_url)s,
-                                    %(product_info_id)s,
-                                    %(image_size_id)s,
-                                    %(image_order)s
-                                )
-                            """
-                            db_cursor.execute(insert_image_stmt, image_info)
-                    else:
-                        pass
+                # 이미지 작업 큐에서 처리중인 이미지({'job_id': ..})는 커밋 후 작업에 연결해서 작업이 끝날 때 등록
+                image_rows, pending_image_job_ids, _ = get_product_image_rows(product_info['images'], product_info_id)
+                insert_product_images(db_cursor, image_rows)
 
                 # 4. TABLE product_tags
-                for tag in product_info['tags']:
-
-                    tag_info = {
-                        'name': tag,
-                        'product_info_id': product_info_id
-                    }
-
-                    insert_tag_stmt = """
-                        INSERT INTO product_tags(
-                            name,
-                            product_info_id
-                        ) VALUES (
-                            %(name)s,
-                            %(product_info_id)s
-                        )
-                    """
-                    db_cursor.execute(insert_tag_stmt, tag_info)
+                insert_product_tags(db_cursor, product_info_id, product_info['tags'])
 
                 # 5. TABLE product_change_histories
                 insert_history_stmt = """
@@ -458,7 +610,18 @@ class ProductDao:
                         product_info_no=%(product_info_no)s
                 """
                 db_cursor.execute(insert_history_stmt, {'product_info_no': product_info_id})
+
+                # 상품 리스트 조회용 테이블 갱신
+                refresh_product_list_view(db_cursor, product_no=product_info['product_id'])
                 db_connection.commit()
+
+                # 처리중인 이미지는 작업이 끝날 때 그때의 최신 상품 정보에 등록 (작업을 등록한 계정, 마스터만 연결)
+                for image_job_id in pending_image_job_ids:
+                    get_image_job_queue().attach_product(image_job_id, product_info['product_id'], {
+                        'auth_type_id': product_info['auth_type_id'],
+                        'account_no': product_info['account_no'],
+                    })
+
                 return jsonify({'message': 'SUCCESS'}), 200
 
         except KeyError as e:
@@ -492,6 +655,12 @@ class ProductDao:
 
         History:
             2020-04-08 (leesh3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 이미지 작업 큐에서 처리중인 이미지 참조 지원
+            2026-10-17 (leesh3@brandi.co.kr): 최신 이력 조건을 is_current 로 변경
+            2026-10-17 (leesh3@brandi.co.kr): 커밋 전에 상품 리스트 조회용 테이블(product_list_view) 갱신
+            2026-10-17 (leesh3@brandi.co.kr): 상품의 셀러가 바뀌면 셀러별 상품 수(product_count) 변경
+            2026-10-17 (leesh3@brandi.co.kr): 상품 이미지, 태그를 한번의 INSERT 로 등록하고 바꾸지 않은 이미지는 이전 상품 정보에서 한번에 복사
+            2026-10-17 (leesh3@brandi.co.kr): 처리중인 이미지 작업을 상품 번호로 연결
         """
 
         try:
@@ -505,7 +674,9 @@ class ProductDao:
 
                 get_product_owner_stmt = """
                     SELECT
-                        account_id
+                        account_id,
+                        product_infos.seller_id,
+                        product_infos.product_info_no
                     
                     FROM
                         seller_accounts
@@ -517,7 +688,7 @@ class ProductDao:
                         product_id=%(product_id)s
                     
                     AND
-                        product_infos.close_time='2037-12-31 23:59:59'
+                        product_infos.is_current = 1
                 """
                 db_cursor.execute(get_product_owner_stmt, product_info)
                 validated_account = db_cursor.fetchone()
@@ -546,7 +717,7 @@ class ProductDao:
                             product_id=%(product_id)s
                         
                         AND
-                            close_time='2037-12-31 23:59:59.0'
+                            is_current = 1
                     """
                 db_cursor.execute(update_previous_product_info_stmt,
                                   {'close_time': now, 'product_id': product_info['product_id']})
@@ -608,95 +779,22 @@ class ProductDao:
 
                 product_info_id = db_cursor.lastrowid
 
+                # 상품의 셀러가 바뀌었으면 이전 셀러와 새 셀러의 상품 수 변경
+                move_seller_product_count(db_cursor, validated_account['seller_id'], product_info['seller_account_id'])
+
                 # 2. TABLE product_images
-                images = product_info['images']
-                for image_set in images.keys():
-                    image_order = image_set[-1]
-                    image_sizes = ['big', 'medium', 'small']
-
-                    if images[image_set]:
-                        for size in image_sizes:
-                            image_info = {
-                                'image_url': images[image_set][f'{size}_size_url'],
-                                'product_info_id': product_info_id,
-                                'image_size_id': images[image_set][f'{size}_image_size_id'],
-                                'image_order': image_order
-                            }
-
-                            insert_image_stmt = """
-                                INSERT INTO product_images(
-                                    image_url,
-                                    product_info_id,
-                                    image_size_id,
-                                    image_order
-                                ) VALUES (
-                                    %(image_url)s,
-                                    %(product_info_id)s,
-                                    %(image_size_id)s,
-                                    %(image_order)s
-                                )
-                            """
-                            db_cursor.execute(insert_image_stmt, image_info)
-                    else:
-                        for image_size_id in range(1, len(image_sizes)+1):
-
-                            image_info = {
-                                'product_info_id': product_info_id,
-                                'product_id': product_info['product_id'],
-                                'image_size_id': image_size_id,
-                                'image_order': image_order,
-                                'previous_close_time': now
-                            }
-
-                            insert_image_stmt = """
-                                INSERT INTO product_images(
-                                    image_url,
-                                    image_size_id,
-                                    image_order,
-                                    product_info_id
-                                ) SELECT 
-                                    image_url,
-                                    image_size_id,
-                                    image_order,
-                                    %(product_info_id)s
-                                
-                                FROM
-                                    product_images
-                                
-                                WHERE
-                                    product_info_id=(
-                                        SELECT 
-                                            product_info_no
-                                        FROM 
-                                            product_infos 
-                                        WHERE 
-                                            product_id = %(product_id)s
-                                        AND
-                                            close_time = %(previous_close_time)s)                                        
-                                AND
-                                    image_order=%(image_order)s AND image_size_id=%(image_size_id)s                                
-                            """
-                            db_cursor.execute(insert_image_stmt, image_info)
+                # 이미지 작업 큐에서 처리중인 이미지({'job_id': ..})는 커밋 후 작업에 연결해서 작업이 끝날 때 등록
+                # 바꾸지 않은 순서의 이미지는 이전 상품 정보의 이미지를 복사
+                image_rows, pending_image_job_ids, unchanged_image_orders = \
+                    get_product_image_rows(product_info['images'], product_info_id)
+                insert_product_images(db_cursor, image_rows)
+                copy_product_images(db_cursor, validated_account['product_info_no'], product_info_id, unchanged_image_orders)
 
                 # 3. TABLE product_tags
-                for tag in product_info['tags']:
-
-                    tag_info = {
-                        'name': tag,
-                        'product_info_id': product_info_id
-                    }
-
-                    insert_tag_stmt = """
-                        INSERT INTO product_tags(
-                            name,
-                            product_info_id
-                        ) VALUES (
-                            %(name)s,
-                            %(product_info_id)s
-                        )
-                    """
-                    db_cursor.execute(insert_tag_stmt, tag_info)
+                insert_product_tags(db_cursor, product_info_id, product_info['tags'])
 
+                # 상품 리스트 조회용 테이블 갱신
+                refresh_product_list_view(db_cursor, product_no=product_info['product_id'])
                 db_connection.commit()
 
                 # 4. TABLE product_change_histories
@@ -731,6 +829,13 @@ class ProductDao:
                 db_cursor.execute(insert_history_stmt, {'product_info_no': product_info_id})
                 db_connection.commit()
 
+                # 처리중인 이미지는 작업이 끝날 때 그때의 최신 상품 정보에 등록 (작업을 등록한 계정, 마스터만 연결)
+                for image_job_id in pending_image_job_ids:
+                    get_image_job_queue().attach_product(image_job_id, product_info['product_id'], {
+                        'auth_type_id': product_info['auth_type_id'],
+                        'account_no': product_info['token_account_no'],
+                    })
+
                 return jsonify({'message': 'SUCCESS'}), 200
 
         except KeyError as e:
@@ -742,6 +847,562 @@ class ProductDao:
             db_connection.rollback()
             return jsonify({'message': 'DB_CURSOR_ERROR'}), 500
 
+    # noinspection PyMethodMayBeStatic
+    def change_product_status(self, status_info, db_connection):
+
+        """ 여러 상품의 판매여부 / 진열여부 일괄 수정
+
+        상품마다 새로운 상품 정보 이력을 만들지만, 상품 수와 관계없이 한 트랜잭션 안에서 집합 단위 쿼리로 처리한다.
+            1. 대상 상품의 최신 상품 정보를 잠그고 존재 여부, 셀러 권한 확인
+            2. 값이 바뀌는 상품만 이전 상품 정보를 INSERT ... SELECT 로 복사해서 새 이력 생성
+            3. 이전 상품 정보를 한번의 UPDATE 로 종료
+            4. 이미지, 태그를 새 이력으로 복사하고 상품 변경 이력(product_change_histories) 생성
+            5. 상품 리스트 조회용 테이블 갱신
+
+        Args:
+            status_info:
+                product_ids: 수정할 상품 번호 목록
+                is_available: 판매여부 (None 이면 바꾸지 않음)
+                is_on_display: 진열여부 (None 이면 바꾸지 않음)
+                auth_type_id: 수정하는 계정의 권한 타입
+                token_account_no: 수정하는 계정 번호
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            200: SUCCESS, changed_product_ids (이미 같은 값인 상품은 새 이력을 만들지 않음)
+            403: NO_AUTHORIZATION (셀러 권한일 때 다른 셀러의 상품 포함)
+            404: PRODUCT_DOES_NOT_EXIST, product_ids
+            500: DB_CURSOR_ERROR
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        try:
+            with db_connection.cursor() as db_cursor:
+
+                # 트랜잭션 시작
+                db_cursor.execute("START TRANSACTION")
+
+                db_cursor.execute("SELECT NOW()")
+                now = db_cursor.fetchone()['NOW()']
+
+                status_data = {
+                    'product_ids': tuple(status_info['product_ids']),
+                    'is_available': status_info['is_available'],
+                    'is_on_display': status_info['is_on_display'],
+                    'modifier': status_info['token_account_no'],
+                    'now': now,
+                }
+
+                # 1. 대상 상품의 최신 상품 정보 (수정이 끝날 때까지 잠금)
+                db_cursor.execute("""
+                    SELECT
+                        PI01.product_info_no,
+                        PI01.product_id,
+                        PI01.is_available,
+                        PI01.is_on_display,
+                        SA01.account_id
+                    
+                    FROM
+                        product_infos AS PI01
+                    
+                    INNER JOIN
+                        seller_accounts AS SA01
+                        ON SA01.seller_account_no = PI01.seller_id
+                    
+                    WHERE
+                        PI01.product_id IN %(product_ids)s
+                    
+                    AND
+                        PI01.is_current = 1
+                    
+                    FOR UPDATE
+                """, status_data)
+                current_product_infos = db_cursor.fetchall()
+
+                found_product_ids = {product['product_id'] for product in current_product_infos}
+                missing_product_ids = [
+                    product_id for product_id in status_info['product_ids'] if product_id not in found_product_ids
+                ]
+                if missing_product_ids:
+                    db_connection.rollback()
+                    return jsonify({'message': 'PRODUCT_DOES_NOT_EXIST', 'product_ids': missing_product_ids}), 404
+
+                # 셀러 권한이면 모든 상품이 자신의 상품이어야 함
+                if status_info['auth_type_id'] == 2:
+                    if any(product['account_id'] != status_info['token_account_no'] for product in current_product_infos):
+                        db_connection.rollback()
+                        return jsonify({'message': 'NO_AUTHORIZATION'}), 403
+
+                # 이미 같은 값인 상품은 새 이력을 만들지 않음
+                changed_product_infos = [
+                    product for product in current_product_infos
+                    if (status_info['is_available'] is not None
+                        and product['is_available'] != status_info['is_available'])
+                    or (status_info['is_on_display'] is not None
+                        and product['is_on_display'] != status_info['is_on_display'])
+                ]
+                if not changed_product_infos:
+                    db_connection.rollback()
+                    return jsonify({'message': 'SUCCESS', 'changed_product_ids': []}), 200
+
+                status_data['previous_product_info_nos'] = tuple(
+                    product['product_info_no'] for product in changed_product_infos
+                )
+                changed_product_ids = [product['product_id'] for product in changed_product_infos]
+                status_data['changed_product_ids'] = tuple(changed_product_ids)
+
+                # 2. 이전 상품 정보를 복사해서 새 이력 생성 (판매여부 / 진열여부만 변경)
+                db_cursor.execute("""
+                    INSERT INTO product_infos
+                    (
+                        is_available,
+                        is_on_display,
+                        product_sort_id,
+                        first_category_id,
+                        second_category_id,
+                        name,
+                        short_description,
+                        color_filter_id,
+                        style_filter_id,
+                        long_description,
+                        youtube_url,
+                        stock,
+                        price,
+                        discount_rate,
+                        discount_start_time,
+                        discount_end_time,
+                        min_unit,
+                        max_unit,
+                        modifier,
+                        seller_id,
+                        product_id,
+                        start_time
+                    )
+                    SELECT
+                        COALESCE(%(is_available)s, is_available),
+                        COALESCE(%(is_on_display)s, is_on_display),
+                        product_sort_id,
+                        first_category_id,
+                        second_category_id,
+                        name,
+                        short_description,
+                        color_filter_id,
+                        style_filter_id,
+                        long_description,
+                        youtube_url,
+                        stock,
+                        price,
+                        discount_rate,
+                        discount_start_time,
+                        discount_end_time,
+                        min_unit,
+                        max_unit,
+                        %(modifier)s,
+                        seller_id,
+                        product_id,
+                        %(now)s
+                    
+                    FROM
+                        product_infos
+                    
+                    WHERE
+                        product_info_no IN %(previous_product_info_nos)s
+                """, status_data)
+
+                # 3. 이전 상품 정보 종료
+                db_cursor.execute("""
+                    UPDATE
+                        product_infos
+                    
+                    SET
+                        close_time = %(now)s
+                    
+                    WHERE
+                        product_info_no IN %(previous_product_info_nos)s
+                """, status_data)
+
+                # 4. 이미지, 태그를 이전 상품 정보에서 새 상품 정보(상품의 최신 이력)로 복사
+                db_cursor.execute("""
+                    INSERT INTO product_images(
+                        image_url,
+                        image_size_id,
+                        image_order,
+                        product_info_id
+                    )
+                    SELECT
+                        PM01.image_url,
+                        PM01.image_size_id,
+                        PM01.image_order,
+                        PI02.product_info_no
+                    
+                    FROM
+                        product_images AS PM01
+                    
+                    INNER JOIN
+                        product_infos AS PI01
+                        ON PI01.product_info_no = PM01.product_info_id
+                    
+                    INNER JOIN
+                        product_infos AS PI02
+                        ON PI02.product_id = PI01.product_id
+                        AND PI02.is_current = 1
+                    
+                    WHERE
+                        PM01.product_info_id IN %(previous_product_info_nos)s
+                """, status_data)
+
+                db_cursor.execute("""
+                    INSERT INTO product_tags(
+                        name,
+                        product_info_id
+                    )
+                    SELECT
+                        PT01.name,
+                        PI02.product_info_no
+                    
+                    FROM
+                        product_tags AS PT01
+                    
+                    INNER JOIN
+                        product_infos AS PI01
+                        ON PI01.product_info_no = PT01.product_info_id
+                    
+                    INNER JOIN
+                        product_infos AS PI02
+                        ON PI02.product_id = PI01.product_id
+                        AND PI02.is_current = 1
+                    
+                    WHERE
+                        PT01.product_info_id IN %(previous_product_info_nos)s
+                """, status_data)
+
+                # 상품 변경 이력
+                db_cursor.execute("""
+                    INSERT INTO product_change_histories
+                    (
+                        product_id,
+                        modifier,
+                        changed_time,
+                        is_available,
+                        is_on_display,
+                        price,
+                        discount_rate,
+                        is_deleted
+                    )
+                    SELECT
+                        product_id,
+                        modifier,
+                        start_time,
+                        is_available,
+                        is_on_display,
+                        price,
+                        discount_rate,
+                        is_deleted
+                    
+                    FROM
+                        product_infos
+                    
+                    WHERE
+                        product_id IN %(changed_product_ids)s
+                    
+                    AND
+                        is_current = 1
+                """, status_data)
+
+                # 5. 상품 리스트 조회용 테이블 갱신
+                refresh_product_list_view(db_cursor, product_nos=changed_product_ids)
+                db_connection.commit()
+
+                return jsonify({'message': 'SUCCESS', 'changed_product_ids': changed_product_ids}), 200
+
+        except KeyError as e:
+            print(f'KEY_ERROR WITH {e}')
+            return jsonify({'message': 'INVALID_KEY'}), 400
+
+        except Error as e:
+            print(f'DATABASE_CURSOR_ERROR_WITH {e}')
+            db_connection.rollback()
+            return jsonify({'message': 'DB_CURSOR_ERROR'}), 500
+
+    # noinspection PyMethodMayBeStatic
+    def get_import_seller(self, account_no, db_connection):
+
+        """ 상품 일괄 등록할 셀러의 셀러 계정 번호와 상품 분류
+
+        Args:
+            account_no: 셀러의 계정 번호
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            {'seller_account_no', 'product_sort_id'}, 셀러가 없으면 None
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+        with db_connection.cursor() as db_cursor:
+            db_cursor.execute("""
+                SELECT
+                    seller_account_no,
+                    product_sort_id
+                    
+                FROM
+                    seller_accounts
+                    
+                INNER JOIN
+                    seller_infos 
+                    ON seller_infos.seller_account_id = seller_accounts.seller_account_no
+                
+                WHERE
+                    account_id = %(account_no)s
+                
+                AND
+                    seller_accounts.is_deleted = 0
+                
+                AND
+                    seller_infos.is_current = 1
+            """, {'account_no': account_no})
+            return db_cursor.fetchone()
+
+    # noinspection PyMethodMayBeStatic
+    def get_stored_product_images(self, image_urls, db_connection):
+
+        """ 이미 저장된 상품 이미지 url 로 같은 이미지의 사이즈별 url 조회 (상품 일괄 등록)
+
+        s3 key 가 이미지 내용 해시이므로 같은 url 이면 같은 이미지이고,
+        그 url 이 등록된 상품 정보의 같은 이미지 순서에서 나머지 사이즈의 url 을 찾는다.
+
+        Args:
+            image_urls: 상품 이미지 url 목록 (사이즈 상관없음)
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            {url: {'big_size_url', 'big_image_size_id', ..}} 상품 이미지로 저장된 적 없는 url 은 빠짐
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+        if not image_urls:
+            return {}
+
+        size_names = {size_id: size_name for size_name, _, size_id in PRODUCT_IMAGE_SIZES}
+
+        with db_connection.cursor() as db_cursor:
+            db_cursor.execute("""
+                SELECT
+                    PI01.image_url AS stored_url,
+                    PI01.product_info_id,
+                    PI02.image_url,
+                    PI02.image_size_id
+                
+                FROM
+                    product_images AS PI01
+                
+                INNER JOIN
+                    product_images AS PI02
+                    ON PI02.product_info_id = PI01.product_info_id
+                    AND PI02.image_order = PI01.image_order
+                
+                WHERE
+                    PI01.image_url IN %(image_urls)s
+                
+                ORDER BY
+                    PI01.product_info_id DESC
+            """, {'image_urls': tuple(image_urls)})
+
+            # 같은 url 이 여러 상품 정보에 있으면 가장 최근 상품 정보의 이미지 사용
+            stored_images = {}
+            stored_product_info_ids = {}
+            for image in db_cursor.fetchall():
+                stored_url = image['stored_url']
+                if stored_product_info_ids.setdefault(stored_url, image['product_info_id']) != image['product_info_id']:
+                    continue
+
+                size_name = size_names[image['image_size_id']]
+                stored_images.setdefault(stored_url, {})[f'{size_name}_size_url'] = image['image_url']
+                stored_images[stored_url][f'{size_name}_image_size_id'] = image['image_size_id']
+
+            return stored_images
+
+    # noinspection PyMethodMayBeStatic
+    def insert_product_batch(self, batch_info, products, db_connection):
+
+        """ 상품 여러개를 한 트랜잭션으로 등록 (상품 일괄 등록)
+
+        insert_new_product 와 같은 테이블에 쓰지만, 상품마다 쿼리를 실행하지 않고 테이블마다 multi-row INSERT 한번으로 등록한다.
+        multi-row INSERT 로 생성된 auto increment 값은 auto_increment_increment, innodb_autoinc_lock_mode=2 에서는
+        연속되지 않을 수 있으므로, 생성된 products / product_infos 의 번호는 같은 트랜잭션에서 다시 조회한다.
+        요청 안에서 배치마다 호출되므로 http 응답 대신 등록 결과를 리턴하고, 에러는 롤백 후 호출한 쪽으로 다시 발생시킨다.
+
+        Args:
+            batch_info:
+                seller_id: 셀러 계정 번호
+                product_sort_id: 셀러의 상품 분류
+                account_no: 등록하는 계정 번호 (uploader, modifier)
+            products: product.service.product_import.parse_product_row 의 상품 정보 목록 (images 포함)
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            상품 순서대로 (상품 번호, 상품 정보 번호) 목록
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 생성된 상품, 상품 정보 번호를 계산하지 않고 같은 트랜잭션에서 다시 조회
+        """
+        if not products:
+            return []
+
+        try:
+            with db_connection.cursor() as db_cursor:
+
+                # 트랜잭션 시작
+                db_cursor.execute("START TRANSACTION")
+
+                # 1. TABLE products
+                db_cursor.execute(
+                    f"INSERT INTO products (uploader) VALUES {', '.join(['(%s)'] * len(products))}",
+                    [batch_info['account_no']] * len(products)
+                )
+
+                # 이 배치의 상품 번호: lastrowid(첫 번호) 이후 이 계정이 올린 상품 중 아직 상품 정보가 없는 상품
+                # (다른 세션이 커밋한 상품은 상품 정보와 같이 커밋되므로 제외됨)
+                db_cursor.execute("""
+                    SELECT
+                        product_no
+                    
+                    FROM
+                        products AS P
+                    
+                    WHERE
+                        product_no >= %(first_product_no)s
+                    AND
+                        uploader = %(account_no)s
+                    AND NOT EXISTS (
+                        SELECT 1 FROM product_infos WHERE product_id = P.product_no
+                    )
+                    
+                    ORDER BY
+                        product_no
+                    
+                    LIMIT %(product_count)s
+                """, {
+                    'first_product_no': db_cursor.lastrowid,
+                    'account_no': batch_info['account_no'],
+                    'product_count': len(products),
+                })
+                product_nos = [product['product_no'] for product in db_cursor.fetchall()]
+                if len(product_nos) != len(products):
+                    raise ValueError('INSERTED_PRODUCT_COUNT_MISMATCH')
+
+                # 2. TABLE product_infos
+                product_info_columns = [
+                    'is_available', 'is_on_display', 'first_category_id', 'second_category_id', 'name',
+                    'short_description', 'color_filter_id', 'style_filter_id', 'long_description', 'youtube_url',
+                    'stock', 'price', 'discount_rate', 'discount_start_time', 'discount_end_time', 'min_unit', 'max_unit'
+                ]
+                product_info_values = []
+                for product_no, product in zip(product_nos, products):
+                    product_info_values += [product[column] for column in product_info_columns]
+                    product_info_values += [
+                        batch_info['product_sort_id'], batch_info['account_no'], batch_info['seller_id'], product_no
+                    ]
+
+                row_placeholder = f"({', '.join(['%s'] * (len(product_info_columns) + 4))})"
+                db_cursor.execute(f"""
+                    INSERT INTO product_infos
+                    (
+                        {', '.join(product_info_columns)},
+                        product_sort_id,
+                        modifier,
+                        seller_id,
+                        product_id
+                    ) VALUES {', '.join([row_placeholder] * len(products))}
+                """, product_info_values)
+
+                # 새 상품이므로 상품마다 상품 정보는 하나
+                db_cursor.execute("""
+                    SELECT
+                        product_id,
+                        product_info_no
+                    
+                    FROM
+                        product_infos
+                    
+                    WHERE
+                        product_id IN %(product_nos)s
+                """, {'product_nos': tuple(product_nos)})
+                product_info_no_by_product = {
+                    product_info['product_id']: product_info['product_info_no'] for product_info in db_cursor.fetchall()
+                }
+                product_info_nos = [product_info_no_by_product[product_no] for product_no in product_nos]
+
+                # 셀러의 상품 수 증가
+                change_seller_product_count(db_cursor, batch_info['seller_id'], len(products))
+
+                # 3. TABLE product_images, 4. TABLE product_tags
+                image_rows = []
+                tag_rows = []
+                for product_info_no, product in zip(product_info_nos, products):
+                    product_image_rows, _, _ = get_product_image_rows(product['images'], product_info_no)
+                    image_rows += product_image_rows
+                    tag_rows += [(tag, product_info_no) for tag in product['tags']]
+
+                insert_product_images(db_cursor, image_rows)
+                insert_product_tag_rows(db_cursor, tag_rows)
+
+                # 5. TABLE product_change_histories
+                db_cursor.execute("""
+                    INSERT INTO product_change_histories
+                    (
+                        product_id,
+                        modifier,
+                        changed_time,
+                        is_available,
+                        is_on_display,
+                        price,
+                        discount_rate,
+                        is_deleted
+                    )
+                    SELECT
+                        product_id,
+                        modifier,
+                        start_time,
+                        is_available,
+                        is_on_display,
+                        price,
+                        discount_rate,
+                        is_deleted
+                    
+                    FROM
+                        product_infos
+                    
+                    WHERE
+                        product_id IN %(product_nos)s
+                """, {'product_nos': tuple(product_nos)})
+
+                # 상품 리스트 조회용 테이블 갱신
+                refresh_product_list_view(db_cursor, product_nos=product_nos)
+                db_connection.commit()
+
+                return list(zip(product_nos, product_info_nos))
+
+        except Exception:
+            db_connection.rollback()
+            raise
+
     # noinspection PyMethodMayBeStatic
     def get_color_filters(self, db_connection):
 
@@ -787,6 +1448,99 @@ class ProductDao:
             db_connection.rollback()
             return jsonify({'message': 'DB_CURSOR_ERROR'}), 500
 
+    # noinspection PyMethodMayBeStatic
+    def get_product_list_query(self, filter_info):
+
+        """ 상품 리스트 조회 쿼리
+
+        상품 리스트와 엑셀파일 생성 작업에서 같이 사용하는 필터가 적용된 조회 쿼리를 만듦.
+
+        Args:
+            filter_info: 필터에 쓰이는 쿼리 정보
+
+        Returns:
+            ListQuery 객체
+
+        Authors:
+            kimsj5@brandi.co.kr (김승준)
+            leejm3@brandi.co.kr (이종민)
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): get_product_list 에서 분리
+            2026-10-17 (leesh3@brandi.co.kr): 셀러명, 상품명을 일치 검색 대신 ngram 전문 검색으로 검색 (정렬은 등록순 유지)
+        """
+
+        # 상품 리스트 조회 컬럼 (상품 등록 / 수정, 셀러 정보 변경시 갱신되는 product_list_view 에서 조회)
+        product_list_columns = """
+            PL01.created_at,
+            PL01.image_url,
+            PL01.product_name,
+            PL01.product_no,
+            PL01.seller_type_name,
+            PL01.seller_name,
+            PL01.price,
+            PL01.discount_price,
+            PL01.is_available,
+            PL01.is_on_display,
+            PL01.is_discount
+        """
+
+        # product_list_view 에는 상품 리스트에 표출되는 상품만 저장되어 있으므로 필터 조건만 추가
+        product_list_from = """
+            FROM product_list_view as PL01
+            WHERE 1 = 1
+        """
+
+        # 셀러 속성
+        if filter_info.get('seller_type_id', None):
+            filter_info['seller_type_id'] = tuple(filter_info['seller_type_id'])
+
+        product_list_query = ListQuery(product_list_columns, product_list_from, filter_info)
+
+        # 검색 조건
+        # 등록 기간 시작
+        if filter_info.get('period_start', None):
+            product_list_query.add_filter("PL01.created_at > %(period_start)s")
+
+        # 등록기간 종료
+        if filter_info.get('period_end', None):
+            product_list_query.add_filter("PL01.created_at < %(period_end)s")
+
+        # 셀러명 (ngram 전문 검색으로 부분 / 단어 검색)
+        if filter_info.get('seller_name', None):
+            product_list_query.add_text_search("PL01.seller_name", 'seller_name')
+
+        # 상품명 (ngram 전문 검색으로 부분 / 단어 검색)
+        if filter_info.get('product_name', None):
+            product_list_query.add_text_search("PL01.product_name", 'product_name')
+
+        # 상품번호
+        if filter_info.get('product_number', None):
+            product_list_query.add_filter("PL01.product_no = %(product_number)s")
+
+        # 셀러 속성
+        if filter_info.get('seller_type_id', None):
+            product_list_query.add_filter("PL01.seller_type_id in %(seller_type_id)s")
+
+        # 판매여부
+        if filter_info.get('is_available', None) is not None:
+            product_list_query.add_filter("PL01.is_available = %(is_available)s")
+
+        # 진열여부
+        if filter_info.get('is_on_display', None) is not None:
+            product_list_query.add_filter("PL01.is_on_display = %(is_on_display)s")
+
+        # 할인여부
+        if filter_info.get('is_on_discount', None) is not None:
+            if filter_info['is_on_discount'] == 1:
+                product_list_query.add_filter("PL01.is_discount = 1")
+
+            else:
+                product_list_query.add_filter("PL01.is_discount = 0")
+
+        return product_list_query
+
     # noinspection PyMethodMayBeStatic
     def get_product_list(self, filter_info, db_connection):
 
@@ -816,208 +1570,77 @@ class ProductDao:
                 - 주석 추가
             2020-04-16 (leejm3@brandi.co.kr):
                 - 등록순 정렬 추가
+            2026-10-17 (leesh3@brandi.co.kr): cursor(등록일시, 상품번호) 페이지네이션 추가, 응답에 다음 / 이전 페이지 cursor 추가
+            2026-10-17 (leesh3@brandi.co.kr): ListQuery 로 필터 조건을 한번만 만들고 리스트와 상품 수를 한번에 조회, with_count 추가
+            2026-10-17 (leesh3@brandi.co.kr): 최신 이력 조건을 is_current 로 변경
+            2026-10-17 (leesh3@brandi.co.kr): 상품 리스트 조회용 테이블(product_list_view)에서 조회
+            2026-10-17 (leesh3@brandi.co.kr): 조회 쿼리 생성을 get_product_list_query 로 분리
         """
 
+        product_list_query = self.get_product_list_query(filter_info)
+
+        # cursor 페이지네이션: 기준 상품(등록일시, 상품번호)의 다음 / 이전 상품부터 조회 (등록일시가 같으면 상품번호로 구분)
+        cursor_direction = filter_info.get('cursor_direction', None)
+        seek_condition = None
+        if cursor_direction == 'next':
+            seek_condition = """
+                (PL01.created_at < %(cursor_created_at)s
+                OR (PL01.created_at = %(cursor_created_at)s AND PL01.product_no < %(cursor_product_no)s))
+            """
+
+        elif cursor_direction == 'prev':
+            seek_condition = """
+                (PL01.created_at > %(cursor_created_at)s
+                OR (PL01.created_at = %(cursor_created_at)s AND PL01.product_no > %(cursor_product_no)s))
+            """
+
+        # 등록순 정렬 (이전 페이지는 반대로 조회한 뒤 뒤집음)
+        if cursor_direction == 'prev':
+            order_by = "PL01.created_at ASC, PL01.product_no ASC"
+
+        else:
+            order_by = PRODUCT_LIST_ORDER_BY
+
+        # 페이징 시작 (cursor 가 없을 때만 사용)
+        limit = filter_info.get('limit', None)
+        offset = filter_info.get('offset', None) if not cursor_direction else None
+
         try:
             with db_connection as db_cursor:
 
-                # 상품 리스트를 가져오는 sql 명령문, 쿼리가 들어오면 쿼리문을 바인딩해서 검색 실행
-                select_product_list_statement = '''
-                    SELECT 
-                        PL01.created_at, 
-                        PL03.image_url, 
-                        PL02.name as product_name,
-                        PL01.product_no, 
-                        PL05.name as seller_type_name,
-                        PL04.name_kr as seller_name,
-                        PL02.price,
-                        FLOOR(PL02.price*(1-PL02.discount_rate)) as discount_price,
-                        PL02.is_available,
-                        PL02.is_on_display,
-                        (CASE WHEN PL02.discount_rate > 0 THEN 1 ELSE 0 END) AS is_discount
-
-                    FROM products as PL01
-                    
-                    # 상품 정보 조인
-                    LEFT JOIN product_infos as PL02
-                    ON PL01.product_no = PL02.product_id
-                    
-                    # 상품 이미지 조인
-                    LEFT JOIN product_images as PL03 
-                    ON PL02.product_info_no = PL03.product_info_id
-                     
-                     # 셀러 정보 조인
-                    LEFT JOIN seller_infos as PL04 
-                    ON PL04.seller_account_id = PL02.seller_id
-                    
-                    # 셀러 속성 조인
-                    LEFT JOIN seller_types as PL05
-                    ON PL04.seller_type_id = PL05.seller_type_no
-                    
-                    # 셀러 계정 조인
-                    LEFT JOIN seller_accounts as PL06 
-                    ON PL04.seller_account_id = PL06.seller_account_no
+                # 상품 리스트와 필터된 상품 수를 한번에 조회 (다음 페이지가 있는지 확인하기 위해 하나 더 조회)
+                product_info, product_count = product_list_query.fetch_page(
+                    db_cursor,
+                    order_by,
+                    limit=limit + 1 if limit else None,
+                    offset=offset,
+                    seek_condition=seek_condition,
+                    with_count=filter_info.get('with_count', True)
+                )
 
-                    WHERE
-                    -- 셀러 계정과 상품 삭제여부
-                    PL06.is_deleted = 0
-                    AND PL01.is_deleted = 0
-                    
-                    -- 상품 이미지 제한
-                    AND PL03.image_order = 1
-                    AND PL03.image_size_id = 1
-                    
-                    -- 상품, 셀러 정보 최신 이력 제한
-                    AND PL02.close_time ='2037-12-31 23:59:59'
-                    AND PL04.close_time = '2037-12-31 23:59:59'
-                    '''
-                # 검색 조건
-                # 등록 기간 시작
-                if filter_info.get('period_start', None):
-                    select_product_list_statement += " AND PL01.created_at > %(period_start)s"
-
-                # 등록기간 종료
-                if filter_info.get('period_end', None):
-                    select_product_list_statement += " AND PL01.created_at < %(period_end)s"
-
-                # 셀러명
-                if filter_info.get('seller_name', None):
-                    select_product_list_statement += " AND PL04.name_kr = %(seller_name)s"
-
-                # 상품명
-                if filter_info.get('product_name', None):
-                    select_product_list_statement += " AND PL02.name = %(product_name)s"
-
-                # 상품번호
-                if filter_info.get('product_number', None):
-                    select_product_list_statement += " AND PL01.product_no = %(product_number)s"
-
-                # 셀러 속성
-                if filter_info.get('seller_type_id', None):
-                    filter_info['seller_type_id'] = tuple(filter_info['seller_type_id'])
-                    select_product_list_statement += " AND PL05.seller_type_no in %(seller_type_id)s"
-
-                # 판매여부
-                if filter_info.get('is_available', None) is not None:
-                    select_product_list_statement += " AND PL02.is_available = %(is_available)s"
-
-                # 진열여부
-                if filter_info.get('is_on_display', None) is not None:
-                    select_product_list_statement += " AND PL02.is_on_display = %(is_on_display)s"
-
-                # 할인여부
-                if filter_info.get('is_on_discount', None) is not None:
-                    if filter_info['is_on_discount'] == 1:
-                        select_product_list_statement += " AND PL02.discount_rate > 0"
-
-                    else:
-                        select_product_list_statement += " AND PL02.discount_rate = 0"
-
-                # 등록순 정렬
-                select_product_list_statement += " ORDER BY PL01.created_at DESC"
-
-                # 페이징 마지막
-                if filter_info.get('limit', None):
-                    select_product_list_statement += " LIMIT %(limit)s"
-
-                # 페이징 시작
-                if filter_info.get('offset', None):
-                    select_product_list_statement += " OFFSET %(offset)s"
-
-                # sql 쿼리와 pagination 데이터 바인딩
-                db_cursor.execute(select_product_list_statement, filter_info)
-                product_info = db_cursor.fetchall()
-
-                # pagination 을 위해서 상품 몇개인지 카운트
-                product_count_statement = '''
-                    SELECT 
-                      COUNT(0) as filtered_product_count
+                has_more = bool(limit) and len(product_info) > limit
+                if has_more:
+                    product_info = product_info[:limit]
 
-                    FROM products as PL01
-                    
-                    # 상품 정보 조인
-                    LEFT JOIN product_infos as PL02
-                    ON PL01.product_no = PL02.product_id
-                    
-                    # 상품 이미지 조인
-                    LEFT JOIN product_images as PL03 
-                    ON PL02.product_info_no = PL03.product_info_id
-                     
-                     # 셀러 정보 조인
-                    LEFT JOIN seller_infos as PL04 
-                    ON PL04.seller_account_id = PL02.seller_id
-                    
-                    # 셀러 속성 조인
-                    LEFT JOIN seller_types as PL05
-                    ON PL04.seller_type_id = PL05.seller_type_no
-                    
-                    # 셀러 계정 조인
-                    LEFT JOIN seller_accounts as PL06 
-                    ON PL04.seller_account_id = PL06.seller_account_no
+                if cursor_direction == 'prev':
+                    product_info = product_info[::-1]
 
-                    WHERE
-                    -- 셀러 계정과 상품 삭제여부
-                    PL06.is_deleted = 0
-                    AND PL01.is_deleted = 0
-                    
-                    -- 상품 이미지 제한
-                    AND PL03.image_order = 1
-                    AND PL03.image_size_id = 1
-                    
-                    -- 상품, 셀러 정보 최신 이력 제한
-                    AND PL02.close_time ='2037-12-31 23:59:59'
-                    AND PL04.close_time = '2037-12-31 23:59:59'
-
-                   '''
-                # 검색 조건
-                # 등록 기간 시작
-                if filter_info.get('period_start', None):
-                    product_count_statement += " AND PL01.created_at > %(period_start)s"
-
-                # 등록기간 종료
-                if filter_info.get('period_end', None):
-                    product_count_statement += " AND PL01.created_at < %(period_end)s"
-
-                # 셀러명
-                if filter_info.get('seller_name', None):
-                    product_count_statement += " AND PL04.name_kr = %(seller_name)s"
-
-                # 상품명
-                if filter_info.get('product_name', None):
-                    product_count_statement += " AND PL02.name = %(product_name)s"
-
-                # 상품번호
-                if filter_info.get('product_number', None):
-                    product_count_statement += " AND PL01.product_no = %(product_number)s"
-
-                # 셀러 속성
-                if filter_info.get('seller_type_id', None):
-                    filter_info['seller_type_id'] = tuple(filter_info['seller_type_id'])
-                    product_count_statement += " AND PL05.seller_type_no in %(seller_type_id)s"
-
-                # 판매 여부
-                if filter_info.get('is_available', None) is not None:
-                    product_count_statement += " AND PL02.is_available = %(is_available)s"
-
-                # 진열여부
-                if filter_info.get('is_on_display', None) is not None:
-                    product_count_statement += " AND PL02.is_on_display = %(is_on_display)s"
-
-                # 할인여부
-                if filter_info.get('is_on_discount', None) is not None:
-                    if filter_info['is_on_discount'] == 1:
-                        product_count_statement += " AND PL02.discount_rate > 0"
-
-                    else:
-                        product_count_statement += " AND PL02.discount_rate = 0"
-
-                # 실행
-                db_cursor.execute(product_count_statement, filter_info)
-                product_count = db_cursor.fetchone()
-
-                # 상품 리스트와 검색된 상품 수 리턴
+                # 다음 / 이전 페이지 cursor
+                next_cursor, prev_cursor = None, None
+                if product_info:
+                    first_product, last_product = product_info[0], product_info[-1]
+
+                    if has_more or cursor_direction == 'prev':
+                        next_cursor = encode_cursor('next', [last_product['created_at'], last_product['product_no']])
+
+                    if (has_more and cursor_direction == 'prev') or cursor_direction == 'next' or offset:
+                        prev_cursor = encode_cursor('prev', [first_product['created_at'], first_product['product_no']])
+
+                # 상품 리스트와 검색된 상품 수 리턴 (with_count=0 이면 상품 수는 null)
                 return jsonify({'product_list': product_info,
-                                'product_count': product_count['filtered_product_count']
+                                'product_count': product_count,
+                                'next_cursor': next_cursor,
+                                'prev_cursor': prev_cursor
                                 }), 200
 
         # 데이터베이스 error
@@ -0,0 +1,167 @@
+""" 상품 이미지(product_images) / 상품 태그(product_tags) 등록
+
+상품 등록 / 수정시 이미지(순서별 3개 사이즈, 최대 15개)와 태그를 row 마다 INSERT 하지 않고,
+테이블마다 한번의 multi-row INSERT 로 등록한다.
+수정시 바꾸지 않은 순서의 이미지는 이전 상품 정보의 이미지를 한번의 INSERT ... SELECT 로 복사한다.
+모두 호출한 DAO 의 트랜잭션 안에서 실행되고 커밋은 호출한 쪽에서 한다.
+
+Authors:
+    leesh3@brandi.co.kr (이소헌)
+
+History:
+    2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+"""
+
+# 이미지 순서별로 등록하는 사이즈 (images 의 '{size}_size_url', '{size}_image_size_id' key)
+IMAGE_SIZES = ('big', 'medium', 'small')
+
+
+def get_product_image_rows(images, product_info_id):
+
+    """ 이미지 순서별 정보를 product_images row 로 변환
+
+    Args:
+        images: 이미지 순서별 url, 사이즈 정보 ({'image_file_1': {'big_size_url', 'big_image_size_id', ..}, ..})
+            처리중인 이미지는 {'job_id': ..}, 바꾸지 않은 이미지는 빈 딕셔너리
+        product_info_id: 이미지를 연결할 상품 정보 번호
+
+    Returns:
+        (
+            (image_url, product_info_id, image_size_id, image_order) row 목록,
+            이미지 작업 큐에서 처리중인 작업 번호 set,
+            바꾸지 않은 이미지 순서 목록
+        )
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    image_rows = []
+    pending_image_job_ids = set()
+    unchanged_image_orders = []
+
+    for image_set, image in images.items():
+        image_order = image_set[-1]
+
+        if 'job_id' in image:
+            pending_image_job_ids.add(image['job_id'])
+
+        elif image:
+            for size in IMAGE_SIZES:
+                image_rows.append((image[f'{size}_size_url'], product_info_id, image[f'{size}_image_size_id'], image_order))
+
+        else:
+            unchanged_image_orders.append(image_order)
+
+    return image_rows, pending_image_job_ids, unchanged_image_orders
+
+
+def insert_product_images(db_cursor, image_rows):
+
+    """ product_images 여러 row 를 한번의 INSERT 로 등록
+
+    Args:
+        db_cursor: 상품을 등록 / 수정하는 트랜잭션의 데이터베이스 커서
+        image_rows: get_product_image_rows 의 row 목록
+
+    Returns:
+        등록된 row 수
+    """
+    if not image_rows:
+        return 0
+
+    db_cursor.execute(f"""
+        INSERT INTO product_images(
+            image_url,
+            product_info_id,
+            image_size_id,
+            image_order
+        ) VALUES {', '.join(['(%s, %s, %s, %s)'] * len(image_rows))}
+    """, [value for image_row in image_rows for value in image_row])
+
+    return db_cursor.rowcount
+
+
+def copy_product_images(db_cursor, previous_product_info_id, product_info_id, image_orders):
+
+    """ 이전 상품 정보의 이미지 중 image_orders 순서의 이미지를 새 상품 정보로 한번에 복사
+
+    Args:
+        db_cursor: 상품을 수정하는 트랜잭션의 데이터베이스 커서
+        previous_product_info_id: 이전 상품 정보 번호
+        product_info_id: 새 상품 정보 번호
+        image_orders: 복사할 이미지 순서 목록
+
+    Returns:
+        복사된 row 수
+    """
+    if not image_orders:
+        return 0
+
+    db_cursor.execute("""
+        INSERT INTO product_images(
+            image_url,
+            image_size_id,
+            image_order,
+            product_info_id
+        ) SELECT
+            image_url,
+            image_size_id,
+            image_order,
+            %(product_info_id)s
+
+        FROM
+            product_images
+
+        WHERE
+            product_info_id = %(previous_product_info_id)s
+        AND
+            image_order IN %(image_orders)s
+    """, {
+        'product_info_id': product_info_id,
+        'previous_product_info_id': previous_product_info_id,
+        'image_orders': tuple(image_orders),
+    })
+
+    return db_cursor.rowcount
+
+
+def insert_product_tags(db_cursor, product_info_id, tags):
+
+    """ product_tags 여러 row 를 한번의 INSERT 로 등록
+
+    Args:
+        db_cursor: 상품을 등록 / 수정하는 트랜잭션의 데이터베이스 커서
+        product_info_id: 태그를 연결할 상품 정보 번호
+        tags: 태그 이름 목록
+
+    Returns:
+        등록된 row 수
+    """
+    return insert_product_tag_rows(db_cursor, [(tag, product_info_id) for tag in tags])
+
+
+def insert_product_tag_rows(db_cursor, tag_rows):
+
+    """ 여러 상품 정보의 태그를 한번의 INSERT 로 등록
+
+    Args:
+        db_cursor: 상품을 등록 / 수정하는 트랜잭션의 데이터베이스 커서
+        tag_rows: (태그 이름, 상품 정보 번호) 목록
+
+    Returns:
+        등록된 row 수
+    """
+    if not tag_rows:
+        return 0
+
+    db_cursor.execute(f"""
+        INSERT INTO product_tags(
+            name,
+            product_info_id
+        ) VALUES {', '.join(['(%s, %s)'] * len(tag_rows))}
+    """, [value for tag_row in tag_rows for value in tag_row])
+
+    return db_cursor.rowcount
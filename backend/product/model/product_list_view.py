@@ -0,0 +1,142 @@
+""" 상품 리스트 조회용 테이블(product_list_view) 갱신
+
+상품 관리 페이지의 상품 리스트는 products, product_infos, product_images, seller_infos, seller_types, seller_accounts 를
+조인한 결과를 상품당 한 row 로 product_list_view 에 저장해 두고 읽는다.
+상품 / 상품 이미지 / 셀러 정보를 변경하는 DAO 는 커밋 전에 같은 트랜잭션 안에서 이 모듈의 함수로 해당 row 를 다시 만든다.
+이미지 작업(image_job_id)이 처리중인 상품은 대표 이미지(image_url) 없이 표출되고,
+작업이 끝나 이미지가 등록될 때(ImageDao.link_image_job) 다시 만들어져 대표 이미지가 채워진다.
+
+Authors:
+    leesh3@brandi.co.kr (이소헌)
+
+History:
+    2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    2026-10-17 (leesh3@brandi.co.kr): 대표 이미지가 아직 없는 상품도 image_url NULL 로 표출
+"""
+
+# 상품 리스트에 표출되는 상품 (기존 상품 리스트 쿼리와 같은 조건, 대표 이미지가 없으면 image_url 은 NULL)
+SELECT_PRODUCT_LIST_ROWS_STATEMENT = """
+    SELECT
+        PL01.product_no,
+        PL01.created_at,
+        PL02.product_info_no,
+        PL03.image_url,
+        PL02.name,
+        PL04.seller_account_id,
+        PL04.name_kr,
+        PL05.seller_type_no,
+        PL05.name,
+        PL02.price,
+        FLOOR(PL02.price*(1-PL02.discount_rate)),
+        PL02.is_available,
+        PL02.is_on_display,
+        (CASE WHEN PL02.discount_rate > 0 THEN 1 ELSE 0 END)
+
+    FROM products as PL01
+
+    # 상품 정보 조인
+    LEFT JOIN product_infos as PL02
+    ON PL01.product_no = PL02.product_id
+
+    # 상품 이미지 조인 (대표 이미지로 제한, 이미지 작업이 처리중이면 없음)
+    LEFT JOIN product_images as PL03
+    ON PL02.product_info_no = PL03.product_info_id
+    AND PL03.image_order = 1
+    AND PL03.image_size_id = 1
+
+    # 셀러 정보 조인
+    LEFT JOIN seller_infos as PL04
+    ON PL04.seller_account_id = PL02.seller_id
+
+    # 셀러 속성 조인
+    LEFT JOIN seller_types as PL05
+    ON PL04.seller_type_id = PL05.seller_type_no
+
+    # 셀러 계정 조인
+    LEFT JOIN seller_accounts as PL06
+    ON PL04.seller_account_id = PL06.seller_account_no
+
+    WHERE
+    -- 셀러 계정과 상품 삭제여부
+    PL06.is_deleted = 0
+    AND PL01.is_deleted = 0
+
+    -- 상품, 셀러 정보 최신 이력 제한
+    AND PL02.is_current = 1
+    AND PL04.is_current = 1
+"""
+
+INSERT_PRODUCT_LIST_ROWS_STATEMENT = """
+    INSERT INTO product_list_view (
+        product_no,
+        created_at,
+        product_info_id,
+        image_url,
+        product_name,
+        seller_account_id,
+        seller_name,
+        seller_type_id,
+        seller_type_name,
+        price,
+        discount_price,
+        is_available,
+        is_on_display,
+        is_discount
+    )
+""" + SELECT_PRODUCT_LIST_ROWS_STATEMENT
+
+
+def refresh_product_list_view(db_cursor, product_no=None, seller_account_id=None, product_nos=None):
+
+    """ 상품 리스트 조회용 테이블 갱신
+
+    상품번호 또는 셀러 계정번호에 해당하는 row 를 지우고 원본 테이블에서 다시 만든다.
+    커밋은 하지 않으므로 원본을 변경한 트랜잭션 안에서 커밋 전에 호출한다.
+
+    Args:
+        db_cursor: 원본을 변경한 트랜잭션의 데이터베이스 커서
+        product_no: 갱신할 상품번호
+        seller_account_id: 갱신할 셀러 계정번호 (셀러의 모든 상품)
+        product_nos: 갱신할 상품번호 목록 (여러 상품을 한번에)
+
+    Returns:
+        다시 만든 row 수
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): 여러 상품을 한번에 갱신하는 product_nos 추가
+    """
+    if product_no is not None:
+        db_cursor.execute("DELETE FROM product_list_view WHERE product_no = %(product_no)s", {'product_no': product_no})
+        db_cursor.execute(
+            INSERT_PRODUCT_LIST_ROWS_STATEMENT + " AND PL01.product_no = %(product_no)s",
+            {'product_no': product_no}
+        )
+        return db_cursor.rowcount
+
+    if product_nos:
+        db_cursor.execute(
+            "DELETE FROM product_list_view WHERE product_no IN %(product_nos)s",
+            {'product_nos': tuple(product_nos)}
+        )
+        db_cursor.execute(
+            INSERT_PRODUCT_LIST_ROWS_STATEMENT + " AND PL01.product_no IN %(product_nos)s",
+            {'product_nos': tuple(product_nos)}
+        )
+        return db_cursor.rowcount
+
+    if seller_account_id is not None:
+        db_cursor.execute(
+            "DELETE FROM product_list_view WHERE seller_account_id = %(seller_account_id)s",
+            {'seller_account_id': seller_account_id}
+        )
+        db_cursor.execute(
+            INSERT_PRODUCT_LIST_ROWS_STATEMENT + " AND PL02.seller_id = %(seller_account_id)s",
+            {'seller_account_id': seller_account_id}
+        )
+        return db_cursor.rowcount
+
+    return 0
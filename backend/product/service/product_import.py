@@ -0,0 +1,156 @@
+""" 상품 일괄 등록 파일의 row 검증
+
+상품 일괄 등록 파일(csv / xlsx)의 한 row 를 상품 등록 엔드포인트(ProductView.insert_new_product)와 같은 규칙으로 검증하고
+ProductDao.insert_product_batch 에 넘길 상품 정보로 바꾼다.
+할인 기간은 'YYYY-MM-DD HH:MM:SS' 문자열 또는 xlsx 날짜 셀, 태그는 쉼표로 구분한 문자열이고,
+이미지는 둘 중 하나로 적는다.
+    - image_job_id: 이미지 작업(POST /image/product/job)으로 미리 올린 작업 번호. 여러 row 가 같은 작업을 사용할 수 있다.
+    - image_url_1 ~ image_url_5: 이미 저장된 상품 이미지 url (다른 상품의 이미지, 상품 리스트 / 상세의 이미지 url)
+
+Authors:
+    leesh3@brandi.co.kr (이소헌)
+
+History:
+    2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    2026-10-17 (leesh3@brandi.co.kr): 이미지 작업 번호 대신 이미 저장된 이미지 url 로도 이미지를 받음
+"""
+import re
+from datetime import datetime
+
+from utils import PRODUCT_IMAGE_ORDERS, S3_OBJECT_URL
+
+# 이미 저장된 상품 이미지 url 컬럼 (image_url_1 ~ image_url_5), 저장된 이미지의 key 는 내용 해시(sha256)
+IMAGE_URL_COLUMNS = [f'image_url_{image_set[-1]}' for image_set in PRODUCT_IMAGE_ORDERS]
+IMAGE_URL_PATTERN = f'^{re.escape(S3_OBJECT_URL.format(key=""))}[0-9a-f]{{64}}$'
+
+# (컬럼명, 타입, 필수 여부, 값 범위 패턴) ProductView.insert_new_product 의 Param 과 같은 규칙
+PRODUCT_IMPORT_RULES = [
+    ('is_available', int, True, r'^([0-1])$'),
+    ('is_on_display', int, True, r'^([0-1])$'),
+    ('first_category_id', int, True, r'^([0-9]|[0-3][0-9])$'),
+    ('second_category_id', int, False, r'^([0-9]|[0-9][0-9]|[1][0][0-9]|[1][1][0-4])$'),
+    ('name', str, True, r"[^\"\']"),
+    ('short_description', str, False, None),
+    ('color_filter_id', int, True, None),
+    ('style_filter_id', int, True, None),
+    ('long_description', str, True, None),
+    ('youtube_url', str, False, None),
+    ('stock', int, True, None),
+    ('price', int, True, None),
+    ('discount_rate', float, True, None),
+    ('discount_start_time', datetime, False, None),
+    ('discount_end_time', datetime, False, None),
+    ('min_unit', int, True, r'^([1-9]|[1-2][0-9])$'),
+    ('max_unit', int, True, r'^([1-9]|[1-2][0-9])$'),
+    ('tags', list, False, None),
+    ('image_job_id', str, False, None),
+    *[(column, str, False, IMAGE_URL_PATTERN) for column in IMAGE_URL_COLUMNS],
+]
+
+# 파일에 반드시 있어야 하는 컬럼
+REQUIRED_IMPORT_COLUMNS = [column for column, _, required, _ in PRODUCT_IMPORT_RULES if required]
+
+# 이미지 컬럼은 둘 중 하나가 있어야 함
+IMPORT_IMAGE_COLUMNS = ['image_job_id', IMAGE_URL_COLUMNS[0]]
+
+IMPORT_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+_PATTERNS = {column: re.compile(pattern) for column, _, _, pattern in PRODUCT_IMPORT_RULES if pattern}
+
+
+def _cell_text(value):
+    # xlsx 의 숫자 셀은 int / float 이므로 csv 와 같은 문자열로 맞춤 (1.0 -> '1')
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def _convert(value, value_type):
+    if value_type is datetime:
+        if isinstance(value, datetime):
+            return value.strftime(IMPORT_DATETIME_FORMAT)
+        return datetime.strptime(_cell_text(value), IMPORT_DATETIME_FORMAT).strftime(IMPORT_DATETIME_FORMAT)
+
+    text = _cell_text(value)
+    if value_type is list:
+        return [tag.strip() for tag in text.split(',') if tag.strip()]
+
+    return value_type(text)
+
+
+def parse_product_row(row):
+
+    """ 상품 일괄 등록 파일의 한 row 검증
+
+    Args:
+        row: {컬럼명: 값}
+
+    Returns:
+        (상품 정보, 에러 목록 [{'column', 'message'}]) 에러가 있으면 상품 정보는 None
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): 이미지 작업 번호와 이미지 url 중 하나만 있는지 확인
+    """
+    product_info = {}
+    errors = []
+
+    for column, value_type, required, _ in PRODUCT_IMPORT_RULES:
+        value = row.get(column)
+
+        if _cell_text(value) == '':
+            if required:
+                errors.append({'column': column, 'message': 'REQUIRED_VALUE'})
+            product_info[column] = [] if value_type is list else None
+            continue
+
+        pattern = _PATTERNS.get(column)
+        if pattern and not pattern.search(_cell_text(value)):
+            errors.append({'column': column, 'message': 'INVALID_VALUE'})
+            continue
+
+        try:
+            product_info[column] = _convert(value, value_type)
+        except ValueError:
+            errors.append({'column': column, 'message': 'INVALID_VALUE'})
+
+    # 이미지는 이미지 작업 번호와 이미지 url 중 하나로만 받음
+    has_image_urls = any(_cell_text(row.get(column)) for column in IMAGE_URL_COLUMNS)
+    if product_info['image_job_id'] and has_image_urls:
+        errors.append({'column': 'image_job_id', 'message': 'IMAGE_SOURCE_CONFLICT'})
+    elif not product_info['image_job_id'] and not has_image_urls:
+        errors.append({'column': 'image_job_id', 'message': 'REQUIRED_VALUE'})
+
+    if errors:
+        return None, errors
+
+    # 상품 등록 엔드포인트와 같이 할인율은 퍼센트로 받음
+    product_info['discount_rate'] = product_info['discount_rate'] / 100
+    return product_info, errors
+
+
+def check_product_images(images):
+
+    """ 상품 등록 엔드포인트와 같은 이미지 순서 규칙 확인
+
+    Args:
+        images: 이미지 순서별 이미지 정보 ({'image_file_1': {..}, ..})
+
+    Returns:
+        에러 메세지, 문제가 없으면 None
+    """
+    # 상품 등록시 대표 사진인 1번 사진부터 들어와야함
+    if not images['image_file_1']:
+        return 'REPRESENTATIVE_IMAGE_DOES_NOT_EXIST'
+
+    # 1번 사진부터 순서대로 들어와야함
+    for i in range(2, 6):
+        if images[f'image_file_{i}'] and not images[f'image_file_{i-1}']:
+            return 'IMAGES_SHOULD_BE_IN_ORDER'
+
+    return None
@@ -1,5 +1,16 @@
 from flask import jsonify, g
-from product.model.product_dao import ProductDao
+from excel_import import ImportFileError, read_upload_rows
+from export_job import get_export_job_queue
+from image_job import get_image_job_queue
+from product.model.product_dao import ProductDao, PRODUCT_EXCEL_COLUMNS, PRODUCT_LIST_ORDER_BY
+from product.model.product_image_tag import get_product_image_rows
+from product.service.product_import import (
+    IMAGE_URL_COLUMNS, IMPORT_IMAGE_COLUMNS, REQUIRED_IMPORT_COLUMNS, check_product_images, parse_product_row
+)
+from utils import PRODUCT_IMAGE_ORDERS
+
+# 상품 일괄 등록 결과에 담는 최대 에러 수
+MAX_REPORTED_IMPORT_ERRORS = 1000
 
 
 class ProductService:
@@ -69,18 +80,23 @@ class ProductService:
         return categories
 
     # noinspection PyMethodMayBeStatic
-    def get_product_detail(self, product_no, db_connection):
+    def get_product_detail(self, product_no, account_info, db_connection, as_of=None):
 
         """ 상품 등록/수정시 나타나는 개별 상품의 기존 정보 표출
 
         상품의 번호를 받아 해당하는 상품의 상세 정보를 표출.
+        마스터는 모든 상품을, 셀러는 자신의 상품만 조회할 수 있음. (셀러 확인은 dao 에서 함)
 
         Args:
             product_no(integer): 동일 상품 변경 이력의 가장 최신 버전 인덱스 번호
+            account_info: 조회하는 계정 정보(auth_type_id, token_account_no)
             db_connection(DatabaseConnection): 데이터베이스 커넥션 객체
+            as_of: 이 시점(데이터베이스 일시)에 유효했던 이력을 조회, 없으면 최신 이력
 
         Returns:
             200: 상품별 상세 정보
+            403: NO_AUTHORIZATION
+            404: PRODUCT_DOES_NOT_EXIST
 
         Authors:
 
@@ -88,14 +104,46 @@ class ProductService:
 
         History:
             2020-04-03 (leesh3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): as_of 시점 조회 추가
+            2026-10-17 (leesh3@brandi.co.kr): 셀러는 자신의 상품만 조회
 
         """
 
         product_dao = ProductDao()
-        product_infos = product_dao.get_product_detail(product_no, db_connection)
+        product_infos = product_dao.get_product_detail(product_no, account_info, db_connection, as_of)
 
         return product_infos
 
+    # noinspection PyMethodMayBeStatic
+    def get_product_history(self, history_info, db_connection):
+
+        """ 상품 정보 변경 이력 목록
+
+        마스터는 모든 상품을, 셀러는 자신의 상품만 조회할 수 있음. (셀러 확인은 dao 에서 함)
+
+        Args:
+            history_info: 상품 번호, offset, limit, 조회하는 계정 정보
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns: Http 응답코드
+            200: 전체 이력 수, 상품 이력 목록
+            400: INVALID_AUTH_ID
+            403: NO_AUTHORIZATION
+            404: PRODUCT_DOES_NOT_EXIST
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        if history_info['auth_type_id'] not in (1, 2):
+            return jsonify({'message': 'INVALID_AUTH_ID'}), 400
+
+        product_dao = ProductDao()
+        return product_dao.get_product_history(history_info, db_connection)
+
     # noinspection PyMethodMayBeStatic
     def insert_new_product(self, product_info, db_connection):
 
@@ -180,6 +228,200 @@ class ProductService:
 
         return jsonify({'message': 'INVALID_AUTH_ID'}), 400
 
+    # noinspection PyMethodMayBeStatic
+    def change_product_status(self, status_info, db_connection):
+
+        """ 여러 상품의 판매여부 / 진열여부 일괄 수정
+
+        마스터는 모든 상품을, 셀러는 자신의 상품만 수정할 수 있음. (셀러 확인은 dao 에서 상품을 잠근 뒤에 함)
+
+        Args:
+            status_info: 수정할 상품 번호 목록, 판매여부, 진열여부, 수정하는 계정 정보
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns: Http 응답코드
+            200: SUCCESS, changed_product_ids
+            400: INVALID_AUTH_ID
+            403: NO_AUTHORIZATION
+            404: PRODUCT_DOES_NOT_EXIST
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        if status_info['auth_type_id'] not in (1, 2):
+            return jsonify({'message': 'INVALID_AUTH_ID'}), 400
+
+        product_dao = ProductDao()
+        return product_dao.change_product_status(status_info, db_connection)
+
+    # noinspection PyMethodMayBeStatic
+    def import_products(self, import_info, upload_file, db_connection):
+
+        """ 상품 일괄 등록
+
+        업로드된 csv / xlsx 파일을 한 row 씩 읽으면서 상품 등록 엔드포인트와 같은 규칙으로 검증하고,
+        통과한 row 를 batch_size 개씩 모아서 배치마다 한 트랜잭션으로 등록하고 커밋한다.
+        검증에 실패한 row 와 등록에 실패한 배치의 row 는 건너뛰고 row 번호와 에러를 리턴한다.
+        이미지는 row 의 이미지 작업 번호(image_job_id, 여러 row 가 같은 작업을 사용할 수 있음)로 찾거나,
+        이미 저장된 상품 이미지 url(image_url_1 ~ image_url_5)로 사이즈별 이미지를 찾는다.
+        이미지 작업은 작업을 등록한 계정과 마스터만 사용할 수 있다.
+
+        Args:
+            import_info: 등록하는 계정 정보(auth_type_id, account_no), 셀러 계정 번호(selected_account_no),
+                배치 크기(batch_size), 파일 이름(file_name)
+            upload_file: 업로드된 파일 객체
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns: Http 응답코드
+            200: SUCCESS, row_count, imported_count, error_count, errors (최대 MAX_REPORTED_IMPORT_ERRORS 개)
+            400: INVALID_AUTH_ID, NO_SELECTED_USER, MISSING_COLUMNS, 파일 에러(UNSUPPORTED_FILE_TYPE 등)
+            404: ACCOUNT_DOES_NOT_EXIST
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 처리중인 이미지 작업을 상품 번호로 연결
+            2026-10-17 (leesh3@brandi.co.kr): 이미 저장된 이미지 url 로 이미지를 받고, 같은 이미지 작업은 한번만 조회
+            2026-10-17 (leesh3@brandi.co.kr): 다른 계정이 등록한 이미지 작업을 사용한 row 는 NO_AUTHORIZATION 에러
+        """
+        auth_type = import_info['auth_type_id']
+
+        # 마스터는 등록할 셀러를 선택해야 하고, 셀러는 자신의 상품만 등록
+        if auth_type == 1:
+            if not import_info['selected_account_no']:
+                return jsonify({'message': 'NO_SELECTED_USER'}), 400
+            seller_account_no = import_info['selected_account_no']
+
+        elif auth_type == 2:
+            seller_account_no = import_info['account_no']
+
+        else:
+            return jsonify({'message': 'INVALID_AUTH_ID'}), 400
+
+        product_dao = ProductDao()
+        seller = product_dao.get_import_seller(seller_account_no, db_connection)
+        if not seller:
+            return jsonify({'message': 'ACCOUNT_DOES_NOT_EXIST'}), 404
+
+        try:
+            columns, rows = read_upload_rows(upload_file, import_info['file_name'])
+        except ImportFileError as e:
+            return jsonify({'message': f'{e}'}), 400
+
+        missing_columns = [column for column in REQUIRED_IMPORT_COLUMNS if column not in columns]
+        if not any(column in columns for column in IMPORT_IMAGE_COLUMNS):
+            missing_columns += IMPORT_IMAGE_COLUMNS
+        if missing_columns:
+            return jsonify({'message': 'MISSING_COLUMNS', 'columns': missing_columns}), 400
+
+        batch_info = {
+            'seller_id': seller['seller_account_no'],
+            'product_sort_id': seller['product_sort_id'],
+            'account_no': import_info['account_no'],
+        }
+        image_job_queue = get_image_job_queue()
+
+        # 여러 row 가 같은 이미지 작업, 이미지 url 을 사용하므로 한번만 조회
+        image_jobs = {}
+        stored_images = {}
+
+        report = {'row_count': 0, 'imported_count': 0, 'error_count': 0, 'errors': []}
+
+        def add_error(row_number, column, message):
+            report['error_count'] += 1
+            if len(report['errors']) < MAX_REPORTED_IMPORT_ERRORS:
+                report['errors'].append({'row': row_number, 'column': column, 'message': message})
+
+        def insert_batch(batch):
+            try:
+                inserted_products = product_dao.insert_product_batch(
+                    batch_info, [product for _, product in batch], db_connection
+                )
+            except Exception as e:
+                print(f'PRODUCT_IMPORT_BATCH_ERROR_WITH {e}')
+                for row_number, _ in batch:
+                    add_error(row_number, None, 'DB_CURSOR_ERROR')
+                return
+
+            report['imported_count'] += len(inserted_products)
+
+            # 처리중인 이미지는 커밋 후 작업에 연결해서 작업이 끝날 때 등록
+            for (_, product), (product_no, product_info_no) in zip(batch, inserted_products):
+                _, pending_image_job_ids, _ = get_product_image_rows(product['images'], product_info_no)
+                for image_job_id in pending_image_job_ids:
+                    image_job_queue.attach_product(image_job_id, product_no, import_info)
+
+        batch = []
+        for row_number, row in rows:
+            report['row_count'] += 1
+
+            product_info, errors = parse_product_row(row)
+            for error in errors:
+                add_error(row_number, error['column'], error['message'])
+            if errors:
+                continue
+
+            image_job_id = product_info['image_job_id']
+            if image_job_id:
+                # 상품 등록 엔드포인트의 image_job_id 와 같은 방식으로 이미지 확인
+                image_column = 'image_job_id'
+                if image_job_id not in image_jobs:
+                    image_jobs[image_job_id] = image_job_queue.get_job(image_job_id)
+
+                image_job = image_jobs[image_job_id]
+                if image_job is None:
+                    add_error(row_number, image_column, 'IMAGE_JOB_DOES_NOT_EXIST')
+                    continue
+                if not image_job.is_accessible_by(import_info):
+                    add_error(row_number, image_column, 'NO_AUTHORIZATION')
+                    continue
+                if image_job.status == 'failed':
+                    add_error(row_number, image_column, 'IMAGE_JOB_FAILED')
+                    continue
+
+                product_info['images'] = image_job_queue.get_image_references(image_job)
+
+            else:
+                # 이미 저장된 이미지 url 이면 사이즈별 url 을 찾아서 사용
+                image_column = IMAGE_URL_COLUMNS[0]
+                image_urls = dict(zip(PRODUCT_IMAGE_ORDERS, [product_info[column] for column in IMAGE_URL_COLUMNS]))
+
+                new_image_urls = [url for url in image_urls.values() if url and url not in stored_images]
+                if new_image_urls:
+                    stored_images.update(product_dao.get_stored_product_images(new_image_urls, db_connection))
+
+                unknown_columns = [
+                    column for column, url in zip(IMAGE_URL_COLUMNS, image_urls.values())
+                    if url and url not in stored_images
+                ]
+                if unknown_columns:
+                    add_error(row_number, unknown_columns[0], 'IMAGE_DOES_NOT_EXIST')
+                    continue
+
+                product_info['images'] = {
+                    image_set: (stored_images[url] if url else {}) for image_set, url in image_urls.items()
+                }
+
+            image_error = check_product_images(product_info['images'])
+            if image_error:
+                add_error(row_number, image_column, image_error)
+                continue
+
+            batch.append((row_number, product_info))
+            if len(batch) >= import_info['batch_size']:
+                insert_batch(batch)
+                batch = []
+
+        insert_batch(batch)
+
+        return jsonify({'message': 'SUCCESS', **report}), 200
+
     # noinspection PyMethodMayBeStatic
     def get_color_filters(self, db_connection):
 
@@ -235,3 +477,63 @@ class ProductService:
 
         except Exception as e:
             return jsonify({'message': f'{e}'}), 500
+
+    # noinspection PyMethodMayBeStatic
+    def submit_product_list_export(self, filter_info, export_info):
+
+        """ 상품 리스트 엑셀 / csv 파일 생성 작업 등록
+
+        상품 리스트와 같은 필터로 만든 조회 쿼리를 작업 큐에 등록하고 작업 번호를 바로 리턴합니다.
+        같은 필터, 같은 파일 형식의 작업이 최근에 등록되었으면 그 작업을 리턴합니다.
+        작업 스레드에서 서버 사이드 커서로 읽으면서 파일을 s3 multipart 업로드로 바로 올립니다. (excel_export.export_rows_to_s3)
+
+        Args:
+            filter_info: 필터에 쓰이는 쿼리 정보
+            export_info: 파일 형식(file_format: 'xlsx', 'csv'), gzip 압축 여부(compress)
+
+        Returns:
+            202: 작업 번호, 상태, 진행 상황(row_count), 재사용 여부(reused)
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 파일 형식(xlsx / csv), gzip 압축 추가 (export=excel / csv 도 작업으로 처리)
+        """
+        product_dao = ProductDao()
+        product_list_query = product_dao.get_product_list_query(filter_info)
+
+        export_job, reused = get_export_job_queue().submit(
+            'product_list',
+            product_list_query.select_statement(PRODUCT_LIST_ORDER_BY),
+            filter_info,
+            PRODUCT_EXCEL_COLUMNS,
+            file_format=export_info['file_format'],
+            compress=export_info['compress']
+        )
+        return jsonify({**export_job.to_dict(), 'reused': reused}), 202
+
+    # noinspection PyMethodMayBeStatic
+    def get_product_list_export(self, job_id):
+
+        """ 상품 리스트 엑셀파일 생성 작업 상태 조회
+
+        Args:
+            job_id: 작업 번호
+
+        Returns:
+            200: 작업 상태, 진행 상황(row_count), 완료된 경우 다운로드 url(file_url)
+            404: EXPORT_JOB_DOES_NOT_EXIST
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+        export_job = get_export_job_queue().get_job(job_id)
+        if export_job is None or export_job.list_name != 'product_list':
+            return jsonify({'message': 'EXPORT_JOB_DOES_NOT_EXIST'}), 404
+
+        return jsonify(export_job.to_dict()), 200
@@ -5,6 +5,7 @@ from flask import request, Blueprint, jsonify, g
 from flask_request_validator import (
     GET,
     FORM,
+    JSON,
     PATH,
     Param,
     Pattern,
@@ -12,7 +13,19 @@ from flask_request_validator import (
 )
 from product.service.product_service import ProductService
 from connection import get_db_connection, DatabaseConnection
-from utils import login_required, ImageUpload
+from image.service.image_service import ImageService
+from utils import login_required, ImageUpload, decode_cursor, parse_as_of
+
+# 판매여부 / 진열여부를 한번에 수정할 수 있는 최대 상품 수
+MAX_STATUS_CHANGE_COUNT = 1000
+
+# 상품 일괄 등록시 한 트랜잭션으로 등록하는 상품 수
+PRODUCT_IMPORT_BATCH_SIZE = 500
+MAX_PRODUCT_IMPORT_BATCH_SIZE = 5000
+
+# 상품 이력 목록의 기본 / 최대 조회 수
+PRODUCT_HISTORY_LIMIT = 10
+MAX_PRODUCT_HISTORY_LIMIT = 100
 
 
 class ProductView:
@@ -37,14 +50,28 @@ class ProductView:
         Param('is_available', GET, int, required=False),
         Param('is_on_display', GET, int, required=False),
         Param('is_on_discount', GET, int, required=False),
-        Param('offset', GET, int),
-        Param('limit', GET, int),
+        Param('offset', GET, int, required=False),
+        Param('limit', GET, int, required=False),
         Param('is_available', GET, str, required=False,
               rules=[Pattern(r"^[0-1]{1}$")]),
         Param('is_on_display', GET, str, required=False,
               rules=[Pattern(r"^[0-1]{1}$")]),
         Param('is_on_discount', GET, str, required=False,
-              rules=[Pattern(r"^[0-1]{1}$")])
+              rules=[Pattern(r"^[0-1]{1}$")]),
+
+        # 이전 응답의 next_cursor / prev_cursor. 들어오면 offset 대신 사용
+        Param('cursor', GET, str, required=False),
+
+        # 0 이면 필터된 상품 수를 조회하지 않음
+        Param('with_count', GET, int, required=False),
+
+        # 1 이면 엑셀파일 생성 작업을 등록하고 작업 번호를 바로 리턴 (export=excel 과 같음)
+        Param('export_job', GET, int, required=False),
+
+        # excel / csv 이면 필터된 상품 전체를 파일로 만드는 작업을 등록하고 작업 번호를 바로 리턴 (gzip=1 이면 csv 를 gzip 으로 압축)
+        Param('export', GET, str, required=False,
+              rules=[Pattern(r"^(excel|csv)$")]),
+        Param('gzip', GET, int, required=False)
     )
     def get_product_list(*args):
 
@@ -52,9 +79,12 @@ class ProductView:
 
         상품 관리 페이지에서 표출되는 필터링된 상품 리스트를 표출합니다.
         쿼리 파라미터로 필터링에 사용할 파라미터 값을 받습니다.
+        cursor 가 들어오면 offset 대신 cursor 기준으로 다음 / 이전 페이지를 조회합니다.
 
         Returns:
-            200: 상품 리스트
+            200: 상품 리스트, 다음 / 이전 페이지 cursor
+            202: export=excel / csv 또는 export_job=1 이면 파일 생성 작업 정보 (GET /product/export-job/<job_id> 로 조회)
+            400: INVALID_CURSOR, GZIP_ONLY_FOR_CSV
             403: NO_AUTHORIZATION
             500: NO_DATABASE_CONNECTION, DB_CURSOR_ERROR
                  NO_DATABASE_CONNECTION
@@ -71,6 +101,11 @@ class ProductView:
                 - 마스터 권한이 아니면 접근 불가 처리(NO_AUTHORIZATION)
                 - db connection try/except 추가
                 - 셀러속성 쿼리 값을 리스트 형태로 받도록 변경
+            2026-10-17 (leesh3@brandi.co.kr): cursor 페이지네이션 추가, offset 은 선택값으로 변경
+            2026-10-17 (leesh3@brandi.co.kr): with_count 추가
+            2026-10-17 (leesh3@brandi.co.kr): export_job 추가
+            2026-10-17 (leesh3@brandi.co.kr): export(excel / csv), gzip 추가
+            2026-10-17 (leesh3@brandi.co.kr): export 도 파일 생성 작업으로 처리, limit 을 선택값으로 변경
         """
 
         # 마스터 권한이 아니면 에러 반환
@@ -110,16 +145,43 @@ class ProductView:
             'is_on_display': args[7],
             'is_on_discount': args[8],
             'offset': args[9],
-            'limit': args[10]
+            'limit': args[10],
+            'with_count': args[15] != 0
         }
 
-        # offset 과 limit 에 음수가 들어오면 default 값 지정
-        if filter_info['offset'] < 0:
+        # offset 이 없거나 offset 과 limit 에 음수가 들어오면 default 값 지정
+        if not filter_info['offset'] or filter_info['offset'] < 0:
             filter_info['offset'] = 0
 
-        if filter_info['limit'] < 0:
+        if not filter_info['limit'] or filter_info['limit'] < 0:
             filter_info['limit'] = 10
 
+        # cursor 에서 기준 상품의 등록일시와 상품번호를 꺼냄
+        if args[14]:
+            try:
+                direction, (created_at, product_no) = decode_cursor(args[14], 2)
+                filter_info['cursor_direction'] = direction
+                filter_info['cursor_created_at'] = str(datetime.strptime(created_at, '%Y-%m-%d %H:%M:%S'))
+                filter_info['cursor_product_no'] = int(product_no)
+
+            except (ValueError, TypeError):
+                return jsonify({'message': 'INVALID_CURSOR'}), 400
+
+        # 파일 생성 작업은 작업 스레드에서 커넥션을 따로 사용하므로 바로 등록 (export_job=1 은 export=excel)
+        export_format = args[17] or ('excel' if args[16] == 1 else None)
+        if export_format:
+
+            # xlsx 는 이미 zip 으로 압축되어 있으므로 gzip 은 csv 만
+            if args[18] == 1 and export_format != 'csv':
+                return jsonify({'message': 'GZIP_ONLY_FOR_CSV'}), 400
+
+            export_info = {
+                'file_format': 'xlsx' if export_format == 'excel' else 'csv',
+                'compress': args[18] == 1
+            }
+            product_service = ProductService()
+            return product_service.submit_product_list_export(filter_info, export_info)
+
         try:
             db_connection = get_db_connection()
             if db_connection:
@@ -140,19 +202,64 @@ class ProductView:
             except Exception as e:
                 return jsonify({'message': f'{e}'}), 500
 
+    @product_app.route('/export-job/<job_id>', methods=['GET'], endpoint='get_product_list_export')
+    @login_required
+    def get_product_list_export(job_id):
+
+        """ 상품 리스트 엑셀파일 생성 작업 상태 엔드포인트
+
+        상품 리스트에서 export=excel / csv 또는 export_job=1 로 등록한 작업의 진행 상황(파일에 쓴 상품 수)과 완료된 경우 다운로드 url 을 리턴합니다.
+
+        Args:
+            job_id: 작업 번호
+
+        Returns:
+            200: 작업 상태
+            403: NO_AUTHORIZATION
+            404: EXPORT_JOB_DOES_NOT_EXIST
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        # 마스터 권한이 아니면 에러 반환
+        if g.account_info['auth_type_id'] != 1:
+            return jsonify({'message': 'NO_AUTHORIZATION'}), 403
+
+        product_service = ProductService()
+        export_job_result = product_service.get_product_list_export(job_id)
+        return export_job_result
+
     @product_app.route("/<int:product_no>", methods=["GET"], endpoint='get_product_detail')
     @login_required
-    def get_product_detail(product_no):
+    @validate_params(
+        Param('product_no', PATH, int),
+        Param('as_of', GET, str, required=False),
+    )
+    def get_product_detail(*args):
 
         """ 상품 등록/수정시 나타나는 개별 상품의 기존 정보 표출 엔드포인트
 
         상품의 번호를 path parameter 로 받아 해당하는 상품의 기존 상세 정보를 표출.
+        as_of 를 받으면 그 시점에 유효했던 상품 정보(이력)를 표출.
 
         Args:
-            product_no(integer): 상품 id
+            *args:
+                product_no(integer): 상품 id
+                as_of: 조회할 시점 ('YYYY-MM-DD HH:MM:SS' 또는 'YYYY-MM-DD', 응답 일시와 같은 한국 시간)
+
+        g.account_info: 데코레이터에서 넘겨받은 계정 정보
+            auth_type_id: 계정의 권한정보
+            account_no: 데코레이터에서 확인된 계정번호
 
         Returns:
             200: 상품별 상세 정보
+            400: INVALID_AS_OF
+            403: NO_AUTHORIZATION
+            404: PRODUCT_DOES_NOT_EXIST
             500: 데이터베이스 에러
 
         Authors:
@@ -162,13 +269,27 @@ class ProductView:
             2020-04-03 (leesh3@brandi.co.kr): 초기 생성
             2020-04-07 (leesh3@brandi.co.kr): 파라미터 변수를 product_info_no -> product_no로 변경
             2020-04-16 (leejm3@brandi.co.kr): 사용하지 않는 parameter validator 삭제
+            2026-10-17 (leesh3@brandi.co.kr): as_of 시점 조회 추가
+            2026-10-17 (leesh3@brandi.co.kr): 셀러는 자신의 상품만 조회
         """
+        product_no = args[0]
+        account_info = {
+            'auth_type_id': g.account_info['auth_type_id'],
+            'token_account_no': g.account_info['account_no'],
+        }
+
+        as_of = None
+        if args[1]:
+            try:
+                as_of = parse_as_of(args[1])
+            except ValueError:
+                return jsonify({'message': 'INVALID_AS_OF'}), 400
 
         try:
             db_connection = get_db_connection()
             if db_connection:
                 product_service = ProductService()
-                product_infos = product_service.get_product_detail(product_no, db_connection)
+                product_infos = product_service.get_product_detail(product_no, account_info, db_connection, as_of)
                 return product_infos
 
             else:
@@ -184,6 +305,78 @@ class ProductView:
             except Exception as e:
                 return jsonify({'message': f'{e}'}), 500
 
+    @product_app.route("/<int:product_no>/history", methods=["GET"], endpoint='get_product_history')
+    @login_required
+    @validate_params(
+        Param('product_no', PATH, int),
+        Param('offset', GET, int, required=False),
+        Param('limit', GET, int, required=False),
+    )
+    def get_product_history(*args):
+
+        """ 상품 정보 변경 이력 목록 엔드포인트
+
+        상품 정보가 수정될 때마다 만들어진 이력을 최신순으로 표출.
+        이력의 start_time 을 상품 상세 표출 엔드포인트의 as_of 로 넘기면 그 이력의 상세 정보를 볼 수 있음.
+        마스터는 모든 상품을, 셀러는 자신의 상품만 조회할 수 있음.
+
+        Args:
+            *args:
+                product_no(integer): 상품 id
+                offset: 건너뛸 이력 수
+                limit: 조회할 이력 수 (최대 MAX_PRODUCT_HISTORY_LIMIT)
+
+        g.account_info: 데코레이터에서 넘겨받은 계정 정보
+            auth_type_id: 계정의 권한정보
+            account_no: 데코레이터에서 확인된 계정번호
+
+        Returns:
+            200: 전체 이력 수, 상품 이력 목록
+            403: NO_AUTHORIZATION
+            404: PRODUCT_DOES_NOT_EXIST
+            500: NO_DATABASE_CONNECTION, DB_CURSOR_ERROR
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+        history_info = {
+            'auth_type_id': g.account_info['auth_type_id'],
+            'token_account_no': g.account_info['account_no'],
+            'product_no': args[0],
+            'offset': args[1],
+            'limit': args[2],
+        }
+
+        # offset 이 없거나 음수면 0, limit 이 없거나 범위를 벗어나면 기본값
+        if not history_info['offset'] or history_info['offset'] < 0:
+            history_info['offset'] = 0
+
+        if not history_info['limit'] or not 0 < history_info['limit'] <= MAX_PRODUCT_HISTORY_LIMIT:
+            history_info['limit'] = PRODUCT_HISTORY_LIMIT
+
+        try:
+            db_connection = get_db_connection()
+            if db_connection:
+                product_service = ProductService()
+                product_history = product_service.get_product_history(history_info, db_connection)
+                return product_history
+
+            else:
+                return jsonify({'message': 'NO_DATABASE_CONNECTION'}), 500
+
+        except Exception as e:
+            return jsonify({'message': f'{e}'}), 500
+
+        finally:
+            try:
+                db_connection.close()
+
+            except Exception as e:
+                return jsonify({'message': f'{e}'}), 500
+
     @product_app.route("/category", methods=["GET"])
     @login_required
     @validate_params(
@@ -284,6 +477,86 @@ class ProductView:
             except Exception as e:
                 return jsonify({'message': f'{e}'}), 500
 
+    @product_app.route('/status', methods=['PUT'], endpoint='change_product_status')
+    @login_required
+    @validate_params(
+        Param('product_ids', JSON, list),
+        Param('is_available', JSON, int, required=False),
+        Param('is_on_display', JSON, int, required=False),
+    )
+    def change_product_status(*args):
+
+        """ 상품 판매여부 / 진열여부 일괄 수정 엔드포인트
+
+        상품 관리 페이지에서 선택한 상품들의 판매여부, 진열여부를 한번에 바꿉니다.
+        상품 정보 전체를 다시 보내지 않고, 한 트랜잭션 안에서 모든 상품의 새 이력을 만듭니다.
+
+        request.body:
+            product_ids: 수정할 상품 번호 목록 (최대 MAX_STATUS_CHANGE_COUNT 개)
+            is_available: 판매여부 (0, 1) 없으면 바꾸지 않음
+            is_on_display: 진열여부 (0, 1) 없으면 바꾸지 않음
+
+        g.account_info: 데코레이터에서 넘겨받은 수정을 수행하는 계정 정보
+            auth_type_id: 계정의 권한정보
+            account_no: 데코레이터에서 확인된 계정번호
+
+        Returns: Http 응답코드
+            200: SUCCESS, changed_product_ids
+            400: INVALID_PRODUCT_IDS, INVALID_STATUS, NO_STATUS_TO_CHANGE, TOO_MANY_PRODUCTS
+            403: NO_AUTHORIZATION
+            404: PRODUCT_DOES_NOT_EXIST
+            500: NO_DATABASE_CONNECTION, DB_CURSOR_ERROR
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        product_ids = args[0]
+        if not product_ids or not all(type(product_id) is int and product_id > 0 for product_id in product_ids):
+            return jsonify({'message': 'INVALID_PRODUCT_IDS'}), 400
+
+        # 중복 제거 (순서 유지)
+        product_ids = list(dict.fromkeys(product_ids))
+        if len(product_ids) > MAX_STATUS_CHANGE_COUNT:
+            return jsonify({'message': 'TOO_MANY_PRODUCTS'}), 400
+
+        if args[1] is None and args[2] is None:
+            return jsonify({'message': 'NO_STATUS_TO_CHANGE'}), 400
+
+        if args[1] not in (None, 0, 1) or args[2] not in (None, 0, 1):
+            return jsonify({'message': 'INVALID_STATUS'}), 400
+
+        status_info = {
+            'auth_type_id': g.account_info['auth_type_id'],
+            'token_account_no': g.account_info['account_no'],
+            'product_ids': product_ids,
+            'is_available': args[1],
+            'is_on_display': args[2],
+        }
+
+        try:
+            db_connection = get_db_connection()
+            if db_connection:
+                product_service = ProductService()
+                status_change_result = product_service.change_product_status(status_info, db_connection)
+                return status_change_result
+
+            else:
+                return jsonify({'message': 'NO_DATABASE_CONNECTION'}), 500
+
+        except Exception as e:
+            return jsonify({'message': f'{e}'}), 500
+
+        finally:
+            try:
+                db_connection.close()
+
+            except Exception as e:
+                return jsonify({'message': f'{e}'}), 500
+
     @product_app.route("/color", methods=["GET"])
     def get_color_filters():
 
@@ -356,6 +629,7 @@ class ProductView:
               rules=[Pattern(r'^([1-9]|[1-2][0-9])$')]),
         Param('min_unit', FORM, str,
               rules=[Pattern(r'^([1-9]|[1-2][0-9])$')]),
+        Param('image_job_id', FORM, str, required=False),
     )
     def insert_new_product(*args):
 
@@ -384,10 +658,17 @@ class ProductView:
             2020-04-06 (leesh3@brandi.co.kr): 초기 생성
             2020-04-14 (leesh3@brandi.co.kr): 이미지 순서 문제 캐치
             2020-04-15 (leesh3@barndi.co.kr): form data 형태로 받을 수 있도록 tags 자료형 변경 (str -> list)
+            2026-10-17 (leesh3@brandi.co.kr): 이미지 작업 번호(image_job_id)로 비동기 처리된 이미지 사용
         """
-        image_uploader = ImageUpload()
-        uploaded_images = image_uploader.upload_product_image(request)
-        if (400 in uploaded_images) or (500 in uploaded_images):
+        # 이미지 작업 번호가 들어오면 작업 큐의 이미지를 사용하고, 아니면 요청 안에서 리사이즈 / 업로드
+        if args[25]:
+            image_service = ImageService()
+            uploaded_images = image_service.get_product_image_references(args[25], g.account_info)
+        else:
+            image_uploader = ImageUpload()
+            uploaded_images = image_uploader.upload_product_image(request)
+
+        if (400 in uploaded_images) or (403 in uploaded_images) or (404 in uploaded_images) or (500 in uploaded_images):
             return uploaded_images
 
         # 상품 등록시 대표 사진인 1번 사진부터 들어와야함
@@ -446,6 +727,74 @@ class ProductView:
             except Exception as e:
                 return jsonify({'message': f'{e}'}), 500
 
+    @product_app.route('/import', methods=['POST'], endpoint='import_products')
+    @login_required
+    @validate_params(
+        Param('selected_account_no', FORM, int, required=False),
+        Param('batch_size', FORM, int, required=False),
+    )
+    def import_products(*args):
+
+        """ 상품 일괄 등록 엔드포인트
+
+        셀러 입점시 상품 등록 엔드포인트를 상품마다 호출하지 않고, csv / xlsx 파일 하나로 상품을 한번에 등록합니다.
+        파일은 한 row 씩 읽으면서 상품 등록과 같은 규칙으로 검증하고, batch_size 개씩 한 트랜잭션으로 등록합니다.
+        검증에 실패한 row 는 건너뛰고 row 번호, 컬럼, 에러를 리턴합니다.
+
+        request.form:
+            product_file: 상품 파일 (csv, xlsx) 첫 row 는 컬럼명 (product.service.product_import 참고)
+            selected_account_no: 마스터 권한일 때 상품을 등록할 셀러의 계정 번호
+            batch_size: 한 트랜잭션으로 등록할 상품 수 (기본 PRODUCT_IMPORT_BATCH_SIZE, 최대 MAX_PRODUCT_IMPORT_BATCH_SIZE)
+
+        g.account_info: 데코레이터에서 넘겨받은 등록을 수행하는 계정 정보
+            auth_type_id: 계정의 권한정보
+            account_no: 데코레이터에서 확인된 계정번호
+
+        Returns: Http 응답코드
+            200: SUCCESS, row_count, imported_count, error_count, errors
+            400: NO_PRODUCT_FILE, NO_SELECTED_USER, MISSING_COLUMNS, UNSUPPORTED_FILE_TYPE, INVALID_FILE
+            404: ACCOUNT_DOES_NOT_EXIST
+            500: NO_DATABASE_CONNECTION
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        product_file = request.files.get('product_file', None)
+        if not product_file:
+            return jsonify({'message': 'NO_PRODUCT_FILE'}), 400
+
+        import_info = {
+            'auth_type_id': g.account_info['auth_type_id'],
+            'account_no': g.account_info['account_no'],
+            'selected_account_no': args[0],
+            'batch_size': min(max(args[1] or PRODUCT_IMPORT_BATCH_SIZE, 1), MAX_PRODUCT_IMPORT_BATCH_SIZE),
+            'file_name': product_file.filename,
+        }
+
+        try:
+            db_connection = get_db_connection()
+            if db_connection:
+                product_service = ProductService()
+                product_import_result = product_service.import_products(import_info, product_file.stream, db_connection)
+                return product_import_result
+
+            else:
+                return jsonify({'message': 'NO_DATABASE_CONNECTION'}), 500
+
+        except Exception as e:
+            return jsonify({'message': f'{e}'}), 500
+
+        finally:
+            try:
+                db_connection.close()
+
+            except Exception as e:
+                return jsonify({'message': f'{e}'}), 500
+
     @product_app.route("/<int:product_id>", methods=['PUT'], endpoint='update_product_info')
     @login_required
     @validate_params(
@@ -470,6 +819,7 @@ class ProductView:
         Param('tags', FORM, str, required=False),
         Param('product_id', PATH, int),
         Param('seller_account_no', FORM, int),
+        Param('image_job_id', FORM, str, required=False),
     )
     def update_product_info(*args):
 
@@ -496,13 +846,19 @@ class ProductView:
 
         History:
             2020-04-08 (leesh3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 이미지 작업 번호(image_job_id)로 비동기 처리된 이미지 사용
         """
 
-        image_uploader = ImageUpload()
-        uploaded_images = image_uploader.upload_product_image(request)
+        # 이미지 작업 번호가 들어오면 작업 큐의 이미지를 사용하고, 아니면 요청 안에서 리사이즈 / 업로드
+        if args[21]:
+            image_service = ImageService()
+            uploaded_images = image_service.get_product_image_references(args[21], g.account_info)
+        else:
+            image_uploader = ImageUpload()
+            uploaded_images = image_uploader.upload_product_image(request)
 
         # 이미지 업로더를 호출한 결과값에 애러코드 400이 포함되어있으면 utils.py 에서 발생한 에러메세지를 그대로 리턴
-        if (400 in uploaded_images) or (500 in uploaded_images):
+        if (400 in uploaded_images) or (403 in uploaded_images) or (404 in uploaded_images) or (500 in uploaded_images):
             return uploaded_images
 
         product_info = {
@@ -0,0 +1,6 @@
+-- brandi_schema_v2.11 -> v2.12
+-- 상품 리스트는 v2.7 부터 product_list_view 의 (created_at, product_no) 인덱스로 조회하므로
+-- v2.5 에서 추가한 products 의 cursor 페이지네이션 인덱스(IX_products_created_at) 삭제
+use brandi;
+
+DROP INDEX IX_products_created_at ON products;
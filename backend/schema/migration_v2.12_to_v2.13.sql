@@ -0,0 +1,11 @@
+-- brandi_schema_v2.12 -> v2.13
+-- 상품 이미지 작업(product_image_jobs)에 작업을 등록한 계정 추가
+-- 작업 조회와 상품 / 일괄 등록 row 에 작업 연결은 등록한 계정과 마스터만 할 수 있음 (이미 등록된 작업은 NULL 이므로 마스터만 사용 가능)
+use brandi;
+
+ALTER TABLE product_image_jobs
+    ADD COLUMN `account_id` INT NULL COMMENT '작업을 등록한 계정 외래키 (등록한 계정과 마스터만 조회, 상품 연결 가능)' AFTER `job_id`;
+
+ALTER TABLE product_image_jobs
+    ADD CONSTRAINT FK_product_image_jobs_account_id FOREIGN KEY (account_id)
+        REFERENCES accounts (account_no);
@@ -0,0 +1,80 @@
+-- brandi_schema_v2.13 -> v2.14
+-- 이미지 작업(image_job_id)이 처리중인 상품은 대표 이미지가 없어 상품 리스트 조회용 테이블(product_list_view)에서 빠졌으므로
+-- 대표 이미지가 없는 상품도 image_url NULL 로 표출하고, 작업이 끝나 이미지가 등록될 때 채워짐
+-- 빠져 있던 상품(처리중이거나 실패 / 만료된 이미지 작업을 사용한 상품)을 채움
+use brandi;
+
+ALTER TABLE product_list_view
+    MODIFY COLUMN `image_url` VARCHAR(200) NULL COMMENT '대표 이미지 url (1번 이미지 big 사이즈, 이미지 작업이 처리중이면 NULL)';
+
+INSERT INTO product_list_view (
+    product_no,
+    created_at,
+    product_info_id,
+    image_url,
+    product_name,
+    seller_account_id,
+    seller_name,
+    seller_type_id,
+    seller_type_name,
+    price,
+    discount_price,
+    is_available,
+    is_on_display,
+    is_discount
+)
+
+SELECT
+    PL01.product_no,
+    PL01.created_at,
+    PL02.product_info_no,
+    PL03.image_url,
+    PL02.name,
+    PL04.seller_account_id,
+    PL04.name_kr,
+    PL05.seller_type_no,
+    PL05.name,
+    PL02.price,
+    FLOOR(PL02.price*(1-PL02.discount_rate)),
+    PL02.is_available,
+    PL02.is_on_display,
+    (CASE WHEN PL02.discount_rate > 0 THEN 1 ELSE 0 END)
+
+FROM products as PL01
+
+# 상품 정보 조인
+LEFT JOIN product_infos as PL02
+ON PL01.product_no = PL02.product_id
+
+# 상품 이미지 조인 (대표 이미지로 제한, 이미지 작업이 처리중이면 없음)
+LEFT JOIN product_images as PL03
+ON PL02.product_info_no = PL03.product_info_id
+AND PL03.image_order = 1
+AND PL03.image_size_id = 1
+
+# 셀러 정보 조인
+LEFT JOIN seller_infos as PL04
+ON PL04.seller_account_id = PL02.seller_id
+
+# 셀러 속성 조인
+LEFT JOIN seller_types as PL05
+ON PL04.seller_type_id = PL05.seller_type_no
+
+# 셀러 계정 조인
+LEFT JOIN seller_accounts as PL06
+ON PL04.seller_account_id = PL06.seller_account_no
+
+# 이미 있는 상품 제외
+LEFT JOIN product_list_view as PL07
+ON PL01.product_no = PL07.product_no
+
+WHERE
+-- 셀러 계정과 상품 삭제여부
+PL06.is_deleted = 0
+AND PL01.is_deleted = 0
+
+-- 상품, 셀러 정보 최신 이력 제한
+AND PL02.is_current = 1
+AND PL04.is_current = 1
+
+AND PL07.product_no IS NULL;
@@ -0,0 +1,27 @@
+-- brandi_schema_v2.14 -> v2.15
+-- 리스트 파일 생성 작업(export_jobs) 테이블 추가
+-- 작업 상태를 프로세스 메모리 대신 데이터베이스에 저장해서 어느 프로세스에서나 작업을 조회하고 같은 필터의 작업을 재사용
+use brandi;
+
+CREATE TABLE export_jobs
+(
+    `job_id`       CHAR(32)        NOT NULL    COMMENT '작업 번호',
+    `list_name`    VARCHAR(20)     NOT NULL    COMMENT '리스트 이름(seller_list, product_list)',
+    `filter_key`   CHAR(64)        NOT NULL    COMMENT '리스트 이름, 조회 쿼리와 바인딩 값, 파일 형식으로 만든 key',
+    `file_format`  VARCHAR(10)     NOT NULL    COMMENT '파일 형식(xlsx, csv)',
+    `compress`     TINYINT         NOT NULL    DEFAULT 0 COMMENT 'gzip 압축 여부',
+    `status`       VARCHAR(10)     NOT NULL    DEFAULT 'pending' COMMENT '작업 상태(pending, processing, done, failed)',
+    `row_count`    INT             NOT NULL    DEFAULT 0 COMMENT '파일에 쓴 row 수',
+    `file_key`     VARCHAR(200)    NULL        COMMENT '완료된 경우 s3 key',
+    `error`        VARCHAR(200)    NULL        COMMENT '실패한 경우 에러 메세지',
+    `created_at`   DATETIME        NOT NULL    DEFAULT CURRENT_TIMESTAMP COMMENT '등록일시',
+    `started_at`   DATETIME        NULL        COMMENT '처리 시작일시',
+    `finished_at`  DATETIME        NULL        COMMENT '완료 / 실패일시',
+    PRIMARY KEY (job_id)
+)ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT '리스트 파일 생성 작업';
+
+-- 같은 필터의 최근 작업 조회
+CREATE INDEX IX_export_jobs_filter_key ON export_jobs (filter_key, created_at);
+
+-- 끝나지 않은 작업 만료 처리
+CREATE INDEX IX_export_jobs_status ON export_jobs (status, created_at);
@@ -0,0 +1,5 @@
+-- brandi_schema_v2.4 -> v2.5
+-- 상품 리스트 cursor 페이지네이션 인덱스 추가
+use brandi;
+
+CREATE INDEX IX_products_created_at ON products (is_deleted, created_at, product_no);
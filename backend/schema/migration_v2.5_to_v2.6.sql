@@ -0,0 +1,18 @@
+-- brandi_schema_v2.5 -> v2.6
+-- 선분이력 테이블에 최신 이력 여부(is_current) 생성 컬럼과 인덱스 추가
+-- 최신 이력은 close_time 이 '2037-12-31 23:59:59' 인 row 이고, is_current 는 close_time 이 바뀌면 같이 바뀜
+use brandi;
+
+ALTER TABLE seller_infos
+    ADD COLUMN `is_current` TINYINT AS (close_time = '2037-12-31 23:59:59') STORED COMMENT '최신 이력 여부(종료일시가 2037-12-31 23:59:59 이면 1)' AFTER close_time;
+
+ALTER TABLE product_infos
+    ADD COLUMN `is_current` TINYINT AS (close_time = '2037-12-31 23:59:59') STORED COMMENT '최신 이력 여부(종료일시가 2037-12-31 23:59:59 이면 1)' AFTER close_time;
+
+ALTER TABLE event_infos
+    ADD COLUMN `is_current` TINYINT AS (close_time = '2037-12-31 23:59:59') STORED COMMENT '최신 이력 여부(종료일시가 2037-12-31 23:59:59 이면 1)' AFTER close_time;
+
+CREATE INDEX IX_seller_infos_current ON seller_infos (is_current, seller_account_id);
+CREATE INDEX IX_product_infos_current ON product_infos (is_current, product_id);
+CREATE INDEX IX_product_infos_current_seller ON product_infos (is_current, seller_id);
+CREATE INDEX IX_event_infos_current ON event_infos (is_current, event_id);
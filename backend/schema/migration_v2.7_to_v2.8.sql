@@ -0,0 +1,20 @@
+-- brandi_schema_v2.7 -> v2.8
+-- 셀러별 상품 수(seller_accounts.product_count) 추가
+use brandi;
+
+ALTER TABLE seller_accounts
+    ADD COLUMN `product_count` INT NOT NULL DEFAULT 0 COMMENT '상품 수 (최신 상품 정보 기준)';
+
+-- 셀러별 상품 수 채우기
+-- 상품 등록 / 셀러 변경시 같은 트랜잭션에서 갱신 (seller/model/seller_product_count.py)
+UPDATE seller_accounts AS SA
+LEFT JOIN (
+    SELECT
+        seller_id,
+        COUNT(0) AS product_count
+    FROM product_infos
+    WHERE is_current = 1
+    GROUP BY seller_id
+) AS PC
+ON PC.seller_id = SA.seller_account_no
+SET SA.product_count = COALESCE(PC.product_count, 0);
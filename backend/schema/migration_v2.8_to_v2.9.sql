@@ -0,0 +1,12 @@
+-- brandi_schema_v2.8 -> v2.9
+-- 셀러 한글명, 담당자 연락처, 상품 리스트의 상품명 / 셀러명 부분 검색용 ngram 전문 검색 인덱스 추가
+-- LIKE '%..%' 대신 MATCH ... AGAINST 로 검색 (list_query.ListQuery.add_text_search)
+use brandi;
+
+-- ngram 인덱스에서 영문 불용어('in', 'at' 등)가 포함된 토큰이 빠지지 않도록 불용어 처리를 끔 (인덱스 생성시 적용)
+SET SESSION innodb_ft_enable_stopword = OFF;
+
+CREATE FULLTEXT INDEX IX_seller_infos_name_kr_ngram ON seller_infos (name_kr) WITH PARSER ngram;
+CREATE FULLTEXT INDEX IX_manager_infos_contact_number_ngram ON manager_infos (contact_number) WITH PARSER ngram;
+CREATE FULLTEXT INDEX IX_product_list_view_product_name_ngram ON product_list_view (product_name) WITH PARSER ngram;
+CREATE FULLTEXT INDEX IX_product_list_view_seller_name_ngram ON product_list_view (seller_name) WITH PARSER ngram;
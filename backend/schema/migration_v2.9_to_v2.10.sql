@@ -0,0 +1,7 @@
+-- brandi_schema_v2.9 -> v2.10
+-- 상품 정보 / 셀러 정보의 특정 시점 이력 조회(as_of)와 이력 목록 조회용 인덱스 추가
+-- (product_id, start_time) 범위에서 start_time <= 시점인 마지막 이력을 찾고 close_time 으로 확인
+use brandi;
+
+CREATE INDEX IX_product_infos_period ON product_infos (product_id, start_time, close_time);
+CREATE INDEX IX_seller_infos_period ON seller_infos (seller_account_id, start_time, close_time);
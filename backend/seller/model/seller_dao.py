@@ -1,9 +1,31 @@
-import pandas as pd, uuid, os
+import uuid
 from flask import jsonify
-from mysql.connector.errors import Error
-
-from connection import get_s3_connection
-
+from pymysql.err import Error
+
+from auth_token import revoke_account_tokens, token_revocation_list
+from cache import invalidate_account_cache, invalidate_list_count_cache
+from excel_export import export_rows_to_s3
+from list_query import ListQuery, get_total_count
+from product.model.product_list_view import refresh_product_list_view
+from seller.model.seller_info import SellerInfo, get_seller_info_statement
+from seller.model.seller_product_count import reconcile_seller_product_count
+from seller_name_index import update_seller_name_index
+
+# 셀러 리스트 엑셀파일의 컬럼명과 셀러 정보의 key
+SELLER_EXCEL_COLUMNS = [
+    ('셀러번호', 'seller_account_id'),
+    ('관리자계정ID', 'login_id'),
+    ('셀러영문명', 'name_en'),
+    ('셀러한글명', 'name_kr'),
+    ('브랜디회원번호', 'brandi_app_user_id'),
+    ('담당자명', 'manager_name'),
+    ('담당자전화번호', 'manager_contact_number'),
+    ('판매구분', 'seller_type_name'),
+    ('상품개수', 'product_count'),
+    ('셀러URL', 'site_url'),
+    ('셀러등록일', 'created_at'),
+    ('승인여부', 'seller_status')
+]
 
 class SellerDao:
     """ 셀러 모델
@@ -116,6 +138,10 @@ class SellerDao:
                 - 주석 수정(Args)
                     - change_info 인자 중 dao 에서 사용하는 인자에 대한 설명 추가
                     - INVALID_PARAMETER_ACCOUNT_NO 에러 추가
+            2026-10-17 (leesh3@brandi.co.kr): 변경 후 계정 정보 캐시 무효화
+            2026-10-17 (leesh3@brandi.co.kr): 변경 후 기존 토큰 폐기
+            2026-10-17 (leesh3@brandi.co.kr): 토큰 폐기 시각을 비밀번호 변경과 같은 트랜잭션에서 저장
+            2026-10-17 (leesh3@brandi.co.kr): 프로세스의 토큰 폐기 목록은 커밋 후에 반영
         """
 
         try:
@@ -139,9 +165,16 @@ class SellerDao:
                 if db_cursor.rowcount == 0:
                     return jsonify({'message': 'INVALID_PARAMETER_ACCOUNT_NO'}), 400
 
+                # 기존 토큰 폐기 (비밀번호 변경과 같은 트랜잭션에서 폐기 시각 저장)
+                revoked_at = revoke_account_tokens(db_cursor, change_info['parameter_account_no'])
+
                 # 실행 결과 반영
                 db_connection.commit()
 
+                # 커밋된 후에 이 프로세스의 토큰 폐기 목록에 반영하고 변경된 계정의 캐시 무효화
+                token_revocation_list.revoke(change_info['parameter_account_no'], revoked_at)
+                invalidate_account_cache(change_info['parameter_account_no'])
+
                 return jsonify({'message': 'SUCCESS'}), 200
 
         except KeyError:
@@ -151,6 +184,56 @@ class SellerDao:
             print(f'DATABASE_CURSOR_ERROR_WITH {e}')
             return jsonify({'message': 'DB_CURSOR_ERROR'}), 500
 
+    # noinspection PyMethodMayBeStatic
+    def update_password_hash(self, rehash_info, db_connection):
+
+        """ UPDATE 재암호화된 비밀번호 DB
+
+        비밀번호 자체는 바뀌지 않고 암호화 cost 만 바뀌므로 계정 캐시 무효화나 토큰 폐기를 하지 않음.
+        그 사이에 비밀번호가 변경되었으면 덮어쓰지 않도록 기존 암호화 비밀번호가 같을 때만 변경.
+
+        Args:
+            rehash_info:
+                account_no: 비밀번호를 재암호화할 계정 번호
+                previous_password: 기존 암호화 비밀번호
+                password: 재암호화된 비밀번호
+            db_connection: 연결된 database connection 객체
+
+        Returns:
+            변경된 row 수
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        try:
+            with db_connection.cursor() as db_cursor:
+                update_password_hash_statement = """
+                    UPDATE
+                    accounts
+                    SET
+                    password = %(password)s
+                    WHERE
+                    account_no = %(account_no)s
+                    AND password = %(previous_password)s
+                """
+                db_cursor.execute(update_password_hash_statement, rehash_info)
+                db_connection.commit()
+
+                return db_cursor.rowcount
+
+        except KeyError as e:
+            print(f'KEY_ERROR WITH {e}')
+            return 0
+
+        except Error as e:
+            print(f'DATABASE_CURSOR_ERROR_WITH {e}')
+            db_connection.rollback()
+            return 0
+
     # noinspection PyMethodMayBeStatic
     def get_seller_info(self, account_info, db_connection):
 
@@ -160,7 +243,8 @@ class SellerDao:
 
         Args:
             account_info: account 정보
-            (parameter_account_no: 셀러정보를 확인할 account_no)
+            (parameter_account_no: 셀러정보를 확인할 account_no,
+             as_of: 이 시점에 유효했던 셀러정보를 조회, 없으면 최신 셀러정보)
             db_connection: 연결된 database connection 객체
 
         Returns:
@@ -178,226 +262,119 @@ class SellerDao:
             2020-04-03 (leejm3@brandi.co.kr): 표출 정보에 외래키 id 값 추가
             2020-04-15 (leejm3@brandi.co.kr): 해당 계정이 없으면 에러 리턴 추가
             2020-04-16 (leejm3@brandi.co.kr): SQL 문 별칭 적용
+            2026-10-17 (leesh3@brandi.co.kr): 최신 이력 조건을 is_current 로 변경
+            2026-10-17 (leesh3@brandi.co.kr): 기본 정보와 담당자 정보, 상태 변경 기록, 셀러 속성 리스트를 한번의 쿼리로 조회해서 SellerInfo 로 리턴
+            2026-10-17 (leesh3@brandi.co.kr): as_of 시점의 셀러정보 조회 추가
 
         """
         try:
             with db_connection.cursor() as db_cursor:
 
-                # 셀러 기본 정보(외래키 제외)
                 # SELECT 문 조건 데이터
                 account_info_data = {
-                    'account_no': account_info['parameter_account_no']
+                    'account_no': account_info['parameter_account_no'],
+                    'as_of': account_info.get('as_of')
                 }
 
-                # seller_info 테이블 SELECT (get 기본 정보)
-                select_seller_info_statement = """
-                    SELECT 
-                        seller_info_no,
-                        seller_account_id,
-                        profile_image_url,
-                        CS03.status_no as seller_status_no,
-                        CS03.name as seller_status_name,
-                        CS04.seller_type_no as seller_type_no,
-                        CS04.name as seller_type_name,
-                        CS05.account_no as account_no,
-                        CS05.login_id as account_login_id,
-                        CS06.app_user_no as brandi_app_user_no,
-                        CS06.app_id as brandi_app_user_app_id,
-                        name_kr,
-                        name_en,
-                        brandi_app_user_id,
-                        ceo_name,
-                        company_name,
-                        business_number,
-                        certificate_image_url,
-                        online_business_number,
-                        online_business_image_url,
-                        background_image_url,
-                        short_description,
-                        long_description,
-                        site_url,
-                        insta_id,
-                        center_number,
-                        kakao_id,
-                        yellow_id,
-                        zip_code,
-                        address,
-                        detail_address,
-                        weekday_start_time,
-                        weekday_end_time,
-                        weekend_start_time,
-                        weekend_end_time,
-                        bank_name,
-                        bank_holder_name,
-                        account_number
-                    
-                    FROM seller_accounts AS CS01
-                    
-                    -- seller_info 기본 정보
-                    INNER JOIN seller_infos AS CS02
-                    ON CS01.seller_account_no = CS02.seller_account_id
-                    
-                    -- 셀러 상태명
-                    INNER JOIN seller_statuses as CS03
-                    ON CS02.seller_status_id = CS03.status_no
-
-                    -- 셀러 속성명
-                    INNER JOIN seller_types as CS04
-                    ON CS02.seller_type_id = CS04.seller_type_no
-
-                    -- 셀러계정 로그인 아이디
-                    LEFT JOIN accounts as CS05
-                    ON CS05.account_no = CS01.account_id
-                    AND CS05.is_deleted =0
-
-                    -- 브랜디 앱 아이디
-                    LEFT JOIN brandi_app_users as CS06
-                    ON CS02.brandi_app_user_id = CS06.app_user_no
-                    
-                    WHERE 
-                        -- 삭제되지 않은 계정의 최신 셀러정보 리스트, 삭제되지 않은 브랜디앱 아이디
-                        CS01.account_id = %(account_no)s
-                        AND CS01.is_deleted = 0
-                        AND CS02.close_time = '2037-12-31 23:59:59'
-                    
-                """
-
-                # SELECT 문 실행
-                db_cursor.execute(select_seller_info_statement, account_info_data)
-
-                # seller_info_result 에 쿼리 결과 저장
-                seller_info_result = db_cursor.fetchone()
+                # 셀러 기본 정보, 담당자 정보, 셀러 상태 변경 기록, 셀러 속성 리스트를 한번에 가져옴
+                db_cursor.execute(get_seller_info_statement(account_info_data['as_of']), account_info_data)
+                seller_info_row = db_cursor.fetchone()
 
                 # 해당 번호의 셀러가 없으면 에러 리턴
-                if seller_info_result is None:
-                    return seller_info_result
+                if seller_info_row is None:
+                    return seller_info_row
 
-                # 담당자 정보
-                # SELECT 문 조건 데이터
-                seller_info_no_data = {
-                    'seller_info_no': seller_info_result['seller_info_no']
-                }
-                # manager_infos 테이블 SELECT(get *)
-                select_manager_infos_statement = """
-                                SELECT
-                                    MI02.name,
-                                    MI02.contact_number,
-                                    MI02.email,
-                                    MI02.ranking
-                                    
-                                FROM 
-                                    seller_infos AS MI01
-                                
-                                INNER JOIN 
-                                    manager_infos AS MI02
-                                    ON MI01.seller_info_no = MI02.seller_info_id
-                                
-                                WHERE 
-                                    seller_info_no = %(seller_info_no)s
-                                    AND MI02.is_deleted = 0
-                                
-                                LIMIT 3
-                            """
+                return SellerInfo.from_row(seller_info_row, account_info['auth_type_id'])
 
-                # SELECT 문 실행
-                db_cursor.execute(select_manager_infos_statement, seller_info_no_data)
+        except KeyError as e:
+            print(f'KEY_ERROR WITH {e}')
+            return jsonify({'message': 'INVALID_KEY'}), 500
 
-                # manager_infos 출력 결과 저장
-                manager_infos = db_cursor.fetchall()
+        except Error as e:
+            print(f'DATABASE_CURSOR_ERROR_WITH {e}')
+            return jsonify({'message': 'DB_CURSOR_ERROR'}), 500
 
-                # seller_info_result 에 manager_info 저장
-                seller_info_result['manager_infos'] = [info for info in manager_infos]
+    # noinspection PyMethodMayBeStatic
+    def get_seller_history(self, account_info, db_connection):
 
-                # 셀러 상태 변경 기록
-                # SELECT 문 조건 데이터
-                account_info_data = {
-                    'seller_account_id': seller_info_result['seller_account_id']
-                }
+        """ 계정의 셀러정보 변경 이력 목록
 
-                # seller_status_change_histories 테이블 SELECT
-                select_status_history_statement = """
-                                SELECT
-                                    changed_time,
-                                    SH03.name as seller_status_name,
-                                    SH04.login_id as modifier
-                                
-                                FROM
-                                    seller_accounts as SH01
-
-                                -- 셀러상태이력 기본정보
-                                INNER JOIN
-                                    seller_status_change_histories as SH02
-                                    ON SH01.seller_account_no = SH02.seller_account_id
-
-                                -- 셀러 상태명
-                                INNER JOIN
-                                    seller_statuses as SH03
-                                    ON SH02.seller_status_id = SH03.status_no
-
-                                -- 수정자 로그인아이디
-                                LEFT JOIN
-                                    accounts as SH04
-                                    ON SH04.account_no = SH01.account_id
-
-                                WHERE 
-                                    SH01.seller_account_no = %(seller_account_id)s
-                                    AND SH04.is_deleted = 0
-                                
-                                ORDER BY changed_time
-                            """
+        셀러정보가 수정될 때마다 만들어진 seller_infos 이력을 시작일시 최신순으로 가져옵니다.
+        (seller_account_id, start_time, close_time) 인덱스로 셀러의 이력만 읽습니다.
 
-                # SELECT 문 실행
-                db_cursor.execute(select_status_history_statement, account_info_data)
+        Args:
+            account_info: account 정보
+            (parameter_account_no: 이력을 확인할 account_no, offset, limit)
+            db_connection: 연결된 database connection 객체
 
-                # seller_status_change_histories 출력 결과 저장
-                status_histories = db_cursor.fetchall()
+        Returns:
+            200: 전체 이력 수(total_count), 셀러정보 이력 목록(histories)
+            404: ACCOUNT_DOES_NOT_EXIST
+            500: DB_CURSOR_ERROR, INVALID_KEY
 
-                # seller_info_result 에 seller_status_change_histories 저장
-                seller_info_result['seller_status_change_histories'] = [history for history in status_histories]
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+        try:
+            with db_connection.cursor() as db_cursor:
 
-                # 셀러 속성 리스트(마스터가 셀러의 속성 변경하는 옵션 제공용)
                 # SELECT 문 조건 데이터
                 account_info_data = {
-                    'seller_info_no': seller_info_result['seller_info_no']
+                    'account_no': account_info['parameter_account_no'],
+                    'offset': account_info['offset'],
+                    'limit': account_info['limit']
                 }
 
-                # seller_types 테이블 SELECT
-                select_seller_types_statement = """
-                                SELECT
-                                    ST03.seller_type_no as seller_type_no,
-                                    ST03.name as seller_type_name
-                                
-                                FROM 
-                                product_sorts as ST01
-                                
-                                -- 셀러정보
-                                INNER JOIN
-                                    seller_infos as ST02
-                                    ON ST01.product_sort_no = ST02.product_sort_id
-                               
-                                -- 상품속성
-                                INNER JOIN
-                                    seller_types as ST03
-                                    ON ST01.product_sort_no = ST03.product_sort_id
-
-                                WHERE 
-                                ST02.seller_info_no = %(seller_info_no)s
-                            """
-
-                # SELECT 문 실행
-                db_cursor.execute(select_seller_types_statement, account_info_data)
+                # 삭제되지 않은 셀러 계정과 전체 이력 수
+                db_cursor.execute("""
+                    SELECT
+                        SA01.seller_account_no,
+                        (
+                            SELECT COUNT(*)
+                            FROM seller_infos AS SI01
+                            WHERE SI01.seller_account_id = SA01.seller_account_no
+                        ) AS total_count
+                    FROM seller_accounts AS SA01
+                    WHERE SA01.account_id = %(account_no)s
+                    AND SA01.is_deleted = 0
+                """, account_info_data)
+                seller_account = db_cursor.fetchone()
+
+                if seller_account is None:
+                    return jsonify({'message': 'ACCOUNT_DOES_NOT_EXIST'}), 404
+
+                account_info_data['seller_account_no'] = seller_account['seller_account_no']
 
-                # seller_types 출력 결과 저장
-                seller_types = db_cursor.fetchall()
+                db_cursor.execute("""
+                    SELECT
+                        SI01.seller_info_no,
+                        SI01.start_time,
+                        SI01.close_time,
+                        SI01.is_current,
+                        SS01.name as seller_status_name,
+                        SI01.name_kr,
+                        SI01.name_en,
+                        AC01.login_id as modifier
+                    FROM seller_infos AS SI01
 
-                # seller_info_result 에 seller_types 저장
-                seller_info_result['seller_types'] = seller_types
+                    -- 셀러 상태명
+                    INNER JOIN seller_statuses AS SS01
+                    ON SI01.seller_status_id = SS01.status_no
 
-                # seller_info_result 에 auth_type_id 저장
+                    -- 수정자 로그인아이디
+                    LEFT JOIN accounts AS AC01
+                    ON AC01.account_no = SI01.modifier
 
-                seller_info_result['auth_type_id'] = account_info['auth_type_id']
+                    WHERE SI01.seller_account_id = %(seller_account_no)s
+                    ORDER BY SI01.start_time DESC, SI01.seller_info_no DESC
+                    LIMIT %(limit)s OFFSET %(offset)s
+                """, account_info_data)
+                histories = db_cursor.fetchall()
 
-                return seller_info_result
+                return jsonify({'total_count': seller_account['total_count'], 'histories': histories}), 200
 
         except KeyError as e:
             print(f'KEY_ERROR WITH {e}')
@@ -408,37 +385,31 @@ class SellerDao:
             return jsonify({'message': 'DB_CURSOR_ERROR'}), 500
 
     # noinspection PyMethodMayBeStatic
-    def get_seller_list(self, valid_param, db_connection):
+    def get_seller_list_query(self, valid_param):
 
-        """ GET 셀러 리스트를 표출하고, 검색 키워드가 오면 키워드 별 검색 가능.
-        페이지네이션 기능: offset 과 limit 값을 받아서 페이지네이션 구현.
-        검색기능: 키워드를 받아서 검색기능 구현. 키워드가 추가 될 때 마다 검색어가 쿼리문에 추가됨
-        엑셀다운로드 기능: excel=1을 쿼리파라미터로 받으면 데이터베이스의 값을
-                        엑셀파일로 만들어 s3에 업로드하고 다운로드 링크를 리턴
+        """ 셀러 리스트 조회 쿼리
+
+        셀러 리스트와 엑셀파일 생성 작업에서 같이 사용하는 필터가 적용된 조회 쿼리를 만듦.
+        키워드가 추가 될 때 마다 검색어가 쿼리문에 추가되고, LIKE 검색과 기간 검색에 맞게 valid_param 의 값을 바꿈.
 
         Args:
-            db_connection: 연결된 database connection 객체
-            valid_param: view 에서 validation 을 통과한 파라미터들을 가져옴.
+            valid_param: view 에서 validation 을 통과한 파라미터들
 
-        Returns: http 응답코드
-            200: 키워드로 excel=1이 들어온 경우 s3에 올라간 엑셀파일 다운로드 url
-            200: 셀러 리스트 표출(검색기능 포함), 키워드에 맞는 셀러 숫자
-            500: SERVER ERROR
+        Returns:
+            ListQuery 객체
 
         Authors:
             yoonhc@brandi.co.kr (윤희철)
+            leesh3@brandi.co.kr (이소헌)
 
         History:
-            2020-04-03(yoonhc@brandi.co.kr): 초기 생성
-            2020-04-07(yoonhc@brandi.co.kr): 엑셀 다운로드 기능 추가
-            2020-04-10(yoonhc@brandi.co.kr): 필터링 키워드가 들어오면 필터된 셀러를 count 하고 결과값에 추가하는 기능 작성
-            2020-04-14(yoonhc@brandi.co.kr): 키워드가 들어오면 쿼리문 자체에 string 을 추가하고 db_connection 을 열고 바인딩하는 방식으로 변경.
+            2026-10-17 (leesh3@brandi.co.kr): get_seller_list 에서 분리
+            2026-10-17 (leesh3@brandi.co.kr): 셀러 한글명, 담당자 연락처를 LIKE 대신 ngram 전문 검색으로 검색
         """
 
-        # 키워드 검색을 위해서 쿼리문을 미리 정의해줌.
-        select_seller_list_statement = '''
-            SELECT 
-            seller_account_id, 
+        # 키워드 검색을 위해서 조회 컬럼과 조인, 기본 조건을 미리 정의해줌. (리스트 조회와 count 에서 같이 사용)
+        seller_list_columns = """
+            seller_account_id,
             accounts.login_id,
             name_en,
             name_kr,
@@ -447,12 +418,7 @@ class SellerDao:
             seller_status_id,
             seller_types.name as seller_type_name,
             site_url,
-            (
-                SELECT COUNT(0) 
-                FROM product_infos 
-                WHERE product_infos.seller_id  = seller_infos.seller_account_id 
-                AND product_infos.close_time = '2037-12-31 23:59:59' 
-            ) as product_count,
+            seller_accounts.product_count,
             seller_accounts.created_at,
             manager_infos.name as manager_name,
             manager_infos.contact_number as manager_contact_number,
@@ -460,79 +426,53 @@ class SellerDao:
             seller_infos.product_sort_id,
             profile_image_url,
             accounts.account_no
+        """
+        seller_list_from = """
             FROM seller_infos
             right JOIN seller_accounts ON seller_accounts.seller_account_no = seller_infos.seller_account_id
             LEFT JOIN accounts ON seller_accounts.account_id = accounts.account_no
             LEFT JOIN seller_statuses ON seller_infos.seller_status_id = seller_statuses.status_no
             LEFT JOIN seller_types ON seller_infos.seller_type_id = seller_types.seller_type_no
-            LEFT JOIN manager_infos on manager_infos.seller_info_id = seller_infos.seller_info_no 
-            WHERE seller_infos.close_time = '2037-12-31 23:59:59.0'
+            LEFT JOIN manager_infos on manager_infos.seller_info_id = seller_infos.seller_info_no
+            WHERE seller_infos.is_current = 1
             AND accounts.is_deleted = 0
             AND seller_accounts.is_deleted = 0
             AND manager_infos.ranking = 1
-        '''
-
-        # 키워드검색이 들어왔을 때 검색결과의 셀러를 count 하기위해서 count 용 쿼리도 미리 정의해줌.
-        filter_query_values_count_statement = '''
-            SELECT COUNT(0) as filtered_seller_count
-            FROM seller_infos
-            right JOIN seller_accounts ON seller_accounts.seller_account_no = seller_infos.seller_account_id
-            LEFT JOIN accounts ON seller_accounts.account_id = accounts.account_no
-            LEFT JOIN seller_statuses ON seller_infos.seller_status_id = seller_statuses.status_no
-            LEFT JOIN seller_types ON seller_infos.seller_type_id = seller_types.seller_type_no
-            LEFT JOIN manager_infos on manager_infos.seller_info_id = seller_infos.seller_info_no 
-            WHERE seller_infos.close_time = '2037-12-31 23:59:59.0'
-            AND accounts.is_deleted = 0
-            AND seller_accounts.is_deleted = 0 
-            AND manager_infos.ranking = 1
-        '''
+        """
+        seller_list_query = ListQuery(seller_list_columns, seller_list_from, valid_param)
 
         # 쿼리파라미터에 키워드가 들어왔는지 확인하고 위에서 정의해준 명령문에 쿼리를 추가해줌.
         if valid_param.get('seller_account_no', None):
-            select_seller_list_statement += " AND seller_accounts.seller_account_no = %(seller_account_no)s"
-            filter_query_values_count_statement += " AND seller_accounts.seller_account_no = %(seller_account_no)s"
+            seller_list_query.add_filter("seller_accounts.seller_account_no = %(seller_account_no)s")
 
         if valid_param.get('login_id', None):
-            select_seller_list_statement += " AND accounts.login_id = %(login_id)s"
-            filter_query_values_count_statement += " AND accounts.login_id = %(login_id)s"
+            seller_list_query.add_filter("accounts.login_id = %(login_id)s")
 
-        # 셀러 한글명 같은 경우는 키워드로 들어온 값을 포함하는 모든 셀러를 검색해야 하기 때문에 like 문을 사용한다.
-        name_kr = valid_param.get('name_kr', None)
+        # 셀러 한글명 같은 경우는 키워드로 들어온 값을 포함하는 모든 셀러를 검색해야 하기 때문에 ngram 전문 검색을 사용한다.
         if valid_param.get('name_kr', None):
-            valid_param['name_kr'] = '%'+name_kr+'%'
-            select_seller_list_statement += " AND name_kr LIKE %(name_kr)s"
-            filter_query_values_count_statement += " AND name_kr LIKE %(name_kr)s"
+            seller_list_query.add_text_search("seller_infos.name_kr", 'name_kr')
 
         if valid_param.get('name_en', None):
-            select_seller_list_statement += " AND name_en = %(name_en)s"
-            filter_query_values_count_statement += " AND name_en = %(name_en)s"
+            seller_list_query.add_filter("name_en = %(name_en)s")
 
         if valid_param.get('brandi_app_user_id', None):
-            select_seller_list_statement += " AND brandi_app_user_id = %(brandi_app_user_id)s"
-            filter_query_values_count_statement += " AND brandi_app_user_id = %(brandi_app_user_id)s"
+            seller_list_query.add_filter("brandi_app_user_id = %(brandi_app_user_id)s")
 
         if valid_param.get('manager_name', None):
-            select_seller_list_statement += " AND manager_infos.name = %(manager_name)s"
-            filter_query_values_count_statement += " AND manager_infos.name = %(manager_name)s"
+            seller_list_query.add_filter("manager_infos.name = %(manager_name)s")
 
         if valid_param.get('seller_status', None):
-            select_seller_list_statement += " AND seller_statuses.name = %(seller_status)s"
-            filter_query_values_count_statement += " AND seller_statuses.name = %(seller_status)s"
+            seller_list_query.add_filter("seller_statuses.name = %(seller_status)s")
 
-        # 담당자 연락처 같은 경우는 키워드로 들어온 값을 포함하는 모든 셀러를 검색해야 하기 때문에 like 문을 사용한다
-        manager_contact_number = valid_param.get('manager_contact_number', None)
+        # 담당자 연락처 같은 경우는 키워드로 들어온 값을 포함하는 모든 셀러를 검색해야 하기 때문에 ngram 전문 검색을 사용한다
         if valid_param.get('manager_contact_number', None):
-            valid_param['manager_contact_number'] = '%'+manager_contact_number+'%'
-            select_seller_list_statement += " AND manager_infos.contact_number LIKE %(manager_contact_number)s"
-            filter_query_values_count_statement += " AND manager_infos.contact_number LIKE %(manager_contact_number)s"
+            seller_list_query.add_text_search("manager_infos.contact_number", 'manager_contact_number')
 
         if valid_param.get('manager_email', None):
-            select_seller_list_statement += " AND manager_infos.email = %(manager_email)s"
-            filter_query_values_count_statement += " AND manager_infos.email = %(manager_email)s"
+            seller_list_query.add_filter("manager_infos.email = %(manager_email)s")
 
         if valid_param.get('seller_type_name', None):
-            select_seller_list_statement += " AND seller_types.name = %(seller_type_name)s"
-            filter_query_values_count_statement += " AND seller_types.name = %(seller_type_name)s"
+            seller_list_query.add_filter("seller_types.name = %(seller_type_name)s")
 
         # 데이터베이스에서는 날짜 + 시간까지 같이 검색하기 때문에 날짜에 시간을 더해줌.
         start_time = valid_param['start_time']
@@ -540,72 +480,80 @@ class SellerDao:
         if start_time and close_time:
             valid_param['start_time'] = start_time + ' 00:00:00'
             valid_param['close_time'] = close_time + ' 23:59:59'
-            select_seller_list_statement += " AND seller_accounts.created_at > %(start_time)s AND seller_accounts.created_at < %(close_time)s"
-            filter_query_values_count_statement += " AND seller_accounts.created_at > %(start_time)s AND seller_accounts.created_at < %(close_time)s"
+            seller_list_query.add_filter("seller_accounts.created_at > %(start_time)s AND seller_accounts.created_at < %(close_time)s")
 
-        # sql 명령문에 키워드 추가가 완료되면 정렬, limit, offset 쿼리문을 추가해준다.
-        select_seller_list_statement += " ORDER BY seller_account_id DESC LIMIT %(limit)s OFFSET %(offset)s"
+        return seller_list_query
 
-        try:
-            with db_connection as db_cursor:
+    # noinspection PyMethodMayBeStatic
+    def get_seller_list(self, valid_param, db_connection):
 
-                # sql 쿼리와 pagination 데이터 바인딩
-                db_cursor.execute(select_seller_list_statement, valid_param)
-                seller_info = db_cursor.fetchall()
+        """ GET 셀러 리스트를 표출하고, 검색 키워드가 오면 키워드 별 검색 가능.
+        페이지네이션 기능: offset 과 limit 값을 받아서 페이지네이션 구현.
+        검색기능: 키워드를 받아서 검색기능 구현. 키워드가 추가 될 때 마다 검색어가 쿼리문에 추가됨
+        엑셀다운로드 기능: excel=1을 쿼리파라미터로 받으면 데이터베이스의 값을
+                        엑셀파일로 만들어 s3에 업로드하고 다운로드 링크를 리턴
 
-                # 쿼리파라미터에 excel 키가 1로 들어오면 엑셀파일을 만듦.
-                if valid_param['excel'] == 1:
-                    s3 = get_s3_connection()
-
-                    # 엑셀파일로 만들경우 페이지네이션 적용을 받지않고 검색 적용만 받기 때문에 페이지네이션 부분 쿼리를 제거해준다.
-                    replaced_statement = select_seller_list_statement.replace('ORDER BY seller_account_id DESC LIMIT %(limit)s OFFSET %(offset)s', '')
-                    db_cursor.execute(replaced_statement, valid_param)
-                    seller_info = db_cursor.fetchall()
-
-                    # pandas 데이터 프레임을 만들기 위한 column 과 value 정리
-                    seller_list_dict = {
-                        '셀러번호': [seller['seller_account_id'] for seller in seller_info],
-                        '관리자계정ID': [seller['login_id'] for seller in seller_info],
-                        '셀러영문명': [seller['name_en'] for seller in seller_info],
-                        '셀러한글명': [seller['name_kr'] for seller in seller_info],
-                        '브랜디회원번호': [seller['brandi_app_user_id'] for seller in seller_info],
-                        '담당자명': [seller['manager_name'] for seller in seller_info],
-                        '담당자전화번호': [seller['manager_contact_number'] for seller in seller_info],
-                        '판매구분': [seller['seller_type_name'] for seller in seller_info],
-                        '상품개수': [seller['product_count'] for seller in seller_info],
-                        '셀러URL': [seller['site_url'] for seller in seller_info],
-                        '셀러등록일': [seller['created_at'] for seller in seller_info],
-                        '승인여부': [seller['seller_status'] for seller in seller_info]
-                    }
+        Args:
+            db_connection: 연결된 database connection 객체
+            valid_param: view 에서 validation 을 통과한 파라미터들을 가져옴.
 
-                    # 데이터베이스의 데이터를 기반으로 한 딕셔너리를 판다스 데이터 프레임으로 만들어줌.
-                    df = pd.DataFrame(data=seller_list_dict)
-                    # 첫번제 인덱스의 컬럼명을 지정해주고, 번호가 1부터 시작하도록 한다.
-                    df.index.name = '번호'
-                    df.index += 1
+        Returns: http 응답코드
+            200: 키워드로 excel=1이 들어온 경우 s3에 올라간 엑셀파일 다운로드 url
+            200: 셀러 리스트 표출(검색기능 포함), 키워드에 맞는 셀러 숫자
+            500: SERVER ERROR
 
-                    # 파일이름과 파일경로를 정의해줌.
-                    file_name = f'{self.gen_random_name()}.xlsx'
-                    file = f'../{file_name}'
+        Authors:
+            yoonhc@brandi.co.kr (윤희철)
+
+        History:
+            2020-04-03(yoonhc@brandi.co.kr): 초기 생성
+            2020-04-07(yoonhc@brandi.co.kr): 엑셀 다운로드 기능 추가
+            2020-04-10(yoonhc@brandi.co.kr): 필터링 키워드가 들어오면 필터된 셀러를 count 하고 결과값에 추가하는 기능 작성
+            2020-04-14(yoonhc@brandi.co.kr): 키워드가 들어오면 쿼리문 자체에 string 을 추가하고 db_connection 을 열고 바인딩하는 방식으로 변경.
+            2026-10-17(leesh3@brandi.co.kr): ListQuery 로 리스트와 필터된 셀러 수를 한번에 조회, 전체 셀러 수는 캐시, with_count 추가
+            2026-10-17(leesh3@brandi.co.kr): 최신 이력 조건을 is_current 로 변경
+            2026-10-17(leesh3@brandi.co.kr): 상품 수를 서브쿼리 대신 seller_accounts.product_count 에서 조회
+            2026-10-17(leesh3@brandi.co.kr): 엑셀파일을 로컬에 만들지 않고 서버 사이드 커서에서 s3 multipart 업로드로 바로 쓰도록 변경
+            2026-10-17(leesh3@brandi.co.kr): 조회 쿼리 생성을 get_seller_list_query 로 분리
+            2026-10-17(leesh3@brandi.co.kr): 검색어가 있으면 검색 관련도 순으로 정렬
+        """
 
-                    # 파일을 엑셀파일로 변환해서 로컬에 저장
-                    df.to_excel(file, encoding='utf8')
+        seller_list_query = self.get_seller_list_query(valid_param)
 
-                    # 로컬에 저장된 파일을 s3에 업로드. 업로드 할 때 실패할 것을 고려하여 try-except 사용.
+        with_count = valid_param.get('with_count', True)
+
+        try:
+            with db_connection as db_cursor:
+
+                # 쿼리파라미터에 excel 키가 1로 들어오면 엑셀파일을 만듦.
+                if valid_param['excel'] == 1:
+
+                    # 엑셀파일로 만들경우 페이지네이션 적용을 받지않고 검색 적용만 받음.
+                    # 서버 사이드 커서로 읽으면서 엑셀파일을 s3 multipart 업로드로 바로 올림. (로컬에 파일을 만들지 않음)
                     try:
-                        s3.upload_file(file, "brandi-intern", file_name)
+                        file_url, _ = export_rows_to_s3(
+                            db_connection,
+                            seller_list_query.select_statement(),
+                            valid_param,
+                            SELLER_EXCEL_COLUMNS,
+                            f'{self.gen_random_name()}.xlsx'
+                        )
                     except Exception as e:
                         print(f'error: {e}')
                         return jsonify({'message': 'S3_UPLOAD_FAIL'}), 500
 
-                    # s3에 올라간 파일을 다운받는 url
-                    file_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{file_name}'
-
-                    # s3에 올라간 후에 로컬에 있는 파일 삭제
-                    os.remove(file)
-
                     return jsonify({'file_url': file_url}), 200
 
+                # 셀러 리스트와 필터된 셀러 수를 한번에 조회 (with_count=0 이면 셀러 수는 조회하지 않음)
+                # 셀러 한글명, 담당자 연락처 검색이 있으면 검색 관련도가 높은 순으로 먼저 정렬
+                seller_info, filtered_seller_count = seller_list_query.fetch_page(
+                    db_cursor,
+                    seller_list_query.relevance_order('seller_account_id DESC'),
+                    limit=valid_param['limit'],
+                    offset=valid_param['offset'],
+                    with_count=with_count
+                )
+
                 # 셀러 상태를 확인하여 해당 상태에서 취할 수 있는 action 을 기존의 seller_info 에 넣어줌.
                 for seller in seller_info:
                     if seller['seller_status'] == '입점':
@@ -630,22 +578,18 @@ class SellerDao:
                             {'name': '퇴점 철회 처리', 'seller_status_id': 2}
                         ]
 
-                # pagination 을 위해서 전체 셀러가 몇명인지 count 해서 기존의 seller_info 에 넣어줌.
-                seller_count_statement = '''
-                    SELECT 
-                    COUNT(seller_account_id) as total_seller_count
-                    FROM seller_infos
-                    LEFT JOIN seller_accounts ON seller_infos.seller_account_id = seller_accounts.seller_account_no 
-                    LEFT JOIN accounts ON seller_accounts.account_id = accounts.account_no 
-                    WHERE close_time = '2037-12-31 23:59:59.0' AND accounts.is_deleted = 0
-                '''
-                db_cursor.execute(seller_count_statement)
-                seller_count = db_cursor.fetchone()
-
-                # 쿼리파라미터가 들어오면 필터된 셀러를 카운트하고 리턴 값에 포함시킨다. 쿼리파라미터가 들어오지않으면 전체 셀러 수를 포함시킴.
-                db_cursor.execute(filter_query_values_count_statement, valid_param)
-                filter_query_values_count = db_cursor.fetchone()
-                seller_count['filtered_seller_count'] = filter_query_values_count['filtered_seller_count']
+                # pagination 을 위해서 전체 셀러가 몇명인지 count 해서 기존의 seller_info 에 넣어줌. (짧은 시간 캐시된 값을 사용)
+                # 쿼리파라미터가 들어오면 필터된 셀러 수를, 들어오지않으면 전체 셀러 수를 포함시킴.
+                seller_count = {'total_seller_count': None, 'filtered_seller_count': filtered_seller_count}
+                if with_count:
+                    seller_count['total_seller_count'] = get_total_count('seller_list', db_cursor, """
+                        SELECT
+                        COUNT(seller_account_id) as total_seller_count
+                        FROM seller_infos
+                        LEFT JOIN seller_accounts ON seller_infos.seller_account_id = seller_accounts.seller_account_no
+                        LEFT JOIN accounts ON seller_accounts.account_id = accounts.account_no
+                        WHERE is_current = 1 AND accounts.is_deleted = 0
+                    """)
 
                 return jsonify({'seller_list': seller_info, 'seller_count': seller_count}), 200
 
@@ -655,7 +599,7 @@ class SellerDao:
             return jsonify({'error': 'DB_CURSOR_ERROR'}), 500
 
     # noinspection PyMethodMayBeStatic
-    def change_seller_info(self, account_info, db_connection):
+    def change_seller_info(self, account_info, seller_info, db_connection):
 
         """ 계정 셀러정보를 수정(새로운 이력 생성) INSERT INTO DB
 
@@ -671,6 +615,7 @@ class SellerDao:
 
         Args:
             account_info: 엔드포인트에서 전달 받은 account 정보
+            seller_info: 수정 전에 조회한 셀러정보(SellerInfo)
             db_connection: 연결된 database connection 객체
 
         Returns: http 응답코드
@@ -678,6 +623,7 @@ class SellerDao:
             400: INVALID_APP_ID (존재하지 않는 브랜디 앱 아이디 입력)
                  NO_CHANGEABLE_STATUS (입점 대기 상태일때는 수정 불가)
             403: NO_AUTHORIZATION_FOR_STATUS_CHANGE
+            409: SELLER_INFO_CHANGED (조회 이후 다른 요청에서 셀러정보가 먼저 수정됨)
             500: DB_CURSOR_ERROR, INVALID_KEY
 
         Authors:
@@ -696,6 +642,10 @@ class SellerDao:
                 - 변경하고자 하는 셀러의 아이디 값을 기존에는 parameter 로 받았는데,
                   parameter_account_no 를 기준으로 DB 에서 꺼내오도록 변경
                 - 입점대기 상태일 때는 수정할 수 없도록 변경
+            2026-10-17 (leesh3@brandi.co.kr): 최신 이력 조건을 is_current 로 변경
+            2026-10-17 (leesh3@brandi.co.kr): 커밋 전에 상품 리스트 조회용 테이블(product_list_view)의 셀러 정보 갱신
+            2026-10-17 (leesh3@brandi.co.kr): 변경된 셀러명을 셀러명 자동완성 색인에 반영
+            2026-10-17 (leesh3@brandi.co.kr): 조회한 셀러정보(SellerInfo)를 받아서 셀러계정, 이전 셀러정보, 이전 상태를 다시 조회하지 않음
         """
         try:
             with db_connection.cursor() as db_cursor:
@@ -717,36 +667,10 @@ class SellerDao:
 
                 account_info['now'] = now['now()']
 
-                # parameter_account의 셀러 아이디 가져오기
-                select_seller_account_no_statement = """
-                    SELECT seller_account_no
-                    FROM accounts
-                    INNER JOIN
-                    seller_accounts
-                    ON accounts.account_no = seller_accounts.account_id
-                    WHERE accounts.account_no = %(parameter_account_no)s
-                """
-
-                db_cursor.execute(select_seller_account_no_statement, account_info)
-                seller_account_result = db_cursor.fetchone()
-
-                # 셀러계정 아이디 저장
-                account_info['seller_account_id'] = seller_account_result['seller_account_no']
-
-                # 이전 셀러정보 아이디 가져오기
-                # seller_infos 테이블 SELECT
-                select_seller_infos_statement = """
-                    SELECT seller_info_no
-                    FROM seller_infos
-                    WHERE seller_account_id = %(seller_account_id)s
-                    AND close_time = '2037-12-31 23:59:59'
-                """
-
-                db_cursor.execute(select_seller_infos_statement, account_info)
-
-                previous_seller_info_id = db_cursor.fetchone()
-
-                account_info['previous_seller_info_id'] = previous_seller_info_id['seller_info_no']
+                # 조회한 셀러정보의 셀러계정 아이디, 이전 셀러정보 아이디, 이전 셀러 상태값 저장
+                account_info['seller_account_id'] = seller_info.seller_account_id
+                account_info['previous_seller_info_id'] = seller_info.seller_info_no
+                account_info['previous_seller_status_id'] = seller_info.seller_status_no
 
                 # 브랜디앱유저 검색 정보
                 brandi_app_user_data = {
@@ -892,22 +816,15 @@ class SellerDao:
                     SET
                     close_time = %(now)s
                     WHERE seller_info_no = %(previous_seller_info_id)s
+                    AND is_current = 1
                 """
 
                 db_cursor.execute(update_previous_seller_info_statement, account_info)
 
-                # 이전 셀러정보의 셀러 상태값 가져오기
-                select_previous_seller_status_statement = """
-                    SELECT seller_status_id
-                    FROM seller_infos
-                    WHERE seller_info_no = %(previous_seller_info_id)s
-                """
-
-                db_cursor.execute(select_previous_seller_status_statement, account_info)
-
-                previous_seller_status_id = db_cursor.fetchone()
-
-                account_info['previous_seller_status_id'] = previous_seller_status_id['seller_status_id']
+                # 조회 이후 다른 요청에서 셀러정보가 먼저 수정되었으면 이전 셀러정보가 이미 종료되어 있음
+                if db_cursor.rowcount == 0:
+                    db_connection.rollback()
+                    return jsonify({'message': 'SELLER_INFO_CHANGED'}), 409
 
                 # 입점대기 상태일 때는 셀러정보를 수정할 수 없음
                 if account_info['previous_seller_status_id'] == 1:
@@ -945,7 +862,13 @@ class SellerDao:
 
                     db_cursor.execute(insert_status_history_statement, seller_status_data)
 
+                # 상품 리스트 조회용 테이블의 셀러 정보 갱신
+                refresh_product_list_view(db_cursor, seller_account_id=account_info['seller_account_id'])
+
                 db_connection.commit()
+
+                # 셀러명 자동완성 색인 갱신
+                update_seller_name_index(account_info['seller_account_id'], account_info['name_kr'], account_info['name_en'])
                 return jsonify({'message': 'SUCCESS'}), 200
 
         except KeyError as e:
@@ -981,6 +904,11 @@ class SellerDao:
                 2020-04-05 (yoonhc@brandi.co.kr): 초기 생성
                 2020-04-09 (yoonhc@brandi.co.kr): 셀러정보 선분이력 반영
                 2020-04-13 (yoonhc@brandi.co.kr): 셀러 상태를 변경하면 seller_status_change_histories 테이블에 row 추가.
+                2026-10-17 (leesh3@brandi.co.kr): 변경 후 계정 정보 캐시 무효화 및 기존 토큰 폐기
+                2026-10-17 (leesh3@brandi.co.kr): 최신 이력 조건을 is_current 로 변경
+                2026-10-17 (leesh3@brandi.co.kr): 커밋 전에 상품 리스트 조회용 테이블(product_list_view)의 셀러 정보 갱신
+                2026-10-17 (leesh3@brandi.co.kr): 토큰 폐기 시각을 상태 변경과 같은 트랜잭션에서 저장
+                2026-10-17 (leesh3@brandi.co.kr): 셀러 상태는 토큰 정보가 아니므로 토큰 폐기 제거 (캐시 무효화만 유지)
 
         """
 
@@ -1004,7 +932,7 @@ class SellerDao:
                                 
                 WHERE 
                     seller_account_id = %(seller_account_id)s
-                    AND close_time = '2037-12-31 23:59:59'
+                    AND is_current = 1
                     AND is_deleted = 0
                 ''', target_seller_info)
 
@@ -1095,7 +1023,7 @@ class SellerDao:
                     WHERE
                         seller_account_id = %(seller_account_id)s 
                     AND 
-                        close_time = '2037-12-31 23:59:59'
+                        is_current = 1
                     AND
                         is_deleted = 0
                 """
@@ -1157,7 +1085,22 @@ class SellerDao:
                 )
                 ''', target_seller_info)
 
+                # 캐시 무효화를 위해 셀러 계정의 account 번호를 가져옴
+                db_cursor.execute('''
+                SELECT account_id FROM seller_accounts WHERE seller_account_no = %(seller_account_id)s
+                ''', target_seller_info)
+                seller_account = db_cursor.fetchone()
+
+                # 상품 리스트 조회용 테이블의 셀러 정보 갱신
+                refresh_product_list_view(db_cursor, seller_account_id=target_seller_info['seller_account_id'])
+
+                # 셀러 상태는 토큰에 담긴 정보(auth_type_id, is_deleted)가 아니므로 토큰은 폐기하지 않음
                 db_connection.commit()
+
+                # 상태가 바뀐 셀러 계정의 캐시 무효화
+                if seller_account:
+                    invalidate_account_cache(seller_account['account_id'])
+
                 return jsonify({'message': 'SUCCESS'}), 200
 
         except KeyError as e:
@@ -1193,6 +1136,8 @@ class SellerDao:
             2020-04-05 (choiyj@brandi.co.kr): 초기 생성
             2020-04-05 (choiyj@brandi.co.kr): SQL 문을 통해 DB 에서 원하는 정보를 가지고 와서 return 하는 함수 구현
             2020-04-16 (leejm3@brandi.co.kr): 로그인 시 입점대기 여부를 확인하기 위해 상태 정보 셀렉트 추가
+            2026-10-17 (leesh3@brandi.co.kr): 토큰에 담기 위해 권한, 삭제 여부 셀렉트 추가
+            2026-10-17 (leesh3@brandi.co.kr): 최신 이력 조건을 is_current 로 변경
         """
 
         try:
@@ -1204,6 +1149,8 @@ class SellerDao:
                     SELECT
                         AC01.account_no,
                         AC01.password,
+                        AC01.auth_type_id,
+                        AC01.is_deleted,
                         AC03.seller_status_id
                     
                     FROM 
@@ -1220,7 +1167,7 @@ class SellerDao:
                     WHERE 
                         AC01.login_id = %(login_id)s 
                         AND AC01.is_deleted = 0
-                        AND AC03.close_time = '2037-12-31 23:59:59'
+                        AND AC03.is_current = 1
                 """
 
                 # SELECT 문 실행
@@ -1240,6 +1187,72 @@ class SellerDao:
             print(f'DATABASE_CURSOR_ERROR_WITH {e}')
             return jsonify({'message': 'DB_CURSOR_ERROR'}), 500
 
+    # noinspection PyMethodMayBeStatic
+    def get_account_auth_info(self, account_info, db_connection):
+
+        """ 토큰 재발급을 위한 계정 권한 정보 확인
+
+        account_info['account_no'] 계정의 권한, 삭제 여부, 현재 셀러 상태를 가져와서 return
+
+        Args:
+            account_info: account_no 를 가진 계정 정보
+            db_connection: 연결된 database connection 객체
+
+        Returns:
+            200: db 에서 get 한 account_no, auth_type_id, is_deleted, seller_status_id,
+                 tokens_revoked_at(토큰 폐기 시각, unix time)
+            400: INVALID_KEY
+            500: DB_CURSOR_ERROR
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 토큰 폐기 시각(tokens_revoked_at) 조회
+        """
+
+        try:
+            with db_connection.cursor() as db_cursor:
+
+                # 마스터 계정은 셀러 정보가 없으므로 선분이력 조건을 조인 조건에 둠
+                select_account_auth_info_statement = """
+                    SELECT
+                        AC01.account_no,
+                        AC01.auth_type_id,
+                        AC01.is_deleted,
+                        AC03.seller_status_id,
+                        UNIX_TIMESTAMP(AC01.tokens_revoked_at) AS tokens_revoked_at
+
+                    FROM
+                        accounts as AC01
+
+                    LEFT JOIN
+                        seller_accounts as AC02
+                        ON AC01.account_no = AC02.account_id
+
+                    LEFT JOIN
+                        seller_infos as AC03
+                        ON AC02.seller_account_no = AC03.seller_account_id
+                        AND AC03.is_current = 1
+
+                    WHERE
+                        AC01.account_no = %(account_no)s
+                """
+
+                db_cursor.execute(select_account_auth_info_statement, account_info)
+                account_auth_info = db_cursor.fetchone()
+
+                return account_auth_info
+
+        except KeyError as e:
+            print(f'KEY_ERROR WITH {e}')
+            return jsonify({'message': 'INVALID_KEY'}), 400
+
+        except Error as e:
+            print(f'DATABASE_CURSOR_ERROR_WITH {e}')
+            return jsonify({'message': 'DB_CURSOR_ERROR'}), 500
+
     # noinspection PyMethodMayBeStatic
     def check_overlap_login_id(self, login_id, db_connection):
 
@@ -1450,6 +1463,9 @@ class SellerDao:
 
         History:
             2020-04-01 (leejm3@brandi.co.kr) : 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr) : 생성된 계정의 계정 정보 캐시 무효화
+            2026-10-17 (leesh3@brandi.co.kr) : 셀러 리스트 전체 셀러 수 캐시 무효화
+            2026-10-17 (leesh3@brandi.co.kr) : 가입한 셀러명을 셀러명 자동완성 색인에 추가
             
         """
 
@@ -1557,6 +1573,15 @@ class SellerDao:
                 # 데이터 sql 명령문과 셀러 데이터 바인딩
                 db_cursor.execute(insert_status_histories_statement, account_info)
                 db_connection.commit()
+
+                # 새로 생성된 계정 번호가 캐시에 남아있지 않도록 무효화
+                invalidate_account_cache(account_no)
+
+                # 셀러 리스트 전체 셀러 수가 바뀌었으므로 캐시 무효화
+                invalidate_list_count_cache('seller_list')
+
+                # 셀러명 자동완성 색인에 추가
+                update_seller_name_index(account_info['seller_account_id'], account_info['name_kr'], account_info['name_en'])
                 return jsonify({"message": "SUCCESS"}), 200
 
         except KeyError as e:
@@ -1568,3 +1593,33 @@ class SellerDao:
             print(f'DATABASE_CURSOR_ERROR_WITH {e}')
             db_connection.rollback()
             return jsonify({'message': 'DB_CURSOR_ERROR'}), 500
+
+    # noinspection PyMethodMayBeStatic
+    def reconcile_product_count(self, reconcile_info, db_connection):
+
+        """ 셀러별 상품 수 재계산
+
+        seller_accounts.product_count 를 product_infos 에서 다시 계산해서 어긋난 셀러를 리턴하고 바로잡음.
+
+        Args:
+            reconcile_info:
+                fix: False 이면 어긋난 셀러만 리턴하고 수정하지 않음
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            200: 전체 셀러 수, 어긋난 셀러 수와 목록, 수정한 셀러 수
+            500: DB_CURSOR_ERROR
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+        try:
+            report = reconcile_seller_product_count(db_connection, fix=reconcile_info['fix'])
+            return jsonify(report), 200
+
+        except Exception as e:
+            print(f'DATABASE_CURSOR_ERROR_WITH {e}')
+            return jsonify({'message': 'DB_CURSOR_ERROR'}), 500
@@ -0,0 +1,232 @@
+""" 셀러정보 조회 결과(SellerInfo)
+
+get_seller_info 는 셀러 기본 정보와 담당자 정보, 셀러 상태 변경 기록, 셀러 속성 리스트를 한번의 쿼리로 가져온다.
+목록 정보는 상관 서브쿼리에서 JSON_ARRAYAGG 로 묶어서 한 row 에 담고, 여기서 파이썬 객체로 바꾼다.
+as_of 를 주면 최신 셀러정보 대신 그 시점에 유효했던 셀러정보와 그 시점까지의 상태 변경 기록을 가져온다.
+SellerInfo 는 dict 이므로 그대로 응답으로 쓸 수 있고,
+셀러정보 수정시 이미 조회한 셀러 계정 번호, 셀러정보 번호, 셀러 상태 번호를 다시 조회하지 않고 사용한다.
+
+Authors:
+    leesh3@brandi.co.kr (이소헌)
+
+History:
+    2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+"""
+import json
+from datetime import datetime
+
+# 셀러당 표출하는 담당자 수
+MAX_MANAGER_COUNT = 3
+
+SELECT_SELLER_INFO_STATEMENT = """
+    SELECT
+        seller_info_no,
+        seller_account_id,
+        CS02.start_time as start_time,
+        CS02.close_time as close_time,
+        profile_image_url,
+        CS03.status_no as seller_status_no,
+        CS03.name as seller_status_name,
+        CS04.seller_type_no as seller_type_no,
+        CS04.name as seller_type_name,
+        CS05.account_no as account_no,
+        CS05.login_id as account_login_id,
+        CS06.app_user_no as brandi_app_user_no,
+        CS06.app_id as brandi_app_user_app_id,
+        name_kr,
+        name_en,
+        brandi_app_user_id,
+        ceo_name,
+        company_name,
+        business_number,
+        certificate_image_url,
+        online_business_number,
+        online_business_image_url,
+        background_image_url,
+        short_description,
+        long_description,
+        site_url,
+        insta_id,
+        center_number,
+        kakao_id,
+        yellow_id,
+        zip_code,
+        address,
+        detail_address,
+        weekday_start_time,
+        weekday_end_time,
+        weekend_start_time,
+        weekend_end_time,
+        bank_name,
+        bank_holder_name,
+        account_number,
+
+        -- 담당자 정보
+        (
+            SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                'name', MI01.name,
+                'contact_number', MI01.contact_number,
+                'email', MI01.email,
+                'ranking', MI01.ranking
+            ))
+            FROM manager_infos AS MI01
+            WHERE MI01.seller_info_id = CS02.seller_info_no
+            AND MI01.is_deleted = 0
+        ) AS manager_infos,
+
+        -- 셀러 상태 변경 기록
+        (
+            SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                'changed_time', SH01.changed_time,
+                'seller_status_name', SH02.name,
+                'modifier', SH03.login_id
+            ))
+            FROM seller_status_change_histories AS SH01
+
+            -- 셀러 상태명
+            INNER JOIN seller_statuses AS SH02
+            ON SH01.seller_status_id = SH02.status_no
+
+            -- 수정자 로그인아이디
+            INNER JOIN accounts AS SH03
+            ON SH03.account_no = CS01.account_id
+            AND SH03.is_deleted = 0
+
+            WHERE SH01.seller_account_id = CS01.seller_account_no
+            {status_history_condition}
+        ) AS seller_status_change_histories,
+
+        -- 셀러 속성 리스트(마스터가 셀러의 속성 변경하는 옵션 제공용)
+        (
+            SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                'seller_type_no', ST01.seller_type_no,
+                'seller_type_name', ST01.name
+            ))
+            FROM seller_types AS ST01
+            WHERE ST01.product_sort_id = CS02.product_sort_id
+        ) AS seller_types
+
+    FROM seller_accounts AS CS01
+
+    -- seller_info 기본 정보
+    INNER JOIN seller_infos AS CS02
+    ON CS01.seller_account_no = CS02.seller_account_id
+
+    -- 셀러 상태명
+    INNER JOIN seller_statuses as CS03
+    ON CS02.seller_status_id = CS03.status_no
+
+    -- 셀러 속성명
+    INNER JOIN seller_types as CS04
+    ON CS02.seller_type_id = CS04.seller_type_no
+
+    -- 셀러계정 로그인 아이디
+    LEFT JOIN accounts as CS05
+    ON CS05.account_no = CS01.account_id
+    AND CS05.is_deleted = 0
+
+    -- 브랜디 앱 아이디
+    LEFT JOIN brandi_app_users as CS06
+    ON CS02.brandi_app_user_id = CS06.app_user_no
+
+    WHERE
+        -- 삭제되지 않은 계정의 셀러정보
+        CS01.account_id = %(account_no)s
+        AND CS01.is_deleted = 0
+        AND {version_condition}
+"""
+
+
+def get_seller_info_statement(as_of=None):
+
+    """ 셀러정보 조회 쿼리
+
+    Args:
+        as_of: 이 시점(데이터베이스 일시)에 유효했던 셀러정보를 조회, 없으면 최신 셀러정보
+
+    Returns:
+        SELECT 문 (as_of 가 있으면 %(as_of)s 파라미터를 사용)
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    if not as_of:
+        return SELECT_SELLER_INFO_STATEMENT.format(
+            status_history_condition='',
+            version_condition='CS02.is_current = 1'
+        )
+
+    # (seller_account_id, start_time, close_time) 인덱스로 그 시점의 셀러정보 하나를 찾음
+    return SELECT_SELLER_INFO_STATEMENT.format(
+        status_history_condition='AND SH01.changed_time <= %(as_of)s',
+        version_condition='CS02.start_time <= %(as_of)s AND CS02.close_time > %(as_of)s'
+    )
+
+
+def _load_json_list(value):
+    # 묶을 row 가 없으면 JSON_ARRAYAGG 는 NULL
+    if value is None:
+        return []
+    return json.loads(value) if isinstance(value, (str, bytes)) else value
+
+
+class SellerInfo(dict):
+
+    """ 셀러정보 조회 결과
+
+    get_seller_info_statement 결과 row 에 목록 정보를 풀어서 담은 dict.
+    기존 get_seller_info 응답과 같은 key 를 가진다.
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+
+    @classmethod
+    def from_row(cls, row, auth_type_id):
+
+        """ 조회 결과 row 로 SellerInfo 생성
+
+        Args:
+            row: get_seller_info_statement 쿼리의 결과 row
+            auth_type_id: 조회한 계정의 권한 타입
+
+        Returns:
+            SellerInfo 객체
+        """
+        seller_info = cls(row)
+
+        # 담당자는 순번 순으로 MAX_MANAGER_COUNT 명까지
+        manager_infos = _load_json_list(row['manager_infos'])
+        seller_info['manager_infos'] = sorted(manager_infos, key=lambda info: info['ranking'])[:MAX_MANAGER_COUNT]
+
+        # JSON 안의 DATETIME 은 문자열이므로 datetime 으로 되돌리고 변경 일시 순으로 정렬
+        status_histories = _load_json_list(row['seller_status_change_histories'])
+        for history in status_histories:
+            history['changed_time'] = datetime.fromisoformat(history['changed_time'])
+        seller_info['seller_status_change_histories'] = sorted(status_histories, key=lambda history: history['changed_time'])
+
+        seller_types = _load_json_list(row['seller_types'])
+        seller_info['seller_types'] = sorted(seller_types, key=lambda seller_type: seller_type['seller_type_no'])
+
+        seller_info['auth_type_id'] = auth_type_id
+        return seller_info
+
+    @property
+    def seller_account_id(self):
+        return self['seller_account_id']
+
+    @property
+    def seller_info_no(self):
+        """ 최신 셀러정보 번호 (수정시 종료할 이전 셀러정보) """
+        return self['seller_info_no']
+
+    @property
+    def seller_status_no(self):
+        """ 최신 셀러정보의 셀러 상태 번호 """
+        return self['seller_status_no']
@@ -0,0 +1,140 @@
+""" 셀러별 상품 수(seller_accounts.product_count) 관리
+
+셀러 리스트의 상품 수는 셀러 계정에 저장된 product_count 를 읽는다.
+상품 정보의 최신 이력(product_infos.is_current = 1) 중 셀러에 속한 상품 수이고,
+상품 등록 / 삭제, 상품의 셀러 변경시 원본을 변경한 트랜잭션 안에서 커밋 전에 변경한다.
+reconcile_seller_product_count 로 전체를 다시 계산해서 어긋난 셀러를 찾고 바로잡는다.
+
+Authors:
+    leesh3@brandi.co.kr (이소헌)
+
+History:
+    2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+"""
+
+# 셀러별 실제 상품 수
+ACTUAL_PRODUCT_COUNT_STATEMENT = """
+    SELECT
+        seller_id,
+        COUNT(0) AS product_count
+    FROM product_infos
+    WHERE is_current = 1
+    GROUP BY seller_id
+"""
+
+
+def change_seller_product_count(db_cursor, seller_account_id, amount):
+
+    """ 셀러의 상품 수 증감
+
+    Args:
+        db_cursor: 원본을 변경한 트랜잭션의 데이터베이스 커서
+        seller_account_id: 셀러 계정 번호
+        amount: 증감할 수 (등록 1, 삭제 -1)
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    if not amount:
+        return
+
+    db_cursor.execute("""
+        UPDATE seller_accounts
+        SET product_count = GREATEST(product_count + %(amount)s, 0)
+        WHERE seller_account_no = %(seller_account_id)s
+    """, {'seller_account_id': seller_account_id, 'amount': amount})
+
+
+def move_seller_product_count(db_cursor, previous_seller_account_id, seller_account_id, amount=1):
+
+    """ 상품의 셀러가 바뀐 경우 이전 셀러의 상품 수를 줄이고 새 셀러의 상품 수를 늘림
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    if previous_seller_account_id == seller_account_id:
+        return
+
+    change_seller_product_count(db_cursor, previous_seller_account_id, -amount)
+    change_seller_product_count(db_cursor, seller_account_id, amount)
+
+
+def reconcile_seller_product_count(db_connection, fix=True):
+
+    """ 셀러별 상품 수 재계산
+
+    product_infos 에서 셀러별 상품 수를 한번에 계산해서 저장된 값과 다른 셀러를 찾고,
+    fix 가 True 이면 같은 트랜잭션에서 한번의 UPDATE 로 바로잡는다.
+
+    Args:
+        db_connection: 데이터베이스 커넥션 객체
+        fix: False 이면 어긋난 셀러만 리턴하고 수정하지 않음
+
+    Returns:
+        {
+            'seller_count': 전체 셀러 수,
+            'drift_count': 상품 수가 어긋난 셀러 수,
+            'drift': [{'seller_account_no', 'product_count'(저장된 값), 'actual_product_count'(실제 값)}],
+            'fixed': 수정한 셀러 수
+        }
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    try:
+        with db_connection.cursor() as db_cursor:
+
+            # 트랜잭션 시작
+            db_cursor.execute("START TRANSACTION")
+
+            db_cursor.execute("SELECT COUNT(0) AS seller_count FROM seller_accounts")
+            seller_count = db_cursor.fetchone()['seller_count']
+
+            # 저장된 상품 수와 실제 상품 수가 다른 셀러 (수정할 row 는 잠금)
+            db_cursor.execute(f"""
+                SELECT
+                    SA.seller_account_no,
+                    SA.product_count,
+                    COALESCE(PC.product_count, 0) AS actual_product_count
+                FROM seller_accounts AS SA
+                LEFT JOIN ({ACTUAL_PRODUCT_COUNT_STATEMENT}) AS PC
+                ON PC.seller_id = SA.seller_account_no
+                WHERE SA.product_count <> COALESCE(PC.product_count, 0)
+                FOR UPDATE
+            """)
+            drift = db_cursor.fetchall()
+
+            fixed = 0
+            if fix and drift:
+                db_cursor.execute(f"""
+                    UPDATE seller_accounts AS SA
+                    LEFT JOIN ({ACTUAL_PRODUCT_COUNT_STATEMENT}) AS PC
+                    ON PC.seller_id = SA.seller_account_no
+                    SET SA.product_count = COALESCE(PC.product_count, 0)
+                    WHERE SA.product_count <> COALESCE(PC.product_count, 0)
+                """)
+                fixed = db_cursor.rowcount
+
+            db_connection.commit()
+
+            report = {
+                'seller_count': seller_count,
+                'drift_count': len(drift),
+                'drift': drift,
+                'fixed': fixed,
+            }
+            print(f'SELLER_PRODUCT_COUNT_DRIFT {report["drift_count"]} FIXED {fixed}')
+            return report
+
+    except Exception:
+        db_connection.rollback()
+        raise
@@ -1,11 +1,13 @@
-import bcrypt
 import jwt
 from flask import jsonify, g
-from datetime import datetime, timedelta
 from config import SECRET
+from auth_token import issue_tokens, is_issued_before, is_token_revoked
 from connection import DatabaseConnection, get_s3_connection
+from export_job import get_export_job_queue
+from password_hasher import get_password_hasher, PasswordHashError
+from seller_name_index import get_seller_name_index
 
-from seller.model.seller_dao import SellerDao
+from seller.model.seller_dao import SellerDao, SELLER_EXCEL_COLUMNS
 
 
 class SellerService:
@@ -40,6 +42,7 @@ class SellerService:
             400: INVALID_AUTH_TYPE_ID, INVALID_PARAMETER_ACCOUNT_NO
             401: INVALID_PASSWORD
             500: DB_CURSOR_ERROR, INVALID_KEY
+            503: PASSWORD_HASH_BUSY, PASSWORD_HASH_TIMEOUT
 
         Authors:
             leejm3@brandi.co.kr (이종민)
@@ -52,9 +55,11 @@ class SellerService:
                 - 'INVALID_PARAMETER_ACCOUNT_NO' 에러 추가
                 - 받는 인자 명칭을 명확히 하기 위해 변경(account_info -> change_info)
                 - parameter validator 를 사용하기 전에 들어온 값을 확인하기 위해 만들었던 new_change_info 를 제거
+            2026-10-17 (leesh3@brandi.co.kr): bcrypt 작업을 암호화 작업 풀에서 처리하도록 변경
         """
 
         seller_dao = SellerDao()
+        password_hasher = get_password_hasher()
         try:
             # 계정이 가진 권한 타입을 가져옴
             account_auth_type_id = change_info['auth_type_id']
@@ -62,9 +67,8 @@ class SellerService:
             # 마스터 권한일 때
             if account_auth_type_id == 1:
 
-                # 인자로 전달 받은 새로운 비밀번호를 암호화 시킨 후 디코드 시켜 'password' 로 저장
-                crypted_password = bcrypt.hashpw(change_info['new_password'].encode('utf-8'), bcrypt.gensalt())
-                change_info['password'] = crypted_password.decode('utf-8')
+                # 인자로 전달 받은 새로운 비밀번호를 암호화 작업 풀에서 암호화 시킨 후 'password' 로 저장
+                change_info['password'] = password_hasher.hash_password(change_info['new_password'])
 
                 # 새로운 비밀번호를 담아서 seller_dao 의 비밀번호 변경 dao 를 호출 및 반환
                 changing_password_result = seller_dao.change_password(change_info, db_connection)
@@ -78,12 +82,10 @@ class SellerService:
                     original_password = seller_dao.get_account_password(change_info, db_connection)
 
                     # DB 에서 가져온 기존 비밀번호와 셀러가 입력한 기존 비밀번호가 일치하는지 확인
-                    if bcrypt.checkpw(change_info['original_password'].encode('utf-8'),
-                                      original_password['password'].encode('utf-8')):
+                    if password_hasher.check_password(change_info['original_password'], original_password['password']):
 
                         # 일치하는지 확인되면 새로운 비밀번호를 암호화해서 change_info 에 저장해줌
-                        crypted_password = bcrypt.hashpw(change_info['new_password'].encode('utf-8'), bcrypt.gensalt())
-                        change_info['password'] = crypted_password.decode('utf-8')
+                        change_info['password'] = password_hasher.hash_password(change_info['new_password'])
 
                         # 새로운 비밀번호를 담아서 seller_dao 의 비밀번호 변경 dao 를 호출 및 반환
                         changing_password_result = seller_dao.change_password(change_info, db_connection)
@@ -100,6 +102,10 @@ class SellerService:
             else:
                 return jsonify({'message': 'INVALID_AUTH_TYPE_ID'}), 400
 
+        # 암호화 작업 풀이 가득 찼거나 시간 초과
+        except PasswordHashError as e:
+            return jsonify({'message': f'{e}'}), 503
+
         except Exception as e:
             return jsonify({'message': f'{e}'}), 500
 
@@ -166,6 +172,45 @@ class SellerService:
         except Exception as e:
             return jsonify({'message': f'{e}'}), 500
 
+    # noinspection PyMethodMayBeStatic
+    def get_seller_history(self, account_info, db_connection):
+
+        """ 계정 셀러정보 변경 이력 목록
+
+        셀러정보 표출과 같이 마스터 권한이면 모든 셀러의 이력을,
+        셀러 권한이면 데코레이터에서 확인된 account_no 와 parameter_account_no 가 같을 때만 이력을 표출합니다.
+
+        Args:
+            account_info: 엔드포인트에서 전달 받은 account 정보, offset, limit
+            db_connection: 연결된 database connection 객체
+
+        Returns: http 응답코드
+            200: 전체 이력 수, 셀러정보 이력 목록
+            400: INVALID_AUTH_TYPE_ID
+            403: NO_AUTHORIZATION
+            404: ACCOUNT_DOES_NOT_EXIST
+            500: DB_CURSOR_ERROR, INVALID_KEY
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        seller_dao = SellerDao()
+
+        # 존재하지 않는 auth_type_id
+        if account_info['auth_type_id'] not in (1, 2):
+            return jsonify({'message': 'INVALID_AUTH_TYPE_ID'}), 400
+
+        # 셀러 권한이면 자신의 셀러정보만 열람 가능
+        if account_info['auth_type_id'] == 2 \
+                and account_info['decorator_account_no'] != account_info['parameter_account_no']:
+            return jsonify({'message': 'NO_AUTHORIZATION'}), 403
+
+        return seller_dao.get_seller_history(account_info, db_connection)
+
     # noinspection PyMethodMayBeStatic
     def change_seller_info(self, account_info, db_connection):
 
@@ -188,6 +233,7 @@ class SellerService:
                  INVALID_AUTH_TYPE_ID, NO_CHANGEABLE_STATUS,
                  EXISTING_NAME_KR, EXISTING_NAME_EN, INVALID_ACCOUNT_NO
             403: NO_AUTHORIZATION
+            409: SELLER_INFO_CHANGED
             500: INVALID_KEY, DB_CURSOR_ERROR
 
         Authors:
@@ -196,6 +242,7 @@ class SellerService:
         History:
             2020-04-03 (leejm3@brandi.co.kr) : 초기 생성
             2020-04-15 (leejm3@brandi.co.kr) : 셀러명 중복체크 추가 / 없는 계정 에러 추가
+            2026-10-17 (leesh3@brandi.co.kr) : 셀러명 비교에 조회한 셀러정보를 셀러정보 수정 dao 에 넘김
 
         """
 
@@ -229,8 +276,9 @@ class SellerService:
                         if check_overlap_name_en_result:
                             return jsonify({'message': 'EXISTING_NAME_EN'}), 400
 
-                    # parameter_account_no 의 셀러정보를 수정함(새로운 이력 생성)
-                    changing_seller_info_result = seller_dao.change_seller_info(account_info, db_connection)
+                    # 조회한 셀러정보를 넘겨서 parameter_account_no 의 셀러정보를 수정함(새로운 이력 생성)
+                    changing_seller_info_result = seller_dao. \
+                        change_seller_info(account_info, getting_seller_info_result, db_connection)
                     return changing_seller_info_result
 
                 # parameter_account_no 에 해당하는 셀러가 없으면 에러 반환
@@ -262,8 +310,9 @@ class SellerService:
                         if check_overlap_name_en_result:
                             return jsonify({'message': 'EXISTING_NAME_EN'}), 400
 
-                    # parameter_account_no 의 셀러정보를 수정함(새로운 이력 생성)
-                    changing_seller_info_result = seller_dao.change_seller_info(account_info, db_connection)
+                    # 조회한 셀러정보를 넘겨서 parameter_account_no 의 셀러정보를 수정함(새로운 이력 생성)
+                    changing_seller_info_result = seller_dao. \
+                        change_seller_info(account_info, getting_seller_info_result, db_connection)
                     return changing_seller_info_result
 
                 # decorator_account_no 와 parameter_account_no 가 다를 경우 셀러정보 수정 권한이 없음
@@ -310,6 +359,104 @@ class SellerService:
 
         return jsonify({'message': 'AUTHORIZATION_REQUIRED'}), 403
 
+    # noinspection PyMethodMayBeStatic
+    def submit_seller_list_export(self, valid_param, user):
+
+        """ 셀러 리스트 엑셀파일 생성 작업 등록
+        요청을 보내온 유저의 권한을 확인해서 마스터유저이면 셀러 리스트와 같은 필터로 만든 조회 쿼리를 작업 큐에 등록.
+        같은 필터의 작업이 최근에 등록되었으면 그 작업을 리턴.
+
+        Args:
+            valid_param: 클라이언트에서 온 요청
+            user: 유저 정보
+
+        Returns:
+            202: 작업 번호, 상태, 진행 상황(row_count), 재사용 여부(reused)
+            403: auth_type_id가 1(마스터)이 아니면 열람 권한 없음
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+        if user.get('auth_type_id', None) != 1:
+            return jsonify({'message': 'AUTHORIZATION_REQUIRED'}), 403
+
+        seller_dao = SellerDao()
+        seller_list_query = seller_dao.get_seller_list_query(valid_param)
+
+        export_job, reused = get_export_job_queue().submit(
+            'seller_list',
+            seller_list_query.select_statement(seller_list_query.relevance_order('seller_account_id DESC')),
+            valid_param,
+            SELLER_EXCEL_COLUMNS
+        )
+        return jsonify({**export_job.to_dict(), 'reused': reused}), 202
+
+    # noinspection PyMethodMayBeStatic
+    def get_seller_list_export(self, job_id, user):
+
+        """ 셀러 리스트 엑셀파일 생성 작업 상태 조회
+
+        Args:
+            job_id: 작업 번호
+            user: 유저 정보
+
+        Returns:
+            200: 작업 상태, 진행 상황(row_count), 완료된 경우 다운로드 url(file_url)
+            403: AUTHORIZATION_REQUIRED
+            404: EXPORT_JOB_DOES_NOT_EXIST
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+        if user.get('auth_type_id', None) != 1:
+            return jsonify({'message': 'AUTHORIZATION_REQUIRED'}), 403
+
+        export_job = get_export_job_queue().get_job(job_id)
+        if export_job is None or export_job.list_name != 'seller_list':
+            return jsonify({'message': 'EXPORT_JOB_DOES_NOT_EXIST'}), 404
+
+        return jsonify(export_job.to_dict()), 200
+
+    # noinspection PyMethodMayBeStatic
+    def autocomplete_seller_name(self, autocomplete_info, user):
+
+        """ 셀러명 자동완성
+        요청을 보내온 유저의 권한을 확인해서 마스터유저이면 셀러명 색인에서 한글명 / 영문명이 검색어로 시작하는 셀러를 찾음.
+
+        Args:
+            autocomplete_info: 검색어(q), 최대 셀러 수(limit)
+            user: 유저 정보
+
+        Returns:
+            200: 셀러 계정 번호, 한글명, 영문명 리스트
+            403: AUTHORIZATION_REQUIRED
+            500: SELLER_NAME_INDEX_ERROR
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+        if user.get('auth_type_id', None) != 1:
+            return jsonify({'message': 'AUTHORIZATION_REQUIRED'}), 403
+
+        try:
+            seller_name_index = get_seller_name_index()
+
+        except Exception as e:
+            print(f'SELLER_NAME_INDEX_LOAD_ERROR_WITH {e}')
+            return jsonify({'message': 'SELLER_NAME_INDEX_ERROR'}), 500
+
+        sellers = seller_name_index.search(autocomplete_info['q'], autocomplete_info['limit'])
+        return jsonify({'sellers': sellers}), 200
+
     def change_seller_status(self, target_seller_info, user, db_connection):
 
         """ 마스터 권한 셀러 상태 변경
@@ -364,6 +511,7 @@ class SellerService:
             200: SUCCESS 로그인 성공
             400: INVALID_LOGIN_ID
             401: INVALID_PASSWORD, STATUS_1_CANT_LOGIN
+            503: PASSWORD_HASH_BUSY, PASSWORD_HASH_TIMEOUT
 
         Authors:
             choiyj@brandi.co.kr (최예지)
@@ -371,10 +519,13 @@ class SellerService:
         History:
             2020-04-05 (choiyj@brandi.co.kr): 초기 생성
             2020-04-05 (choiyj@brandi.co.kr): 로그인 로직을 처리하는 함수 작성, login_id 존재여부에 따라 token 발행 함수 구현
+            2026-10-17 (leesh3@brandi.co.kr): 토큰 발급을 issue_tokens 로 변경 (stateless 모드 지원)
+            2026-10-17 (leesh3@brandi.co.kr): bcrypt 작업을 암호화 작업 풀에서 처리, cost 가 다르면 재암호화
         """
 
         # SellerDao 에서 가져온 정보를 담는 seller_dao 인스턴스 생성
         seller_dao = SellerDao()
+        password_hasher = get_password_hasher()
         try:
             # seller_dao 에 있는 get_account_info 함수로 account_info 와 db_connection 을 인자로 넘겨줌
             account_info_result = seller_dao.get_account_info(account_info, db_connection)
@@ -384,17 +535,19 @@ class SellerService:
 
                 if account_info_result['seller_status_id'] != 1:
 
-                    # bcrypt.checkpw 를 통해 암호화 된 password 와 인자로 받아 온 password 를 비교
-                    if bcrypt.checkpw(account_info['password'].encode('utf-8'),
-                                      account_info_result['password'].encode('utf-8')):
+                    # 암호화 작업 풀에서 암호화 된 password 와 인자로 받아 온 password 를 비교
+                    if password_hasher.check_password(account_info['password'], account_info_result['password']):
+
+                        # 저장된 비밀번호의 cost 가 설정된 work factor 와 다르면 새로 암호화해서 저장
+                        if password_hasher.needs_rehash(account_info_result['password']):
+                            self._rehash_password(account_info['password'], account_info_result, db_connection)
 
-                        # 두 password 가 일치하면 token 을 발급하는데 현재시간 + 3일 만큼 유효하도록 지정해 줌
-                        token = jwt.encode({'account_no': account_info_result['account_no'],
-                                            'exp': datetime.utcnow() + timedelta(days=3)},
-                                           SECRET['secret_key'], algorithm=SECRET['algorithm'])
+                        # 두 password 가 일치하면 token 을 발급
+                        # (stateless 모드이면 권한 정보를 담은 access token 과 refresh token 을 같이 발급)
+                        tokens = issue_tokens(account_info_result)
 
                         # 발급 된 token 을 return
-                        return jsonify({'token': token}), 200
+                        return jsonify(tokens), 200
 
                     else:
                         # 만약 두 password 가 불일치하면 에러 메세지 return
@@ -407,6 +560,104 @@ class SellerService:
                 # DB에 login_id 가 존재하지 않으면 에러 메세지 return
                 return jsonify({'message': 'INVALID_LOGIN_ID'}), 400
 
+        # 암호화 작업 풀이 가득 찼거나 시간 초과
+        except PasswordHashError as e:
+            return jsonify({'message': f'{e}'}), 503
+
+        # 명시하지 않은 모든 에러를 잡아서 return
+        except Exception as e:
+            return jsonify({'message': f'{e}'}), 500
+
+    # noinspection PyMethodMayBeStatic
+    def _rehash_password(self, password, account_info_result, db_connection):
+
+        """ 로그인 시 비밀번호 재암호화
+
+        저장된 비밀번호의 cost 가 설정된 work factor 와 다를 때 로그인에 성공한 비밀번호를 새로 암호화해서 저장.
+        로그인은 이미 성공했으므로 재암호화에 실패해도 에러를 출력만 하고 다음 로그인 때 다시 시도.
+
+        Args:
+            password: 로그인에 성공한 비밀번호
+            account_info_result: dao 에서 가져온 계정 정보 (account_no, password)
+            db_connection: 연결된 database connection 객체
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+        seller_dao = SellerDao()
+        try:
+            rehash_info = {
+                'account_no': account_info_result['account_no'],
+                'previous_password': account_info_result['password'],
+                'password': get_password_hasher().hash_password(password)
+            }
+            seller_dao.update_password_hash(rehash_info, db_connection)
+
+        # 재암호화 실패가 로그인 실패가 되지 않도록 모든 에러를 출력만 함
+        except Exception as e:
+            print(f'PASSWORD_REHASH_ERROR_WITH {e}')
+
+    # noinspection PyMethodMayBeStatic
+    def refresh_token(self, token_info, db_connection):
+
+        """ access token 재발급 로직 처리
+
+        refresh token 을 검증하고, 계정의 현재 권한 정보로 access token 과 refresh token 을 새로 발급
+
+        Args:
+            token_info: refresh_token 을 가진 토큰 정보
+            db_connection: 연결된 database connection 객체
+
+        Returns:
+            200: 새로 발급된 token, refresh_token
+            400: DELETED_ACCOUNT
+            401: INVALID_TOKEN, REVOKED_TOKEN, STATUS_1_CANT_LOGIN
+            404: ACCOUNT_DOES_NOT_EXIST
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): 데이터베이스의 토큰 폐기 시각 확인
+        """
+        seller_dao = SellerDao()
+
+        try:
+            payload = jwt.decode(token_info['refresh_token'], SECRET['secret_key'], algorithm=SECRET['algorithm'])
+
+        except jwt.InvalidTokenError:
+            return jsonify({'message': 'INVALID_TOKEN'}), 401
+
+        # access token 으로는 재발급할 수 없음
+        if payload.get('type') != 'refresh':
+            return jsonify({'message': 'INVALID_TOKEN'}), 401
+
+        if is_token_revoked(payload):
+            return jsonify({'message': 'REVOKED_TOKEN'}), 401
+
+        try:
+            # 토큰에 담을 권한 정보는 데이터베이스의 최신 정보를 사용
+            account = seller_dao.get_account_auth_info({'account_no': payload['account_no']}, db_connection)
+
+            if not account:
+                return jsonify({'message': 'ACCOUNT_DOES_NOT_EXIST'}), 404
+
+            if account['is_deleted'] != 0:
+                return jsonify({'message': 'DELETED_ACCOUNT'}), 400
+
+            if account['seller_status_id'] == 1:
+                return jsonify({'message': 'STATUS_1_CANT_LOGIN'}), 401
+
+            # 다른 프로세스에서 폐기한 토큰도 데이터베이스의 폐기 시각으로 확인
+            if is_issued_before(payload, account['tokens_revoked_at']):
+                return jsonify({'message': 'REVOKED_TOKEN'}), 401
+
+            return jsonify(issue_tokens(account)), 200
+
         # 명시하지 않은 모든 에러를 잡아서 return
         except Exception as e:
             return jsonify({'message': f'{e}'}), 500
@@ -446,6 +697,7 @@ class SellerService:
 
         History:
             2020-04-06 (leejm3@brandi.co.kr): 초기 생성
+            2026-10-17 (leesh3@brandi.co.kr): bcrypt 작업을 암호화 작업 풀에서 처리하도록 변경
 
         """
 
@@ -472,14 +724,17 @@ class SellerService:
             if check_overlap_name_en_result:
                 return jsonify({'message': 'EXISTING_NAME_EN'}), 400
 
-            # 중복체크까지 모두 끝나면 암호화된 비밀번호 생성
-            bcrypted_password = bcrypt.hashpw(account_info['password'].encode('utf-8'), bcrypt.gensalt())
-            account_info['password'] = bcrypted_password
+            # 중복체크까지 모두 끝나면 암호화 작업 풀에서 암호화된 비밀번호 생성
+            account_info['password'] = get_password_hasher().hash_password(account_info['password'])
 
             # 회원가입 절차 진행
             sign_up_result = seller_dao.sign_up(account_info, db_connection)
             return sign_up_result
 
+        # 암호화 작업 풀이 가득 찼거나 시간 초과
+        except PasswordHashError as e:
+            return jsonify({'message': f'{e}'}), 503
+
         except Exception as e:
             return jsonify({'message': f'{e}'}), 500
 
@@ -513,3 +768,32 @@ class SellerService:
 
         except Exception as e:
             return jsonify({'message': f'{e}'}), 500
+
+    # noinspection PyMethodMayBeStatic
+    def reconcile_product_count(self, reconcile_info, user, db_connection):
+
+        """ 셀러별 상품 수 재계산
+
+        마스터 권한이면 dao 에 전달.
+
+        Args:
+            reconcile_info: 재계산 옵션 (fix)
+            user: 데코레이터에서 넘겨받은 계정 정보
+            db_connection: 데이터베이스 커넥션 객체
+
+        Returns:
+            200: 재계산 결과
+            403: AUTHORIZATION_REQUIRED
+            500: DB_CURSOR_ERROR
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+        if user.get('auth_type_id', None) != 1:
+            return jsonify({'message': 'AUTHORIZATION_REQUIRED'}), 403
+
+        seller_dao = SellerDao()
+        return seller_dao.reconcile_product_count(reconcile_info, db_connection)
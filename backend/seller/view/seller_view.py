@@ -16,7 +16,11 @@ from flask_request_validator import (
 
 from seller.service.seller_service import SellerService
 from connection import get_db_connection, DatabaseConnection
-from utils import login_required, ImageUpload
+from utils import login_required, ImageUpload, parse_as_of
+
+# 셀러정보 이력 목록의 기본 / 최대 조회 수
+SELLER_HISTORY_LIMIT = 10
+MAX_SELLER_HISTORY_LIMIT = 100
 
 
 class SellerView:
@@ -195,6 +199,60 @@ class SellerView:
             except Exception as e:
                 return jsonify({'message': f'{e}'}), 500
 
+    @seller_app.route('/refresh', methods=['POST'])
+    @validate_params(
+        Param('refresh_token', JSON, str)
+    )
+    def refresh_token(*args):
+
+        """ access token 재발급 엔드포인트
+
+        stateless 토큰 모드에서 로그인 시 발급된 refresh_token 을 받아
+        access token 과 refresh token 을 새로 발급합니다.
+
+        request.body:
+            refresh_token: 로그인 시 발급된 refresh token
+
+        Args:
+            *args: 유효성 검사를 통과한 request.body 의 인자
+
+        Returns:
+            200: 새로 발급된 token, refresh_token
+            400: DELETED_ACCOUNT
+            401: INVALID_TOKEN, REVOKED_TOKEN, STATUS_1_CANT_LOGIN
+            404: ACCOUNT_DOES_NOT_EXIST
+            500: NO_DATABASE_CONNECTION
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        token_info = {
+            'refresh_token': args[0]
+        }
+
+        try:
+            db_connection = get_db_connection()
+            if db_connection:
+                seller_service = SellerService()
+                refresh_result = seller_service.refresh_token(token_info, db_connection)
+                return refresh_result
+
+            else:
+                return jsonify({'message': 'NO_DATABASE_CONNECTION'}), 500
+
+        except Exception as e:
+            return jsonify({'message': f'{e}'}), 500
+
+        finally:
+            try:
+                db_connection.close()
+            except Exception as e:
+                return jsonify({'message': f'{e}'}), 500
+
     @seller_app.route('', methods=['GET'], endpoint='get_all_sellers')
     @login_required
     @validate_params(
@@ -212,7 +270,13 @@ class SellerView:
         Param('close_time', GET, str, required=False),
         Param('excel', GET, int, required=False),
         Param('offset', GET, int, required=False),
-        Param('limit', GET, int, required=False)
+        Param('limit', GET, int, required=False),
+
+        # 0 이면 셀러 수를 조회하지 않음
+        Param('with_count', GET, int, required=False),
+
+        # 1 이면 엑셀파일 생성 작업을 등록하고 작업 번호를 바로 리턴
+        Param('export_job', GET, int, required=False)
     )
     def get_seller_list(*args):
 
@@ -228,6 +292,7 @@ class SellerView:
         Returns:
             seller_list_result: 가입된 모든 셀러 및 셀러 세부 정보 리스트로 표출(seller_service 에서 받은 리턴 값.)
             400: seller_service 로 값을 넘겨줄 때 애러가나면 400 리턴
+            202: export_job=1 이면 엑셀파일 생성 작업 정보
             500: database 연결에 실패하면 500리턴
 
         Authors:
@@ -238,6 +303,8 @@ class SellerView:
             2020-04-07 (yoonhc@brandi.co.kr): 파라미터 유효성검사 추가
             2020-04-10 (yoonhc@brandi.co.kr): 애러 처리 추가
             2020-04-14 (yoonhc@brandi.co.kr): offset 과 limit 도 유효성검사 실시
+            2026-10-17 (leesh3@brandi.co.kr): with_count 추가
+            2026-10-17 (leesh3@brandi.co.kr): export_job 추가
         """
 
         # 유효성 확인 위해 기간 데이터 먼저 정의
@@ -268,10 +335,16 @@ class SellerView:
         valid_param['excel'] = args[12]
         valid_param['offset'] = args[13] if args[13] else 0
         valid_param['limit'] = args[14] if args[14] else 10
+        valid_param['with_count'] = args[15] != 0
 
         # 유저 정보를 g에서 읽어와서 service 에 전달
         user = g.account_info
 
+        # 엑셀파일 생성 작업은 작업 스레드에서 커넥션을 따로 사용하므로 바로 등록
+        if args[16] == 1:
+            seller_service = SellerService()
+            return seller_service.submit_seller_list_export(valid_param, user)
+
         # 데이터베이스 커넥션을 열어줌.
         try:
             db_connection = DatabaseConnection()
@@ -291,11 +364,78 @@ class SellerView:
             except Exception as e:
                 return jsonify({'message': f'{e}'}), 500
 
+    @seller_app.route('/autocomplete', methods=['GET'], endpoint='autocomplete_seller_name')
+    @login_required
+    @validate_params(
+        Param('q', GET, str),
+        Param('limit', GET, int, required=False)
+    )
+    def autocomplete_seller_name(*args):
+
+        """ 셀러명 자동완성 엔드포인트
+
+        상품 / 셀러 리스트의 셀러명 필터 입력시 한글명 또는 영문명이 검색어로 시작하는 셀러를 리턴합니다.
+        데이터베이스를 조회하지 않고 메모리의 셀러명 색인에서 찾습니다.
+
+        request.args:
+            q: 검색어 (공백, 대소문자 무시)
+            limit: 최대 셀러 수 (기본 10, 최대 50)
+
+        Returns:
+            200: 셀러 리스트
+            403: AUTHORIZATION_REQUIRED
+            500: SELLER_NAME_INDEX_ERROR
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        # limit 이 없거나 범위를 벗어나면 보정
+        limit = args[1] if args[1] else 10
+        autocomplete_info = {
+            'q': args[0],
+            'limit': min(max(limit, 1), 50)
+        }
+
+        seller_service = SellerService()
+        autocomplete_result = seller_service.autocomplete_seller_name(autocomplete_info, g.account_info)
+        return autocomplete_result
+
+    @seller_app.route('/export-job/<job_id>', methods=['GET'], endpoint='get_seller_list_export')
+    @login_required
+    def get_seller_list_export(job_id):
+
+        """ 셀러 리스트 엑셀파일 생성 작업 상태 엔드포인트
+
+        셀러 리스트에서 export_job=1 로 등록한 작업의 진행 상황(엑셀에 쓴 셀러 수)과 완료된 경우 다운로드 url 을 리턴합니다.
+
+        Args:
+            job_id: 작업 번호
+
+        Returns:
+            200: 작업 상태
+            403: AUTHORIZATION_REQUIRED
+            404: EXPORT_JOB_DOES_NOT_EXIST
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+        seller_service = SellerService()
+        export_job_result = seller_service.get_seller_list_export(job_id, g.account_info)
+        return export_job_result
+
     @seller_app.route('/<int:parameter_account_no>', methods=['GET'], endpoint='get_seller_info')
     @login_required
     @validate_params(
         Param('parameter_account_no', PATH, int),
         Param('parameter_account_no', PATH, str, rules=[MaxLength(6)]),
+        Param('as_of', GET, str, required=False),
     )
     def get_seller_info(*args):
 
@@ -315,13 +455,17 @@ class SellerView:
         url parameter:
             parameter_account_no: 열람하고자 하는 셀러정보의 계정 번호
 
+        query string:
+            as_of: 조회할 시점 ('YYYY-MM-DD HH:MM:SS' 또는 'YYYY-MM-DD', 응답 일시와 같은 한국 시간)
+                   없으면 최신 셀러정보
+
         g.account_info: 데코레이터에서 넘겨받은(셀러정보를 열람을 수행하려는) 계정 정보
             auth_type_id: 계정의 권한정보
             account_no: 데코레이터에서 확인된 계정번호
 
         Returns: http 응답코드
             200: SUCCESS 셀러정보 겟 완료
-            400: INVALID_ACCOUNT_NO, INVALID_AUTH_TYPE_ID
+            400: INVALID_ACCOUNT_NO, INVALID_AUTH_TYPE_ID, INVALID_AS_OF
             403: NO_AUTHORIZATION
             500: NO_DATABASE_CONNECTION, DB_CURSOR_ERROR, INVALID_KEY
 
@@ -334,6 +478,7 @@ class SellerView:
             2020-04-03 (leejm3@brandil.co.kr): 주석 수정(메인문구, url parameter 수정)
             2020-04-06 (leejm3@brandi.co.kr):
                 url path 변경('/<int:parameter_account_no>/info' -> '/<int:parameter_account_no>')
+            2026-10-17 (leesh3@brandi.co.kr): as_of 시점 조회 추가
 
         """
 
@@ -344,6 +489,12 @@ class SellerView:
             'decorator_account_no': g.account_info['account_no'],
         }
 
+        if args[2]:
+            try:
+                account_info['as_of'] = parse_as_of(args[2])
+            except ValueError:
+                return jsonify({'message': 'INVALID_AS_OF'}), 400
+
         db_connection = get_db_connection()
         try:
             if db_connection:
@@ -364,6 +515,85 @@ class SellerView:
             except Exception as e:
                 return jsonify({'message': f'{e}'}), 500
 
+    @seller_app.route('/<int:parameter_account_no>/history', methods=['GET'], endpoint='get_seller_history')
+    @login_required
+    @validate_params(
+        Param('parameter_account_no', PATH, int),
+        Param('parameter_account_no', PATH, str, rules=[MaxLength(6)]),
+        Param('offset', GET, int, required=False),
+        Param('limit', GET, int, required=False),
+    )
+    def get_seller_history(*args):
+
+        """ 계정 셀러정보 변경 이력 목록 엔드포인트
+
+        셀러정보가 수정될 때마다 만들어진 이력을 최신순으로 표출하는 엔드포인트 입니다.
+        이력의 start_time 을 셀러정보 표출 엔드포인트의 as_of 로 넘기면 그 이력의 셀러정보를 볼 수 있습니다.
+        열람 권한은 셀러정보 표출과 같습니다. (마스터는 모든 셀러, 셀러는 자신의 셀러정보)
+
+        Args:
+            *args: 유효성 검사를 통과한 파라미터
+
+        url parameter:
+            parameter_account_no: 열람하고자 하는 셀러정보의 계정 번호
+
+        query string:
+            offset: 건너뛸 이력 수
+            limit: 조회할 이력 수 (최대 MAX_SELLER_HISTORY_LIMIT)
+
+        g.account_info: 데코레이터에서 넘겨받은 계정 정보
+            auth_type_id: 계정의 권한정보
+            account_no: 데코레이터에서 확인된 계정번호
+
+        Returns: http 응답코드
+            200: 전체 이력 수, 셀러정보 이력 목록
+            400: INVALID_AUTH_TYPE_ID
+            403: NO_AUTHORIZATION
+            404: ACCOUNT_DOES_NOT_EXIST
+            500: NO_DATABASE_CONNECTION, DB_CURSOR_ERROR, INVALID_KEY
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        account_info = {
+            'parameter_account_no': args[0],
+            'auth_type_id': g.account_info['auth_type_id'],
+            'decorator_account_no': g.account_info['account_no'],
+            'offset': args[2],
+            'limit': args[3],
+        }
+
+        # offset 이 없거나 음수면 0, limit 이 없거나 범위를 벗어나면 기본값
+        if not account_info['offset'] or account_info['offset'] < 0:
+            account_info['offset'] = 0
+
+        if not account_info['limit'] or not 0 < account_info['limit'] <= MAX_SELLER_HISTORY_LIMIT:
+            account_info['limit'] = SELLER_HISTORY_LIMIT
+
+        db_connection = get_db_connection()
+        try:
+            if db_connection:
+                seller_service = SellerService()
+                seller_history_result = seller_service.get_seller_history(account_info, db_connection)
+
+                return seller_history_result
+
+            else:
+                return jsonify({'message': 'NO_DATABASE_CONNECTION'}), 500
+
+        except Exception as e:
+            return jsonify({'message': f'{e}'}), 500
+
+        finally:
+            try:
+                db_connection.close()
+            except Exception as e:
+                return jsonify({'message': f'{e}'}), 500
+
     @seller_app.route('/mypage', methods=['GET'], endpoint='get_my_page')
     @login_required
     def get_my_page():
@@ -846,3 +1076,59 @@ class SellerView:
 
         except Exception as e:
             return ({'message': f'{e}'}), 400
+
+        finally:
+            try:
+                db_connection.close()
+            except Exception as e:
+                return jsonify({'message': f'{e}'}), 500
+
+    @seller_app.route('/product-count/reconcile', methods=['POST'], endpoint='reconcile_product_count')
+    @login_required
+    @validate_params(
+        Param('fix', JSON, int, required=False)
+    )
+    def reconcile_product_count(*args):
+
+        """ 셀러별 상품 수 재계산 엔드포인트
+
+        셀러 리스트에 표출되는 셀러별 상품 수를 상품 정보에서 다시 계산해서 어긋난 셀러를 리턴하고 바로잡습니다.
+        주기적으로 실행하는 작업에서 호출합니다. fix=0 이면 확인만 하고 수정하지 않습니다.
+
+        request.body:
+            fix: 0 이면 수정하지 않음 (기본 1)
+
+        Returns:
+            200: seller_count, drift_count, drift, fixed
+            403: AUTHORIZATION_REQUIRED
+            500: NO_DATABASE_CONNECTION, DB_CURSOR_ERROR
+
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
+
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        """
+
+        reconcile_info = {
+            'fix': args[0] != 0
+        }
+
+        try:
+            db_connection = get_db_connection()
+            if db_connection:
+                seller_service = SellerService()
+                reconcile_result = seller_service.reconcile_product_count(reconcile_info, g.account_info, db_connection)
+                return reconcile_result
+
+            else:
+                return jsonify({'message': 'NO_DATABASE_CONNECTION'}), 500
+
+        except Exception as e:
+            return jsonify({'message': f'{e}'}), 500
+
+        finally:
+            try:
+                db_connection.close()
+            except Exception as e:
+                return jsonify({'message': f'{e}'}), 500
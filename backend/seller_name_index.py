@@ -0,0 +1,232 @@
+import bisect
+import threading
+import time
+
+from config import SECRET
+from connection import get_db_connection
+
+# 자동완성 대상 셀러명 (삭제되지 않은 셀러의 최신 셀러 정보)
+SELECT_SELLER_NAMES_STATEMENT = """
+    SELECT
+        SI.seller_account_id,
+        SI.name_kr,
+        SI.name_en
+    FROM seller_infos AS SI
+    INNER JOIN seller_accounts AS SA
+    ON SA.seller_account_no = SI.seller_account_id
+    WHERE SI.is_current = 1
+    AND SA.is_deleted = 0
+"""
+
+
+def normalize_name(name):
+    """ 색인 / 검색에 사용하는 이름 (공백 제거, 소문자) """
+    return ''.join((name or '').split()).lower()
+
+
+class SellerNameIndex:
+
+    """ 셀러 한글명 / 영문명 접두어 색인 (자동완성)
+
+    (정규화된 이름, 셀러 계정 번호) 를 정렬된 리스트에 보관하고 bisect 로 접두어 범위를 찾는다.
+    셀러당 한글명, 영문명 두개의 key 만 가지므로 메모리는 셀러 수에 비례하고, max_size 셀러까지만 색인한다.
+    회원가입 / 셀러 정보 수정시 set 으로 바로 갱신하고,
+    다른 프로세스에서 바뀐 셀러명은 refresh_interval 마다 백그라운드에서 데이터베이스에서 다시 읽어 반영한다.
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+
+    def __init__(self, max_size=100000, refresh_interval=600):
+        self.max_size = max_size
+        self.refresh_interval = refresh_interval
+
+        self._lock = threading.Lock()
+
+        # 정렬된 (정규화된 이름, 셀러 계정 번호) 목록과 셀러 계정 번호 -> (한글명, 영문명)
+        self._keys = []
+        self._names = {}
+
+        self.loaded_at = None
+        self._is_refreshing = False
+
+    def load(self, rows):
+
+        """ 셀러명 전체를 새로 색인
+
+        Args:
+            rows: seller_account_id, name_kr, name_en 을 가진 row 목록
+        """
+        names = {}
+        for row in rows:
+            if len(names) >= self.max_size:
+                print(f'SELLER_NAME_INDEX_FULL {self.max_size}')
+                break
+            names[row['seller_account_id']] = (row['name_kr'], row['name_en'])
+
+        keys = sorted(
+            (normalize_name(name), seller_account_id)
+            for seller_account_id, seller_names in names.items()
+            for name in set(seller_names) if name
+        )
+
+        with self._lock:
+            self._keys = keys
+            self._names = names
+            self.loaded_at = time.monotonic()
+
+    def set(self, seller_account_id, name_kr, name_en):
+        """ 셀러 한 명의 이름을 추가하거나 바꿈 """
+        with self._lock:
+            if seller_account_id not in self._names and len(self._names) >= self.max_size:
+                print(f'SELLER_NAME_INDEX_FULL {self.max_size}')
+                return
+
+            self._remove(seller_account_id)
+            self._names[seller_account_id] = (name_kr, name_en)
+            for name in {name_kr, name_en}:
+                if name:
+                    bisect.insort(self._keys, (normalize_name(name), seller_account_id))
+
+    def remove(self, seller_account_id):
+        with self._lock:
+            self._remove(seller_account_id)
+
+    def _remove(self, seller_account_id):
+        # lock 을 잡은 상태에서 호출
+        for name in set(self._names.pop(seller_account_id, ())):
+            if name:
+                key = (normalize_name(name), seller_account_id)
+                index = bisect.bisect_left(self._keys, key)
+                if index < len(self._keys) and self._keys[index] == key:
+                    del self._keys[index]
+
+    def search(self, prefix, limit=10):
+
+        """ 한글명 또는 영문명이 prefix 로 시작하는 셀러
+
+        Args:
+            prefix: 검색어 (공백, 대소문자 무시)
+            limit: 최대 셀러 수
+
+        Returns:
+            [{'seller_account_id', 'name_kr', 'name_en'}] (이름 순)
+        """
+        key = normalize_name(prefix)
+        if not key:
+            return []
+
+        sellers = []
+        with self._lock:
+            seen = set()
+            index = bisect.bisect_left(self._keys, (key,))
+
+            while index < len(self._keys) and len(sellers) < limit:
+                name, seller_account_id = self._keys[index]
+                if not name.startswith(key):
+                    break
+
+                if seller_account_id not in seen:
+                    seen.add(seller_account_id)
+                    name_kr, name_en = self._names[seller_account_id]
+                    sellers.append({'seller_account_id': seller_account_id, 'name_kr': name_kr, 'name_en': name_en})
+                index += 1
+
+        return sellers
+
+    def is_stale(self):
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > self.refresh_interval
+
+    def refresh_in_background(self):
+        """ 다른 refresh 가 진행중이 아니면 작업 스레드에서 데이터베이스에서 다시 읽음 """
+        with self._lock:
+            if self._is_refreshing:
+                return
+            self._is_refreshing = True
+
+        threading.Thread(target=self._refresh, name='seller-name-index', daemon=True).start()
+
+    def _refresh(self):
+        try:
+            load_seller_names(self)
+        except Exception as e:
+            print(f'SELLER_NAME_INDEX_LOAD_ERROR_WITH {e}')
+        finally:
+            with self._lock:
+                self._is_refreshing = False
+
+    def stats(self):
+        with self._lock:
+            return {
+                'seller_count': len(self._names),
+                'key_count': len(self._keys),
+                'max_size': self.max_size,
+                'age': time.monotonic() - self.loaded_at if self.loaded_at is not None else None,
+            }
+
+
+def load_seller_names(seller_name_index):
+    """ 데이터베이스에서 셀러명을 읽어 색인을 새로 만듦. 요청 밖에서는 커넥션 풀에서 따로 빌려서 사용하고 반납 """
+    db_connection = get_db_connection()
+    try:
+        with db_connection.cursor() as db_cursor:
+            db_cursor.execute(SELECT_SELLER_NAMES_STATEMENT)
+            seller_name_index.load(db_cursor.fetchall())
+
+    finally:
+        db_connection.close()
+
+
+_seller_name_index = None
+_seller_name_index_lock = threading.Lock()
+
+
+def get_seller_name_index():
+
+    """ 셀러명 자동완성 색인
+
+    처음 호출될 때 한번만 생성하고 데이터베이스에서 셀러명을 읽어 색인한다. (앱 시작시 create_app 에서 호출)
+    읽기에 실패하면 다음 호출 때 다시 읽고, 색인이 refresh_interval 보다 오래되면 백그라운드에서 다시 읽는다.
+    설정은 SECRET 에 선택적으로 추가할 수 있다.
+        seller_name_index_max_size: 색인할 최대 셀러 수 (기본 100000)
+        seller_name_index_refresh_interval: 데이터베이스에서 다시 읽는 간격(초) (기본 600)
+
+    Returns:
+        SellerNameIndex 객체
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    global _seller_name_index
+
+    if _seller_name_index is None or _seller_name_index.loaded_at is None:
+        with _seller_name_index_lock:
+            if _seller_name_index is None:
+                _seller_name_index = SellerNameIndex(
+                    max_size=SECRET.get('seller_name_index_max_size', 100000),
+                    refresh_interval=SECRET.get('seller_name_index_refresh_interval', 600),
+                )
+
+            if _seller_name_index.loaded_at is None:
+                load_seller_names(_seller_name_index)
+
+    elif _seller_name_index.is_stale():
+        _seller_name_index.refresh_in_background()
+
+    return _seller_name_index
+
+
+def update_seller_name_index(seller_account_id, name_kr, name_en):
+    """ 회원가입 / 셀러 정보 수정이 커밋된 뒤 색인 갱신. 색인을 아직 만들지 않았으면 만들 때 데이터베이스에서 읽으므로 생략 """
+    try:
+        if _seller_name_index is not None and _seller_name_index.loaded_at is not None:
+            _seller_name_index.set(seller_account_id, name_kr, name_en)
+
+    except Exception as e:
+        print(f'SELLER_NAME_INDEX_UPDATE_ERROR_WITH {e}')
@@ -0,0 +1,26 @@
+""" 단위 테스트 공통 설정
+
+backend 디렉토리의 모듈을 import 할 수 있도록 경로를 추가하고,
+config.py(데이터베이스, s3 접속 정보)가 없는 환경에서는 빈 설정으로 대신한다.
+데이터베이스나 s3 에 접속하지 않는 순수 파이썬 로직만 테스트한다.
+
+Authors:
+    leesh3@brandi.co.kr (이소헌)
+
+History:
+    2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+"""
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import config  # noqa: F401
+except ImportError:
+    config = types.ModuleType('config')
+    config.DATABASES = {}
+    config.S3_CONFIG = {}
+    config.SECRET = {}
+    sys.modules['config'] = config
@@ -0,0 +1,34 @@
+""" auth_token 토큰 폐기 단위 테스트 """
+import time
+
+from auth_token import TokenRevocationList, revoke_account_tokens, token_revocation_list
+
+
+class FakeCursor:
+
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, statement, params=None):
+        self.executed.append((statement, params))
+
+
+def test_revoke_account_tokens_does_not_touch_memory_before_commit():
+    db_cursor = FakeCursor()
+
+    revoked_at = revoke_account_tokens(db_cursor, 987654)
+
+    # 데이터베이스에만 저장하고, 커밋 전이므로 프로세스의 폐기 목록에는 반영하지 않음
+    _, params = db_cursor.executed[0]
+    assert params == {'revoked_at': revoked_at, 'account_no': 987654}
+    assert not token_revocation_list.is_revoked(987654, revoked_at - 1)
+
+
+def test_revocation_list_rejects_tokens_issued_before_revocation():
+    revoked_at = time.time()
+    revocation_list = TokenRevocationList(60)
+    revocation_list.revoke(1, revoked_at)
+
+    assert revocation_list.is_revoked(1, revoked_at - 0.5)
+    assert not revocation_list.is_revoked(1, revoked_at)
+    assert not revocation_list.is_revoked(2, 0)
@@ -0,0 +1,227 @@
+""" connection.ConnectionPool 단위 테스트
+
+실제 데이터베이스 대신 FakeConnection 을 만드는 connect 함수로 풀을 만든다.
+"""
+import threading
+import time
+
+import pytest
+
+from connection import ConnectionPool, PoolTimeoutError, PooledConnection, RequestConnection
+
+
+class FakeConnection:
+
+    def __init__(self):
+        self.open = True
+        self.alive = True
+        self.rollback_count = 0
+        self.closed = False
+
+    def ping(self, reconnect=False):
+        if not self.alive:
+            raise ConnectionError('lost connection')
+
+    def rollback(self):
+        self.rollback_count += 1
+
+    def close(self):
+        self.open = False
+        self.closed = True
+
+
+class FakeConnect:
+
+    def __init__(self):
+        self.connections = []
+
+    def __call__(self):
+        connection = FakeConnection()
+        self.connections.append(connection)
+        return connection
+
+
+def make_pool(**kwargs):
+    connect = FakeConnect()
+    return ConnectionPool(connect, **kwargs), connect
+
+
+def test_invalid_pool_size():
+    with pytest.raises(ValueError):
+        ConnectionPool(FakeConnect(), min_size=3, max_size=2)
+
+    with pytest.raises(ValueError):
+        ConnectionPool(FakeConnect(), max_size=0)
+
+
+def test_fill_creates_min_size_connections():
+    pool, connect = make_pool(min_size=2, max_size=4)
+    pool.fill()
+
+    assert len(connect.connections) == 2
+    assert pool.stats()['idle'] == 2
+    assert pool.stats()['size'] == 2
+
+
+def test_checkout_reuses_released_connection():
+    pool, connect = make_pool(min_size=0, max_size=2)
+
+    connection = pool.get_connection()
+    assert isinstance(connection, PooledConnection)
+    assert pool.stats()['in_use'] == 1
+
+    raw_connection = connect.connections[0]
+    connection.close()
+
+    # 반납할 때 rollback 하고 풀에 다시 넣음
+    assert raw_connection.rollback_count == 1
+    assert pool.stats()['in_use'] == 0
+    assert pool.stats()['idle'] == 1
+
+    # 가장 최근에 반납된 커넥션을 다시 빌려줌
+    connection = pool.get_connection()
+    assert len(connect.connections) == 1
+    assert connection.ping() is None
+    connection.close()
+
+    assert pool.stats()['checkout_count'] == 2
+    assert pool.stats()['created_count'] == 1
+
+
+def test_close_twice_releases_once():
+    pool, _ = make_pool(min_size=0, max_size=1)
+
+    connection = pool.get_connection()
+    connection.close()
+    connection.close()
+
+    assert pool.stats()['in_use'] == 0
+    assert pool.stats()['idle'] == 1
+
+
+def test_request_connection_is_released_only_by_release():
+    pool, _ = make_pool(min_size=0, max_size=1)
+
+    connection = pool.get_connection(connection_class=RequestConnection)
+    connection.close()
+    assert pool.stats()['in_use'] == 1
+
+    connection.release()
+    assert pool.stats()['in_use'] == 0
+
+
+def test_dead_connection_is_replaced_on_checkout():
+    pool, connect = make_pool(min_size=1, max_size=1)
+    pool.fill()
+    connect.connections[0].alive = False
+
+    connection = pool.get_connection()
+
+    assert len(connect.connections) == 2
+    assert connect.connections[0].closed
+    assert pool.stats()['discarded_count'] == 1
+    assert pool.stats()['size'] == 1
+    connection.close()
+
+
+def test_unusable_connection_is_discarded_on_release():
+    pool, connect = make_pool(min_size=0, max_size=1)
+
+    connection = pool.get_connection()
+    connect.connections[0].open = False
+    connection.close()
+
+    assert pool.stats()['idle'] == 0
+    assert pool.stats()['size'] == 0
+    assert pool.stats()['discarded_count'] == 1
+
+
+def test_checkout_times_out_when_pool_is_exhausted():
+    pool, _ = make_pool(min_size=0, max_size=1, timeout=0.05)
+    connection = pool.get_connection()
+
+    started_at = time.monotonic()
+    with pytest.raises(PoolTimeoutError):
+        pool.get_connection()
+
+    assert time.monotonic() - started_at >= 0.05
+    assert pool.stats()['timeout_count'] == 1
+    assert pool.stats()['waiting'] == 0
+    connection.close()
+
+
+def test_waiting_checkout_gets_released_connection():
+    pool, connect = make_pool(min_size=0, max_size=1, timeout=5)
+    connection = pool.get_connection()
+
+    checked_out = []
+
+    def checkout():
+        waiting_connection = pool.get_connection()
+        checked_out.append(waiting_connection)
+        waiting_connection.close()
+
+    thread = threading.Thread(target=checkout)
+    thread.start()
+
+    # 다른 스레드가 기다리기 시작한 뒤 반납
+    while pool.stats()['waiting'] == 0:
+        time.sleep(0.001)
+    connection.close()
+    thread.join(timeout=5)
+
+    assert len(checked_out) == 1
+    assert len(connect.connections) == 1
+    assert pool.stats()['max_wait_time'] > 0
+
+
+def test_failed_connect_frees_reserved_slot():
+    def connect():
+        raise ConnectionError('cannot connect')
+
+    pool = ConnectionPool(connect, min_size=0, max_size=1)
+
+    with pytest.raises(ConnectionError):
+        pool.get_connection()
+
+    assert pool.stats()['size'] == 0
+    assert pool.stats()['in_use'] == 0
+
+
+def test_idle_connections_are_evicted_down_to_min_size():
+    pool, connect = make_pool(min_size=1, max_size=3, max_idle_time=0.01)
+
+    connections = [pool.get_connection() for _ in range(3)]
+    for connection in connections:
+        connection.close()
+    assert pool.stats()['idle'] == 3
+
+    time.sleep(0.02)
+    pool.evict_idle_connections()
+
+    assert pool.stats()['idle'] == 1
+    assert pool.stats()['size'] == 1
+    assert pool.stats()['discarded_count'] == 2
+
+    # 가장 오래 쉰 커넥션부터 정리
+    assert [raw_connection.closed for raw_connection in connect.connections] == [True, True, False]
+
+
+def test_recently_used_connections_are_not_evicted():
+    pool, _ = make_pool(min_size=0, max_size=2, max_idle_time=60)
+
+    connections = [pool.get_connection() for _ in range(2)]
+    for connection in connections:
+        connection.close()
+    pool.evict_idle_connections()
+
+    assert pool.stats()['idle'] == 2
+
+
+def test_close_disconnects_idle_connections():
+    pool, connect = make_pool(min_size=2, max_size=2)
+    pool.fill()
+    pool.close()
+
+    assert all(raw_connection.closed for raw_connection in connect.connections)
+    assert pool.stats()['size'] == 0
@@ -0,0 +1,60 @@
+""" utils.encode_cursor / decode_cursor 단위 테스트 """
+import base64
+import json
+from datetime import datetime
+
+import pytest
+
+from utils import decode_cursor, encode_cursor
+
+
+def test_round_trip():
+    cursor = encode_cursor('next', ['2026-10-17 12:00:00', 15])
+
+    assert decode_cursor(cursor, 2) == ('next', ['2026-10-17 12:00:00', 15])
+
+
+def test_datetime_is_encoded_as_string():
+    cursor = encode_cursor('prev', [datetime(2026, 10, 17, 9, 30, 5), 3])
+
+    assert decode_cursor(cursor, 2) == ('prev', ['2026-10-17 09:30:05', 3])
+
+
+def test_cursor_is_url_safe_without_padding():
+    # base64 로 +, /, = 가 나올 수 있는 값
+    cursor = encode_cursor('next', ['>>>???', 'é' * 7])
+
+    assert not set(cursor) & set('+/=')
+    assert decode_cursor(cursor, 2) == ('next', ['>>>???', 'é' * 7])
+
+
+@pytest.mark.parametrize('cursor', [
+    '',
+    'not a cursor',
+    base64.urlsafe_b64encode(b'[1, 2]').decode(),
+    base64.urlsafe_b64encode(b'{"d": "next"}').decode(),
+])
+def test_malformed_cursor(cursor):
+    with pytest.raises(ValueError, match='INVALID_CURSOR'):
+        decode_cursor(cursor, 2)
+
+
+def test_unknown_direction():
+    cursor = base64.urlsafe_b64encode(json.dumps({'d': 'up', 'v': [1, 2]}).encode()).decode()
+
+    with pytest.raises(ValueError, match='INVALID_CURSOR'):
+        decode_cursor(cursor, 2)
+
+
+def test_value_count_mismatch():
+    cursor = encode_cursor('next', ['2026-10-17 12:00:00', 15])
+
+    with pytest.raises(ValueError, match='INVALID_CURSOR'):
+        decode_cursor(cursor, 3)
+
+
+def test_values_must_be_list():
+    cursor = base64.urlsafe_b64encode(json.dumps({'d': 'next', 'v': 'ab'}).encode()).decode()
+
+    with pytest.raises(ValueError, match='INVALID_CURSOR'):
+        decode_cursor(cursor, 2)
@@ -0,0 +1,154 @@
+""" export_job.ExportJobQueue 단위 테스트
+
+데이터베이스(export_jobs) 대신 작업 row 를 딕셔너리에 저장하는 FakeExportDao 를 여러 큐가 공유해서
+다른 프로세스의 큐에서 등록한 작업을 조회, 재사용하는지 확인한다.
+"""
+import pytest
+
+import export_job
+from export.model.export_dao import EXPORT_JOB_PENDING_STATUSES
+from export_job import ExportJob, ExportJobQueue
+
+STATEMENT = 'SELECT seller_account_id FROM seller_accounts WHERE name_kr = %(name_kr)s'
+COLUMNS = [('번호', 'seller_account_id')]
+
+
+class FakeConnection:
+
+    def close(self):
+        pass
+
+
+class FakeExportDao:
+
+    def __init__(self):
+        self.jobs = {}
+        self.progress = []
+
+    def get_fresh_export_job(self, filter_info, db_connection):
+        fresh_jobs = [
+            job for job in self.jobs.values()
+            if job['filter_key'] == filter_info['filter_key']
+            and (job['status'] in EXPORT_JOB_PENDING_STATUSES or job['status'] == 'done')
+        ]
+        return dict(fresh_jobs[-1]) if fresh_jobs else None
+
+    def insert_export_job(self, job_info, db_connection):
+        self.jobs[job_info['job_id']] = dict(
+            job_info, status='pending', row_count=0, file_key=None, error=None,
+            created_at=None, started_at=None, finished_at=None
+        )
+
+    def get_export_job(self, job_id, db_connection):
+        job = self.jobs.get(job_id)
+        return dict(job) if job else None
+
+    def start_export_job(self, job_id, db_connection):
+        if self.jobs[job_id]['status'] != 'pending':
+            return False
+        self.jobs[job_id]['status'] = 'processing'
+        return True
+
+    def update_export_job_progress(self, progress_info, db_connection):
+        self.progress.append(progress_info['row_count'])
+        self.jobs[progress_info['job_id']]['row_count'] = progress_info['row_count']
+
+    def finish_export_job(self, job_info, db_connection):
+        job = self.jobs[job_info['job_id']]
+        if job['status'] not in EXPORT_JOB_PENDING_STATUSES:
+            return False
+        job.update({key: job_info.get(key) for key in ('status', 'row_count', 'file_key', 'error')})
+        return True
+
+    def expire_export_jobs(self, expire_info, db_connection):
+        return 0
+
+
+class InlineExecutor:
+    """ 등록된 작업을 바로 실행 (hold=True 이면 실행하지 않고 보관해서 처리중인 상태로 남김) """
+
+    def __init__(self, hold=False):
+        self.hold = hold
+        self.pending = []
+
+    def submit(self, function, *args):
+        if self.hold:
+            self.pending.append((function, args))
+        else:
+            function(*args)
+
+
+@pytest.fixture
+def export_dao(monkeypatch):
+    monkeypatch.setattr(export_job, 'get_db_connection', FakeConnection)
+    return FakeExportDao()
+
+
+def make_queue(export_dao, hold=False):
+    queue = ExportJobQueue(max_workers=1)
+    queue._executor = InlineExecutor(hold)
+    queue._export_dao = export_dao
+    return queue
+
+
+def test_job_is_visible_from_another_worker(export_dao, monkeypatch):
+    def export_rows_to_s3(db_connection, statement, params, columns, file_name, progress, file_format, compress):
+        assert params == {'name_kr': '셀러'}
+        return f'url/{file_name}', 3
+
+    monkeypatch.setattr(export_job, 'export_rows_to_s3', export_rows_to_s3)
+    worker, other_worker = make_queue(export_dao), make_queue(export_dao)
+
+    job, reused = worker.submit('seller_list', STATEMENT, {'name_kr': '셀러', 'limit': 10}, COLUMNS)
+
+    other_job = other_worker.get_job(job.job_id)
+    assert not reused
+    assert other_job.status == 'done'
+    assert other_job.row_count == 3
+    assert other_job.to_dict()['file_url'].endswith(f'seller_list_{job.job_id}.xlsx')
+
+
+def test_same_filter_reuses_job_from_another_worker(export_dao):
+    worker, other_worker = make_queue(export_dao, hold=True), make_queue(export_dao, hold=True)
+
+    job, _ = worker.submit('seller_list', STATEMENT, {'name_kr': '셀러', 'offset': 0}, COLUMNS)
+
+    # 페이지네이션 값은 필터 key 에 포함하지 않음
+    reused_job, reused = other_worker.submit('seller_list', STATEMENT, {'name_kr': '셀러', 'offset': 20}, COLUMNS)
+    assert reused
+    assert reused_job.job_id == job.job_id
+    assert reused_job.status == 'pending'
+
+    # 파일 형식이 다르면 새로 만듦
+    csv_job, reused = other_worker.submit('seller_list', STATEMENT, {'name_kr': '셀러'}, COLUMNS, file_format='csv')
+    assert not reused
+    assert csv_job.job_id != job.job_id
+
+
+def test_failed_job_records_progress_and_is_not_reused(export_dao, monkeypatch):
+    def export_rows_to_s3(db_connection, statement, params, columns, file_name, progress, file_format, compress):
+        progress(1000)
+        raise ConnectionError('lost connection')
+
+    monkeypatch.setattr(export_job, 'export_rows_to_s3', export_rows_to_s3)
+    monkeypatch.setattr(export_job, 'PROGRESS_UPDATE_INTERVAL', 0)
+    worker = make_queue(export_dao)
+
+    job, _ = worker.submit('product_list', STATEMENT, {'name_kr': '셀러'}, COLUMNS, compress=True)
+
+    failed_job = worker.get_job(job.job_id)
+    assert failed_job.status == 'failed'
+    assert failed_job.error == 'lost connection'
+    assert failed_job.row_count == 1000
+    assert export_dao.progress == [1000]
+    assert worker.stats()['failed_count'] == 1
+
+    _, reused = worker.submit('product_list', STATEMENT, {'name_kr': '셀러'}, COLUMNS, compress=True)
+    assert not reused
+
+
+def test_job_without_file_has_no_url():
+    job = ExportJob('job', 'seller_list', 'key', compress=1)
+
+    assert job.to_dict()['file_url'] is None
+    assert job.to_dict()['gzip'] is True
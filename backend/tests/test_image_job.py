@@ -0,0 +1,97 @@
+""" 상품 이미지 작업(image_job.ImageJob, ImageDao) 단위 테스트
+
+실행된 쿼리와 파라미터를 기록하는 FakeConnection 으로 DAO 를 호출한다.
+"""
+import pytest
+
+from image.model.image_dao import ImageDao
+from image_job import ImageJob
+
+MASTER = {'auth_type_id': 1, 'account_no': 1}
+OWNER = {'auth_type_id': 2, 'account_no': 10}
+OTHER_SELLER = {'auth_type_id': 2, 'account_no': 11}
+
+
+class FakeCursor:
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute(self, statement, params=None):
+        self.connection.executed.append((statement, params))
+        self.rowcount = self.connection.rowcount
+
+
+class FakeConnection:
+
+    def __init__(self, rowcount=1):
+        self.rowcount = rowcount
+        self.executed = []
+        self.committed = False
+        self.rolled_back = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+@pytest.mark.parametrize('account_info, accessible', [
+    (OWNER, True),
+    (MASTER, True),
+    (OTHER_SELLER, False),
+])
+def test_job_is_accessible_by_owner_and_master(account_info, accessible):
+    image_job = ImageJob('job', account_id=OWNER['account_no'])
+
+    assert image_job.is_accessible_by(account_info) is accessible
+
+
+def test_job_without_owner_is_accessible_only_by_master():
+    image_job = ImageJob('job')
+
+    assert image_job.is_accessible_by(MASTER)
+    assert not image_job.is_accessible_by(OWNER)
+
+
+def test_insert_image_job_stores_owner():
+    db_connection = FakeConnection()
+
+    ImageDao().insert_image_job({'job_id': 'job', 'account_id': 10, 'image_orders': ['1']}, db_connection)
+
+    _, params = db_connection.executed[0]
+    assert params == {'job_id': 'job', 'account_id': 10, 'image_orders': '["1"]'}
+    assert db_connection.committed
+
+
+def test_link_is_inserted_only_for_owner_or_master():
+    db_connection = FakeConnection()
+    link_info = dict(OWNER, job_id='job', product_id=5)
+
+    ImageDao().insert_image_job_link(link_info, db_connection)
+
+    statement, params = db_connection.executed[0]
+    assert '(account_id = %(account_no)s OR %(auth_type_id)s = 1)' in statement
+    assert params == link_info
+    assert db_connection.committed
+
+
+def test_link_by_other_account_is_rejected():
+    db_connection = FakeConnection(rowcount=0)
+
+    with pytest.raises(ValueError, match='NO_AUTHORIZATION'):
+        ImageDao().insert_image_job_link(dict(OTHER_SELLER, job_id='job', product_id=5), db_connection)
+
+    assert db_connection.rolled_back
+    assert not db_connection.committed
@@ -0,0 +1,161 @@
+""" list_query.ListQuery 단위 테스트
+
+실행된 쿼리와 파라미터를 기록하는 FakeCursor 로 만들어진 쿼리를 확인한다.
+"""
+from list_query import ListQuery
+
+
+class FakeCursor:
+
+    def __init__(self, rows=(), count=0):
+        self.rows = [dict(row) for row in rows]
+        self.count = count
+        self.executed = []
+
+    def execute(self, statement, params=None):
+        self.executed.append((statement, params))
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        return {'filtered_count': self.count}
+
+
+def make_query(**params):
+    return ListQuery('P.product_no, P.name', 'FROM products AS P WHERE P.is_deleted = 0', params)
+
+
+def test_text_search_uses_ngram_phrases():
+    query = make_query(product_name='  셔츠 "린넨"  ')
+    query.add_text_search('P.name', 'product_name')
+
+    assert query.filters == ['MATCH(P.name) AGAINST (%(product_name)s IN BOOLEAN MODE)']
+    assert query.params['product_name'] == '+"셔츠" +"린넨"'
+    assert query.relevance_order('P.product_no DESC') == \
+        'MATCH(P.name) AGAINST (%(product_name)s IN BOOLEAN MODE) DESC, P.product_no DESC'
+
+
+def test_short_word_falls_back_to_like():
+    query = make_query(product_name='a 셔츠')
+    query.add_text_search('P.name', 'product_name')
+
+    assert query.filters == ['P.name LIKE %(product_name)s']
+    assert query.params['product_name'] == '%a 셔츠%'
+    assert query.relevance_order('P.product_no DESC') == 'P.product_no DESC'
+
+
+def test_like_fallback_escapes_wildcards():
+    query = make_query(product_name='5%_ %')
+    query.add_text_search('P.name', 'product_name')
+
+    assert query.params['product_name'] == '%5\\%\\_ \\%%'
+
+
+def test_quote_only_keyword_falls_back_to_like():
+    query = make_query(product_name='""')
+    query.add_text_search('P.name', 'product_name')
+
+    assert query.filters == ['P.name LIKE %(product_name)s']
+
+
+def test_select_and_count_statements_share_filters():
+    query = make_query(price=1000)
+    query.add_filter('P.price >= %(price)s')
+
+    assert query.select_statement('P.product_no DESC') == (
+        'SELECT P.product_no, P.name FROM products AS P WHERE P.is_deleted = 0 AND P.price >= %(price)s'
+        ' ORDER BY P.product_no DESC'
+    )
+    assert query.count_statement() == (
+        'SELECT COUNT(0) AS filtered_count FROM products AS P WHERE P.is_deleted = 0 AND P.price >= %(price)s'
+    )
+
+
+def test_fetch_page_counts_with_window_function():
+    query = make_query()
+    db_cursor = FakeCursor(rows=[{'product_no': 2, 'filtered_count': 7}, {'product_no': 1, 'filtered_count': 7}])
+
+    rows, filtered_count = query.fetch_page(db_cursor, 'P.product_no DESC', limit=2, offset=4)
+
+    statement, params = db_cursor.executed[0]
+    assert statement == (
+        'SELECT P.product_no, P.name, COUNT(*) OVER () AS filtered_count'
+        ' FROM products AS P WHERE P.is_deleted = 0'
+        ' ORDER BY P.product_no DESC LIMIT %(page_limit)s OFFSET %(page_offset)s'
+    )
+    assert params == {'page_limit': 2, 'page_offset': 4}
+    assert rows == [{'product_no': 2}, {'product_no': 1}]
+    assert filtered_count == 7
+    assert len(db_cursor.executed) == 1
+
+    # 페이지 파라미터는 쿼리 객체의 params 에 남기지 않음
+    assert query.params == {}
+
+
+def test_fetch_page_with_seek_condition_counts_separately():
+    query = make_query(cursor_product_no=10)
+    db_cursor = FakeCursor(rows=[{'product_no': 9}], count=30)
+
+    rows, filtered_count = query.fetch_page(
+        db_cursor, 'P.product_no DESC', limit=1, seek_condition='P.product_no < %(cursor_product_no)s'
+    )
+
+    statement, _ = db_cursor.executed[0]
+    assert 'COUNT(*) OVER ()' not in statement
+    assert statement.endswith(
+        'WHERE P.is_deleted = 0 AND P.product_no < %(cursor_product_no)s ORDER BY P.product_no DESC LIMIT %(page_limit)s'
+    )
+
+    # 필터된 건수에는 cursor 조건을 적용하지 않음
+    count_statement, count_params = db_cursor.executed[1]
+    assert count_statement == query.count_statement()
+    assert 'cursor_product_no' not in count_statement
+    assert count_params == {'cursor_product_no': 10}
+    assert rows == [{'product_no': 9}]
+    assert filtered_count == 30
+
+
+def test_fetch_page_without_count():
+    query = make_query()
+    db_cursor = FakeCursor(rows=[{'product_no': 1}])
+
+    rows, filtered_count = query.fetch_page(db_cursor, 'P.product_no DESC', limit=10, with_count=False)
+
+    statement, params = db_cursor.executed[0]
+    assert 'COUNT(*) OVER ()' not in statement
+    assert params == {'page_limit': 10}
+    assert filtered_count is None
+    assert len(db_cursor.executed) == 1
+
+
+def test_fetch_page_empty_first_page_skips_count_query():
+    query = make_query()
+    db_cursor = FakeCursor(rows=[])
+
+    rows, filtered_count = query.fetch_page(db_cursor, 'P.product_no DESC', limit=10)
+
+    assert (rows, filtered_count) == ([], 0)
+    assert len(db_cursor.executed) == 1
+
+
+def test_fetch_page_offset_past_end_counts_separately():
+    query = make_query()
+    db_cursor = FakeCursor(rows=[], count=5)
+
+    rows, filtered_count = query.fetch_page(db_cursor, 'P.product_no DESC', limit=10, offset=20)
+
+    assert (rows, filtered_count) == ([], 5)
+    assert db_cursor.executed[1][0] == query.count_statement()
+
+
+def test_fetch_page_without_limit_reads_all_rows():
+    query = make_query()
+    db_cursor = FakeCursor(rows=[{'product_no': 1, 'filtered_count': 1}])
+
+    query.fetch_page(db_cursor, 'P.product_no DESC', offset=5)
+
+    statement, params = db_cursor.executed[0]
+    assert 'LIMIT' not in statement
+    assert 'OFFSET' not in statement
+    assert params == {}
@@ -0,0 +1,106 @@
+""" product_list_view.refresh_product_list_view 단위 테스트
+
+MySQL 대신 메모리 sqlite 데이터베이스에 상품 리스트 조회에 필요한 테이블만 만들고,
+pymysql 의 파라미터 형식(%s, %(name)s)과 # 주석을 sqlite 형식으로 바꿔서 실행한다.
+"""
+import math
+import re
+import sqlite3
+
+import pytest
+
+from product.model.product_image_tag import get_product_image_rows, insert_product_images
+from product.model.product_list_view import refresh_product_list_view
+
+SCHEMA = """
+    CREATE TABLE products (product_no INTEGER PRIMARY KEY, created_at TEXT, is_deleted INTEGER DEFAULT 0);
+    CREATE TABLE product_infos (
+        product_info_no INTEGER PRIMARY KEY, product_id INTEGER, seller_id INTEGER, name TEXT,
+        price INTEGER, discount_rate REAL, is_available INTEGER, is_on_display INTEGER, is_current INTEGER
+    );
+    CREATE TABLE product_images (
+        image_no INTEGER PRIMARY KEY, image_url TEXT, product_info_id INTEGER, image_size_id INTEGER, image_order INTEGER
+    );
+    CREATE TABLE seller_infos (seller_account_id INTEGER, seller_type_id INTEGER, name_kr TEXT, is_current INTEGER);
+    CREATE TABLE seller_types (seller_type_no INTEGER PRIMARY KEY, name TEXT);
+    CREATE TABLE seller_accounts (seller_account_no INTEGER PRIMARY KEY, is_deleted INTEGER DEFAULT 0);
+    CREATE TABLE product_list_view (
+        product_no INTEGER PRIMARY KEY, created_at TEXT, product_info_id INTEGER, image_url TEXT, product_name TEXT,
+        seller_account_id INTEGER, seller_name TEXT, seller_type_id INTEGER, seller_type_name TEXT, price INTEGER,
+        discount_price INTEGER, is_available INTEGER, is_on_display INTEGER, is_discount INTEGER
+    );
+
+    INSERT INTO seller_types VALUES (1, '쇼핑몰');
+    INSERT INTO seller_accounts VALUES (3, 0);
+    INSERT INTO seller_infos VALUES (3, 1, '셀러', 1);
+    INSERT INTO products VALUES (7, '2026-10-17 12:00:00', 0);
+    INSERT INTO product_infos VALUES (70, 7, 3, '셔츠', 10000, 0.1, 1, 1, 1);
+"""
+
+IMAGES = {
+    'image_file_1': {
+        'big_size_url': 'big_1', 'big_image_size_id': 1,
+        'medium_size_url': 'medium_1', 'medium_image_size_id': 2,
+        'small_size_url': 'small_1', 'small_image_size_id': 3,
+    },
+}
+
+
+class SqliteCursor:
+
+    def __init__(self, connection):
+        self.cursor = connection.cursor()
+
+    @property
+    def rowcount(self):
+        return self.cursor.rowcount
+
+    def execute(self, statement, params=None):
+        statement = re.sub(r'^\s*#', '--', statement, flags=re.MULTILINE)
+        statement = re.sub(r'%\((\w+)\)s', r':\1', statement).replace('%s', '?')
+        self.cursor.execute(statement, params or ())
+
+    def fetchall(self):
+        return self.cursor.fetchall()
+
+
+@pytest.fixture
+def db_cursor():
+    connection = sqlite3.connect(':memory:')
+    connection.create_function('FLOOR', 1, math.floor)
+    connection.executescript(SCHEMA)
+    yield SqliteCursor(connection)
+    connection.close()
+
+
+def get_view_rows(db_cursor):
+    db_cursor.execute('SELECT product_no, image_url, discount_price FROM product_list_view')
+    return db_cursor.fetchall()
+
+
+def test_product_with_pending_image_job_is_listed_without_image(db_cursor):
+    # 이미지 작업이 처리중인 상품은 product_images 없이 등록됨
+    image_rows, pending_image_job_ids, _ = get_product_image_rows({'image_file_1': {'job_id': 'job'}}, 70)
+    insert_product_images(db_cursor, image_rows)
+
+    assert refresh_product_list_view(db_cursor, product_no=7) == 1
+    assert pending_image_job_ids == {'job'}
+    assert get_view_rows(db_cursor) == [(7, None, 9000)]
+
+
+def test_linked_image_job_fills_representative_image(db_cursor):
+    refresh_product_list_view(db_cursor, product_no=7)
+
+    # 작업이 끝나면 최신 상품 정보에 이미지를 등록하고 조회용 테이블을 다시 만듦 (ImageDao.link_image_job)
+    image_rows, _, _ = get_product_image_rows(IMAGES, 70)
+    insert_product_images(db_cursor, image_rows)
+    refresh_product_list_view(db_cursor, product_no=7)
+
+    assert get_view_rows(db_cursor) == [(7, 'big_1', 9000)]
+
+
+def test_deleted_product_is_not_listed(db_cursor):
+    db_cursor.execute('UPDATE products SET is_deleted = 1 WHERE product_no = 7')
+
+    assert refresh_product_list_view(db_cursor, product_no=7) == 0
+    assert get_view_rows(db_cursor) == []
@@ -1,10 +1,15 @@
-import jwt, uuid, io, os
-from mysql.connector.errors import Error
+import jwt, uuid, os, threading, time, io, hashlib, json, base64
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from datetime import datetime, timedelta
+from pymysql.err import Error
 from flask import request, jsonify, g
 
-from connection import DatabaseConnection, get_s3_connection
-from PIL import Image
-from config import SECRET
+from auth_token import is_token_revoked, sync_token_revocations
+from cache import account_cache
+from connection import get_db_connection, get_s3_connection, PoolTimeoutError
+from config import SECRET, S3_CONFIG
+from image_index import get_image_hash_index
+from image_resize import resize_image, ImageResizeError, PRODUCT_IMAGE_SIZES
 
 
 def login_required(func):
@@ -16,590 +21,520 @@ def login_required(func):
                 payload = jwt.decode(access_token, SECRET['secret_key'], algorithm=SECRET['algorithm'])
                 account_no = payload['account_no']
 
-                db_connection = DatabaseConnection()
-                if db_connection:
-                    try:
-                        with db_connection as db_cursor:
-                            get_account_info_stmt = ("""
-                                SELECT auth_type_id, is_deleted FROM accounts WHERE account_no=%(account_no)s
-                            """)
-                            db_cursor.execute(get_account_info_stmt, {'account_no': account_no})
-                            account = db_cursor.fetchone()
-                            if account:
-                                if account['is_deleted'] == 0:
-                                    g.account_info = {
-                                        'account_no': account_no,
-                                        'auth_type_id': account['auth_type_id']
-                                    }
-                                    return func(*args, **kwargs)
-                                return jsonify({'message': 'DELETED_ACCOUNT'}), 400
-                            return jsonify({'message': 'ACCOUNT_DOES_NOT_EXIST'}), 404
-
-                    except Error as e:
-                        print(f'DATABASE_CURSOR_ERROR_WITH {e}')
-                        return jsonify({'message': 'DB_CURSOR_ERROR'}), 400
-
             except jwt.InvalidTokenError:
                 return jsonify({'message': 'INVALID_TOKEN'}), 401
 
-            return jsonify({'message': 'NO_DATABASE_CONNECTION'}), 400
+            # refresh token 으로는 인증할 수 없음
+            if payload.get('type') == 'refresh':
+                return jsonify({'message': 'INVALID_TOKEN'}), 401
+
+            # stateless 토큰이면 데이터베이스 조회 없이 토큰에 담긴 권한 정보를 사용하고 폐기 목록만 확인
+            # (다른 프로세스의 폐기는 sync 주기마다 한번 데이터베이스에서 읽어옴)
+            if 'auth_type_id' in payload:
+                try:
+                    sync_token_revocations(get_db_connection)
+
+                except (PoolTimeoutError, Error) as e:
+                    print(f'TOKEN_REVOCATION_SYNC_ERROR_WITH {e}')
+
+                if is_token_revoked(payload):
+                    return jsonify({'message': 'REVOKED_TOKEN'}), 401
+
+                if payload['is_deleted'] == 0:
+                    g.account_info = {
+                        'account_no': account_no,
+                        'auth_type_id': payload['auth_type_id']
+                    }
+                    return func(*args, **kwargs)
+                return jsonify({'message': 'DELETED_ACCOUNT'}), 400
+
+            # 캐시에 있는 계정이면 데이터베이스를 조회하지 않음
+            account = account_cache.get(account_no)
+
+            if account is None:
+                # 요청 단위 커넥션을 열어 뷰와 같이 사용함. 커넥션 반납은 app 의 teardown 에서 처리
+                try:
+                    db_connection = get_db_connection()
+                    with db_connection.cursor() as db_cursor:
+                        get_account_info_stmt = ("""
+                            SELECT auth_type_id, is_deleted FROM accounts WHERE account_no=%(account_no)s
+                        """)
+                        db_cursor.execute(get_account_info_stmt, {'account_no': account_no})
+                        account = db_cursor.fetchone()
+
+                except PoolTimeoutError as e:
+                    print(f'POOL_TIMEOUT_ERROR_WITH {e}')
+                    return jsonify({'message': 'NO_DATABASE_CONNECTION'}), 500
+
+                except Error as e:
+                    print(f'DATABASE_CURSOR_ERROR_WITH {e}')
+                    return jsonify({'message': 'DB_CURSOR_ERROR'}), 400
+
+                # 존재하는 계정만 캐시에 저장. 계정 정보가 바뀌면 invalidate_account_cache 로 무효화됨
+                if account:
+                    account_cache.set(account_no, account)
+
+            if account:
+                if account['is_deleted'] == 0:
+                    g.account_info = {
+                        'account_no': account_no,
+                        'auth_type_id': account['auth_type_id']
+                    }
+                    return func(*args, **kwargs)
+                return jsonify({'message': 'DELETED_ACCOUNT'}), 400
+            return jsonify({'message': 'ACCOUNT_DOES_NOT_EXIST'}), 404
+
         return jsonify({'message': 'INVALID_TOKEN'}), 401
     return wrapper
 
 
-class ImageUpload:
+# 리스트 페이지네이션 cursor 의 방향
+CURSOR_DIRECTIONS = ('next', 'prev')
 
-    # 이미지 리사이즈 : big
-    def resize_to_big(self, image_file):
-        """ 이미지를 big 사이즈로 리사이즈
-        pillow 라이브러리를 사용하여 들어온 이미지 파일을 pillow 객체로 만들고 pillow 객체에 있는 매서드를 사용하여 리사이즈.
-        가로의 길이를 고정 사이즈로 이용하여 세로의 길이를 구해서 리사이즈함.
-        리사이즈 된 pillow 객체를 bytesIO buffer 에 담고 랜덤으로 생성한 이름과 buffer 자체를 리턴함.
-        각파일의 확장자를 반영하여 메모리에 저장
 
-        Args:
-            image_file: 이미지 파일 객체
+def encode_cursor(direction, values):
 
-        Returns:
-            [big_io, str(uuid.uuid4())]: ByteIO 객체, uuid 를 리스트에 담아서 리턴
-            None: 리사이즈 실패시 이 함수를 호출하는 함수에서의 에러처리를위해 None 을 리턴함.
-        Authors:
-            yoonhc@brandi.co.kr (윤희철)
+    """ keyset 페이지네이션 cursor 생성
 
-        History:
-            2020-04-02 (yoonhc@brandi.co.kr): 초기 생성
-            2020-04-14 (yoonhc@brandi.co.kr): 확장자별(png, jpg)로 메모리에 저장하는 로직 구현.
-        """
+    정렬 기준 컬럼 값과 방향을 json 으로 묶어서 url 에 그대로 넣을 수 있는 문자열로 만든다.
+    클라이언트는 cursor 의 내용을 해석하지 않고 받은 값을 그대로 다시 보낸다.
 
-        standard_size = 640
-        try:
-            with Image.open(image_file) as opened_image:
-                big = (int(standard_size), int(opened_image.size[1]*(standard_size/opened_image.size[0])))
-                resized_image_big = opened_image.resize(big)
-                big_io = io.BytesIO()
-                image_file_form = image_file.content_type
+    Args:
+        direction: next(다음 페이지) 또는 prev(이전 페이지)
+        values: 기준이 되는 row 의 정렬 컬럼 값 리스트 (datetime 은 문자열로 변환)
 
-                # 파일 타입을 화인하여 파일객체 확장자와 변환하고자하는 파일의 확장자를 맞춰줌.
-                if 'png' in image_file_form:
-                    resized_image_big.save(big_io, 'png')
-                if 'jpeg' in image_file_form:
-                    resized_image_big.save(big_io, 'jpeg')
-                big_io.seek(0)
-                return [big_io, str(uuid.uuid4())]
-        # 예외처리의 결과를 None 으로 리턴해서 이 함수를 호출하는 함수에서 에러를 잡아줌.
-        except:
-            return None
-
-    # 이미지 리사이즈 : medium
-    def resize_to_medium(self, image_file):
-        """ 이미지를 medium 사이즈로 리사이즈
-        pillow 라이브러리를 사용하여 들어온 이미지 파일을 pillow 객체로 만들고 pillow 객체에 있는 매서드를 사용하여 리사이즈.
-        가로의 길이를 고정 사이즈로 이용하여 세로의 길이를 구해서 리사이즈함.
-        리사이즈 된 pillow 객체를 bytesIO buffer 에 담고 랜덤으로 생성한 이름과 buffer 자체를 리턴함.
-        각파일의 확장자를 반영하여 메모리에 저장
+    Returns:
+        cursor 문자열
 
-        Args:
-            image_file: 이미지 파일 객체
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
 
-        Returns:
-            [medium_io, str(uuid.uuid4())]: ByteIO 객체, uuid 를 리스트에 담아서 리턴
-            None: 리사이즈 실패시 이 함수를 호출하는 함수에서의 에러처리를위해 None 을 리턴함.
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    values = [value.strftime('%Y-%m-%d %H:%M:%S') if hasattr(value, 'strftime') else value for value in values]
+    cursor = json.dumps({'d': direction, 'v': values}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(cursor.encode()).decode().rstrip('=')
 
-        Authors:
-            yoonhc@brandi.co.kr (윤희철)
 
-        History:
-            2020-04-02 (yoonhc@brandi.co.kr): 초기 생성
-            2020-04-14 (yoonhc@brandi.co.kr): 확장자별(png, jpg)로 메모리에 저장하는 로직 구현.
-        """
-        standard_size = 320
-        try:
-            with Image.open(image_file) as opened_image:
-                medium = (int(standard_size), int(opened_image.size[1]*(standard_size/opened_image.size[0])))
-                resized_image_medium = opened_image.resize(medium)
-                medium_io = io.BytesIO()
-                image_file_form = image_file.content_type
+def decode_cursor(cursor, value_count):
 
-                # 파일 타입을 화인하여 파일객체 확장자와 변환하고자하는 파일의 확장자를 맞춰줌.
-                if 'png' in image_file_form:
-                    resized_image_medium.save(medium_io, 'png')
-                if 'jpeg' in image_file_form:
-                    resized_image_medium.save(medium_io, 'jpeg')
-                medium_io.seek(0)
-                return [medium_io, str(uuid.uuid4())]
-
-        except:
-            return None
-
-    # 이미지 리사이즈 : small
-    def resize_to_small(self, image_file):
-        """ 이미지를 small 사이즈로 리사이즈
-        pillow 라이브러리를 사용하여 들어온 이미지 파일을 pillow 객체로 만들고 pillow 객체에 있는 매서드를 사용하여 리사이즈.
-        가로의 길이를 고정 사이즈로 이용하여 세로의 길이를 구해서 리사이즈함.
-        리사이즈 된 pillow 객체를 bytesIO buffer 에 담고 랜덤으로 생성한 이름과 buffer 자체를 리턴함.
-        각파일의 확장자를 반영하여 메모리에 저장
+    """ encode_cursor 로 만든 cursor 해석
 
-        Args:
-            image_file: 이미지 파일 객체
+    Args:
+        cursor: cursor 문자열
+        value_count: 정렬 컬럼 수
 
-        Returns:
-            [small_io, str(uuid.uuid4())]: ByteIO 객체, uuid 를 리스트에 담아서 리턴
-            None: 리사이즈 실패시 이 함수를 호출하는 함수에서의 에러처리를위해 None 을 리턴함.
+    Returns:
+        (방향, 정렬 컬럼 값 리스트)
 
-        Authors:
-            yoonhc@brandi.co.kr (윤희철)
+    Raises:
+        ValueError: 형식이 잘못된 cursor
 
-        History:
-            2020-04-02 (yoonhc@brandi.co.kr): 초기 생성
-            2020-04-14 (yoonhc@brandi.co.kr): 확장자별(png, jpg)로 메모리에 저장하는 로직 구현.
-        """
-        standard_size = 120
-        try:
-            with Image.open(image_file) as opened_image:
-                small = (int(standard_size), int(opened_image.size[1]*(standard_size/opened_image.size[0])))
-                resized_image_small = opened_image.resize(small)
-                small_io = io.BytesIO()
-                image_file_form = image_file.content_type
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
 
-                # 파일 타입을 화인하여 파일객체 확장자와 변환하고자하는 파일의 확장자를 맞춰줌.
-                if 'png' in image_file_form:
-                    resized_image_small.save(small_io, 'png')
-                if 'jpeg' in image_file_form:
-                    resized_image_small.save(small_io, 'jpeg')
-                small_io.seek(0)
-                return [small_io, str(uuid.uuid4())]
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        direction, values = decoded['d'], decoded['v']
 
-        # 이미지를 pillow 객체로 만들지 못하는 경우 애러처리를 위해 None 을 리턴
-        except:
-            return None
+    except Exception:
+        raise ValueError('INVALID_CURSOR')
 
-    # 요청받은 상품 이미지를 리사이즈 하고 s3에 업로드
-    def upload_product_image(self, request):
-        """ 상품 이미지 파일을 3가지 크기로 리사이즈 해서 s3에 업로드 하고 업로드한 이미지의 url, 사이즈를 리턴하는 함수.
-        들어올 것으로 예상되는 key 값을 지정하고 해당 key로 들어오지 않으면 None 을 변수에 담아서 처리.
-        파일의 형식이 image 가 아닐 경우 이미지를 업로드 하지 않음.
-        파일의 크기가 일정크기를 넘으면 업로드 하지 않음.
-        이미지가 들어오지 않아도 해당 이미지 순서에 있는 key는 존재하도록 설계
+    if direction not in CURSOR_DIRECTIONS or not isinstance(values, list) or len(values) != value_count:
+        raise ValueError('INVALID_CURSOR')
 
-        Args:
-            request: 상품 이미지 파일을 포함한 요청 값.
+    return direction, values
 
-        Returns:
-            data: s3 버킷에 올라간 이미지파일의 url(dictionary), size 를 포함한 딕셔너리
-            400: 파일형식이 잘못된 경우, 파일 크기가 너무 큰 경우,
-            500: s3에 업로드과정에서 애러가 난 경우.
 
-        Authors:
-            yoonhc@brandi.co.kr (윤희철)
+# 응답의 일시는 데이터베이스 일시에 9시간을 더한 한국 시간 (app.CustomJSONEncoder)
+RESPONSE_TIME_OFFSET = timedelta(hours=9)
 
-        History:
-            2020-04-02 (yoonhc@brandi.co.kr): 초기 생성
-            2020-04-09 (yoonhc@brandi.co,kr): RESTful api 형식에 맞추기 위해서 이미지 업로드 기능의 모듈화.
-            2020-04-11 (yoonhc@brandi.co.kr): s3에 업로드 되는 과정에서 발생하는 애러 except 처리 추가.
-        """
-        # s3 연결
-        s3 = get_s3_connection()
-
-        # 리턴값이 들어갈 리스트
-        data = {
-            'image_file_1': {},
-            'image_file_2': {},
-            'image_file_3': {},
-            'image_file_4': {},
-            'image_file_5': {}
-        }
+AS_OF_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d')
 
-        # 파일의 존재여부 확인, 이미지 순서를 파일 이름으로 받음.
-        image_file_1 = request.files.get('image_file_1', None)
-        image_file_2 = request.files.get('image_file_2', None)
-        image_file_3 = request.files.get('image_file_3', None)
-        image_file_4 = request.files.get('image_file_4', None)
-        image_file_5 = request.files.get('image_file_5', None)
-
-        # 순서1번의 이미지파일 이 존재하면 업로드하고 url 을 딕셔너리에 추가
-        if image_file_1:
-            # 들어온 파일의 사이즈와 확장자를 구함.
-            image_file_size = os.fstat(image_file_1.fileno()).st_size
-            image_file_form = image_file_1.content_type
 
-            # 이미지 파일이 아닌 다른형식의 파일이 들어오는 것을 차단.
-            if not ('image' in image_file_form):
-                return jsonify({'message': 'INVALID_FILE_FORM'}), 400
+def parse_as_of(as_of):
 
-            # 들어온 이미지 크기가 10MB 보다 크면 request 를 받지 않음.
-            if image_file_size > 1000000:
-                return jsonify({'message': 'INVALID_IMAGE_SIZE'}), 400
+    """ 이력 시점 조회(as_of) 파라미터를 데이터베이스 일시로 변환
 
-            # big_size 업로드
-            big_size_buffer = self.resize_to_big(image_file_1)
-            if not big_size_buffer:
-                return jsonify({"message": "RESIZE_FAIL"}), 400
+    응답에 표출되는 일시(한국 시간)와 같은 기준으로 받으므로, 이력 목록의 start_time 을 그대로 넣으면 그 이력이 조회된다.
+    날짜만 들어오면 그 날의 00:00:00 시점.
 
-            try:
-                s3.put_object(
-                    Body=big_size_buffer[0],
-                    Bucket="brandi-intern",
-                    Key=big_size_buffer[1],
-                    ContentType='image/jpeg'
-                )
+    Args:
+        as_of: 'YYYY-MM-DD HH:MM:SS' 또는 'YYYY-MM-DD'
 
-            except Exception as e:
-                print(f'error: {e}')
-                return jsonify({'message': 'INVALID_REQUEST'}), 400
+    Returns:
+        데이터베이스 일시 문자열 ('YYYY-MM-DD HH:MM:SS')
 
-            big_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{big_size_buffer[1]}'
-            data['image_file_1']['big_size_url'] = big_size_url
-            data['image_file_1']['big_image_size_id'] = 1
+    Raises:
+        ValueError: 형식이 잘못된 경우
 
-            # medium_size 업로드
-            medium_size_buffer = self.resize_to_medium(image_file_1)
-            if not medium_size_buffer:
-                return jsonify({"message": "RESIZE_FAIL"}), 400
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
 
-            try:
-                s3.put_object(
-                    Body=medium_size_buffer[0],
-                    Bucket="brandi-intern",
-                    Key=medium_size_buffer[1],
-                    ContentType='image/jpeg'
-                )
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+    """
+    for as_of_format in AS_OF_FORMATS:
+        try:
+            as_of_time = datetime.strptime(as_of.strip(), as_of_format)
+        except ValueError:
+            continue
 
-            except Exception as e:
-                print(f'error: {e}')
-                return jsonify({'message': 'INVALID_REQUEST'}), 400
+        return str(as_of_time - RESPONSE_TIME_OFFSET)
 
-            medium_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{medium_size_buffer[1]}'
-            data['image_file_1']['medium_size_url'] = medium_size_url
-            data['image_file_1']['medium_image_size_id'] = 2
+    raise ValueError('INVALID_AS_OF')
 
-            # small_size 업로드
-            small_size_buffer = self.resize_to_small(image_file_1)
-            if not small_size_buffer:
-                return jsonify({"message": "RESIZE_FAIL"}), 400
 
-            try:
-                s3.put_object(
-                    Body=small_size_buffer[0],
-                    Bucket="brandi-intern",
-                    Key=small_size_buffer[1],
-                    ContentType='image/jpeg'
-                )
+# 상품 이미지 순서 (요청의 파일 key, 1번이 대표 이미지)
+PRODUCT_IMAGE_ORDERS = ('image_file_1', 'image_file_2', 'image_file_3', 'image_file_4', 'image_file_5')
 
-            except Exception as e:
-                print(f'error: {e}')
-                return jsonify({'message': 'INVALID_REQUEST'}), 400
+# s3에 업로드 된 파일의 url
+S3_OBJECT_URL = 'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{key}'
 
-            small_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{small_size_buffer[1]}'
-            data['image_file_1']['small_size_url'] = small_size_url
-            data['image_file_1']['small_image_size_id'] = 3
+_upload_executor = None
+_upload_executor_lock = threading.Lock()
 
-        # 순서2번의 이미지파일 이 존재하면 업로드하고 url 을 딕셔너리에 추가
-        if image_file_2:
-            # 들어온 파일의 사이즈와 확장자를 구함.
-            image_file_size = os.fstat(image_file_2.fileno()).st_size
-            image_file_form = image_file_2.content_type
+# s3 업로드 통계 (upload_objects 호출마다 누적)
+_upload_stats = {
+    'request_count': 0,
+    'failed_request_count': 0,
+    'upload_count': 0,
+    'upload_bytes': 0,
+    'upload_elapsed': 0.0,
+    'max_upload_elapsed': 0.0,
+    'request_elapsed': 0.0,
+    'max_request_elapsed': 0.0,
+}
+_upload_stats_lock = threading.Lock()
 
-            # 이미지 파일이 아닌 다른형식의 파일이 들어오는 것을 차단.
-            if not ('image' in image_file_form):
-                return jsonify({'message': 'INVALID_FILE_FORM'})
 
-            # 들어온 이미지 크기가 10MB 보다 크면 request 를 받지 않음.
-            if image_file_size > 10485760:
-                return jsonify({'message': 'INVALID_IMAGE_SIZE'})
+def get_upload_executor():
+    """ s3 업로드에 사용하는 스레드 풀. 처음 호출될 때 생성되고 S3_CONFIG 의 upload_max_workers(기본 8) 만큼 동시에 업로드 """
+    global _upload_executor
 
-            # big_size 업로드
-            big_size_buffer = self.resize_to_big(image_file_2)
-            if not big_size_buffer:
-                return jsonify({"message": "RESIZE_FAIL"}), 400
+    if _upload_executor is None:
+        with _upload_executor_lock:
+            if _upload_executor is None:
+                _upload_executor = ThreadPoolExecutor(
+                    max_workers=S3_CONFIG.get('upload_max_workers', 8),
+                    thread_name_prefix='s3-upload'
+                )
 
+    return _upload_executor
+
+
+def upload_objects(s3, upload_jobs, bucket='brandi-intern', content_type='image/jpeg', delete_on_error=True):
+
+    """ 여러 파일을 s3에 동시에 업로드
+
+    하나의 s3 클라이언트를 스레드 풀의 작업들이 같이 사용한다.
+    업로드가 하나라도 실패하면 아직 시작하지 않은 업로드는 취소하고,
+    실행중인 업로드가 끝나기를 기다린 뒤 에러를 다시 발생시킨다.
+    delete_on_error 이면 그 전에 이번 호출에서 올라간 파일을 모두 삭제한다.
+    내용 해시처럼 다른 요청이 같은 key 로 올린 파일일 수 있는 경우에는 삭제하지 않아야 한다.
+
+    Args:
+        s3: s3 클라이언트
+        upload_jobs: 업로드할 파일 목록. 각 항목은 body(파일 객체), key(s3 key) 를 포함하고, 나머지 값은 소요 시간 기록에 그대로 담김
+        bucket: 업로드할 버킷
+        content_type: 업로드할 파일의 content type
+        delete_on_error: 실패시 이번 호출에서 올라간 파일을 삭제할지 여부
+
+    Returns:
+        업로드별 소요 시간 목록 [{..upload_job, 'bytes', 'elapsed'}], 마지막 항목은 전체 소요 시간 {'key': None, 'elapsed'}
+
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
+
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): 소요 시간 출력 대신 get_upload_stats 통계에 누적
+        2026-10-17 (leesh3@brandi.co.kr): 실패시 올라간 파일 삭제를 선택(delete_on_error)으로 변경
+    """
+
+    def put_object(upload_job):
+        started_at = time.monotonic()
+        s3.put_object(
+            Body=upload_job['body'],
+            Bucket=bucket,
+            Key=upload_job['key'],
+            ContentType=content_type
+        )
+        timing = {key: value for key, value in upload_job.items() if key != 'body'}
+        timing['bytes'] = upload_job['body'].getbuffer().nbytes if hasattr(upload_job['body'], 'getbuffer') else None
+        timing['elapsed'] = time.monotonic() - started_at
+        return timing
+
+    started_at = time.monotonic()
+    executor = get_upload_executor()
+    futures = [executor.submit(put_object, upload_job) for upload_job in upload_jobs]
+
+    # 먼저 끝나는 순서대로 확인해서 실패가 있으면 바로 중단
+    timings = []
+    error = None
+    for future in as_completed(futures):
+        try:
+            timings.append(future.result())
+        except Exception as e:
+            error = e
+            break
+
+    if error is not None:
+        for future in futures:
+            future.cancel()
+        wait(futures)
+
+        # 실패 전후로 업로드에 성공한 파일을 삭제
+        uploaded_keys = [
+            upload_job['key'] for upload_job, future in zip(upload_jobs, futures)
+            if not future.cancelled() and future.exception() is None
+        ]
+        if delete_on_error and uploaded_keys:
             try:
-                s3.put_object(
-                    Body=big_size_buffer[0],
-                    Bucket="brandi-intern",
-                    Key=big_size_buffer[1],
-                    ContentType='image/jpeg'
+                s3.delete_objects(
+                    Bucket=bucket,
+                    Delete={'Objects': [{'Key': key} for key in uploaded_keys], 'Quiet': True}
                 )
-
             except Exception as e:
-                print(f'error1 : {e}')
-                return jsonify({'message': 'S3_UPLOAD_FAIL'}), 500
+                print(f'S3_DELETE_ERROR_WITH {e} {uploaded_keys}')
+        _record_upload_timings(timings, failed=True)
+        raise error
 
-            big_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{big_size_buffer[1]}'
-            data['image_file_2']['big_size_url'] = big_size_url
-            data['image_file_2']['big_image_size_id'] = 1
+    timings.append({'key': None, 'elapsed': time.monotonic() - started_at})
+    _record_upload_timings(timings)
+    return timings
 
-            # medium_size 업로드
-            medium_size_buffer = self.resize_to_medium(image_file_2)
-            if not medium_size_buffer:
-                return jsonify({"message": "RESIZE_FAIL"}), 400
 
-            try:
-                s3.put_object(
-                    Body=medium_size_buffer[0],
-                    Bucket="brandi-intern",
-                    Key=medium_size_buffer[1],
-                    ContentType='image/jpeg'
-                )
+def _record_upload_timings(timings, failed=False):
+    with _upload_stats_lock:
+        _upload_stats['request_count'] += 1
+        if failed:
+            _upload_stats['failed_request_count'] += 1
+            return
 
-            except Exception as e:
-                print(f'error1 : {e}')
-                return jsonify({'message': 'S3_UPLOAD_FAIL'}), 500
+        for timing in timings[:-1]:
+            _upload_stats['upload_count'] += 1
+            _upload_stats['upload_bytes'] += timing['bytes'] or 0
+            _upload_stats['upload_elapsed'] += timing['elapsed']
+            _upload_stats['max_upload_elapsed'] = max(_upload_stats['max_upload_elapsed'], timing['elapsed'])
 
-            medium_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{medium_size_buffer[1]}'
-            data['image_file_2']['medium_size_url'] = medium_size_url
-            data['image_file_2']['medium_image_size_id'] = 2
+        _upload_stats['request_elapsed'] += timings[-1]['elapsed']
+        _upload_stats['max_request_elapsed'] = max(_upload_stats['max_request_elapsed'], timings[-1]['elapsed'])
 
-            # small_size 업로드
-            small_size_buffer = self.resize_to_small(image_file_2)
-            if not small_size_buffer:
-                return jsonify({"message": "RESIZE_FAIL"}), 400
 
-            try:
-                s3.put_object(
-                    Body=small_size_buffer[0],
-                    Bucket="brandi-intern",
-                    Key=small_size_buffer[1],
-                    ContentType='image/jpeg'
-                )
+def get_upload_stats():
+    """ s3 업로드 통계 (업로드 호출 / 파일 수, 바이트, 소요 시간 합계와 최대값) """
+    with _upload_stats_lock:
+        return dict(_upload_stats)
 
-            except Exception as e:
-                print(f'error1 : {e}')
-                return jsonify({'message': 'S3_UPLOAD_FAIL'}), 500
 
-            small_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{small_size_buffer[1]}'
-            data['image_file_2']['small_size_url'] = small_size_url
-            data['image_file_2']['small_image_size_id'] = 3
+def get_image_source_hash(image_bytes, content_type, resample, reducing_gap):
+    """ 원본 이미지 해시. 같은 원본이라도 리사이즈 설정이나 저장 형식이 다르면 결과물이 다르므로 함께 해시한다. """
+    image_format = 'png' if 'png' in content_type else 'jpeg'
+    source_hash = hashlib.sha256(image_bytes)
+    source_hash.update(f'|{image_format}|{resample}|{reducing_gap}|{PRODUCT_IMAGE_SIZES}'.encode())
+    return source_hash.hexdigest()
 
-        # 순서3번의 이미지파일 이 존재하면 업로드하고 url 을 딕셔너리에 추가
-        if image_file_3:
-            # 들어온 파일의 사이즈와 확장자를 구함.
-            image_file_size = os.fstat(image_file_3.fileno()).st_size
-            image_file_form = image_file_3.content_type
 
-            # 이미지 파일이 아닌 다른형식의 파일이 들어오는 것을 차단.
-            if not ('image' in image_file_form):
-                return jsonify({'message': 'INVALID_FILE_FORM'})
+def store_product_images(image_sources):
 
-            # 들어온 이미지 크기가 10MB 보다 크면 request 를 받지 않음.
-            if image_file_size > 10485760:
-                return jsonify({'message': 'INVALID_IMAGE_SIZE'})
+    """ 상품 이미지를 사이즈별로 리사이즈해서 내용 해시를 key 로 s3에 저장
 
-            # big_size 업로드
-            big_size_buffer = self.resize_to_big(image_file_3)
-            if not big_size_buffer:
-                return jsonify({"message": "RESIZE_FAIL"}), 400
+    - 사이즈별 이미지는 인코딩된 결과물의 sha256 을 s3 key 로 사용한다.
+    - 같은 원본(같은 리사이즈 설정)이 이미 저장되어 있으면 리사이즈와 업로드를 모두 생략한다.
+    - 리사이즈 결과물이 이미 저장되어 있으면 그 사이즈의 업로드만 생략한다.
+    - 저장 여부는 로컬 해시 색인(image_index)으로만 확인하고 s3 에는 묻지 않는다.
+    - 업로드가 모두 성공한 뒤에만 색인에 추가한다.
 
-            try:
-                s3.put_object(
-                    Body=big_size_buffer[0],
-                    Bucket="brandi-intern",
-                    Key=big_size_buffer[1],
-                    ContentType='image/jpeg'
-                )
+    Args:
+        image_sources: {이미지 순서: (이미지 파일 객체 또는 파일 경로, content type)}
 
-            except Exception as e:
-                print(f'error1 : {e}')
-                return jsonify({'message': 'S3_UPLOAD_FAIL'}), 500
+    Returns:
+        (이미지 순서별 url, 사이즈 정보, 업로드별 소요 시간 목록, 절약 결과)
+        절약 결과: {'images', 'resize_saved', 'uploads', 'bytes_uploaded', 'uploads_saved', 'bytes_saved'}
 
-            big_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{big_size_buffer[1]}'
-            data['image_file_3']['big_size_url'] = big_size_url
-            data['image_file_3']['big_image_size_id'] = 1
+    Raises:
+        ImageResizeError: 이미지를 열거나 리사이즈하지 못한 경우
+        s3 업로드 에러 (upload_objects 참고)
 
-            # medium_size 업로드
-            medium_size_buffer = self.resize_to_medium(image_file_3)
-            if not medium_size_buffer:
-                return jsonify({"message": "RESIZE_FAIL"}), 400
+    Authors:
+        leesh3@brandi.co.kr (이소헌)
 
-            try:
-                s3.put_object(
-                    Body=medium_size_buffer[0],
-                    Bucket="brandi-intern",
-                    Key=medium_size_buffer[1],
-                    ContentType='image/jpeg'
-                )
+    History:
+        2026-10-17 (leesh3@brandi.co.kr): 초기 생성
+        2026-10-17 (leesh3@brandi.co.kr): 업로드 실패시 내용 해시 key 를 삭제하지 않음
+    """
+    hash_index = get_image_hash_index()
+    resample = S3_CONFIG.get('image_resample', 'lanczos')
+    reducing_gap = S3_CONFIG.get('image_reducing_gap', 2.0)
 
-            except Exception as e:
-                print(f'error1 : {e}')
-                return jsonify({'message': 'S3_UPLOAD_FAIL'}), 500
+    images = {image_order: {} for image_order in PRODUCT_IMAGE_ORDERS}
+    upload_jobs = []
+    new_sources = {}
+    report = {'images': 0, 'resize_saved': 0, 'uploads': 0, 'bytes_uploaded': 0, 'uploads_saved': 0, 'bytes_saved': 0}
 
-            medium_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{medium_size_buffer[1]}'
-            data['image_file_3']['medium_size_url'] = medium_size_url
-            data['image_file_3']['medium_image_size_id'] = 2
+    for image_order, (image_file, content_type) in image_sources.items():
+        if isinstance(image_file, str):
+            with open(image_file, 'rb') as opened_file:
+                image_bytes = opened_file.read()
+        else:
+            image_bytes = image_file.read()
 
-            # small_size 업로드
-            small_size_buffer = self.resize_to_small(image_file_3)
-            if not small_size_buffer:
-                return jsonify({"message": "RESIZE_FAIL"}), 400
+        report['images'] += 1
+        source_hash = get_image_source_hash(image_bytes, content_type, resample, reducing_gap)
+        variants = hash_index.get_variants(source_hash) or new_sources.get(source_hash)
 
-            try:
-                s3.put_object(
-                    Body=small_size_buffer[0],
-                    Bucket="brandi-intern",
-                    Key=small_size_buffer[1],
-                    ContentType='image/jpeg'
-                )
+        # 같은 원본이 이미 저장되어 있으면 리사이즈와 업로드를 생략
+        if variants is not None:
+            report['resize_saved'] += 1
+            report['uploads_saved'] += len(variants)
+            report['bytes_saved'] += sum(variant['bytes'] for variant in variants.values())
 
+        else:
+            try:
+                resized_images = resize_image(io.BytesIO(image_bytes), content_type, resample=resample, reducing_gap=reducing_gap)
             except Exception as e:
-                print(f'error1 : {e}')
-                return jsonify({'message': 'S3_UPLOAD_FAIL'}), 500
+                raise ImageResizeError(e)
 
-            small_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{small_size_buffer[1]}'
-            data['image_file_3']['small_size_url'] = small_size_url
-            data['image_file_3']['small_image_size_id'] = 3
-
-        # 순서4번의 이미지파일 이 존재하면 업로드하고 url 을 딕셔너리에 추가
-        if image_file_4:
-            # 들어온 파일의 사이즈와 확장자를 구함.
-            image_file_size = os.fstat(image_file_4.fileno()).st_size
-            image_file_form = image_file_4.content_type
-
-            # 이미지 파일이 아닌 다른형식의 파일이 들어오는 것을 차단.
-            if not ('image' in image_file_form):
-                return jsonify({'message': 'INVALID_FILE_FORM'}), 400
+            variants = {}
+            for size_name, (image_buffer, _, image_size_id) in resized_images.items():
+                image_body = image_buffer.getvalue()
+                image_key = hashlib.sha256(image_body).hexdigest()
+                variants[size_name] = {'key': image_key, 'image_size_id': image_size_id, 'bytes': len(image_body)}
 
-            # 들어온 이미지 크기가 10MB 보다 크면 request 를 받지 않음.
-            if image_file_size > 10485760:
-                return jsonify({'message': 'INVALID_IMAGE_SIZE'}), 400
+                # 결과물이 이미 저장되어 있거나 이번 요청에서 올라갈 예정이면 업로드를 생략
+                if hash_index.has_object(image_key) or any(job['key'] == image_key for job in upload_jobs):
+                    report['uploads_saved'] += 1
+                    report['bytes_saved'] += len(image_body)
+                    continue
 
-            # big_size 업로드
-            big_size_buffer = self.resize_to_big(image_file_4)
-            if not big_size_buffer:
-                return jsonify({"message": "RESIZE_FAIL"}), 400
+                upload_jobs.append({
+                    'image_order': image_order,
+                    'size_name': size_name,
+                    'body': image_buffer,
+                    'key': image_key,
+                })
+                report['uploads'] += 1
+                report['bytes_uploaded'] += len(image_body)
 
-            try:
-                s3.put_object(
-                    Body=big_size_buffer[0],
-                    Bucket="brandi-intern",
-                    Key=big_size_buffer[1],
-                    ContentType='image/jpeg'
-                )
+            new_sources[source_hash] = variants
 
-            except Exception as e:
-                print(f'error: {e}')
-                return jsonify({'message': 'INVALID_REQUEST4'}), 400
+        for size_name, variant in variants.items():
+            images[image_order][f'{size_name}_size_url'] = S3_OBJECT_URL.format(key=variant['key'])
+            images[image_order][f'{size_name}_image_size_id'] = variant['image_size_id']
 
-            big_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{big_size_buffer[1]}'
-            data['image_file_4']['big_size_url'] = big_size_url
-            data['image_file_4']['big_image_size_id'] = 1
+    # 새로 만든 이미지만 동시에 업로드
+    # key 가 내용 해시라서 같은 이미지를 동시에 올린 다른 요청의 파일일 수 있으므로, 실패해도 올라간 파일은 삭제하지 않음
+    # (색인에 추가되지 않은 파일은 남겨두고, 같은 이미지가 다시 올라오면 같은 key 로 덮어씀)
+    upload_timings = upload_objects(get_s3_connection(), upload_jobs, delete_on_error=False)
 
-            # medium_size 업로드
-            medium_size_buffer = self.resize_to_medium(image_file_4)
-            if not medium_size_buffer:
-                return jsonify({"message": "RESIZE_FAIL"}), 400
+    for source_hash, variants in new_sources.items():
+        hash_index.add(source_hash, variants)
 
-            try:
-                s3.put_object(
-                    Body=medium_size_buffer[0],
-                    Bucket="brandi-intern",
-                    Key=medium_size_buffer[1],
-                    ContentType='image/jpeg'
-                )
+    hash_index.record(report)
+    return images, upload_timings, report
 
-            except Exception as e:
-                print(f'error: {e}')
-                return jsonify({'message': 'INVALID_REQUEST'}), 400
 
-            medium_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{medium_size_buffer[1]}'
-            data['image_file_4']['medium_size_url'] = medium_size_url
-            data['image_file_4']['medium_image_size_id'] = 2
+class ImageUpload:
 
-            # small_size 업로드
-            small_size_buffer = self.resize_to_small(image_file_4)
-            if not small_size_buffer:
-                return jsonify({"message": "RESIZE_FAIL"}), 400
+    # 요청받은 상품 이미지 파일 확인
+    def get_product_image_files(self, request):
+        """ 요청에 들어온 상품 이미지 파일의 형식과 크기를 확인하고 이미지 순서별로 리턴하는 함수.
+        이미지가 들어오지 않은 순서는 None 으로 채워서 모든 순서의 key 가 존재하도록 함.
 
-            try:
-                s3.put_object(
-                    Body=small_size_buffer[0],
-                    Bucket="brandi-intern",
-                    Key=small_size_buffer[1],
-                    ContentType='image/jpeg'
-                )
+        Args:
+            request: 상품 이미지 파일을 포함한 요청 값.
 
-            except Exception as e:
-                print(f'error: {e}')
-                return jsonify({'message': 'INVALID_REQUEST'}), 400
+        Returns:
+            {'image_file_1': 파일 객체 또는 None, ... 'image_file_5': ...}
+            400: 파일형식이 잘못된 경우, 파일 크기가 너무 큰 경우
 
-            small_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{small_size_buffer[1]}'
-            data['image_file_4']['small_size_url'] = small_size_url
-            data['image_file_4']['small_image_size_id'] = 3
+        Authors:
+            leesh3@brandi.co.kr (이소헌)
 
-        # 순서5번의 이미지파일 이 존재하면 업로드하고 url 을 딕셔너리에 추가
-        if image_file_5:
-            # 들어온 파일의 사이즈와 확장자를 구함.
-            image_file_size = os.fstat(image_file_5.fileno()).st_size
-            image_file_form = image_file_5.content_type
+        History:
+            2026-10-17 (leesh3@brandi.co.kr): upload_product_image 에서 분리 (이미지 작업 큐와 같이 사용)
+        """
+        image_files = {}
 
-            # 이미지 파일이 아닌 다른형식의 파일이 들어오는 것을 차단.
-            if not ('image' in image_file_form):
-                return jsonify({'message': 'INVALID_FILE_FORM'})
+        # 파일의 존재여부 확인, 이미지 순서를 파일 이름으로 받음.
+        for image_order in PRODUCT_IMAGE_ORDERS:
+            image_file = request.files.get(image_order, None)
 
-            # 들어온 이미지 크기가 10MB 보다 크면 request 를 받지 않음.
-            if image_file_size > 10485760:
-                return jsonify({'message': 'INVALID_IMAGE_SIZE'})
+            if image_file:
+                # 들어온 파일의 사이즈와 확장자를 구함.
+                image_file_size = os.fstat(image_file.fileno()).st_size
+                image_file_form = image_file.content_type
 
-            # big_size 업로드
-            big_size_buffer = self.resize_to_big(image_file_5)
-            if not big_size_buffer:
-                return jsonify({"message": "RESIZE_FAIL"}), 400
+                # 이미지 파일이 아닌 다른형식의 파일이 들어오는 것을 차단.
+                if not ('image' in image_file_form):
+                    return jsonify({'message': 'INVALID_FILE_FORM'}), 400
 
-            try:
-                s3.put_object(
-                    Body=big_size_buffer[0],
-                    Bucket="brandi-intern",
-                    Key=big_size_buffer[1],
-                    ContentType='image/jpeg'
-                )
+                # 들어온 이미지 크기가 10MB 보다 크면 request 를 받지 않음.
+                if image_file_size > 10485760:
+                    return jsonify({'message': 'INVALID_IMAGE_SIZE'}), 400
 
-            except Exception as e:
-                print(f'error1 : {e}')
-                return jsonify({'message': 'S3_UPLOAD_FAIL'}), 500
+            image_files[image_order] = image_file
 
-            big_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{big_size_buffer[1]}'
-            data['image_file_5']['big_size_url'] = big_size_url
-            data['image_file_5']['big_image_size_id'] = 1
+        return image_files
 
-            # medium_size 업로드
-            medium_size_buffer = self.resize_to_medium(image_file_5)
-            if not medium_size_buffer:
-                return jsonify({"message": "RESIZE_FAIL"}), 400
+    # 요청받은 상품 이미지를 리사이즈 하고 s3에 업로드
+    def upload_product_image(self, request):
+        """ 상품 이미지 파일을 3가지 크기로 리사이즈 해서 s3에 업로드 하고 업로드한 이미지의 url, 사이즈를 리턴하는 함수.
+        들어올 것으로 예상되는 key 값을 지정하고 해당 key로 들어오지 않으면 None 을 변수에 담아서 처리.
+        파일의 형식이 image 가 아닐 경우 이미지를 업로드 하지 않음.
+        파일의 크기가 일정크기를 넘으면 업로드 하지 않음.
+        이미지가 들어오지 않아도 해당 이미지 순서에 있는 key는 존재하도록 설계
 
-            try:
-                s3.put_object(
-                    Body=medium_size_buffer[0],
-                    Bucket="brandi-intern",
-                    Key=medium_size_buffer[1],
-                    ContentType='image/jpeg'
-                )
+        Args:
+            request: 상품 이미지 파일을 포함한 요청 값.
 
-            except Exception as e:
-                print(f'error1 : {e}')
-                return jsonify({'message': 'S3_UPLOAD_FAIL'}), 500
+        Returns:
+            data: s3 버킷에 올라간 이미지파일의 url(dictionary), size 를 포함한 딕셔너리
+            400: 파일형식이 잘못된 경우, 파일 크기가 너무 큰 경우,
+            500: s3에 업로드과정에서 애러가 난 경우.
 
-            medium_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{medium_size_buffer[1]}'
-            data['image_file_5']['medium_size_url'] = medium_size_url
-            data['image_file_5']['medium_image_size_id'] = 2
+        Authors:
+            yoonhc@brandi.co.kr (윤희철)
+            leesh3@brandi.co.kr (이소헌)
 
-            # small_size 업로드
-            small_size_buffer = self.resize_to_small(image_file_5)
-            if not small_size_buffer:
-                return jsonify({"message": "RESIZE_FAIL"}), 400
+        History:
+            2020-04-02 (yoonhc@brandi.co.kr): 초기 생성
+            2020-04-09 (yoonhc@brandi.co,kr): RESTful api 형식에 맞추기 위해서 이미지 업로드 기능의 모듈화.
+            2020-04-11 (yoonhc@brandi.co.kr): s3에 업로드 되는 과정에서 발생하는 애러 except 처리 추가.
+            2026-10-17 (leesh3@brandi.co.kr): 이미지 순서별로 반복되던 로직을 하나로 합치고, 한번 디코딩으로 3가지 사이즈 생성
+            2026-10-17 (leesh3@brandi.co.kr): 검사와 리사이즈가 모두 끝난 뒤 스레드 풀에서 동시에 업로드, 업로드별 소요 시간은 upload_timings 에 저장
+            2026-10-17 (leesh3@brandi.co.kr): 내용 해시를 s3 key 로 사용하고 이미 저장된 이미지는 리사이즈 / 업로드 생략 (dedupe_report 에 절약 결과 저장)
+        """
+        # 업로드별 소요 시간과 중복 제거 결과
+        self.upload_timings = []
+        self.dedupe_report = None
+
+        # 파일의 존재여부, 형식, 크기 확인
+        image_files = self.get_product_image_files(request)
+        if (400 in image_files) or (500 in image_files):
+            return image_files
+
+        image_sources = {
+            image_order: (image_file, image_file.content_type)
+            for image_order, image_file in image_files.items() if image_file
+        }
 
-            try:
-                s3.put_object(
-                    Body=small_size_buffer[0],
-                    Bucket="brandi-intern",
-                    Key=small_size_buffer[1],
-                    ContentType='image/jpeg'
-                )
+        # 리사이즈 후 내용 해시를 key 로 업로드. 이미 저장된 이미지는 리사이즈 / 업로드를 생략
+        try:
+            data, self.upload_timings, self.dedupe_report = store_product_images(image_sources)
 
-            except Exception as e:
-                print(f'error1 : {e}')
-                return jsonify({'message': 'S3_UPLOAD_FAIL'}), 500
+        except ImageResizeError as e:
+            print(f'RESIZE_ERROR_WITH {e}')
+            return jsonify({"message": "RESIZE_FAIL"}), 400
 
-            small_size_url = f'https://brandi-intern.s3.ap-northeast-2.amazonaws.com/{small_size_buffer[1]}'
-            data['image_file_5']['small_size_url'] = small_size_url
-            data['image_file_5']['small_image_size_id'] = 3
+        except Exception as e:
+            print(f'error : {e}')
+            return jsonify({'message': 'S3_UPLOAD_FAIL'}), 500
 
         return data
 